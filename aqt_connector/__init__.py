@@ -1,15 +1,100 @@
+from typing import TYPE_CHECKING, Any
+
 from aqt_connector._application.authentication import get_access_token as get_access_token
 from aqt_connector._application.authentication import log_in as log_in
 from aqt_connector._application.jobs import fetch_job_state as fetch_job_state
+from aqt_connector._application.jobs import fetch_job_states as fetch_job_states
+from aqt_connector._application.jobs import gather_final_states as gather_final_states
+from aqt_connector._application.jobs import stream_job_state as stream_job_state
 from aqt_connector._application.jobs import wait_for_final_state as wait_for_final_state
+from aqt_connector._application.jobs import wait_for_final_states as wait_for_final_states
+from aqt_connector._application.jobs import watch_job as watch_job
+from aqt_connector._application.jobs import watch_jobs as watch_jobs
+from aqt_connector._application.journal import journal_entries as journal_entries
+from aqt_connector._application.journal import track_job as track_job
+from aqt_connector._application.journal import unfinished_jobs as unfinished_jobs
 from aqt_connector._arnica_app import ArnicaApp as ArnicaApp
+from aqt_connector._domain.cancellation import CancelEvent as CancelEvent
+from aqt_connector._domain.counts_accumulator import CountsAccumulator as CountsAccumulator
+from aqt_connector._domain.polling import AdaptivePolling as AdaptivePolling
+from aqt_connector._domain.polling import FixedIntervalPolling as FixedIntervalPolling
+from aqt_connector._domain.polling import PollContext as PollContext
+from aqt_connector._domain.polling import PollingStrategy as PollingStrategy
+from aqt_connector._domain.wait_events import AsyncEventStream as AsyncEventStream
+from aqt_connector._domain.wait_events import BackedOff as BackedOff
+from aqt_connector._domain.wait_events import EventSink as EventSink
+from aqt_connector._domain.wait_events import JobFinished as JobFinished
+from aqt_connector._domain.wait_events import PollFinished as PollFinished
+from aqt_connector._domain.wait_events import PollStarted as PollStarted
+from aqt_connector._domain.wait_events import QueueSink as QueueSink
+from aqt_connector._domain.wait_events import StateChanged as StateChanged
+from aqt_connector._domain.wait_events import TextSink as TextSink
+from aqt_connector._domain.wait_events import TokenRefreshed as TokenRefreshed
+from aqt_connector._domain.wait_events import TransientErrorEncountered as TransientErrorEncountered
+from aqt_connector._domain.wait_events import WaitEvent as WaitEvent
+from aqt_connector._infrastructure.arrow_export import ParquetResultWriter as ParquetResultWriter
+from aqt_connector._infrastructure.arrow_export import result_record_batches as result_record_batches
+from aqt_connector._infrastructure.job_journal import JournalEntry as JournalEntry
+from aqt_connector._infrastructure.result_store import ResultStore as ResultStore
+from aqt_connector._infrastructure.result_stream import NpyDirectorySink as NpyDirectorySink
+from aqt_connector._infrastructure.result_stream import ShotSink as ShotSink
+from aqt_connector._infrastructure.shared_results import SharedResult as SharedResult
+from aqt_connector._infrastructure.shared_results import SharedResults as SharedResults
 from aqt_connector._sdk_config import ArnicaConfig as ArnicaConfig
 
+if TYPE_CHECKING:
+    from aqt_connector._domain.job_watcher import JobHandle as JobHandle
+
 __all__ = [
     "ArnicaApp",
     "get_access_token",
     "log_in",
     "fetch_job_state",
+    "fetch_job_states",
+    "stream_job_state",
+    "ShotSink",
+    "NpyDirectorySink",
     "wait_for_final_state",
+    "wait_for_final_states",
+    "gather_final_states",
+    "watch_job",
+    "watch_jobs",
+    "JobHandle",
+    "CancelEvent",
+    "track_job",
+    "journal_entries",
+    "unfinished_jobs",
+    "JournalEntry",
+    "CountsAccumulator",
+    "ResultStore",
+    "ParquetResultWriter",
+    "result_record_batches",
+    "SharedResults",
+    "SharedResult",
     "ArnicaConfig",
+    "PollingStrategy",
+    "PollContext",
+    "FixedIntervalPolling",
+    "AdaptivePolling",
+    "WaitEvent",
+    "PollStarted",
+    "PollFinished",
+    "StateChanged",
+    "TransientErrorEncountered",
+    "BackedOff",
+    "TokenRefreshed",
+    "JobFinished",
+    "EventSink",
+    "TextSink",
+    "QueueSink",
+    "AsyncEventStream",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # The watcher is imported on first use, as concurrent.futures takes long to import
+    if name == "JobHandle":
+        from aqt_connector._domain.job_watcher import JobHandle
+
+        return JobHandle
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,21 @@
 import sys
-from collections.abc import Callable
-from typing import TextIO
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from datetime import datetime
+from typing import TYPE_CHECKING, TextIO
 from uuid import UUID
 
 from aqt_connector._arnica_app import ArnicaApp
+from aqt_connector._domain.polling import FixedIntervalPolling, PollingStrategy
+from aqt_connector._domain.wait_events import EventSink
+from aqt_connector._infrastructure.result_stream import ShotSink
 from aqt_connector.exceptions import NotAuthenticatedError
 from aqt_connector.models.arnica.response_bodies.jobs import FinalJobState, JobState, NonFinalJobState
 
+if TYPE_CHECKING:
+    from aqt_connector._domain.job_watcher import JobHandle
+
 
 def fetch_job_state(app: ArnicaApp, job_id: UUID, *, api_token: str | None = None) -> JobState:
     """Fetch the state of a job.
@@ -35,6 +44,63 @@ def fetch_job_state(app: ArnicaApp, job_id: UUID, *, api_token: str | None = Non
     return app.job_service.fetch_job_state(token, job_id)
 
 
+def stream_job_state(
+    app: ArnicaApp, job_id: UUID, *, api_token: str | None = None, sink: ShotSink | None = None
+) -> JobState:
+    """Fetch the state of a job, decoding the results of a finished job to arrays as the response is received.
+
+    Unlike `fetch_job_state`, the response is never held in memory as a whole, and neither are lists of the shots.
+    This requires the `numpy` extra.
+
+    Args:
+        app (ArnicaApp): the application instance.
+        job_id (UUID): the unique identifier of the job.
+        api_token (str | None, optional): a static API token to use for authentication. This will be used
+            in place of any token retrieved when logging in. Defaults to None.
+        sink (ShotSink | None, optional): receives the shots of each circuit once decoded, and returns the array to
+            keep in the state. Use an `NpyDirectorySink` to write them to disk as they arrive. Defaults to None, to
+            keep the arrays in memory.
+
+    Raises:
+        See `fetch_job_state`.
+
+    Returns:
+        JobState: the state of the job. A finished state holds its results as arrays, see `RRFinished.result_arrays`.
+    """
+    token = api_token or app.auth_service.get_or_refresh_access_token(app.config.store_access_token)
+    if not token:
+        raise NotAuthenticatedError("User not authenticated. Please log in.")
+    return app.job_service.stream_job_state(token, job_id, sink=sink)
+
+
+def fetch_job_states(
+    app: ArnicaApp, job_ids: Iterable[UUID], *, api_token: str | None = None, max_concurrency: int = 8
+) -> dict[UUID, JobState | Exception]:
+    """Fetch a snapshot of the states of several jobs.
+
+    The access token is resolved once for all jobs, and the jobs are requested with bounded concurrency over the
+    application's shared connection pool. A failure to fetch one job does not affect the others.
+
+    Args:
+        app (ArnicaApp): the application instance.
+        job_ids (Iterable[UUID]): the unique identifiers of the jobs. Duplicates are ignored.
+        api_token (str | None, optional): a static API token to use for authentication. This will be used
+            in place of any token retrieved when logging in. Defaults to None.
+        max_concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+
+    Raises:
+        NotAuthenticatedError: if the user is not authenticated and no access token is available.
+
+    Returns:
+        dict[UUID, JobState | Exception]: the state of each job, or the exception raised while fetching it, in the
+            order of the given job IDs. See `fetch_job_state` for the possible exceptions.
+    """
+    token = api_token or app.auth_service.get_or_refresh_access_token(app.config.store_access_token)
+    if not token:
+        raise NotAuthenticatedError("User not authenticated. Please log in.")
+    return app.job_service.fetch_job_states(token, job_ids, max_concurrency=max_concurrency)
+
+
 def wait_for_final_state(
     app: ArnicaApp,
     job_id: UUID,
@@ -42,13 +108,25 @@ def wait_for_final_state(
     api_token: str | None = None,
     query_interval_seconds: float = 1.0,
     max_attempts: int = 600,
-    out: TextIO = sys.stdout,
+    timeout: float | None = None,
+    deadline: datetime | None = None,
+    cancel: threading.Event | None = None,
+    out: TextIO | None = sys.stdout,
     report_state: Callable[[NonFinalJobState], None] | None = None,
+    polling: PollingStrategy | None = None,
+    priority: float = 1.0,
+    events: EventSink | None = None,
+    number_of_circuits: int | None = None,
 ) -> FinalJobState:
     """Wait for a job to reach a final state.
 
-    Polls the job state until it reaches a finished state or the maximum number of attempts is reached. A finished
-    state includes jobs that have succeeded, failed, or been cancelled.
+    Polls the job state until it reaches a finished state, the maximum number of attempts is reached or the timeout
+    or deadline passes. A finished state includes jobs that have succeeded, failed, or been cancelled. The timeout
+    and deadline cover the whole wait, including token refreshes.
+
+    Setting the `cancel` event from another thread ends the wait immediately, releasing the waiting thread. When another
+    wait is already polling the same job, this happens right away only for a `CancelEvent`, and within 0.1 seconds
+    for other events.
 
     Args:
         app (ArnicaApp): the application instance.
@@ -57,8 +135,20 @@ def wait_for_final_state(
             in place of any token retrieved when logging in. Defaults to None.
         query_interval_seconds (float, optional): The base interval between job state queries. Defaults to 1.0.
         max_attempts (int, optional): The maximum number of attempts to query the job state. Defaults to 600.
-        out (TextIO, optional): text stream to send output to. Defaults to sys.stdout.
-        report_state (Callable[[NonFinalJobState], None], optional): Callable to report state.
+        timeout (float | None, optional): The maximum duration of the wait in seconds. Defaults to None.
+        deadline (datetime | None, optional): The point in time after which to stop waiting. Naive datetimes are
+            interpreted as local time. Defaults to None.
+        cancel (threading.Event | None, optional): An event that cancels the wait when set. Defaults to None.
+        out (TextIO | None, optional): text stream to send output to, None for no output. Defaults to sys.stdout.
+        report_state (Callable[[NonFinalJobState], None], optional): Callable to report state changes.
+        polling (PollingStrategy | None, optional): The strategy deciding the wait between queries, e.g.
+            `AdaptivePolling`. Defaults to a jittered fixed interval based on `query_interval_seconds`.
+        priority (float, optional): The relative share of the application's polling budget the wait gets when the
+            budget is exhausted. Defaults to 1.0.
+        events (EventSink | None, optional): A sink receiving the events of the wait, such as state changes, poll
+            latencies and token refreshes, e.g. a `QueueSink` or an `AsyncEventStream`. Defaults to None.
+        number_of_circuits (int | None, optional): The number of circuits in the job, which lets `AdaptivePolling`
+            estimate the time remaining. Defaults to None.
 
     Raises:
         NotAuthenticatedError: if the user is not authenticated and no access token is available.
@@ -68,38 +158,272 @@ def wait_for_final_state(
         UnknownServerError: If the Arnica API encounters an internal error.
         RuntimeError: For any other unexpected errors.
         TimeoutError: If the maximum wait time is exceeded.
+        WaitCancelledError: If the wait is cancelled.
 
     Returns:
         JobState: the final state of the job.
     """
+    monotonic_deadline = _monotonic_deadline(timeout, deadline)
     token = api_token or app.auth_service.get_or_refresh_access_token(app.config.store_access_token)
     if not token:
         raise NotAuthenticatedError("User not authenticated. Please log in.")
 
-    # User-managed token provided, don't attempt to refresh
-    if api_token:
-        return app.job_service.wait_for_result(
-            token,
-            job_id,
+    return app.job_service.wait_for_result(
+        token,
+        job_id,
+        refresh_token=_token_refresher(app, api_token),
+        query_interval_seconds=query_interval_seconds,
+        max_attempts=max_attempts,
+        deadline=monotonic_deadline,
+        cancel=cancel,
+        out=out,
+        report_state=report_state,
+        polling=polling,
+        priority=priority,
+        events=events,
+        number_of_circuits=number_of_circuits,
+    )
+
+
+def wait_for_final_states(
+    app: ArnicaApp,
+    job_ids: Iterable[UUID],
+    *,
+    api_token: str | None = None,
+    query_interval_seconds: float = 1.0,
+    max_attempts: int = 600,
+    timeout: float | None = None,
+    deadline: datetime | None = None,
+    cancel: threading.Event | None = None,
+    max_concurrency: int = 8,
+    out: TextIO | None = sys.stdout,
+    report_state: Callable[[UUID, NonFinalJobState], None] | None = None,
+    polling: PollingStrategy | None = None,
+    priority: float = 1.0,
+    events: EventSink | None = None,
+    number_of_circuits: Mapping[UUID, int] | None = None,
+) -> Iterator[tuple[UUID, FinalJobState]]:
+    """Wait for several jobs to reach a final state, yielding each job as soon as it finishes.
+
+    All jobs are polled by a single scheduler over the application's shared connection pool, so waiting on many jobs
+    does not require a thread per job. A finished state includes jobs that have succeeded, failed, or been cancelled.
+
+    Args:
+        app (ArnicaApp): the application instance.
+        job_ids (Iterable[UUID]): the unique identifiers of the jobs. Duplicates are ignored.
+        api_token (str | None, optional): a static API token to use for authentication. This will be used
+            in place of any token retrieved when logging in. Defaults to None.
+        query_interval_seconds (float, optional): The base interval between queries of the same job. Defaults to 1.0.
+        max_attempts (int, optional): The maximum number of attempts to query the state of each job. Defaults to 600.
+        timeout (float | None, optional): The maximum duration of the wait in seconds. Defaults to None.
+        deadline (datetime | None, optional): The point in time after which to stop waiting. Naive datetimes are
+            interpreted as local time. Defaults to None.
+        cancel (threading.Event | None, optional): An event that cancels the wait when set. Defaults to None.
+        max_concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+        out (TextIO | None, optional): text stream to send output to, None for no output. Defaults to sys.stdout.
+        report_state (Callable[[UUID, NonFinalJobState], None], optional): Callable to report state changes of jobs
+            that have not finished yet.
+        polling (PollingStrategy | None, optional): The strategy deciding the wait between queries of the same job,
+            e.g. `AdaptivePolling`. Defaults to a jittered fixed interval based on `query_interval_seconds`.
+        priority (float, optional): The relative share of the application's polling budget each of the jobs gets
+            when the budget is exhausted. Defaults to 1.0.
+        events (EventSink | None, optional): A sink receiving the events of the wait of each job. Defaults to None.
+        number_of_circuits (Mapping[UUID, int] | None, optional): The number of circuits in each job, where known,
+            which lets `AdaptivePolling` estimate the time remaining. Defaults to None.
+
+    Raises:
+        NotAuthenticatedError: if the user is not authenticated and no access token is available.
+        NotAuthenticatedError: If the provided token is invalid or expired.
+        JobNotFoundError: If a job with one of the specified IDs does not exist.
+        InvalidJobIDError: If one of the provided job IDs is not valid.
+        UnknownServerError: If the Arnica API encounters an internal error.
+        RuntimeError: For any other unexpected errors.
+        TimeoutError: If the maximum wait time for a job is exceeded.
+        WaitCancelledError: If the wait is cancelled.
+
+    Returns:
+        Iterator[tuple[UUID, FinalJobState]]: the ID and final state of each job, in order of completion.
+    """
+    monotonic_deadline = _monotonic_deadline(timeout, deadline)
+    token = api_token or app.auth_service.get_or_refresh_access_token(app.config.store_access_token)
+    if not token:
+        raise NotAuthenticatedError("User not authenticated. Please log in.")
+
+    return app.job_service.wait_for_results(
+        token,
+        job_ids,
+        refresh_token=_token_refresher(app, api_token),
+        query_interval_seconds=query_interval_seconds,
+        max_attempts=max_attempts,
+        deadline=monotonic_deadline,
+        cancel=cancel,
+        max_concurrency=max_concurrency,
+        out=out,
+        report_state=report_state,
+        polling=polling,
+        priority=priority,
+        events=events,
+        number_of_circuits=number_of_circuits,
+    )
+
+
+def gather_final_states(
+    app: ArnicaApp,
+    job_ids: Iterable[UUID],
+    *,
+    api_token: str | None = None,
+    query_interval_seconds: float = 1.0,
+    max_attempts: int = 600,
+    timeout: float | None = None,
+    deadline: datetime | None = None,
+    cancel: threading.Event | None = None,
+    max_concurrency: int = 8,
+    out: TextIO | None = sys.stdout,
+    report_state: Callable[[UUID, NonFinalJobState], None] | None = None,
+    polling: PollingStrategy | None = None,
+    priority: float = 1.0,
+    events: EventSink | None = None,
+    number_of_circuits: Mapping[UUID, int] | None = None,
+) -> dict[UUID, FinalJobState]:
+    """Wait for all given jobs to reach a final state.
+
+    See `wait_for_final_states` for a description of the arguments and the raised exceptions.
+
+    Returns:
+        dict[UUID, FinalJobState]: the final state of each job, keyed by job ID in order of completion.
+    """
+    return dict(
+        wait_for_final_states(
+            app,
+            job_ids,
+            api_token=api_token,
             query_interval_seconds=query_interval_seconds,
             max_attempts=max_attempts,
+            timeout=timeout,
+            deadline=deadline,
+            cancel=cancel,
+            max_concurrency=max_concurrency,
             out=out,
             report_state=report_state,
+            polling=polling,
+            priority=priority,
+            events=events,
+            number_of_circuits=number_of_circuits,
+        )
+    )
+
+
+def watch_job(
+    app: ArnicaApp,
+    job_id: UUID,
+    *,
+    api_token: str | None = None,
+    query_interval_seconds: float = 1.0,
+    out: TextIO | None = sys.stdout,
+    polling: PollingStrategy | None = None,
+    priority: float = 1.0,
+    events: EventSink | None = None,
+    number_of_circuits: int | None = None,
+) -> "JobHandle":
+    """Start watching a job, without blocking.
+
+    The returned handle is a `concurrent.futures.Future` resolving to the final state of the job. It is resolved by a
+    background poller shared by all handles of the application, and can be awaited in async code. Cancelling it stops
+    watching the job, without cancelling the job itself. Watching a job that is already being watched shares its poll,
+    with the polling strategy and priority of the first watch.
+
+    Args:
+        app (ArnicaApp): the application instance.
+        job_id (UUID): the unique identifier of the job.
+        api_token (str | None, optional): a static API token to use for authentication. This will be used
+            in place of any token retrieved when logging in. Defaults to None.
+        query_interval_seconds (float, optional): The base interval between job state queries. Defaults to 1.0.
+        out (TextIO | None, optional): text stream to send output to, None for no output. Defaults to sys.stdout.
+        polling (PollingStrategy | None, optional): The strategy deciding the wait between queries. Defaults to
+            `FixedIntervalPolling` with the given query interval.
+        priority (float, optional): The relative share of the global polling budget the job gets when the budget is
+            exhausted. Defaults to 1.0.
+        events (EventSink | None, optional): A sink receiving the events of the wait, sent from the background
+            poller. Defaults to None.
+        number_of_circuits (int | None, optional): The number of circuits in the job, which lets `AdaptivePolling`
+            estimate the time remaining. Defaults to None.
+
+    Raises:
+        NotAuthenticatedError: if the user is not authenticated and no access token is available.
+
+    Returns:
+        JobHandle: the handle resolving to the final state of the job. It fails with the exceptions raised by
+            `wait_for_final_state`, except for timeouts and cancellation.
+    """
+    return watch_jobs(
+        app,
+        [job_id],
+        api_token=api_token,
+        query_interval_seconds=query_interval_seconds,
+        out=out,
+        polling=polling,
+        priority=priority,
+        events=events,
+        number_of_circuits=None if number_of_circuits is None else {job_id: number_of_circuits},
+    )[0]
+
+
+def watch_jobs(
+    app: ArnicaApp,
+    job_ids: Iterable[UUID],
+    *,
+    api_token: str | None = None,
+    query_interval_seconds: float = 1.0,
+    out: TextIO | None = sys.stdout,
+    polling: PollingStrategy | None = None,
+    priority: float = 1.0,
+    events: EventSink | None = None,
+    number_of_circuits: Mapping[UUID, int] | None = None,
+) -> "list[JobHandle]":
+    """Start watching several jobs, without blocking.
+
+    The handles work with `concurrent.futures.wait` and `concurrent.futures.as_completed`. See `watch_job` for a
+    description of the arguments and the handles, the number of circuits being given per job ID where known.
+
+    Returns:
+        list[JobHandle]: a handle per given job ID, in the same order.
+    """
+    token = api_token or app.auth_service.get_or_refresh_access_token(app.config.store_access_token)
+    if not token:
+        raise NotAuthenticatedError("User not authenticated. Please log in.")
+
+    strategy = polling or FixedIntervalPolling(query_interval_seconds)
+    return [
+        app.job_watcher.watch(
+            token,
+            job_id,
+            refresh_token=_token_refresher(app, api_token),
+            polling=strategy,
+            priority=priority,
+            out=out,
+            events=events,
+            number_of_circuits=(number_of_circuits or {}).get(job_id),
         )
+        for job_id in job_ids
+    ]
+
+
+def _token_refresher(app: ArnicaApp, api_token: str | None) -> Callable[[str], str | None] | None:
+    """Refreshes the access token of the app when rejected, unless a user-managed token was provided."""
+    if api_token:
+        return None
+
+    def refresh_token(rejected: str) -> str | None:
+        return app.auth_service.get_or_refresh_access_token(app.config.store_access_token, rejected=rejected)
+
+    return refresh_token
+
 
-    # Token to refresh as needed
-    while True:
-        try:
-            return app.job_service.wait_for_result(
-                token,
-                job_id,
-                query_interval_seconds=query_interval_seconds,
-                max_attempts=max_attempts,
-                out=out,
-                report_state=report_state,
-            )
-        except NotAuthenticatedError:
-            refreshed = app.auth_service.get_or_refresh_access_token(app.config.store_access_token)
-            if not refreshed or refreshed == token:
-                raise
-            token = refreshed
+def _monotonic_deadline(timeout: float | None, deadline: datetime | None) -> float | None:
+    """Combines a timeout and a wall-clock deadline into the earliest deadline on the monotonic clock."""
+    deadlines = []
+    if timeout is not None:
+        deadlines.append(time.monotonic() + timeout)
+    if deadline is not None:
+        deadlines.append(time.monotonic() + (deadline - datetime.now(deadline.tzinfo)).total_seconds())
+    return min(deadlines, default=None)
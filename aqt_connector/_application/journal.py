@@ -0,0 +1,69 @@
+from uuid import UUID
+
+from aqt_connector._arnica_app import ArnicaApp
+from aqt_connector._infrastructure.job_journal import JobJournal, JournalEntry
+from aqt_connector.models.arnica.jobs import JobStatus
+
+
+def track_job(
+    app: ArnicaApp,
+    job_id: UUID,
+    *,
+    label: str | None = None,
+    workspace_id: str | None = None,
+    resource_id: str | None = None,
+) -> None:
+    """Record a job in the journal, e.g. right after submitting it, so that it can be found again after a restart.
+
+    Args:
+        app (ArnicaApp): the application instance.
+        job_id (UUID): the unique identifier of the job.
+        label (str | None, optional): the label of the job. Defaults to None.
+        workspace_id (str | None, optional): the workspace the job was submitted to. Defaults to None.
+        resource_id (str | None, optional): the resource the job was submitted to. Defaults to None.
+
+    Raises:
+        RuntimeError: if the journal is not enabled in the configuration.
+    """
+    _journal(app).track(job_id, label=label, workspace_id=workspace_id, resource_id=resource_id)
+
+
+def journal_entries(app: ArnicaApp, *, status: JobStatus | None = None, label: str | None = None) -> list[JournalEntry]:
+    """List the jobs in the journal, without querying the Arnica API.
+
+    Args:
+        app (ArnicaApp): the application instance.
+        status (JobStatus | None, optional): only list the jobs last known to have this status. Defaults to None.
+        label (str | None, optional): only list the jobs with this label. Defaults to None.
+
+    Raises:
+        RuntimeError: if the journal is not enabled in the configuration.
+
+    Returns:
+        list[JournalEntry]: the matching jobs, least recently updated first.
+    """
+    return _journal(app).entries(status=status, label=label)
+
+
+def unfinished_jobs(app: ArnicaApp, *, label: str | None = None) -> list[JournalEntry]:
+    """List the jobs in the journal that are not known to have finished, without querying the Arnica API.
+
+    These are the jobs to resume waiting for after a restart.
+
+    Args:
+        app (ArnicaApp): the application instance.
+        label (str | None, optional): only list the jobs with this label. Defaults to None.
+
+    Raises:
+        RuntimeError: if the journal is not enabled in the configuration.
+
+    Returns:
+        list[JournalEntry]: the matching jobs, least recently updated first.
+    """
+    return _journal(app).unfinished(label=label)
+
+
+def _journal(app: ArnicaApp) -> JobJournal:
+    if app.job_journal is None:
+        raise RuntimeError("The job journal is not enabled. Set the `journal` option in the configuration.")
+    return app.job_journal
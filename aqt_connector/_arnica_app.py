@@ -1,21 +1,82 @@
-from contextlib import ExitStack
+import os
+import threading
+import weakref
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast, overload
 
 from typing_extensions import Self
 
+from aqt_connector._data_types import OfflineAccessTokens
 from aqt_connector._domain.auth_service import AuthService
 from aqt_connector._domain.job_service import JobService
 from aqt_connector._domain.oidc_service import OIDCService
+from aqt_connector._domain.poll_scheduler import PollScheduler
 from aqt_connector._infrastructure.access_token_verifier import AccessTokenVerifier, AccessTokenVerifierConfig
 from aqt_connector._infrastructure.arnica_adapter import ArnicaAdapter
 from aqt_connector._infrastructure.auth0_adapter import Auth0Adapter
+from aqt_connector._infrastructure.job_journal import JobJournal
+from aqt_connector._infrastructure.result_cache import ResultCache
 from aqt_connector._infrastructure.token_repository import TokenRepository
 from aqt_connector._sdk_config import ArnicaConfig
 
+if TYPE_CHECKING:
+    from aqt_connector._domain.job_watcher import JobWatcher
+
 DEFAULT_CONFIG = ArnicaConfig()
 
+_T = TypeVar("_T")
+
+
+class _BuiltOnFirstUse(Generic[_T]):
+    """An attribute of the app built on first use, once even when first used by several threads at the same time.
+
+    Like `functools.cached_property`, the built value is stored in the dict of the app, where it can be replaced or
+    dropped to be built anew.
+    """
+
+    def __init__(self, build: Callable[["ArnicaApp"], _T]) -> None:
+        self._build = build
+        self.__doc__ = build.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    @overload
+    def __get__(self, app: None, owner: type) -> Self: ...
+
+    @overload
+    def __get__(self, app: "ArnicaApp", owner: type) -> _T: ...
+
+    def __get__(self, app: "ArnicaApp | None", owner: type) -> "_T | Self":
+        if app is None:
+            return self
+        try:
+            return cast(_T, app.__dict__[self._name])
+        except KeyError:
+            pass
+        with app._build_lock:
+            if self._name not in app.__dict__:
+                app.__dict__[self._name] = self._build(app)
+            return cast(_T, app.__dict__[self._name])
+
+    def __set__(self, app: "ArnicaApp", value: _T) -> None:
+        app.__dict__[self._name] = value
+
 
 class ArnicaApp:
-    """Holds the initialization information for the application."""
+    """Holds the initialization information for the application.
+
+    An instance is meant to be shared by all threads of a process, with a single connection pool and token session:
+    all functions taking the app may be called concurrently. When the access token expires or is rejected, one thread
+    refreshes it while the others wait for and then share the new token, and tokens are stored atomically. Waits on
+    the same job share a single poller, and all waits share the polling budget. Closing the app while it is in use by
+    other threads is not supported.
+
+    An instance can also be used across processes. In a process forked from the one that created it, the app drops
+    the connections, locks, waits and watched jobs inherited from the parent, keeping the token session, and creates
+    new HTTP clients and opens the job journal anew on first use. For spawn-based pools, the app is pickled as its
+    configuration and token session.
+    """
 
     def __init__(self, config: ArnicaConfig = DEFAULT_CONFIG) -> None:
         """
@@ -24,7 +85,13 @@ class ArnicaApp:
                 an unmodified instance of `ArnicaConfig`.
         """
         self.config = config
+        self._build(session_tokens=None)
+        _LIVE_APPS.add(self)
 
+    def _build(self, session_tokens: OfflineAccessTokens | None) -> None:
+        """Creates the adapters and the authentication services, which don't open any connection until used. The
+        other services are built on first use."""
+        config = self.config
         token_verifier = AccessTokenVerifier(
             AccessTokenVerifierConfig(
                 jwks_url=config.oidc_config.jwks_url,
@@ -32,25 +99,92 @@ class ArnicaApp:
                 allowed_audiences=[config.arnica_url, config.oidc_config.device_client_id],
             )
         )
+        self._build_lock = threading.RLock()
+        self._auth0_adapter = Auth0Adapter(config.oidc_config)
+        self._arnica_adapter = ArnicaAdapter(config.arnica_url, lazy_results=config.lazy_results)
+        self.oidc_service = OIDCService(self._auth0_adapter, token_verifier)
+        self.auth_service = AuthService(token_verifier, TokenRepository(config._app_dir), self.oidc_service)
+        self.auth_service.session_tokens = session_tokens
 
-        with ExitStack() as stack:
-            self._auth0_adapter = Auth0Adapter(config.oidc_config)
-            stack.callback(self._auth0_adapter.close)
-            self._arnica_adapter = ArnicaAdapter(self.config.arnica_url)
-            stack.callback(self._arnica_adapter.close)
+    @_BuiltOnFirstUse
+    def poll_scheduler(self) -> PollScheduler | None:
+        """The scheduler sharing the polling budget between all waits. Without a budget, waits poll at the pace of
+        their strategy."""
+        max_polls_per_second = self.config.max_polls_per_second
+        return PollScheduler(max_polls_per_second) if max_polls_per_second else None
 
-            self.oidc_service = OIDCService(self._auth0_adapter, token_verifier)
-            self.auth_service = AuthService(token_verifier, TokenRepository(config._app_dir), self.oidc_service)
-            self.job_service = JobService(self._arnica_adapter)
+    @_BuiltOnFirstUse
+    def job_journal(self) -> JobJournal | None:
+        """The journal of jobs, if enabled."""
+        return JobJournal(self.config._app_dir / "journal.sqlite3") if self.config.journal else None
 
-            stack.pop_all()
+    @_BuiltOnFirstUse
+    def result_cache(self) -> ResultCache | None:
+        """The cache of final states, if enabled."""
+        config = self.config
+        if not config.result_cache:
+            return None
+        return ResultCache(
+            config._app_dir / "result_cache",
+            memory_bytes=int(config.result_cache_memory_mb * 1024**2),
+            disk_bytes=int(config.result_cache_disk_mb * 1024**2),
+        )
+
+    @_BuiltOnFirstUse
+    def job_service(self) -> JobService:
+        """The service fetching and waiting on jobs."""
+        return JobService(self._arnica_adapter, self.poll_scheduler, self.job_journal, self.result_cache)
+
+    @_BuiltOnFirstUse
+    def job_watcher(self) -> "JobWatcher":
+        """The watcher polling jobs in the background."""
+        # Imported on first use, as concurrent.futures takes long to import
+        from aqt_connector._domain.job_watcher import JobWatcher
+
+        return JobWatcher(
+            self._arnica_adapter, self.poll_scheduler, journal=self.job_journal, result_cache=self.result_cache
+        )
+
+    def _after_fork(self) -> None:
+        """Resets the clients and locks inherited from the parent process without closing them, as the parent is
+        still using them, keeping the token session. The services holding waits, watched jobs or the journal are
+        dropped, to be built anew on first use."""
+        self._build_lock = threading.RLock()
+        self._auth0_adapter.reset_after_fork()
+        self._arnica_adapter.reset_after_fork()
+        self.auth_service.reset_after_fork()
+        journal = self.__dict__.pop("job_journal", None)
+        if journal:
+            journal.abandon_after_fork()
+        for name in ("poll_scheduler", "result_cache", "job_service", "job_watcher"):
+            self.__dict__.pop(name, None)
 
     def close(self) -> None:
-        """Closes all underlying HTTP clients and releases their connection pools."""
+        """Stops watching jobs, cancelling pending job handles, and closes all underlying HTTP clients, releasing
+        their connection pools, as well as the job journal."""
+        _LIVE_APPS.discard(self)
+        job_watcher: JobWatcher | None = self.__dict__.get("job_watcher")
+        job_journal: JobJournal | None = self.__dict__.get("job_journal")
         try:
-            self._auth0_adapter.close()
+            if job_watcher:
+                job_watcher.close()
         finally:
-            self._arnica_adapter.close()
+            try:
+                self._auth0_adapter.close()
+            finally:
+                try:
+                    self._arnica_adapter.close()
+                finally:
+                    if job_journal:
+                        job_journal.close()
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"config": self.config, "session_tokens": self.auth_service.session_tokens}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.config = state["config"]
+        self._build(state["session_tokens"])
+        _LIVE_APPS.add(self)
 
     def __enter__(self) -> Self:
         return self
@@ -58,3 +192,15 @@ class ArnicaApp:
     def __exit__(self, exc_type: type | None, exc_value: BaseException | None, traceback: object | None) -> bool | None:
         self.close()
         return None
+
+
+_LIVE_APPS: "weakref.WeakSet[ArnicaApp]" = weakref.WeakSet()
+
+
+def _rebuild_apps_after_fork() -> None:
+    for app in list(_LIVE_APPS):
+        app._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_rebuild_apps_after_fork)
@@ -1,11 +1,13 @@
 from typing import NamedTuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class DeviceCodeData(BaseModel):
     """Data required to authenticate a device."""
 
+    model_config = ConfigDict(defer_build=True)
+
     verification_uri_complete: str
     user_code: str
     device_code: str
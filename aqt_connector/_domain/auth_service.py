@@ -1,3 +1,6 @@
+import threading
+
+from aqt_connector._data_types import OfflineAccessTokens
 from aqt_connector._domain.oidc_service import OIDCService
 from aqt_connector._infrastructure.access_token_verifier import AccessTokenVerifier
 from aqt_connector._infrastructure.token_repository import TokenRepository
@@ -5,7 +8,15 @@ from aqt_connector.exceptions import TokenValidationError
 
 
 class AuthService:
-    """Manages access tokens."""
+    """Manages access tokens.
+
+    The service is thread-safe. When the access token needs refreshing, a single thread refreshes it while the others
+    wait for and then share the new token, so a refresh token is never redeemed twice.
+
+    Attributes:
+        session_tokens (OfflineAccessTokens | None): the tokens obtained by the last refresh, kept for the session even
+            when they aren't stored.
+    """
 
     def __init__(
         self, access_token_verifier: AccessTokenVerifier, token_repository: TokenRepository, oidc_service: OIDCService
@@ -20,6 +31,13 @@ class AuthService:
         self._token_verifier = access_token_verifier
         self._token_repo = token_repository
         self._oidc_service = oidc_service
+        self._refresh_lock = threading.Lock()
+        self.session_tokens: OfflineAccessTokens | None = None
+
+    def reset_after_fork(self) -> None:
+        """Replaces the lock inherited from the parent process, which another of its threads may have held, keeping the
+        token session."""
+        self._refresh_lock = threading.Lock()
 
     def get_access_token(self) -> str | None:
         """Loads an access token if a valid one is stored.
@@ -45,23 +63,49 @@ class AuthService:
         """
         self._token_repo.save_access_token(access_token)
 
-    def get_or_refresh_access_token(self, store: bool) -> str | None:
+    def get_or_refresh_access_token(self, store: bool, rejected: str | None = None) -> str | None:
         """Gets an access token for the current user session, or refreshes it.
 
+        The tokens obtained by a refresh are kept for the session even when they aren't stored.
+
         Args:
             store (bool): whether to store the access token.
+            rejected (str | None, optional): an access token the Arnica API has rejected, which is refreshed even if
+                it still looks valid. Defaults to None.
 
         Returns:
             str | None: the access token if available, otherwise None.
         """
-        if existing_token := self.get_access_token():
+        if existing_token := self._current_access_token(rejected):
             return existing_token
 
-        if refresh_token := self._token_repo.load_refresh_token():
-            new_access_token, next_refresh_token = self._oidc_service.authenticate_with_refresh_token(refresh_token)
+        with self._refresh_lock:
+            # Another thread may have refreshed the token while this one was waiting
+            if existing_token := self._current_access_token(rejected):
+                return existing_token
+
+            session_tokens = self.session_tokens
+            refresh_token = self._token_repo.load_refresh_token() if store or session_tokens is None else None
+            if refresh_token is None and session_tokens is not None:
+                refresh_token = session_tokens.refresh_token
+            if not refresh_token:
+                return None
+
+            tokens = self._oidc_service.authenticate_with_refresh_token(refresh_token)
+            self.session_tokens = tokens
             if store:
-                self.save_access_token(new_access_token)
-                self._token_repo.save_refresh_token(next_refresh_token)
-            return new_access_token
+                self.save_access_token(tokens.access_token)
+                self._token_repo.save_refresh_token(tokens.refresh_token)
+            return tokens.access_token
 
+    def _current_access_token(self, rejected: str | None) -> str | None:
+        """The valid access token of the session or the stored one, unless it has been rejected."""
+        session_tokens = self.session_tokens
+        for token in (session_tokens.access_token if session_tokens else None, self._token_repo.load_access_token()):
+            if token is None or token == rejected:
+                continue
+            try:
+                return self._token_verifier.verify_access_token(token)
+            except TokenValidationError:
+                continue
         return None
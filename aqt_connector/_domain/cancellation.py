@@ -0,0 +1,52 @@
+"""Cancellation of waits from other threads."""
+
+import threading
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+
+
+class CancelEvent(threading.Event):
+    """An event that cancels the waits it is given when set, like any `threading.Event`.
+
+    A wait on a job that another wait is already polling blocks until that poll has news for it. Setting a
+    `CancelEvent` wakes such a wait right away, while other events are only checked every `CANCEL_CHECK_SECONDS`.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._conditions_lock = threading.Lock()
+        self._conditions: list[threading.Condition] = []
+
+    def set(self) -> None:
+        super().set()
+        with self._conditions_lock:
+            conditions = list(self._conditions)
+        for condition in conditions:
+            with condition:
+                condition.notify_all()
+
+    @contextmanager
+    def notifying(self, condition: threading.Condition) -> Iterator[None]:
+        """Notifies the condition when the event is set, while in the context.
+
+        Args:
+            condition (threading.Condition): the condition a wait blocks on. Its lock must not be held on entry.
+        """
+        with self._conditions_lock:
+            self._conditions.append(condition)
+        try:
+            yield
+        finally:
+            with self._conditions_lock:
+                self._conditions.remove(condition)
+
+
+CANCEL_CHECK_SECONDS = 0.1
+"""How often a wait blocked on another wait's poll checks whether an event other than a `CancelEvent` is set."""
+
+
+def notified_on_cancel(cancel: threading.Event | None, condition: threading.Condition) -> AbstractContextManager[None]:
+    """Notifies the condition when the wait is cancelled, if the cancel event supports it."""
+    if isinstance(cancel, CancelEvent):
+        return cancel.notifying(condition)
+    return nullcontext()
@@ -0,0 +1,173 @@
+"""Aggregation of the results of many jobs into count tables, e.g. for parameter sweeps."""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from collections.abc import Hashable, Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+from aqt_connector._domain.wait_events import JobFinished, WaitEvent
+from aqt_connector.models.arnica.response_bodies import result_analysis
+from aqt_connector.models.arnica.response_bodies.jobs import RRFinished
+from aqt_connector.models.arnica.response_bodies.shot_arrays import import_numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+
+class CountsAccumulator:
+    """Folds the results of finished jobs into a count table per circuit key as they arrive, dropping their shots.
+
+    The memory used thus grows with the number of distinct outcomes rather than with the number of shots and jobs.
+    By default, the circuits of all jobs are keyed by their index, so that the results of jobs running the same
+    circuits are aggregated. Outcomes are encoded as integers, the first qubit being the least significant bit.
+
+    An accumulator may be shared between threads, and accumulators filled by different threads or processes can be
+    merged, as they pickle as their count tables. It is also an event sink: given as the events of a wait, it folds
+    the results of the jobs as they finish. It requires the `numpy` extra.
+    """
+
+    def __init__(self, *, keep_shots: bool = False) -> None:
+        """
+        Args:
+            keep_shots (bool, optional): whether to also keep the shots of each circuit key. Defaults to False.
+        """
+        self.keep_shots = keep_shots
+        self.jobs_added = 0
+        self._counts: dict[Hashable, Counter[int]] = {}
+        self._shots: dict[Hashable, list[NDArray[np.uint8]]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, state: RRFinished, *, circuit_keys: Mapping[int, Hashable] | None = None) -> None:
+        """Folds the results of a finished job into the count tables.
+
+        Args:
+            state (RRFinished): the final state of the job.
+            circuit_keys (Mapping[int, Hashable] | None, optional): the key of each circuit of the job, e.g. the
+                parameters it was run with. Circuits without a key are keyed by their index. Defaults to None.
+        """
+        keys = circuit_keys or {}
+        arrays = [(keys.get(circuit, circuit), state.result_array(circuit)) for circuit in state.circuits()]
+        self._fold(arrays, jobs=1)
+
+    def add_shots(self, key: Hashable, shots: NDArray[np.uint8]) -> None:
+        """Folds the shots of a single circuit into the count table of a key.
+
+        Args:
+            key (Hashable): the circuit key.
+            shots (NDArray[np.uint8]): the shots, as an array of bits of shape (shots, qubits).
+        """
+        self._fold([(key, shots)], jobs=0)
+
+    def merge(self, other: CountsAccumulator) -> None:
+        """Adds the count tables of another accumulator, e.g. one filled by another thread or process.
+
+        Args:
+            other (CountsAccumulator): the accumulator to merge into this one, which is left unchanged.
+        """
+        with other._lock:
+            counts = {key: Counter(table) for key, table in other._counts.items()}
+            shots = {key: list(arrays) for key, arrays in other._shots.items()}
+            jobs = other.jobs_added
+        with self._lock:
+            for key, table in counts.items():
+                self._counts.setdefault(key, Counter()).update(table)
+            if self.keep_shots:
+                for key, arrays in shots.items():
+                    self._shots.setdefault(key, []).extend(arrays)
+            self.jobs_added += jobs
+
+    def keys(self) -> list[Hashable]:
+        """The circuit keys with results, in the order they were first added."""
+        with self._lock:
+            return list(self._counts)
+
+    def counts(self, key: Hashable) -> dict[int, int]:
+        """The number of shots of each outcome that occurred for a circuit key.
+
+        Args:
+            key (Hashable): the circuit key.
+
+        Raises:
+            KeyError: if no results were added for the key.
+
+        Returns:
+            dict[int, int]: the number of shots of each outcome, by increasing outcome.
+        """
+        with self._lock:
+            return dict(sorted(self._counts[key].items()))
+
+    def total_shots(self, key: Hashable) -> int:
+        """The number of shots added for a circuit key.
+
+        Raises:
+            KeyError: if no results were added for the key.
+        """
+        with self._lock:
+            return self._counts[key].total()
+
+    def parity_expectation(self, key: Hashable, qubits: Sequence[int]) -> float:
+        """The expectation value of the product of Pauli Z operators on a subset of the qubits, from the counts.
+
+        Args:
+            key (Hashable): the circuit key.
+            qubits (Sequence[int]): the qubits the operators act on. A qubit given twice cancels out, as the product of
+                two Z operators on the same qubit is the identity.
+
+        Raises:
+            KeyError: if no results were added for the key.
+            ValueError: if no shots were added for the key.
+
+        Returns:
+            float: the expectation value, between -1 and 1.
+        """
+        return result_analysis.counts_parity_expectation(self.counts(key), qubits)
+
+    def shots(self, key: Hashable) -> NDArray[np.uint8]:
+        """The shots added for a circuit key, in the order they were added.
+
+        Args:
+            key (Hashable): the circuit key.
+
+        Raises:
+            RuntimeError: if the accumulator doesn't keep shots.
+            KeyError: if no results were added for the key.
+
+        Returns:
+            NDArray[np.uint8]: the shots, as an array of bits of shape (shots, qubits).
+        """
+        if not self.keep_shots:
+            raise RuntimeError("The accumulator doesn't keep shots. Create it with `keep_shots=True`.")
+        with self._lock:
+            arrays = [shots for shots in self._shots[key] if shots.size]
+        np = import_numpy()
+        return np.concatenate(arrays) if arrays else np.zeros((0, 0), dtype=np.uint8)
+
+    def __call__(self, event: WaitEvent) -> None:
+        """Folds the results of a job that finished successfully, so that the accumulator can be used as a sink."""
+        if isinstance(event, JobFinished) and isinstance(event.state, RRFinished):
+            self.add(event.state)
+
+    def _fold(self, arrays: Iterable[tuple[Hashable, NDArray[np.uint8]]], *, jobs: int) -> None:
+        # Counted before taking the lock, so that threads only wait for each other to update the tables
+        counted = [(key, result_analysis.counts(shots), shots) for key, shots in arrays]
+        with self._lock:
+            for key, counts, shots in counted:
+                self._counts.setdefault(key, Counter()).update(counts)
+                if self.keep_shots:
+                    self._shots.setdefault(key, []).append(shots)
+            self.jobs_added += jobs
+
+    def __getstate__(self) -> dict[str, Any]:
+        with self._lock:
+            state = self.__dict__.copy()
+            state["_counts"] = {key: Counter(table) for key, table in self._counts.items()}
+            state["_shots"] = {key: list(arrays) for key, arrays in self._shots.items()}
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
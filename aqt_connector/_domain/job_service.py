@@ -1,23 +1,60 @@
-import random
+import heapq
 import sys
+import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from typing import TextIO, cast
 from uuid import UUID
 
+from aqt_connector._domain.cancellation import CANCEL_CHECK_SECONDS, CancelEvent, notified_on_cancel
+from aqt_connector._domain.poll_scheduler import PollRegistration, PollScheduler
+from aqt_connector._domain.polling import FixedIntervalPolling, PollContext, PollingStrategy
+from aqt_connector._domain.wait_events import (
+    BackedOff,
+    EventSink,
+    JobFinished,
+    PollFinished,
+    PollStarted,
+    StateChanged,
+    TextSink,
+    TokenRefreshed,
+    TransientErrorEncountered,
+    WaitEvent,
+    combine_sinks,
+)
 from aqt_connector._infrastructure.arnica_adapter import ArnicaAdapter
-from aqt_connector.exceptions import RequestError
+from aqt_connector._infrastructure.job_journal import JobJournal
+from aqt_connector._infrastructure.result_cache import ResultCache
+from aqt_connector._infrastructure.result_stream import ShotSink
+from aqt_connector.exceptions import NotAuthenticatedError, RequestError, WaitCancelledError
 from aqt_connector.models.arnica.response_bodies.jobs import FinalJobState, JobState, NonFinalJobState
 
 
 class JobService:
-    def __init__(self, arnica: ArnicaAdapter) -> None:
+    def __init__(
+        self,
+        arnica: ArnicaAdapter,
+        scheduler: PollScheduler | None = None,
+        journal: JobJournal | None = None,
+        result_cache: ResultCache | None = None,
+    ) -> None:
         """Initialises the JobService with the given ArnicaAdapter.
 
         Args:
             arnica (ArnicaAdapter): The Arnica adapter to use for fetching job states.
+            scheduler (PollScheduler | None, optional): The scheduler sharing a global polling budget between all
+                waits. When None, every wait polls at its own pace. Defaults to None.
+            journal (JobJournal | None, optional): The journal to record the statuses of jobs in, and where the result
+                cache stored their final states. Defaults to None.
+            result_cache (ResultCache | None, optional): The cache of final states. Fetches of and waits on cached
+                jobs return without querying them. Defaults to None.
         """
         self.arnica = arnica
+        self.scheduler = scheduler
+        self.journal = journal
+        self.result_cache = result_cache
+        self._lock = threading.Lock()
+        self._shared_waits: dict[UUID, _SharedWait] = {}
 
     def fetch_job_state(self, token: str, job_id: UUID) -> JobState:
         """Fetches the state of a job with the given ID using the provided token.
@@ -34,64 +71,642 @@ class JobService:
             UnknownServerError: If the Arnica API encounters an internal error.
             RuntimeError: For any other unexpected errors.
         """
-        return self.arnica.fetch_job_state(token, job_id)
+        if self.result_cache and (cached := self.result_cache.get(job_id)):
+            return cached
+        state = self.arnica.fetch_job_state(token, job_id)
+        self._record(job_id, state)
+        return state
+
+    def stream_job_state(self, token: str, job_id: UUID, *, sink: ShotSink | None = None) -> JobState:
+        """Fetches the state of a job with the given ID, decoding its results to arrays as they are received.
+
+        Args:
+            token (str): The authentication token to use.
+            job_id (UUID): The ID of the job to fetch the state for.
+            sink (ShotSink | None, optional): Receives the shots of each circuit once decoded, and returns the array
+                to keep in the state. Defaults to None, to keep the arrays in memory.
+
+        Raises:
+            See `fetch_job_state`.
+        """
+        if self.result_cache and (cached := self.result_cache.get(job_id)):
+            return cached
+        state = self.arnica.stream_job_state(token, job_id, sink=sink)
+        self._record(job_id, state)
+        return state
+
+    def fetch_job_states(
+        self, token: str, job_ids: Iterable[UUID], *, max_concurrency: int = 8
+    ) -> dict[UUID, JobState | Exception]:
+        """Fetches the states of several jobs using the provided token.
+
+        Args:
+            token (str): The authentication token to use.
+            job_ids (Iterable[UUID]): The IDs of the jobs to fetch the states for. Duplicates are ignored.
+            max_concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+
+        Returns:
+            dict[UUID, JobState | Exception]: The state of each job, or the exception raised while fetching it, in
+                the order of the given job IDs. See `fetch_job_state` for the possible exceptions.
+        """
+        unique_job_ids = list(dict.fromkeys(job_ids))
+        cached = {
+            job_id: state
+            for job_id in unique_job_ids
+            if self.result_cache and (state := self.result_cache.get(job_id)) is not None
+        }
+        fetched = self.arnica.fetch_job_states(
+            token, [job_id for job_id in unique_job_ids if job_id not in cached], max_concurrency=max_concurrency
+        )
+        for job_id, outcome in fetched.items():
+            if not isinstance(outcome, Exception):
+                self._record(job_id, outcome)
+        if not cached:
+            return fetched
+        outcomes: dict[UUID, JobState | Exception] = {**cached, **fetched}
+        return {job_id: outcomes[job_id] for job_id in unique_job_ids if job_id in outcomes}
 
     def wait_for_result(
         self,
         token: str,
         job_id: UUID,
         *,
+        refresh_token: Callable[[str], str | None] | None = None,
         query_interval_seconds: float = 1.0,
         wait: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
         max_attempts: int = 600,  # 10 minutes (average)
-        out: TextIO = sys.stdout,
+        deadline: float | None = None,
+        cancel: threading.Event | None = None,
+        out: TextIO | None = sys.stdout,
         report_state: Callable[[NonFinalJobState], None] | None = None,
+        polling: PollingStrategy | None = None,
+        priority: float = 1.0,
+        events: EventSink | None = None,
+        number_of_circuits: int | None = None,
     ) -> FinalJobState:
         """Waits for the job with the given ID to complete and returns its final state.
 
-        The endpoint is queried repeatedly until the job reaches a finished state or the maximum
-        number of attempts is reached. Between each query, the function waits for a jittered duration
-        based on the specified query interval.
+        The endpoint is queried repeatedly until the job reaches a finished state, the maximum number of attempts is
+        reached or the deadline passes. Between each query, the function waits for a duration decided by the polling
+        strategy, by default a jittered duration based on the specified query interval. The last query is made when
+        the deadline is reached.
+
+        Setting the `cancel` event from another thread ends the wait. When `wait` is left at its default, a pending
+        sleep wakes up as soon as the event is set. A wait sharing the poll of another wakes up right away if the event
+        is a `CancelEvent`, or within `CANCEL_CHECK_SECONDS` otherwise.
+
+        The progress of the wait is sent as events to the `events` sink, while `report_state` is called whenever the
+        state of the job changes and transient errors are written to `out`.
+
+        Concurrent waits on the same job share a single poller: one of them queries the job on behalf of all, sending
+        the events, including state changes, to every wait and the final state to every wait. Events are sent from
+        the thread of the polling wait. If that wait ends early, for example because its deadline passes, another one
+        takes over. Polling stops once the last wait ends.
+
+        A job whose final state is in the result cache isn't queried at all. With a journal, the status of the job is
+        recorded whenever it changes.
+
+        When the token is rejected and can be refreshed, the job is queried again right away with the new token. The
+        rejected query counts as an attempt, and the polling strategy carries on from where it was.
 
         Args:
             token (str): The authentication token to use.
             job_id (UUID): The ID of the job to wait for.
+            refresh_token (Callable[[str], str | None] | None, optional): Returns a new token when the given, current
+                one is rejected. When None, the wait raises NotAuthenticatedError instead. Defaults to None.
             query_interval_seconds (float, optional): The base interval between job state queries. Defaults to 1.0.
             wait (callable, optional): A callable that takes a duration in seconds to wait. Defaults to time.sleep.
+            clock (callable, optional): A monotonic clock returning the current time in seconds. Defaults to
+                time.monotonic.
             max_attempts (int, optional): The maximum number of attempts to query the job state. Defaults to 600.
-            out (TextIO, optional): text stream to send output to. Defaults to sys.stdout.
-            report_state (Callable[[NonFinalJobState], None], optional): Callable to report state.
+            deadline (float | None, optional): The time, as returned by `clock`, after which to stop waiting.
+                Defaults to None.
+            cancel (threading.Event | None, optional): An event that cancels the wait when set. Defaults to None.
+            out (TextIO | None, optional): text stream to send output to, None for no output. Defaults to sys.stdout.
+            report_state (Callable[[NonFinalJobState], None], optional): Callable to report state changes.
+            polling (PollingStrategy | None, optional): The strategy deciding the wait between queries. Defaults to
+                `FixedIntervalPolling` with the given query interval.
+            priority (float, optional): The relative share of the global polling budget the wait gets when the
+                budget is exhausted. Only used with a scheduler. Defaults to 1.0.
+            events (EventSink | None, optional): The sink to send the events of the wait to. Defaults to None.
+            number_of_circuits (int | None, optional): The number of circuits in the job, passed to the polling
+                strategy to estimate the time remaining. Defaults to None.
 
         Raises:
-            NotAuthenticatedError: If the provided token is invalid or expired.
+            NotAuthenticatedError: If the provided token is invalid or expired, and can't be refreshed.
             JobNotFoundError: If the job with the specified ID does not exist.
             InvalidJobIDError: If the provided job ID is not valid.
             UnknownServerError: If the Arnica API encounters an internal error.
             RuntimeError: For any other unexpected errors.
-            TimeoutError: If the job does not complete within the maximum number of attempts.
+            TimeoutError: If the job does not complete within the maximum number of attempts or before the deadline.
+            WaitCancelledError: If the wait is cancelled.
 
         Returns:
             JobState: The final state of the job once it has completed.
         """
-        attempts = 0
+        if known := self._known_final_state(job_id):
+            return known
+
+        sinks = [TextSink(out) if out else None, events, _state_reporter(report_state) if report_state else None]
+        subscriber = _Subscriber([sink for sink in sinks if sink], max_attempts, deadline, clock)
+        with self._lock:
+            shared = self._shared_waits.get(job_id)
+            if shared is None:
+                shared = self._shared_waits[job_id] = _SharedWait(self._lock, number_of_circuits)
+            shared.subscribers.append(subscriber)
+            current_state = shared.context.state
+
+        try:
+            if current_state is not None and not current_state.is_finished():
+                # Joining a wait in progress, catch up with the state of the job
+                state_changed = StateChanged(job_id, cast(NonFinalJobState, current_state), None)
+                for sink in subscriber.sinks:
+                    sink(state_changed)
+            with notified_on_cancel(cancel, shared.changed), shared.changed:
+                outcome = self._follow(shared, subscriber, cancel)
+            if isinstance(outcome, Exception):
+                raise outcome
+            if outcome is not None:
+                return outcome
+            # No wait is polling the job (anymore), so this one takes over
+            return self._lead(
+                token,
+                job_id,
+                shared,
+                subscriber,
+                refresh_token=refresh_token,
+                strategy=polling or FixedIntervalPolling(query_interval_seconds),
+                wait=wait,
+                cancel=cancel,
+                priority=priority,
+            )
+        finally:
+            self._leave(job_id, shared, subscriber)
+
+    def _known_final_state(self, job_id: UUID) -> FinalJobState | None:
+        """The final state of a job from the cache, without querying it."""
+        return self.result_cache.get(job_id) if self.result_cache else None
+
+    def _record(self, job_id: UUID, state: JobState) -> None:
+        """Records the status of a fetched state in the journal, and the state in the cache once final."""
+        if self.journal:
+            self.journal.record_state(job_id, state)
+        if self.result_cache and state.is_finished():
+            location = self.result_cache.put(job_id, cast(FinalJobState, state))
+            if self.journal and location:
+                self.journal.record_result_location(job_id, str(location))
+
+    def _follow(
+        self, shared: "_SharedWait", subscriber: "_Subscriber", cancel: threading.Event | None
+    ) -> FinalJobState | Exception | None:
+        """Blocks until the wait has an outcome or has to take over polling, in which case it returns None.
+
+        Must be called with the lock held.
+        """
         while True:
-            attempts += 1
-            try:
-                job_state = self.arnica.fetch_job_state(token, job_id)
-                if job_state.is_finished():
-                    return cast(FinalJobState, job_state)
-                if report_state:
-                    report_state(cast(NonFinalJobState, job_state))
-
-            except RequestError as err:
-                out.write(f"Transient ({type(err).__name__}) error encountered while fetching job state: {err}.\n")
-
-            if attempts == max_attempts:
-                raise TimeoutError(f"Timed out after {attempts} attempts waiting for job to finish.")
-
-            wait(
-                random.uniform(
-                    query_interval_seconds * 0.5,
-                    query_interval_seconds * 1.5,
+            if subscriber.outcome is not None:
+                return subscriber.outcome
+            if shared.leader is None:
+                shared.leader = subscriber
+                return None
+            _raise_if_cancelled(cancel)
+            subscriber.raise_if_timed_out()
+
+            timeout = None if subscriber.deadline is None else max(subscriber.deadline - subscriber.clock(), 0.0)
+            if cancel is not None and not isinstance(cancel, CancelEvent):
+                timeout = min(timeout, CANCEL_CHECK_SECONDS) if timeout is not None else CANCEL_CHECK_SECONDS
+            shared.changed.wait(timeout)
+
+    def _lead(
+        self,
+        token: str,
+        job_id: UUID,
+        shared: "_SharedWait",
+        subscriber: "_Subscriber",
+        *,
+        refresh_token: Callable[[str], str | None] | None,
+        strategy: PollingStrategy,
+        wait: Callable[[float], None],
+        cancel: threading.Event | None,
+        priority: float,
+    ) -> FinalJobState:
+        """Polls the job on behalf of all waits on it until it finishes or this wait ends."""
+        sleep = _interruptible(wait, cancel)
+        scheduler = self.scheduler
+        registration = scheduler.register(job_id, priority=priority) if scheduler else None
+        try:
+            while True:
+                _raise_if_cancelled(cancel)
+                if scheduler and (pace := scheduler.acquire()) > 0:
+                    sleep(pace)
+                    _raise_if_cancelled(cancel)
+
+                attempt = shared.polls + 1
+                listening = shared.listening()
+                if listening:
+                    shared.emit(PollStarted(job_id, attempt), subscriber)
+                started = time.perf_counter()
+                try:
+                    outcome: JobState | Exception = self.arnica.fetch_job_state(token, job_id)
+                except Exception as err:
+                    outcome = err
+                if listening:
+                    shared.emit(PollFinished(job_id, attempt, time.perf_counter() - started), subscriber)
+
+                previous_state = shared.context.state
+                if isinstance(outcome, RequestError):
+                    shared.record_poll(None)
+                    if listening:
+                        shared.emit(TransientErrorEncountered(job_id, outcome), subscriber)
+                elif isinstance(outcome, NotAuthenticatedError):
+                    # The token is specific to this wait, the others may still succeed with theirs
+                    refreshed = refresh_token(token) if refresh_token else None
+                    if not refreshed or refreshed == token:
+                        raise outcome
+                    token = refreshed
+                    shared.record_rejection(subscriber)
+                    for sink in subscriber.sinks:
+                        sink(TokenRefreshed(job_id))
+                    subscriber.raise_if_timed_out()
+                    continue
+                elif isinstance(outcome, Exception):
+                    self._finish(job_id, shared, outcome)
+                    raise outcome
+                elif outcome.is_finished():
+                    final_state = cast(FinalJobState, outcome)
+                    self._record(job_id, final_state)
+                    if listening:
+                        shared.emit(JobFinished(job_id, final_state, attempt), subscriber)
+                    self._finish(job_id, shared, final_state)
+                    return final_state
+                else:
+                    shared.record_poll(outcome)
+                    if self.journal and outcome != previous_state:
+                        self.journal.record_state(job_id, outcome)
+                    if listening and outcome != previous_state:
+                        previous_status = previous_state.status if previous_state else None
+                        shared.emit(StateChanged(job_id, cast(NonFinalJobState, outcome), previous_status), subscriber)
+
+                with shared.changed:
+                    shared.changed.notify_all()
+                subscriber.raise_if_timed_out()
+
+                delay = strategy.next_interval(shared.context)
+                if registration:
+                    delay = registration.next_delay(delay)
+                if subscriber.deadline is not None:
+                    delay = min(delay, max(subscriber.deadline - subscriber.clock(), 0.0))
+                if listening and shared.context.consecutive_errors:
+                    shared.emit(BackedOff(job_id, delay, shared.context.consecutive_errors), subscriber)
+                sleep(delay)
+        finally:
+            if registration:
+                registration.close()
+
+    def _finish(self, job_id: UUID, shared: "_SharedWait", outcome: FinalJobState | Exception) -> None:
+        """Hands the outcome of the job to every wait on it, and stops sharing the poller with new waits."""
+        with shared.changed:
+            for other in shared.subscribers:
+                if other.outcome is None:
+                    other.outcome = outcome
+            if self._shared_waits.get(job_id) is shared:
+                del self._shared_waits[job_id]
+            shared.changed.notify_all()
+
+    def _leave(self, job_id: UUID, shared: "_SharedWait", subscriber: "_Subscriber") -> None:
+        """Removes a wait from the shared poller, handing polling over if it was the one polling."""
+        with shared.changed:
+            shared.subscribers.remove(subscriber)
+            if shared.leader is subscriber:
+                shared.leader = None
+            if not shared.subscribers and self._shared_waits.get(job_id) is shared:
+                del self._shared_waits[job_id]
+            shared.changed.notify_all()
+
+    def wait_for_results(
+        self,
+        token: str,
+        job_ids: Iterable[UUID],
+        *,
+        refresh_token: Callable[[str], str | None] | None = None,
+        query_interval_seconds: float = 1.0,
+        wait: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+        max_attempts: int = 600,
+        deadline: float | None = None,
+        cancel: threading.Event | None = None,
+        max_concurrency: int = 8,
+        out: TextIO | None = sys.stdout,
+        report_state: Callable[[UUID, NonFinalJobState], None] | None = None,
+        polling: PollingStrategy | None = None,
+        priority: float = 1.0,
+        events: EventSink | None = None,
+        number_of_circuits: Mapping[UUID, int] | None = None,
+    ) -> Iterator[tuple[UUID, FinalJobState]]:
+        """Waits for several jobs to complete and yields their final states as they finish.
+
+        A single scheduler polls all given jobs. Each job is queried again after a duration decided by the polling
+        strategy, by default a jittered duration based on the specified query interval. All jobs that are due at the
+        same time are queried together, with at most `max_concurrency` requests in flight over the adapter's
+        connection pool.
+
+        The jobs whose final states are in the result cache are yielded first without being queried. With a journal,
+        the statuses of the others are recorded whenever they change.
+
+        When a job fails with a non-transient error or times out, the final states of the other jobs queried along
+        with it are yielded before the error is raised. When the token is rejected and can be refreshed, the jobs it
+        was rejected for are queried again right away with the new token, their rejected queries counting as attempts.
+
+        Args:
+            token (str): The authentication token to use.
+            job_ids (Iterable[UUID]): The IDs of the jobs to wait for. Duplicates are ignored.
+            refresh_token (Callable[[str], str | None] | None, optional): Returns a new token when the given, current
+                one is rejected. When None, the wait raises NotAuthenticatedError instead. Defaults to None.
+            query_interval_seconds (float, optional): The base interval between queries of the same job.
+                Defaults to 1.0.
+            wait (callable, optional): A callable that takes a duration in seconds to wait. Defaults to time.sleep.
+            clock (callable, optional): A monotonic clock returning the current time in seconds. Defaults to
+                time.monotonic.
+            max_attempts (int, optional): The maximum number of attempts to query the state of each job.
+                Defaults to 600.
+            deadline (float | None, optional): The time, as returned by `clock`, after which to stop waiting.
+                Defaults to None.
+            cancel (threading.Event | None, optional): An event that cancels the wait when set. When `wait` is left at
+                its default, a pending sleep wakes up as soon as the event is set. Defaults to None.
+            max_concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+            out (TextIO | None, optional): text stream to send output to, None for no output. Defaults to sys.stdout.
+            report_state (Callable[[UUID, NonFinalJobState], None], optional): Callable to report state changes of
+                jobs that have not finished yet.
+            polling (PollingStrategy | None, optional): The strategy deciding the wait between queries of the same
+                job. Defaults to `FixedIntervalPolling` with the given query interval.
+            priority (float, optional): The relative share of the global polling budget each of the jobs gets when
+                the budget is exhausted. Only used with a scheduler. Defaults to 1.0.
+            events (EventSink | None, optional): The sink to send the events of the wait to. The latency of a query is
+                that of the batch of queries it was sent with. Defaults to None.
+            number_of_circuits (Mapping[UUID, int] | None, optional): The number of circuits in each job, where known,
+                passed to the polling strategy to estimate the time remaining. Defaults to None.
+
+        Raises:
+            NotAuthenticatedError: If the provided token is invalid or expired, and can't be refreshed.
+            JobNotFoundError: If a job with one of the specified IDs does not exist.
+            InvalidJobIDError: If one of the provided job IDs is not valid.
+            UnknownServerError: If the Arnica API encounters an internal error.
+            RuntimeError: For any other unexpected errors.
+            TimeoutError: If a job does not complete within the maximum number of attempts or before the deadline.
+            WaitCancelledError: If the wait is cancelled.
+
+        Yields:
+            tuple[UUID, FinalJobState]: The ID and final state of each job, in order of completion.
+        """
+        strategy = polling or FixedIntervalPolling(query_interval_seconds)
+        sleep = _interruptible(wait, cancel)
+        scheduler = self.scheduler
+        sink = combine_sinks(
+            TextSink(out, include_job_id=True) if out else None,
+            events,
+            _job_state_reporter(report_state) if report_state else None,
+        )
+        attempts: dict[UUID, int] = {}
+        contexts: dict[UUID, PollContext] = {}
+        registrations: dict[UUID, PollRegistration] = {}
+        schedule: list[tuple[float, int, UUID]] = []
+        pending: list[UUID] = []
+        for job_id in dict.fromkeys(job_ids):
+            if known := self._known_final_state(job_id):
+                yield job_id, known
+            else:
+                pending.append(job_id)
+        now = clock()
+        for sequence, job_id in enumerate(pending):
+            attempts[job_id] = 0
+            contexts[job_id] = PollContext(number_of_circuits=(number_of_circuits or {}).get(job_id))
+            if scheduler:
+                registrations[job_id] = scheduler.register(job_id, priority=priority)
+            schedule.append((now, sequence, job_id))
+        heapq.heapify(schedule)
+        sequence = len(schedule)
+
+        try:
+            while schedule:
+                _raise_if_cancelled(cancel)
+                delay = schedule[0][0] - clock()
+                if delay > 0:
+                    sleep(delay)
+                    _raise_if_cancelled(cancel)
+
+                now = clock()
+                due: list[UUID] = []
+                while schedule and schedule[0][0] <= now:
+                    due.append(heapq.heappop(schedule)[2])
+
+                if sink:
+                    for job_id in due:
+                        sink(PollStarted(job_id, attempts[job_id] + 1))
+                started = time.perf_counter()
+                batch_token = token
+                outcomes = self.arnica.fetch_job_states(
+                    batch_token, due, max_concurrency=max_concurrency, pace=_paced(scheduler, sleep, cancel)
                 )
-            )
+                latency = time.perf_counter() - started
+                # Raised once the final states fetched in the same batch have been yielded
+                failure: Exception | None = None
+                for job_id, outcome in outcomes.items():
+                    attempts[job_id] += 1
+                    if sink:
+                        sink(PollFinished(job_id, attempts[job_id], latency))
+                    previous_state = contexts[job_id].state
+                    retry_now = False
+                    if isinstance(outcome, RequestError):
+                        contexts[job_id] = contexts[job_id].after_error()
+                        if sink:
+                            sink(TransientErrorEncountered(job_id, outcome))
+                    elif isinstance(outcome, NotAuthenticatedError):
+                        # Every job of the batch was queried with the same token, which is only refreshed once
+                        if token == batch_token:
+                            refreshed = refresh_token(token) if refresh_token else None
+                            if not refreshed or refreshed == token:
+                                failure = failure or outcome
+                                continue
+                            token = refreshed
+                        if sink:
+                            sink(TokenRefreshed(job_id))
+                        retry_now = True
+                    elif isinstance(outcome, Exception):
+                        failure = failure or outcome
+                        continue
+                    elif outcome.is_finished():
+                        self._record(job_id, outcome)
+                        if registration := registrations.pop(job_id, None):
+                            registration.close()
+                        if sink:
+                            sink(JobFinished(job_id, cast(FinalJobState, outcome), attempts[job_id]))
+                        yield job_id, cast(FinalJobState, outcome)
+                        continue
+                    else:
+                        contexts[job_id] = contexts[job_id].after_state(outcome)
+                        if self.journal and outcome != previous_state:
+                            self.journal.record_state(job_id, outcome)
+                        if sink and outcome != previous_state:
+                            previous_status = previous_state.status if previous_state else None
+                            sink(StateChanged(job_id, cast(NonFinalJobState, outcome), previous_status))
+
+                    if attempts[job_id] == max_attempts:
+                        failure = failure or TimeoutError(
+                            f"Timed out after {attempts[job_id]} attempts waiting for job {job_id} to finish."
+                        )
+                        continue
+                    if deadline is not None and clock() >= deadline:
+                        failure = failure or TimeoutError(
+                            f"Timed out waiting for job {job_id} to finish, as the deadline has passed."
+                        )
+                        continue
+
+                    if retry_now:
+                        delay = 0.0
+                    else:
+                        delay = strategy.next_interval(contexts[job_id])
+                        if registration := registrations.get(job_id):
+                            delay = registration.next_delay(delay)
+                    if deadline is not None:
+                        delay = min(delay, max(deadline - clock(), 0.0))
+                    if sink and contexts[job_id].consecutive_errors:
+                        sink(BackedOff(job_id, delay, contexts[job_id].consecutive_errors))
+                    heapq.heappush(schedule, (clock() + delay, sequence, job_id))
+                    sequence += 1
+                if failure:
+                    raise failure
+        finally:
+            for registration in registrations.values():
+                registration.close()
+
+
+def _paced(
+    scheduler: PollScheduler | None, sleep: Callable[[float], None], cancel: threading.Event | None
+) -> Callable[[], None] | None:
+    """Waits for the global polling budget before each request of a batch, so that the batch doesn't burst."""
+    if scheduler is None:
+        return None
+
+    def pace() -> None:
+        _raise_if_cancelled(cancel)
+        if (delay := scheduler.acquire()) > 0:
+            sleep(delay)
+            _raise_if_cancelled(cancel)
+
+    return pace
+
+
+class _Subscriber:
+    """One of the waits on a job sharing a poller."""
+
+    def __init__(
+        self, sinks: list[EventSink], max_attempts: int, deadline: float | None, clock: Callable[[], float]
+    ) -> None:
+        self.sinks = sinks
+        self.max_attempts = max_attempts
+        self.deadline = deadline
+        self.clock = clock
+        self.attempts = 0
+        self.outcome: FinalJobState | Exception | None = None
+
+    def raise_if_timed_out(self) -> None:
+        """Raises if the wait has used up its attempts or its deadline has passed."""
+        if self.attempts >= self.max_attempts:
+            raise TimeoutError(f"Timed out after {self.attempts} attempts waiting for job to finish.")
+        if self.deadline is not None and self.clock() >= self.deadline:
+            raise TimeoutError("Timed out waiting for job to finish, as the deadline has passed.")
+
+
+class _SharedWait:
+    """The poller shared by all concurrent waits on a job."""
+
+    def __init__(self, lock: threading.Lock, number_of_circuits: int | None) -> None:
+        self.changed = threading.Condition(lock)
+        self.subscribers: list[_Subscriber] = []
+        self.leader: _Subscriber | None = None
+        self.context = PollContext(number_of_circuits=number_of_circuits)
+        self.polls = 0
+
+    def record_poll(self, state: JobState | None) -> None:
+        """Records the state returned by a query of the job, or None if it failed with a transient error.
+
+        The query counts towards the attempts of every wait still without outcome.
+        """
+        with self.changed:
+            self.context = self.context.after_error() if state is None else self.context.after_state(state)
+            self.polls += 1
+            for subscriber in self.subscribers:
+                if subscriber.outcome is None:
+                    subscriber.attempts += 1
+
+    def record_rejection(self, subscriber: _Subscriber) -> None:
+        """Records a query rejected for the token of a wait, which only counts towards the attempts of that wait."""
+        with self.changed:
+            self.polls += 1
+            subscriber.attempts += 1
+
+    def listening(self) -> bool:
+        """Whether any of the waits has a sink, so that events need to be created at all."""
+        with self.changed:
+            return any(subscriber.sinks for subscriber in self.subscribers)
+
+    def emit(self, event: WaitEvent, leader: _Subscriber) -> None:
+        """Sends an event to every wait still without outcome.
+
+        Text is only written once per stream. A failing sink ends its wait, unless it is the polling wait's.
+        """
+        with self.changed:
+            subscribers = [subscriber for subscriber in self.subscribers if subscriber.outcome is None]
+        written: set[TextSink] = set()
+        for subscriber in subscribers:
+            for sink in subscriber.sinks:
+                if isinstance(sink, TextSink):
+                    if sink in written:
+                        continue
+                    written.add(sink)
+                try:
+                    sink(event)
+                except Exception as err:
+                    if subscriber is leader:
+                        raise
+                    with self.changed:
+                        subscriber.outcome = err
+                    break
+
+
+def _state_reporter(report_state: Callable[[NonFinalJobState], None]) -> EventSink:
+    """A sink passing state changes on to a `report_state` callable."""
+
+    def report(event: WaitEvent) -> None:
+        if isinstance(event, StateChanged):
+            report_state(event.state)
+
+    return report
+
+
+def _job_state_reporter(report_state: Callable[[UUID, NonFinalJobState], None]) -> EventSink:
+    """A sink passing state changes of several jobs on to a `report_state` callable."""
+
+    def report(event: WaitEvent) -> None:
+        if isinstance(event, StateChanged):
+            report_state(event.job_id, event.state)
+
+    return report
+
+
+def _interruptible(wait: Callable[[float], None], cancel: threading.Event | None) -> Callable[[float], None]:
+    """The callable to sleep with, waking up as soon as the wait is cancelled unless a custom `wait` is given."""
+    if cancel is None or wait is not time.sleep:
+        return wait
+
+    def sleep(duration: float) -> None:
+        cancel.wait(duration)
+
+    return sleep
+
+
+def _raise_if_cancelled(cancel: threading.Event | None) -> None:
+    """Raises if the wait has been cancelled."""
+    if cancel is not None and cancel.is_set():
+        raise WaitCancelledError("The wait for the job was cancelled.")
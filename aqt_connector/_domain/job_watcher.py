@@ -0,0 +1,383 @@
+"""Resolution of job handles by a single background poller."""
+
+import heapq
+import itertools
+import sys
+import threading
+import time
+from collections.abc import Callable, Generator
+from concurrent.futures import Future
+from typing import Any, TextIO, cast
+from uuid import UUID
+
+from aqt_connector._domain.poll_scheduler import PollRegistration, PollScheduler
+from aqt_connector._domain.polling import FixedIntervalPolling, PollContext, PollingStrategy
+from aqt_connector._domain.wait_events import (
+    BackedOff,
+    EventSink,
+    JobFinished,
+    PollFinished,
+    PollStarted,
+    StateChanged,
+    TextSink,
+    TokenRefreshed,
+    TransientErrorEncountered,
+    WaitEvent,
+)
+from aqt_connector._infrastructure.arnica_adapter import ArnicaAdapter
+from aqt_connector._infrastructure.job_journal import JobJournal
+from aqt_connector._infrastructure.result_cache import ResultCache
+from aqt_connector.exceptions import NotAuthenticatedError, RequestError
+from aqt_connector.models.arnica.response_bodies.jobs import FinalJobState, JobState, NonFinalJobState, RROngoing
+
+
+class JobHandle(Future[FinalJobState]):
+    """A future resolving to the final state of a job.
+
+    Handles are resolved by a background poller shared by all handles of an application, so no thread is dedicated to
+    any one job. As a `concurrent.futures.Future`, a handle supports `result(timeout)`, `add_done_callback` and
+    `cancel()`, and works with `concurrent.futures.wait` and `as_completed`. It can also be awaited in async code.
+
+    Cancelling a handle stops waiting for the job, the job itself keeps running on the server.
+
+    Attributes:
+        job_id (UUID): the ID of the job.
+    """
+
+    def __init__(self, job_id: UUID) -> None:
+        super().__init__()
+        self.job_id = job_id
+        self._last_state: JobState | None = None
+        self._sinks: list[EventSink] = []
+
+    @property
+    def state(self) -> JobState | None:
+        """The last state fetched for the job, None if it hasn't been fetched yet."""
+        return self._last_state
+
+    @property
+    def finished_count(self) -> int | None:
+        """The number of circuits of the job that have finished, None if it isn't known."""
+        state = self._last_state
+        return state.finished_count if isinstance(state, RROngoing) else None
+
+    def __await__(self) -> Generator[Any, None, FinalJobState]:
+        # Imported on first use, as asyncio takes long to import
+        import asyncio
+
+        return asyncio.wrap_future(self).__await__()
+
+    def __repr__(self) -> str:
+        status = self._last_state.status.value if self._last_state else "unknown"
+        return f"<{type(self).__name__} job_id={self.job_id} status={status} done={self.done()}>"
+
+
+class JobWatcher:
+    """Polls the jobs being watched in a single background thread, resolving their handles once they finish.
+
+    The thread is started when the first job is watched and ends when no job is left to watch. Jobs that are due at
+    the same time are queried together, with at most `max_concurrency` requests in flight. Watching a job that is
+    already being watched doesn't add a poll, the new handle is resolved along with the existing ones: the job keeps
+    being polled with the token, polling strategy and priority of the first watch, while the events go to the sinks
+    of every handle.
+    """
+
+    def __init__(
+        self,
+        arnica: ArnicaAdapter,
+        scheduler: PollScheduler | None = None,
+        *,
+        max_concurrency: int = 8,
+        clock: Callable[[], float] = time.monotonic,
+        journal: JobJournal | None = None,
+        result_cache: ResultCache | None = None,
+    ) -> None:
+        """
+        Args:
+            arnica (ArnicaAdapter): The Arnica adapter to use for fetching job states.
+            scheduler (PollScheduler | None, optional): The scheduler sharing a global polling budget between all
+                waits. When None, every job is polled at its own pace. Defaults to None.
+            max_concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+            clock (Callable[[], float], optional): A monotonic clock returning the current time in seconds. Defaults
+                to time.monotonic.
+            journal (JobJournal | None, optional): The journal to record the statuses of jobs in, and where the result
+                cache stored their final states. Defaults to None.
+            result_cache (ResultCache | None, optional): The cache of final states. Handles of cached jobs are
+                resolved right away. Defaults to None.
+        """
+        self.arnica = arnica
+        self.scheduler = scheduler
+        self.journal = journal
+        self.result_cache = result_cache
+        self.max_concurrency = max_concurrency
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._watches: dict[UUID, _Watch] = {}
+        self._schedule: list[tuple[float, int, _Watch]] = []
+        self._sequence = itertools.count()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def watch(
+        self,
+        token: str,
+        job_id: UUID,
+        *,
+        refresh_token: Callable[[str], str | None] | None = None,
+        polling: PollingStrategy | None = None,
+        priority: float = 1.0,
+        out: TextIO | None = sys.stdout,
+        events: EventSink | None = None,
+        number_of_circuits: int | None = None,
+    ) -> JobHandle:
+        """Starts watching a job.
+
+        Args:
+            token (str): The authentication token to use.
+            job_id (UUID): The ID of the job to watch.
+            refresh_token (Callable[[str], str | None] | None, optional): Returns a new token when the given, current
+                one is rejected. When None, the handle fails with NotAuthenticatedError instead. Defaults to None.
+            polling (PollingStrategy | None, optional): The strategy deciding the wait between queries. Defaults to
+                `FixedIntervalPolling`.
+            priority (float, optional): The relative share of the global polling budget the job gets when the budget
+                is exhausted. Only used with a scheduler. Defaults to 1.0.
+            out (TextIO | None, optional): text stream to send output to, None for no output. Defaults to sys.stdout.
+            events (EventSink | None, optional): The sink to send the events of the wait to, from the background
+                thread. The latency of a query is that of the batch of queries it was sent with. Defaults to None.
+            number_of_circuits (int | None, optional): The number of circuits in the job, passed to the polling
+                strategy to estimate the time remaining. Defaults to None.
+
+        Raises:
+            RuntimeError: If the watcher has been closed.
+
+        Returns:
+            JobHandle: the handle resolving to the final state of the job. See `JobService.wait_for_result` for the
+                exceptions it may resolve to. It also fails with the exception raised by one of its sinks, which
+                doesn't affect the other handles of the job.
+        """
+        handle = JobHandle(job_id)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The job watcher has been closed.")
+            known = self.result_cache.get(job_id) if self.result_cache else None
+            if known:
+                handle._last_state = known
+                handle.set_running_or_notify_cancel()
+                handle.set_result(known)
+                return handle
+            watch = self._watches.get(job_id)
+            if watch is None:
+                registration = self.scheduler.register(job_id, priority=priority) if self.scheduler else None
+                watch = _Watch(
+                    job_id, token, refresh_token, polling or FixedIntervalPolling(), registration, number_of_circuits
+                )
+                self._watches[job_id] = watch
+                heapq.heappush(self._schedule, (self._clock(), next(self._sequence), watch))
+            handle._sinks = [sink for sink in (TextSink(out, include_job_id=True) if out else None, events) if sink]
+            watch.handles.append(handle)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="aqt-connector-job-watcher", daemon=True)
+                self._thread.start()
+        self._wake.set()
+        return handle
+
+    def close(self) -> None:
+        """Stops polling and cancels all pending handles."""
+        with self._lock:
+            self._closed = True
+            watches = list(self._watches.values())
+            for watch in watches:
+                self._unwatch(watch)
+            thread = self._thread
+        self._wake.set()
+        for watch in watches:
+            for handle in watch.handles:
+                handle.cancel()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _run(self) -> None:
+        """Polls the watched jobs until none is left."""
+        while True:
+            self._wake.clear()
+            with self._lock:
+                self._drop_abandoned()
+                if self._closed or not self._watches:
+                    self._thread = None
+                    return
+                now = self._clock()
+                delay = self._schedule[0][0] - now if self._schedule else 0.0
+                due: list[_Watch] = []
+                while self._schedule and self._schedule[0][0] <= now:
+                    watch = heapq.heappop(self._schedule)[2]
+                    if self._watches.get(watch.job_id) is watch:
+                        due.append(watch)
+
+            if delay > 0:
+                self._wake.wait(delay)
+                continue
+            by_token: dict[str, list[_Watch]] = {}
+            for watch in due:
+                by_token.setdefault(watch.token, []).append(watch)
+            for token, watches in by_token.items():
+                for watch in watches:
+                    watch.attempts += 1
+                    if watch.listening():
+                        watch.emit(PollStarted(watch.job_id, watch.attempts))
+                started = time.perf_counter()
+                try:
+                    outcomes = self.arnica.fetch_job_states(
+                        token,
+                        [watch.job_id for watch in watches],
+                        max_concurrency=self.max_concurrency,
+                        pace=self._pace if self.scheduler else None,
+                    )
+                except Exception as err:
+                    outcomes = dict.fromkeys((watch.job_id for watch in watches), err)
+                latency = time.perf_counter() - started
+                for watch in watches:
+                    try:
+                        if watch.listening():
+                            watch.emit(PollFinished(watch.job_id, watch.attempts, latency))
+                        self._handle_outcome(watch, outcomes[watch.job_id])
+                    except Exception as err:
+                        self._resolve(watch, err)
+
+    def _pace(self) -> None:
+        """Waits for the global polling budget before each query, so that a batch of queries doesn't burst."""
+        if self.scheduler and (delay := self.scheduler.acquire()) > 0:
+            time.sleep(delay)
+
+    def _handle_outcome(self, watch: "_Watch", outcome: JobState | Exception) -> None:
+        """Resolves the handles of a job or schedules its next query."""
+        previous_state = watch.context.state
+        if isinstance(outcome, RequestError):
+            watch.context = watch.context.after_error()
+            if watch.listening():
+                watch.emit(TransientErrorEncountered(watch.job_id, outcome))
+        elif isinstance(outcome, NotAuthenticatedError):
+            refreshed = watch.refresh_token(watch.token) if watch.refresh_token else None
+            if not refreshed or refreshed == watch.token:
+                self._resolve(watch, outcome)
+                return
+            watch.token = refreshed
+            if watch.listening():
+                watch.emit(TokenRefreshed(watch.job_id))
+            self._reschedule(watch, 0.0)
+            return
+        elif isinstance(outcome, Exception):
+            self._resolve(watch, outcome)
+            return
+        elif outcome.is_finished():
+            final_state = cast(FinalJobState, outcome)
+            if self.journal:
+                self.journal.record_state(watch.job_id, final_state)
+            if self.result_cache:
+                location = self.result_cache.put(watch.job_id, final_state)
+                if self.journal and location:
+                    self.journal.record_result_location(watch.job_id, str(location))
+            if watch.listening():
+                watch.emit(JobFinished(watch.job_id, final_state, watch.attempts))
+            self._resolve(watch, final_state)
+            return
+        else:
+            watch.context = watch.context.after_state(outcome)
+            for handle in watch.handles:
+                handle._last_state = outcome
+            if self.journal and outcome != previous_state:
+                self.journal.record_state(watch.job_id, outcome)
+            if watch.listening() and outcome != previous_state:
+                previous_status = previous_state.status if previous_state else None
+                watch.emit(StateChanged(watch.job_id, cast(NonFinalJobState, outcome), previous_status))
+
+        delay = watch.polling.next_interval(watch.context)
+        if watch.registration:
+            delay = watch.registration.next_delay(delay)
+        if watch.listening() and watch.context.consecutive_errors:
+            watch.emit(BackedOff(watch.job_id, delay, watch.context.consecutive_errors))
+        self._reschedule(watch, delay)
+
+    def _reschedule(self, watch: "_Watch", delay: float) -> None:
+        with self._lock:
+            if self._watches.get(watch.job_id) is watch:
+                heapq.heappush(self._schedule, (self._clock() + delay, next(self._sequence), watch))
+
+    def _resolve(self, watch: "_Watch", outcome: FinalJobState | Exception) -> None:
+        """Stops watching a job and resolves its handles."""
+        with self._lock:
+            self._unwatch(watch)
+            handles = list(watch.handles)
+        for handle in handles:
+            # Handles failed by their sinks are already resolved
+            if handle.done() or not handle.set_running_or_notify_cancel():
+                continue
+            if isinstance(outcome, Exception):
+                handle.set_exception(outcome)
+            else:
+                handle._last_state = outcome
+                handle.set_result(outcome)
+
+    def _drop_abandoned(self) -> None:
+        """Stops watching jobs whose handles have all been cancelled, or failed because of their sinks. Must be called
+        with the lock held."""
+        for watch in list(self._watches.values()):
+            watch.handles = [handle for handle in watch.handles if not handle.done()]
+            if not watch.handles:
+                self._unwatch(watch)
+
+    def _unwatch(self, watch: "_Watch") -> None:
+        """Must be called with the lock held."""
+        if self._watches.get(watch.job_id) is watch:
+            del self._watches[watch.job_id]
+        if watch.registration:
+            watch.registration.close()
+        if not self._watches:
+            self._schedule.clear()
+
+
+class _Watch:
+    """A job being watched, with the handles waiting for it."""
+
+    def __init__(
+        self,
+        job_id: UUID,
+        token: str,
+        refresh_token: Callable[[str], str | None] | None,
+        polling: PollingStrategy,
+        registration: PollRegistration | None,
+        number_of_circuits: int | None,
+    ) -> None:
+        self.job_id = job_id
+        self.token = token
+        self.refresh_token = refresh_token
+        self.polling = polling
+        self.registration = registration
+        self.context = PollContext(number_of_circuits=number_of_circuits)
+        self.attempts = 0
+        self.handles: list[JobHandle] = []
+
+    def listening(self) -> bool:
+        """Whether any of the handles has a sink, so that events need to be created at all."""
+        return any(handle._sinks for handle in list(self.handles))
+
+    def emit(self, event: WaitEvent) -> None:
+        """Sends an event to the sinks of all pending handles, writing text only once per stream.
+
+        A failing sink fails its handle, which stops receiving events, while the job keeps being polled for the others.
+        """
+        written: set[TextSink] = set()
+        for handle in list(self.handles):
+            if handle.done():
+                continue
+            for sink in handle._sinks:
+                if isinstance(sink, TextSink):
+                    if sink in written:
+                        continue
+                    written.add(sink)
+                try:
+                    sink(event)
+                except Exception as err:
+                    if handle.set_running_or_notify_cancel():
+                        handle.set_exception(err)
+                    break
@@ -0,0 +1,156 @@
+"""Sharing of a global polling budget between all active waits of an application."""
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from uuid import UUID
+
+from typing_extensions import Self
+
+
+class PollScheduler:
+    """Shares a global budget of requests per second between all active waits.
+
+    Every wait registers the job it polls. While the sum of the rates the waits would like to poll at fits into the
+    budget, each wait polls at its own pace. Once it doesn't, the budget is split between the registered waits in
+    proportion to their priority and the rate they ask for, so jobs expected to complete soon (which polling
+    strategies poll more often) and jobs with a higher priority get a larger share. Stretched intervals are
+    decorrelated-jittered to keep waits from synchronising.
+
+    On top of that, `acquire` paces the actual requests so that the global rate never exceeds the budget, even when
+    many waits start at the same time.
+    """
+
+    def __init__(
+        self,
+        max_requests_per_second: float = 20.0,
+        *,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            max_requests_per_second (float, optional): the global budget of state queries per second. Defaults to 20.
+            burst (int, optional): the number of requests that may be sent back-to-back before pacing sets in.
+                Defaults to 1.
+            clock (Callable[[], float], optional): a monotonic clock returning the current time in seconds. Defaults
+                to time.monotonic.
+        """
+        if max_requests_per_second <= 0:
+            raise ValueError("The polling budget must be positive.")
+        self.max_requests_per_second = max_requests_per_second
+        self._burst_tolerance = max(burst - 1, 0) / max_requests_per_second
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._registrations: set[PollRegistration] = set()
+        self._total_demand = 0.0
+        self._total_weight = 0.0
+        self._theoretical_arrival = 0.0
+
+    @property
+    def active_job_ids(self) -> set[UUID]:
+        """The IDs of the jobs that are currently being waited on."""
+        with self._lock:
+            return {registration.job_id for registration in self._registrations}
+
+    def register(self, job_id: UUID, *, priority: float = 1.0) -> "PollRegistration":
+        """Registers a wait on a job.
+
+        Args:
+            job_id (UUID): the ID of the job being waited on.
+            priority (float, optional): the relative share of the budget the wait gets when the budget is exhausted.
+                Defaults to 1.0.
+
+        Returns:
+            PollRegistration: the registration, to be closed once the wait ends.
+        """
+        if priority <= 0:
+            raise ValueError("The priority of a wait must be positive.")
+        registration = PollRegistration(self, job_id, priority)
+        with self._lock:
+            self._registrations.add(registration)
+        return registration
+
+    def acquire(self) -> float:
+        """Reserves a request within the global budget. Each request of a batch must be reserved separately.
+
+        Returns:
+            float: the duration in seconds to wait before sending the request.
+        """
+        with self._lock:
+            now = self._clock()
+            start = max(self._theoretical_arrival, now)
+            self._theoretical_arrival = start + 1 / self.max_requests_per_second
+            return max(start - now - self._burst_tolerance, 0.0)
+
+    def _next_delay(self, registration: "PollRegistration", desired_seconds: float) -> float:
+        with self._lock:
+            if registration not in self._registrations:
+                return desired_seconds
+
+            self._update_demand(registration, 1 / max(desired_seconds, 1e-3))
+            if self._total_demand <= self.max_requests_per_second:
+                registration.previous_delay = desired_seconds
+                return desired_seconds
+
+            weight = registration.priority * registration.demand
+            allocated = self._total_weight / (self.max_requests_per_second * weight)
+            # Decorrelated jitter between 1/4 and 5/4 of the allocated interval, which averages to the allocation
+            previous = max(registration.previous_delay, allocated / 4)
+            delay = min(allocated * 5 / 4, random.uniform(allocated / 4, previous * 3))
+            registration.previous_delay = delay
+            return max(delay, desired_seconds)
+
+    def _update_demand(self, registration: "PollRegistration", demand: float) -> None:
+        self._total_demand += demand - registration.demand
+        self._total_weight += registration.priority * (demand - registration.demand)
+        registration.demand = demand
+
+    def _unregister(self, registration: "PollRegistration") -> None:
+        with self._lock:
+            if registration in self._registrations:
+                self._update_demand(registration, 0.0)
+                self._registrations.discard(registration)
+                if not self._registrations:
+                    # Reset the running sums to avoid accumulating floating point errors
+                    self._total_demand = 0.0
+                    self._total_weight = 0.0
+
+
+class PollRegistration:
+    """A wait on a job, registered with a `PollScheduler`.
+
+    Attributes:
+        job_id (UUID): the ID of the job being waited on.
+        priority (float): the relative share of the budget the wait gets when the budget is exhausted.
+    """
+
+    def __init__(self, scheduler: PollScheduler, job_id: UUID, priority: float) -> None:
+        self.job_id = job_id
+        self.priority = priority
+        self.demand = 0.0
+        self.previous_delay = 0.0
+        self._scheduler = scheduler
+
+    def next_delay(self, desired_seconds: float) -> float:
+        """The duration to wait before the next query of the job.
+
+        Args:
+            desired_seconds (float): the duration the wait's polling strategy would like to wait.
+
+        Returns:
+            float: the duration to wait in seconds, never shorter than the desired duration.
+        """
+        return self._scheduler._next_delay(self, desired_seconds)
+
+    def close(self) -> None:
+        """Removes the wait from the scheduler. Closing a registration more than once has no effect."""
+        self._scheduler._unregister(self)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: type | None, exc_value: BaseException | None, traceback: object | None) -> bool | None:
+        self.close()
+        return None
@@ -0,0 +1,149 @@
+"""Strategies deciding how long to wait between queries of a job's state."""
+
+import random
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from aqt_connector.models.arnica.jobs import JobStatus
+from aqt_connector.models.arnica.response_bodies.jobs import JobState, RROngoing
+
+
+@dataclass(frozen=True)
+class PollContext:
+    """What is known about a job after a query of its state.
+
+    Attributes:
+        state (JobState | None): the last successfully fetched state of the job, None if no query succeeded yet.
+        polls_in_state (int): the number of consecutive successful queries that returned the current status.
+        consecutive_errors (int): the number of consecutive queries that failed with a transient error.
+        number_of_circuits (int | None): the number of circuits in the job, if known by the wait.
+    """
+
+    state: JobState | None = None
+    polls_in_state: int = 0
+    consecutive_errors: int = 0
+    number_of_circuits: int | None = None
+
+    def after_state(self, state: JobState) -> "PollContext":
+        """The context after a query returned the given state."""
+        same_status = self.state is not None and self.state.status == state.status
+        return PollContext(state, self.polls_in_state + 1 if same_status else 1, 0, self.number_of_circuits)
+
+    def after_error(self) -> "PollContext":
+        """The context after a query failed with a transient error."""
+        return PollContext(self.state, self.polls_in_state, self.consecutive_errors + 1, self.number_of_circuits)
+
+
+class PollingStrategy(ABC):
+    """Decides how long to wait before querying a job's state again.
+
+    Strategies don't hold any per-job state, so a single instance can be shared between waits.
+    """
+
+    @abstractmethod
+    def next_interval(self, context: PollContext) -> float:
+        """The duration in seconds to wait before the next query.
+
+        Args:
+            context (PollContext): what is known about the job after the last query.
+
+        Returns:
+            float: the duration to wait, in seconds.
+        """
+
+
+class FixedIntervalPolling(PollingStrategy):
+    """Polls at a fixed base interval with ±50% jitter, whatever the state of the job."""
+
+    def __init__(self, query_interval_seconds: float = 1.0) -> None:
+        """
+        Args:
+            query_interval_seconds (float, optional): the base interval between queries. Defaults to 1.0.
+        """
+        self.query_interval_seconds = query_interval_seconds
+
+    def next_interval(self, context: PollContext) -> float:
+        return random.uniform(self.query_interval_seconds * 0.5, self.query_interval_seconds * 1.5)
+
+
+class AdaptivePolling(PollingStrategy):
+    """Adapts the interval between queries to the state of the job.
+
+    - While a job is queued, the interval grows geometrically with every poll that finds it still queued.
+    - While a job is ongoing, the time remaining is estimated from the time the job has spent ongoing (taken from
+      the `timing_data` status changes) and its `finished_count`, as well as the number of circuits of the job when
+      the wait knows it. The interval is half the estimated time remaining, so it tightens as the job approaches
+      completion.
+    - After transient request errors, the interval backs off exponentially.
+
+    All intervals are clamped to `[min_interval_seconds, max_interval_seconds]` and jittered by ±25%.
+    """
+
+    def __init__(
+        self,
+        base_interval_seconds: float = 1.0,
+        *,
+        min_interval_seconds: float = 0.2,
+        max_interval_seconds: float = 30.0,
+        queued_backoff: float = 1.5,
+        error_backoff: float = 2.0,
+        now: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        """
+        Args:
+            base_interval_seconds (float, optional): the interval used when nothing better can be estimated.
+                Defaults to 1.0.
+            min_interval_seconds (float, optional): the shortest interval between queries. Defaults to 0.2.
+            max_interval_seconds (float, optional): the longest interval between queries. Defaults to 30.0.
+            queued_backoff (float, optional): the factor the interval grows by per poll of a queued job.
+                Defaults to 1.5.
+            error_backoff (float, optional): the factor the interval grows by per consecutive transient error.
+                Defaults to 2.0.
+            now (Callable[[], datetime], optional): returns the current time. Defaults to the current UTC time.
+        """
+        self.base_interval_seconds = base_interval_seconds
+        self.min_interval_seconds = min_interval_seconds
+        self.max_interval_seconds = max_interval_seconds
+        self.queued_backoff = queued_backoff
+        self.error_backoff = error_backoff
+        self._now = now
+
+    def next_interval(self, context: PollContext) -> float:
+        if context.consecutive_errors:
+            interval = self.base_interval_seconds * self.error_backoff**context.consecutive_errors
+        elif context.state is None:
+            interval = self.base_interval_seconds
+        elif context.state.status == JobStatus.QUEUED:
+            interval = self.base_interval_seconds * self.queued_backoff ** max(context.polls_in_state - 1, 0)
+        elif isinstance(context.state, RROngoing):
+            interval = self._ongoing_interval(context.state, context.number_of_circuits)
+        else:
+            interval = self.base_interval_seconds
+
+        interval = min(max(interval, self.min_interval_seconds), self.max_interval_seconds)
+        return random.uniform(interval * 0.75, interval * 1.25)
+
+    def _ongoing_interval(self, state: RROngoing, number_of_circuits: int | None) -> float:
+        """Half the estimated time remaining for an ongoing job, or the base interval if it can't be estimated."""
+        started_at = next(
+            (
+                change.timestamp
+                for change in reversed(state.timing_data or [])
+                if change.new_status == JobStatus.ONGOING
+            ),
+            None,
+        )
+        if started_at is None or state.finished_count == 0:
+            return self.base_interval_seconds
+
+        now = self._now()
+        if (started_at.tzinfo is None) != (now.tzinfo is None):
+            now = now.replace(tzinfo=started_at.tzinfo)
+        seconds_per_circuit = max((now - started_at).total_seconds(), 0.0) / state.finished_count
+
+        if number_of_circuits is None:
+            return seconds_per_circuit / 2
+        remaining_circuits = max(number_of_circuits - state.finished_count, 1)
+        return seconds_per_circuit * remaining_circuits / 2
@@ -0,0 +1,200 @@
+"""Events sent while waiting for jobs, and the sinks receiving them.
+
+A sink is any callable taking an event. Events are only created when a sink is given, and state changes are only
+sent when the state of a job actually changes, so waits stay cheap however many of them run.
+"""
+
+import queue
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from typing import TextIO, TypeAlias, cast
+from uuid import UUID
+
+from aqt_connector.exceptions import RequestError
+from aqt_connector.models.arnica.jobs import JobStatus
+from aqt_connector.models.arnica.response_bodies.jobs import FinalJobState, NonFinalJobState
+
+
+@dataclass(frozen=True)
+class WaitEvent:
+    """An event of a wait for a job.
+
+    Attributes:
+        job_id (UUID): the ID of the job being waited for.
+    """
+
+    job_id: UUID
+
+
+@dataclass(frozen=True)
+class PollStarted(WaitEvent):
+    """A query of the job's state has been sent.
+
+    Attributes:
+        attempt (int): the number of the query, starting at 1.
+    """
+
+    attempt: int
+
+
+@dataclass(frozen=True)
+class PollFinished(WaitEvent):
+    """A query of the job's state has completed, successfully or not.
+
+    Attributes:
+        attempt (int): the number of the query, starting at 1.
+        latency_seconds (float): the duration of the query.
+    """
+
+    attempt: int
+    latency_seconds: float
+
+
+@dataclass(frozen=True)
+class StateChanged(WaitEvent):
+    """The job has moved to a different, not yet final, state.
+
+    Attributes:
+        state (NonFinalJobState): the new state of the job.
+        previous_status (JobStatus | None): the status of the job before, None if it wasn't known.
+    """
+
+    state: NonFinalJobState
+    previous_status: JobStatus | None
+
+
+@dataclass(frozen=True)
+class TransientErrorEncountered(WaitEvent):
+    """A query of the job's state failed with an error the wait recovers from.
+
+    Attributes:
+        error (RequestError): the error.
+    """
+
+    error: RequestError
+
+
+@dataclass(frozen=True)
+class BackedOff(WaitEvent):
+    """The wait is backing off after transient errors.
+
+    Attributes:
+        delay_seconds (float): the duration until the next query.
+        consecutive_errors (int): the number of queries that failed in a row.
+    """
+
+    delay_seconds: float
+    consecutive_errors: int
+
+
+@dataclass(frozen=True)
+class TokenRefreshed(WaitEvent):
+    """The wait continues with a refreshed access token, as the previous one was rejected."""
+
+
+@dataclass(frozen=True)
+class JobFinished(WaitEvent):
+    """The job has reached a final state, ending the wait.
+
+    Attributes:
+        state (FinalJobState): the final state of the job.
+        attempts (int): the number of queries it took.
+    """
+
+    state: FinalJobState
+    attempts: int
+
+
+EventSink: TypeAlias = Callable[[WaitEvent], None]
+
+
+class TextSink:
+    """Writes transient errors to a text stream, as waits have always done."""
+
+    def __init__(self, out: TextIO, *, include_job_id: bool = False) -> None:
+        """
+        Args:
+            out (TextIO): text stream to send output to.
+            include_job_id (bool, optional): whether to name the job in the output, for waits on several jobs.
+                Defaults to False.
+        """
+        self.out = out
+        self.include_job_id = include_job_id
+
+    def __call__(self, event: WaitEvent) -> None:
+        if not isinstance(event, TransientErrorEncountered):
+            return
+        error = event.error
+        subject = f"state of job {event.job_id}" if self.include_job_id else "job state"
+        self.out.write(f"Transient ({type(error).__name__}) error encountered while fetching {subject}: {error}.\n")
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, TextSink) and other.out is self.out and other.include_job_id == self.include_job_id
+
+    def __hash__(self) -> int:
+        return hash((id(self.out), self.include_job_id))
+
+
+class QueueSink:
+    """Puts events on a queue, to be consumed by another thread."""
+
+    def __init__(self, events: "queue.Queue[WaitEvent] | None" = None) -> None:
+        """
+        Args:
+            events (queue.Queue[WaitEvent] | None, optional): the queue to put events on. Defaults to a new,
+                unbounded queue.
+        """
+        self.queue: queue.Queue[WaitEvent] = events if events is not None else queue.Queue()
+
+    def __call__(self, event: WaitEvent) -> None:
+        self.queue.put(event)
+
+
+class AsyncEventStream:
+    """An async iterator over events, which may be sent from any thread.
+
+    It must be created within the event loop that iterates over it. Iteration ends once `close` has been called and
+    all events sent before have been consumed.
+    """
+
+    _CLOSED = object()
+
+    def __init__(self) -> None:
+        # Imported on first use, as asyncio takes long to import
+        import asyncio
+
+        self._loop = asyncio.get_running_loop()
+        self._events: asyncio.Queue[object] = asyncio.Queue()
+
+    def __call__(self, event: WaitEvent) -> None:
+        self._loop.call_soon_threadsafe(self._events.put_nowait, event)
+
+    def close(self) -> None:
+        """Ends the iteration once all events sent so far have been consumed."""
+        self._loop.call_soon_threadsafe(self._events.put_nowait, self._CLOSED)
+
+    def __aiter__(self) -> AsyncIterator[WaitEvent]:
+        return self
+
+    async def __anext__(self) -> WaitEvent:
+        event = await self._events.get()
+        if event is self._CLOSED:
+            # Keep the iteration ended for later calls
+            self._events.put_nowait(event)
+            raise StopAsyncIteration
+        return cast(WaitEvent, event)
+
+
+def combine_sinks(*sinks: EventSink | None) -> EventSink | None:
+    """Combines sinks into one sending each event to all of them, or None if no sink is given."""
+    given = list(dict.fromkeys(sink for sink in sinks if sink is not None))
+    if not given:
+        return None
+    if len(given) == 1:
+        return given[0]
+
+    def send(event: WaitEvent) -> None:
+        for sink in given:
+            sink(event)
+
+    return send
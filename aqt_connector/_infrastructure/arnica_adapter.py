@@ -1,8 +1,12 @@
+import threading
+from collections.abc import Callable, Iterable
 from uuid import UUID
 
 import httpx
 from pydantic import ValidationError
 
+from aqt_connector._infrastructure.result_payload import find_result_span
+from aqt_connector._infrastructure.result_stream import ResultStreamParser, ShotSink
 from aqt_connector.exceptions import (
     InvalidJobIDError,
     JobNotFoundError,
@@ -10,24 +14,50 @@ from aqt_connector.exceptions import (
     RequestError,
     UnknownServerError,
 )
-from aqt_connector.models.arnica.response_bodies.jobs import JobState, ResultResponse
+from aqt_connector.models.arnica.response_bodies.jobs import JobState, ResultResponse, RRFinished
 
 
 class ArnicaAdapter:
     """Adapter for interacting with the Arnica API."""
 
-    def __init__(self, base_url: str) -> None:
+    def __init__(self, base_url: str, *, lazy_results: bool = False) -> None:
         """Initialises the ArnicaAdapter with the given base URL.
 
         Args:
             base_url (str): The base URL of the Arnica API.
+            lazy_results (bool, optional): Whether the shots of finished jobs are only decoded when accessed, rather
+                than validated with the rest of the response. Defaults to False.
         """
         self._base_url = base_url
-        self._http_client = httpx.Client()
+        self._lazy_results = lazy_results
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def _http_client(self) -> httpx.Client:
+        """The HTTP client, created on first use so that a forked process never inherits one that is in use."""
+        client = self._client
+        if client is None:
+            with self._client_lock:
+                client = self._client
+                if client is None:
+                    client = self._client = httpx.Client()
+        return client
+
+    @_http_client.setter
+    def _http_client(self, client: httpx.Client) -> None:
+        self._client = client
+
+    def reset_after_fork(self) -> None:
+        """Drops the HTTP client inherited from the parent process without closing it, as the parent is still using
+        it, so that a new one is created on first use."""
+        self._client = None
+        self._client_lock = threading.Lock()
 
     def close(self) -> None:
         """Closes the underlying HTTP client and releases its connection pool."""
-        self._http_client.close()
+        if self._client is not None:
+            self._client.close()
 
     def fetch_job_state(self, token: str, job_id: UUID) -> JobState:
         """Fetches the state of a job from the Arnica API.
@@ -52,24 +82,126 @@ class ArnicaAdapter:
         try:
             response = self._http_client.get(endpoint_url, headers={"Authorization": f"Bearer {token}"})
             response.raise_for_status()
-            result = ResultResponse.model_validate_json(response.text)
+            content = response.content
+            span = find_result_span(content) if self._lazy_results else None
+            # Validated straight from the bytes, without decoding large results to a string first
+            if span is not None:
+                # Only the metadata is validated, the shots of each circuit are decoded when first accessed
+                result = ResultResponse.model_validate_json(content[: span[0]] + b"{}" + content[span[1] :])
+            else:
+                result = ResultResponse.model_validate_json(content)
 
         except httpx.RequestError as exc:
             raise RequestError from exc
 
         except httpx.HTTPStatusError as exc:
-            exception_map = {
-                401: NotAuthenticatedError,
-                403: NotAuthenticatedError,
-                404: JobNotFoundError,
-                422: InvalidJobIDError,
-                500: UnknownServerError,
-            }
-            if exc.response.status_code in exception_map:
-                raise exception_map[exc.response.status_code] from exc
-            raise RuntimeError from exc
+            raise _status_error(exc) from exc
 
         except ValidationError as exc:
             raise UnknownServerError from exc
 
+        if span is not None and isinstance(result.response, RRFinished):
+            result.response.attach_raw_result(content[span[0] : span[1]], lazy=True)
+
         return result.response
+
+    def stream_job_state(self, token: str, job_id: UUID, *, sink: ShotSink | None = None) -> JobState:
+        """Fetches the state of a job from the Arnica API, parsing the response as it is received.
+
+        The shots of each circuit are decoded to an array as soon as they have been received, so that neither the
+        body nor lists of the shots are ever held in memory. This requires the `numpy` extra.
+
+        Args:
+            token (str): The authentication token to access the Arnica API.
+            job_id (UUID): The unique identifier of the job to fetch.
+            sink (ShotSink | None, optional): Receives the shots of each circuit once decoded, and returns the array
+                to keep in the state, e.g. an `NpyDirectorySink`. Defaults to None, to keep the arrays in memory.
+
+        Raises:
+            See `fetch_job_state`.
+
+        Returns:
+            JobState: The current state of the job. A finished state holds its results as arrays, see
+                `RRFinished.result_arrays`.
+        """
+        endpoint_url = f"{self._base_url}/v1/result/{job_id}"
+        parser = ResultStreamParser(sink)
+
+        try:
+            with self._http_client.stream(
+                "GET", endpoint_url, headers={"Authorization": f"Bearer {token}"}
+            ) as response:
+                response.raise_for_status()
+                for chunk in response.iter_bytes():
+                    parser.feed(chunk)
+            result = ResultResponse.model_validate_json(parser.close())
+
+        except httpx.RequestError as exc:
+            raise RequestError from exc
+
+        except httpx.HTTPStatusError as exc:
+            raise _status_error(exc) from exc
+
+        except ValueError as exc:
+            # Also covers the validation of the metadata
+            raise UnknownServerError from exc
+
+        if isinstance(result.response, RRFinished):
+            result.response.attach_result_arrays(parser.arrays)
+
+        return result.response
+
+    def fetch_job_states(
+        self,
+        token: str,
+        job_ids: Iterable[UUID],
+        *,
+        max_concurrency: int = 8,
+        pace: Callable[[], None] | None = None,
+    ) -> dict[UUID, JobState | Exception]:
+        """Fetches the states of several jobs from the Arnica API.
+
+        The Arnica API doesn't provide a batch endpoint for job results, so the jobs are requested individually,
+        with at most `max_concurrency` requests in flight over the client's connection pool.
+
+        Args:
+            token (str): The authentication token to access the Arnica API.
+            job_ids (Iterable[UUID]): The unique identifiers of the jobs to fetch. Duplicates are ignored.
+            max_concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+            pace (Callable[[], None] | None, optional): Called before each request, e.g. to wait for a share of a
+                polling budget. An exception it raises is returned as the outcome of the job, which isn't requested.
+                Defaults to None.
+
+        Returns:
+            dict[UUID, JobState | Exception]: The current state of each job, or the exception raised while fetching
+                it, in the order of the given job IDs. See `fetch_job_state` for the possible exceptions.
+        """
+        unique_job_ids = list(dict.fromkeys(job_ids))
+
+        def fetch(job_id: UUID) -> JobState | Exception:
+            try:
+                if pace:
+                    pace()
+                return self.fetch_job_state(token, job_id)
+            except Exception as exc:
+                return exc
+
+        if len(unique_job_ids) <= 1 or max_concurrency <= 1:
+            return {job_id: fetch(job_id) for job_id in unique_job_ids}
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(unique_job_ids))) as executor:
+            return dict(zip(unique_job_ids, executor.map(fetch, unique_job_ids), strict=True))
+
+
+def _status_error(exc: httpx.HTTPStatusError) -> Exception:
+    """The exception raised for an error status of the Arnica API."""
+    exception_map: dict[int, type[Exception]] = {
+        401: NotAuthenticatedError,
+        403: NotAuthenticatedError,
+        404: JobNotFoundError,
+        422: InvalidJobIDError,
+        500: UnknownServerError,
+    }
+    return exception_map.get(exc.response.status_code, RuntimeError)()
@@ -0,0 +1,248 @@
+"""Export of job metadata and results to Apache Arrow record batches and Parquet files.
+
+PyArrow is an optional dependency of aqt-connector, install it with `pip install aqt-connector[arrow]`.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Literal, TypeAlias
+from uuid import UUID
+
+from aqt_connector._domain.wait_events import JobFinished, WaitEvent
+from aqt_connector.models.arnica.jobs import BasicJobMetadata
+from aqt_connector.models.arnica.response_bodies import result_analysis
+from aqt_connector.models.arnica.response_bodies.jobs import JobState, RRError, RRFinished, RROngoing
+from aqt_connector.models.arnica.response_bodies.shot_arrays import import_numpy, pack_shots
+
+if TYPE_CHECKING:
+    import pyarrow as pa  # type: ignore[import-untyped]
+
+ShotEncoding: TypeAlias = Literal["outcomes", "packed"]
+"""How the shots of each circuit are exported.
+
+- outcomes: a list of the outcome of each shot as an integer, the first qubit being the least significant bit, see
+  `result_analysis.outcomes`. Circuits may measure at most 64 qubits.
+- packed: the shots packed to one bit per qubit, as bytes of length shot_count * ceil(qubit_count / 8), see
+  `shot_arrays.pack_shots`.
+"""
+
+
+def import_pyarrow() -> Any:
+    """Imports PyArrow, explaining how to install it if it is missing."""
+    try:
+        import pyarrow
+    except ImportError as exc:
+        raise ImportError(
+            "Exporting results requires PyArrow. Install it with `pip install aqt-connector[arrow]`."
+        ) from exc
+    return pyarrow
+
+
+def result_schema(shot_encoding: ShotEncoding = "outcomes") -> pa.Schema:
+    """The schema of exported results.
+
+    There is one row per circuit of each finished job, and a single row for each job in another state, whose circuit
+    columns are null. Metadata not known, e.g. the resource of a job only known by its ID, is null.
+
+    Args:
+        shot_encoding (ShotEncoding, optional): how the shots are exported. Defaults to "outcomes".
+
+    Returns:
+        pa.Schema: the schema of the record batches.
+    """
+    pa = import_pyarrow()
+    status_change = pa.struct([("new_status", pa.string()), ("timestamp", pa.timestamp("us", tz="UTC"))])
+    shots_field = (
+        pa.field("outcomes", pa.list_(pa.uint64())) if shot_encoding == "outcomes" else pa.field("packed", pa.binary())
+    )
+    return pa.schema(
+        [
+            ("job_id", pa.string()),
+            ("label", pa.string()),
+            ("resource_id", pa.string()),
+            ("workspace_id", pa.string()),
+            ("status", pa.string()),
+            ("finished_count", pa.int64()),
+            ("message", pa.string()),
+            ("timing_data", pa.list_(status_change)),
+            ("circuit", pa.int32()),
+            ("shot_count", pa.int64()),
+            ("qubit_count", pa.int32()),
+            shots_field,
+        ]
+    )
+
+
+def result_record_batch(
+    results: Iterable[tuple[BasicJobMetadata | UUID, JobState]], *, shot_encoding: ShotEncoding = "outcomes"
+) -> pa.RecordBatch:
+    """Converts the states of jobs to a record batch, building the shot columns from arrays rather than rows.
+
+    Args:
+        results (Iterable[tuple[BasicJobMetadata | UUID, JobState]]): the metadata or ID of each job with its state,
+            e.g. as yielded by `wait_for_final_states`, or `(response.job, response.response)` for each
+            `ResultResponse`.
+        shot_encoding (ShotEncoding, optional): how the shots are exported. Defaults to "outcomes".
+
+    Raises:
+        ValueError: if a circuit measures more than 64 qubits, with the "outcomes" encoding.
+
+    Returns:
+        pa.RecordBatch: the record batch, see `result_schema`.
+    """
+    pa, np = import_pyarrow(), import_numpy()
+    schema = result_schema(shot_encoding)
+    columns: dict[str, list[Any]] = {name: [] for name in schema.names[:-1]}
+    outcomes: list[Any] = []
+    shot_counts: list[int] = []
+    packed: list[bytes | None] = []
+
+    for job, state in results:
+        metadata = job if isinstance(job, BasicJobMetadata) else None
+        row = {
+            "job_id": str(metadata.job_id if metadata else job),
+            "label": metadata.label if metadata else None,
+            "resource_id": metadata.resource_id if metadata else None,
+            "workspace_id": metadata.workspace_id if metadata else None,
+            "status": state.status.value,
+            "finished_count": state.finished_count if isinstance(state, RROngoing) else None,
+            "message": state.message if isinstance(state, RRError) else None,
+            "timing_data": (
+                [{"new_status": change.new_status.value, "timestamp": change.timestamp} for change in state.timing_data]
+                if state.timing_data is not None
+                else None
+            ),
+        }
+        circuits = state.result_arrays() if isinstance(state, RRFinished) else {}
+        for circuit, shots in circuits.items() or [(None, None)]:
+            for name, value in row.items():
+                columns[name].append(value)
+            columns["circuit"].append(circuit)
+            columns["shot_count"].append(None if shots is None else shots.shape[0])
+            columns["qubit_count"].append(None if shots is None else shots.shape[1])
+            if shot_encoding == "packed":
+                packed.append(None if shots is None else pack_shots(shots).tobytes())
+            elif shots is not None:
+                outcomes.append(result_analysis.outcomes(shots))
+            shot_counts.append(0 if shots is None else shots.shape[0])
+
+    arrays = [pa.array(columns[field.name], type=field.type) for field in list(schema)[:-1]]
+    if shot_encoding == "packed":
+        arrays.append(pa.array(packed, type=pa.binary()))
+    else:
+        # The outcomes of all circuits in one buffer, sliced by offsets, rather than a Python list per circuit
+        offsets = np.zeros(len(shot_counts) + 1, dtype=np.int32)
+        np.cumsum(shot_counts, out=offsets[1:])
+        values = np.concatenate(outcomes) if outcomes else np.zeros(0, dtype=np.uint64)
+        without_shots = pa.array(columns["circuit"]).is_null()
+        arrays.append(pa.ListArray.from_arrays(pa.array(offsets), pa.array(values), mask=without_shots))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def result_record_batches(
+    results: Iterable[tuple[BasicJobMetadata | UUID, JobState]],
+    *,
+    jobs_per_batch: int = 1000,
+    shot_encoding: ShotEncoding = "outcomes",
+) -> Iterator[pa.RecordBatch]:
+    """Converts the states of many jobs to record batches as they come, e.g. to stream them to another tool.
+
+    Args:
+        results (Iterable[tuple[BasicJobMetadata | UUID, JobState]]): the metadata or ID of each job with its state,
+            see `result_record_batch`.
+        jobs_per_batch (int, optional): the number of jobs in each batch. Defaults to 1000.
+        shot_encoding (ShotEncoding, optional): how the shots are exported. Defaults to "outcomes".
+
+    Yields:
+        pa.RecordBatch: the record batches, see `result_schema`.
+    """
+    batch: list[tuple[BasicJobMetadata | UUID, JobState]] = []
+    for result in results:
+        batch.append(result)
+        if len(batch) >= jobs_per_batch:
+            yield result_record_batch(batch, shot_encoding=shot_encoding)
+            batch = []
+    if batch:
+        yield result_record_batch(batch, shot_encoding=shot_encoding)
+
+
+class ParquetResultWriter:
+    """Writes the states of jobs to a Parquet file as they are given, one row group per batch of jobs.
+
+    Only a batch of jobs is held in memory at any time, so that a writer can export any number of jobs. A writer may
+    be shared between threads, and is also an event sink: given as the events of a wait, it writes the final state of
+    each job as it arrives. Close it, or use it as a context manager, to complete the file.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        jobs_per_row_group: int = 1000,
+        shot_encoding: ShotEncoding = "outcomes",
+        compression: str = "zstd",
+    ) -> None:
+        """
+        Args:
+            path (Path): the Parquet file to write, overwritten if it exists.
+            jobs_per_row_group (int, optional): the number of jobs in each row group. Defaults to 1000.
+            shot_encoding (ShotEncoding, optional): how the shots are exported. Defaults to "outcomes".
+            compression (str, optional): the compression codec of the file, see `pyarrow.parquet.ParquetWriter`.
+                Defaults to "zstd".
+        """
+        import_pyarrow()
+        import pyarrow.parquet as pq  # type: ignore[import-untyped]
+
+        self.path = path
+        self.jobs_per_row_group = jobs_per_row_group
+        self.shot_encoding = shot_encoding
+        self.jobs_written = 0
+        self._pending: list[tuple[BasicJobMetadata | UUID, JobState]] = []
+        self._lock = threading.Lock()
+        self._writer = pq.ParquetWriter(path, result_schema(shot_encoding), compression=compression)
+
+    def write(self, job: BasicJobMetadata | UUID, state: JobState) -> None:
+        """Writes the state of a job, once its batch is complete.
+
+        Args:
+            job (BasicJobMetadata | UUID): the metadata of the job, or only its ID.
+            state (JobState): the state of the job.
+        """
+        with self._lock:
+            self._pending.append((job, state))
+            if len(self._pending) >= self.jobs_per_row_group:
+                self._flush()
+
+    def write_all(self, results: Iterable[tuple[BasicJobMetadata | UUID, JobState]]) -> None:
+        """Writes the states of many jobs, see `write`."""
+        for job, state in results:
+            self.write(job, state)
+
+    def __call__(self, event: WaitEvent) -> None:
+        """Writes the final state of a job, so that the writer can be used as a sink."""
+        if isinstance(event, JobFinished):
+            self.write(event.job_id, event.state)
+
+    def close(self) -> None:
+        """Writes the jobs of the last batch and completes the file."""
+        with self._lock:
+            self._flush()
+            self._writer.close()
+
+    def __enter__(self) -> ParquetResultWriter:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+    def _flush(self) -> None:
+        if self._pending:
+            self._writer.write_batch(result_record_batch(self._pending, shot_encoding=self.shot_encoding))
+            self.jobs_written += len(self._pending)
+            self._pending = []
@@ -1,3 +1,4 @@
+import threading
 import urllib.parse
 
 import httpx
@@ -25,11 +26,34 @@ class Auth0Adapter:
         self.tenant_url = config.issuer
         self.device_client_id = config.device_client_id
         self.audience = config.audience
-        self._http_client = httpx.Client()
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def _http_client(self) -> httpx.Client:
+        """The HTTP client, created on first use so that a forked process never inherits one that is in use."""
+        client = self._client
+        if client is None:
+            with self._client_lock:
+                client = self._client
+                if client is None:
+                    client = self._client = httpx.Client()
+        return client
+
+    @_http_client.setter
+    def _http_client(self, client: httpx.Client) -> None:
+        self._client = client
+
+    def reset_after_fork(self) -> None:
+        """Drops the HTTP client inherited from the parent process without closing it, as the parent is still using
+        it, so that a new one is created on first use."""
+        self._client = None
+        self._client_lock = threading.Lock()
 
     def close(self) -> None:
         """Closes the underlying HTTP client and releases its connection pool."""
-        self._http_client.close()
+        if self._client is not None:
+            self._client.close()
 
     def fetch_token_with_client_credentials(self, client_id: str, client_secret: str) -> str:
         """Fetches an access token using the client credentials flow.
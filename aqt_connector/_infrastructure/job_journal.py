@@ -0,0 +1,242 @@
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from aqt_connector.models.arnica.jobs import JobStatus
+from aqt_connector.models.arnica.response_bodies.jobs import JobState
+
+if TYPE_CHECKING:
+    import sqlite3
+
+_FINAL_STATUSES = (JobStatus.FINISHED.value, JobStatus.ERROR.value, JobStatus.CANCELLED.value)
+
+# Connections inherited by forked processes, kept alive so that they are never closed
+_ABANDONED_CONNECTIONS: list["sqlite3.Connection"] = []
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    label TEXT,
+    workspace_id TEXT,
+    resource_id TEXT,
+    status TEXT,
+    result_location TEXT,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_by_status ON jobs (status);
+CREATE INDEX IF NOT EXISTS jobs_by_label ON jobs (label);
+"""
+
+
+@dataclass(frozen=True)
+class JournalEntry:
+    """What the journal knows about a job.
+
+    Attributes:
+        job_id (UUID): the ID of the job.
+        label (str | None): the label of the job, if known.
+        workspace_id (str | None): the workspace the job was submitted to, if known.
+        resource_id (str | None): the resource the job was submitted to, if known.
+        status (JobStatus | None): the last known status of the job, None if it was never fetched.
+        result_location (str | None): where the final result of the job has been stored, if anywhere.
+        updated_at (datetime): when the entry was last updated.
+    """
+
+    job_id: UUID
+    label: str | None
+    workspace_id: str | None
+    resource_id: str | None
+    status: JobStatus | None
+    result_location: str | None
+    updated_at: datetime
+
+    def is_finished(self) -> bool:
+        """Returns whether the job was last known to be in a finished state."""
+        return self.status is not None and self.status.value in _FINAL_STATUSES
+
+
+class JobJournal:
+    """Records the jobs of a user in a local SQLite database, so that they survive restarts.
+
+    The last known status and the metadata of each job are kept, with indexes on status and label for lookups without
+    network calls. Results are not: they are kept by the result cache, whose files are recorded as the result location
+    of each job. The journal can be shared between threads and processes.
+
+    Attributes:
+        path (Path): the filepath of the database.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Opens the journal at the given filepath, creating it if needed.
+
+        Args:
+            path (Path): the filepath of the database.
+        """
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Imported on first use, as only applications keeping a journal need it
+        import sqlite3
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30.0)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Closes the database."""
+        with self._lock:
+            self._connection.close()
+
+    def abandon_after_fork(self) -> None:
+        """Drops the connection inherited from the parent process without closing it.
+
+        A SQLite connection must not be used across a fork, not even to close it, so it is kept alive rather than
+        closed when garbage collected. The journal can't be used anymore, open a new one instead.
+        """
+        _ABANDONED_CONNECTIONS.append(self._connection)
+
+    def track(
+        self,
+        job_id: UUID,
+        *,
+        label: str | None = None,
+        workspace_id: str | None = None,
+        resource_id: str | None = None,
+    ) -> None:
+        """Records a job, e.g. after submitting it. Known details of a tracked job are kept unless given anew.
+
+        Args:
+            job_id (UUID): the ID of the job.
+            label (str | None, optional): the label of the job. Defaults to None.
+            workspace_id (str | None, optional): the workspace the job was submitted to. Defaults to None.
+            resource_id (str | None, optional): the resource the job was submitted to. Defaults to None.
+        """
+        self._execute(
+            """
+            INSERT INTO jobs (job_id, label, workspace_id, resource_id, updated_at) VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (job_id) DO UPDATE SET
+                label = COALESCE(excluded.label, label),
+                workspace_id = COALESCE(excluded.workspace_id, workspace_id),
+                resource_id = COALESCE(excluded.resource_id, resource_id),
+                updated_at = excluded.updated_at
+            """,
+            (str(job_id), label, workspace_id, resource_id, _now()),
+        )
+
+    def record_state(self, job_id: UUID, state: JobState) -> None:
+        """Records the status of the last known state of a job, tracking the job if needed.
+
+        Args:
+            job_id (UUID): the ID of the job.
+            state (JobState): the state of the job.
+        """
+        self._execute(
+            """
+            INSERT INTO jobs (job_id, status, updated_at) VALUES (?, ?, ?)
+            ON CONFLICT (job_id) DO UPDATE SET status = excluded.status, updated_at = excluded.updated_at
+            """,
+            (str(job_id), state.status.value, _now()),
+        )
+
+    def record_result_location(self, job_id: UUID, location: str) -> None:
+        """Records where the final result of a job has been stored, tracking the job if needed.
+
+        Args:
+            job_id (UUID): the ID of the job.
+            location (str): the location of the result, e.g. a filepath.
+        """
+        self._execute(
+            """
+            INSERT INTO jobs (job_id, result_location, updated_at) VALUES (?, ?, ?)
+            ON CONFLICT (job_id) DO UPDATE SET
+                result_location = excluded.result_location, updated_at = excluded.updated_at
+            """,
+            (str(job_id), location, _now()),
+        )
+
+    def get(self, job_id: UUID) -> JournalEntry | None:
+        """Looks up a job.
+
+        Args:
+            job_id (UUID): the ID of the job.
+
+        Returns:
+            JournalEntry | None: the entry of the job, None if it isn't in the journal.
+        """
+        rows = self._query(f"SELECT {_ENTRY_COLUMNS} FROM jobs WHERE job_id = ?", (str(job_id),))
+        return _entry(rows[0]) if rows else None
+
+    def entries(
+        self, *, status: JobStatus | Iterable[JobStatus] | None = None, label: str | None = None
+    ) -> list[JournalEntry]:
+        """Lists the jobs in the journal, optionally only those with the given status and label.
+
+        Args:
+            status (JobStatus | Iterable[JobStatus] | None, optional): the last known status or statuses of the jobs
+                to list. Defaults to None.
+            label (str | None, optional): the label of the jobs to list. Defaults to None.
+
+        Returns:
+            list[JournalEntry]: the matching entries, least recently updated first.
+        """
+        conditions: list[str] = []
+        parameters: list[str] = []
+        if status is not None:
+            statuses = [status] if isinstance(status, JobStatus) else list(status)
+            conditions.append(f"status IN ({', '.join('?' * len(statuses))})")
+            parameters.extend(status.value for status in statuses)
+        if label is not None:
+            conditions.append("label = ?")
+            parameters.append(label)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self._query(f"SELECT {_ENTRY_COLUMNS} FROM jobs {where} ORDER BY updated_at", tuple(parameters))
+        return [_entry(row) for row in rows]
+
+    def unfinished(self, *, label: str | None = None) -> list[JournalEntry]:
+        """Lists the jobs not known to be finished, including those whose state was never fetched.
+
+        Args:
+            label (str | None, optional): the label of the jobs to list. Defaults to None.
+
+        Returns:
+            list[JournalEntry]: the matching entries, least recently updated first.
+        """
+        where = f"WHERE (status IS NULL OR status NOT IN ({', '.join('?' * len(_FINAL_STATUSES))}))"
+        parameters: tuple[str, ...] = _FINAL_STATUSES
+        if label is not None:
+            where += " AND label = ?"
+            parameters += (label,)
+        rows = self._query(f"SELECT {_ENTRY_COLUMNS} FROM jobs {where} ORDER BY updated_at", parameters)
+        return [_entry(row) for row in rows]
+
+    def _execute(self, statement: str, parameters: tuple[str | None, ...]) -> None:
+        with self._lock:
+            self._connection.execute(statement, parameters)
+
+    def _query(self, statement: str, parameters: tuple[str, ...]) -> list[tuple]:
+        with self._lock:
+            return self._connection.execute(statement, parameters).fetchall()
+
+
+_ENTRY_COLUMNS = "job_id, label, workspace_id, resource_id, status, result_location, updated_at"
+
+
+def _entry(row: tuple) -> JournalEntry:
+    job_id, label, workspace_id, resource_id, status, result_location, updated_at = row
+    return JournalEntry(
+        job_id=UUID(job_id),
+        label=label,
+        workspace_id=workspace_id,
+        resource_id=resource_id,
+        status=JobStatus(status) if status is not None else None,
+        result_location=result_location,
+        updated_at=datetime.fromisoformat(updated_at),
+    )
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
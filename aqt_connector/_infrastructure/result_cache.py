@@ -0,0 +1,174 @@
+import os
+import tempfile
+import threading
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from uuid import UUID
+
+from pydantic import ConfigDict, TypeAdapter, ValidationError
+
+from aqt_connector.models.arnica.response_bodies.jobs import FinalJobState, RRFinished
+
+_FINAL_STATE_ADAPTER: TypeAdapter[FinalJobState] = TypeAdapter(FinalJobState, config=ConfigDict(defer_build=True))
+_SUFFIX = ".json.gz"
+
+
+class ResultCache:
+    """Caches the final states of jobs, which never change, in two tiers.
+
+    Recently used states are kept in memory, in front of gzip-compressed JSON files in a directory, so that they
+    survive restarts. Each tier is bounded in size, evicting the least recently used states first: the size of a
+    state in memory is estimated as the length of its JSON. States are written atomically, so that several processes
+    can share the directory.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        memory_bytes: int = 64 * 1024**2,
+        disk_bytes: int = 1024**3,
+        compression_level: int = 6,
+    ) -> None:
+        """
+        Args:
+            directory (Path): the directory to store the states in, created when first needed.
+            memory_bytes (int, optional): the budget of the memory tier, 0 to disable it. Defaults to 64 MiB.
+            disk_bytes (int, optional): the budget of the disk tier, 0 to disable it. Defaults to 1 GiB.
+            compression_level (int, optional): the gzip compression level of the disk tier, from 1 (fastest) to 9
+                (smallest). Defaults to 6.
+        """
+        self.directory = directory
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self.compression_level = compression_level
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[UUID, tuple[FinalJobState, int]] = OrderedDict()
+        self._memory_used = 0
+        # An estimate of the size of the disk tier, which other processes may also write to, checked when exceeded
+        self._disk_used: int | None = None
+
+    def get(self, job_id: UUID) -> FinalJobState | None:
+        """Looks up the final state of a job, from memory, else from disk.
+
+        Args:
+            job_id (UUID): the unique identifier of the job.
+
+        Returns:
+            FinalJobState | None: the final state of the job, None if it isn't cached.
+        """
+        with self._lock:
+            entry = self._memory.get(job_id)
+            if entry is not None:
+                self._memory.move_to_end(job_id)
+                return entry[0]
+
+        if not self.disk_bytes:
+            return None
+        import gzip
+
+        path = self._path(job_id)
+        try:
+            body = gzip.decompress(path.read_bytes())
+            state = _FINAL_STATE_ADAPTER.validate_json(body)
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, zlib.error, ValidationError):
+            # Left incomplete or corrupted, e.g. by a crash, so it's fetched again
+            path.unlink(missing_ok=True)
+            return None
+        self._remember(job_id, state, len(body))
+        return state
+
+    def put(self, job_id: UUID, state: FinalJobState) -> Path | None:
+        """Caches the final state of a job in both tiers.
+
+        Args:
+            job_id (UUID): the unique identifier of the job.
+            state (FinalJobState): the final state of the job.
+
+        Returns:
+            Path | None: the file the state was written to, None if the disk tier is disabled.
+        """
+        body = _dump_json(state)
+        self._remember(job_id, state, len(body))
+        if not self.disk_bytes:
+            return None
+        import gzip
+
+        return self._write(job_id, gzip.compress(body, compresslevel=self.compression_level))
+
+    def discard(self, job_id: UUID) -> None:
+        """Removes the state of a job from both tiers, if cached.
+
+        Args:
+            job_id (UUID): the unique identifier of the job.
+        """
+        with self._lock:
+            entry = self._memory.pop(job_id, None)
+            if entry is not None:
+                self._memory_used -= entry[1]
+        self._path(job_id).unlink(missing_ok=True)
+
+    def _remember(self, job_id: UUID, state: FinalJobState, size: int) -> None:
+        if size > self.memory_bytes:
+            return
+        with self._lock:
+            previous = self._memory.pop(job_id, None)
+            if previous is not None:
+                self._memory_used -= previous[1]
+            self._memory[job_id] = (state, size)
+            self._memory_used += size
+            while self._memory_used > self.memory_bytes:
+                _, (_, evicted_size) = self._memory.popitem(last=False)
+                self._memory_used -= evicted_size
+
+    def _write(self, job_id: UUID, compressed: bytes) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(job_id)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(compressed)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        with self._lock:
+            if self._disk_used is not None:
+                self._disk_used += len(compressed)
+            if self._disk_used is None or self._disk_used > self.disk_bytes:
+                self._disk_used = self._evict_from_disk()
+        return path
+
+    def _evict_from_disk(self) -> int:
+        """Removes the least recently used files until the disk tier fits its budget, returning its size."""
+        entries = []
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        used = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if used <= self.disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            used -= size
+        return used
+
+    def _path(self, job_id: UUID) -> Path:
+        return self.directory / f"{job_id}{_SUFFIX}"
+
+
+def _dump_json(state: FinalJobState) -> bytes:
+    """Serializes a final state, writing the raw JSON or arrays of a lazy result as they are, without decoding it."""
+    if not isinstance(state, RRFinished) or not state.is_lazy():
+        return _FINAL_STATE_ADAPTER.dump_json(state)
+    # The metadata is serialized with an empty result, which is then replaced
+    metadata = _FINAL_STATE_ADAPTER.dump_json(state.model_copy(update={"result": {}}))
+    before, _, after = metadata.rpartition(b'"result":{}')
+    return before + b'"result":' + state.result_json() + after
@@ -0,0 +1,98 @@
+"""Locating the measurement results in the raw body of a result response, without parsing them."""
+
+import re
+
+# The start of a token, and a whole string token
+_TOKEN_START = re.compile(rb'["{}\[\]:,]')
+_STRING = re.compile(rb'"(?:[^"\\]|\\.)*"')
+
+
+def find_result_span(body: bytes) -> tuple[int, int] | None:
+    """Finds the `response.result` object of a result response body.
+
+    Only the part of the body before the result is tokenised. The result itself is never parsed, as it consists of
+    arrays of bits keyed by circuit index and contains no nested objects, so that its end is the first closing brace.
+
+    Args:
+        body (bytes): the JSON body of a result response.
+
+    Returns:
+        tuple[int, int] | None: the start and end offsets of the result object, None if the body has no result.
+    """
+    start = find_result_start(body)
+    if start is None:
+        return None
+    end = body.find(b"}", start)
+    return (start, end + 1) if end >= 0 else None
+
+
+def find_result_start(body: bytes) -> int | None:
+    """Finds the opening brace of the `response.result` object of a result response body.
+
+    Args:
+        body (bytes): the JSON body of a result response.
+
+    Returns:
+        int | None: the offset of the opening brace of the result object, None if the body has no result.
+    """
+    return ResultStartScanner().scan(body)
+
+
+class ResultStartScanner:
+    """Finds the opening brace of the `response.result` object of a result response body received in parts.
+
+    Every call scans the body received so far from where the previous one stopped, keeping the containers being
+    parsed, so that each byte is only tokenised once however the body is split. A token cut off at the end of the
+    body, e.g. a string, is scanned again once more of the body is available.
+    """
+
+    def __init__(self) -> None:
+        # The keys of the containers being parsed, from the outermost one, None for the root and array items
+        self._path: list[bytes | None] = []
+        self._key: bytes | None = None
+        self._position = 0
+
+    def scan(self, body: bytes | bytearray) -> int | None:
+        """Scans the body received so far, which must start with the body given to the previous calls.
+
+        Args:
+            body (bytes | bytearray): the JSON body of a result response, or its beginning.
+
+        Returns:
+            int | None: the offset of the opening brace of the result object, None if it isn't found (yet).
+        """
+        while (token := _TOKEN_START.search(body, self._position)) is not None:
+            end = token.end()
+            value = bytes(token.group())
+            if value == b'"':
+                string = _STRING.match(body, token.start())
+                if string is None:
+                    break
+                end = string.end()
+                value = bytes(string.group())
+            if value in (b"{", b"["):
+                self._path.append(self._key)
+                self._key = None
+            elif value in (b"}", b"]"):
+                if self._path:
+                    self._path.pop()
+                self._key = None
+            elif value == b",":
+                self._key = None
+            elif value == b":":
+                if self._path == [None, b'"response"'] and self._key == b'"result"':
+                    start = _skip_whitespace(body, end)
+                    if start == len(body):
+                        break
+                    if body[start : start + 1] == b"{":
+                        return start
+            elif self._key is None:
+                self._key = value
+            self._position = end
+        return None
+
+
+def _skip_whitespace(body: bytes | bytearray, position: int) -> int:
+    while body[position : position + 1] in (b" ", b"\t", b"\r", b"\n"):
+        position += 1
+    return position
@@ -0,0 +1,218 @@
+"""An append-only store of the shots of finished jobs on disk, read back as memory-mapped arrays."""
+
+from __future__ import annotations
+
+import functools
+import threading
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from aqt_connector._domain.wait_events import JobFinished, WaitEvent
+from aqt_connector.models.arnica.response_bodies.jobs import RRFinished
+from aqt_connector.models.arnica.response_bodies.shot_arrays import import_numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+_MAGIC = b"AQTSHOTS\x01"
+_HEADER_SIZE = 64
+_INDEX_FILE = "index.bin"
+_DATA_FILE = "shots.bin"
+
+
+@functools.cache
+def _index_dtype() -> Any:
+    """The layout of the index records, one per circuit, stored little-endian right after the header."""
+    np = import_numpy()
+    return np.dtype(
+        [("job_id", "V16"), ("circuit", "<u4"), ("qubits", "<u4"), ("shots", "<u8"), ("offset", "<u8")], align=False
+    )
+
+
+class ResultStore:
+    """Stores the shots of finished jobs in a directory, as fixed-layout binary arrays indexed by job and circuit.
+
+    The shots of each circuit are appended to a data file as an array of bits of shape (shots, qubits), one byte per
+    bit, and an index file records the job, circuit, shape and offset of each array. Both files only ever grow, and the
+    index is written after the data it refers to, so that an interrupted write is ignored. Reads return read-only
+    memory-mapped views of the data file, which are not copied: many processes can read the same store while sharing
+    the page cache, and a store can be far larger than the available memory.
+
+    A store may be shared between threads, but only one process may append to it at a time, while any number read
+    from it. It is also an event sink: given as the events of a wait, it stores the results of the jobs as they
+    finish. It requires the `numpy` extra.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """
+        Args:
+            directory (Path): the directory of the store, created when first appended to.
+        """
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._jobs: dict[UUID, dict[int, tuple[int, int, int]]] = {}
+        self._records_read = 0
+        self._data: NDArray[np.uint8] | None = None
+
+    def append(self, job_id: UUID, state: RRFinished) -> bool:
+        """Stores the shots of a finished job.
+
+        Args:
+            job_id (UUID): the unique identifier of the job.
+            state (RRFinished): the final state of the job.
+
+        Returns:
+            bool: whether the job was stored, False if it already was, as the results of a job never change.
+        """
+        return self.append_arrays(job_id, state.result_arrays())
+
+    def append_arrays(self, job_id: UUID, arrays: Mapping[int, NDArray[np.uint8]]) -> bool:
+        """Stores the shots of each circuit of a job, as returned by `RRFinished.result_arrays`.
+
+        Args:
+            job_id (UUID): the unique identifier of the job.
+            arrays (Mapping[int, NDArray[np.uint8]]): the shots of each circuit, as arrays of bits of shape
+                (shots, qubits).
+
+        Raises:
+            ValueError: if an array isn't two-dimensional.
+
+        Returns:
+            bool: whether the job was stored, False if it already was.
+        """
+        np = import_numpy()
+        if any(shots.ndim != 2 for shots in arrays.values()):
+            raise ValueError("The shots of a circuit must be an array of shape (shots, qubits).")
+        with self._lock:
+            self._refresh()
+            if job_id in self._jobs:
+                return False
+            self.directory.mkdir(parents=True, exist_ok=True)
+            records = []
+            with open(self.directory / _DATA_FILE, "ab") as data:
+                offset = data.tell()
+                for circuit, shots in sorted(arrays.items()):
+                    records.append((job_id.bytes, circuit, shots.shape[1], shots.shape[0], offset))
+                    data.write(np.ascontiguousarray(shots, dtype=np.uint8).tobytes())
+                    offset += shots.size
+            index_path = self.directory / _INDEX_FILE
+            with open(index_path, "ab") as index:
+                if index.tell() == 0:
+                    index.write(_MAGIC.ljust(_HEADER_SIZE, b"\x00"))
+                else:
+                    # Drops the end of a record left incomplete by an interrupted write
+                    index.truncate(_HEADER_SIZE + self._records_read * _index_dtype().itemsize)
+                index.write(np.array(records, dtype=_index_dtype()).tobytes())
+            self._refresh()
+            return True
+
+    def __contains__(self, job_id: object) -> bool:
+        with self._lock:
+            self._refresh()
+            return job_id in self._jobs
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._jobs)
+
+    def __iter__(self) -> Iterator[UUID]:
+        return iter(self.job_ids())
+
+    def job_ids(self) -> list[UUID]:
+        """The jobs in the store, in the order they were stored, including those stored by other processes."""
+        with self._lock:
+            self._refresh()
+            return list(self._jobs)
+
+    def circuits(self, job_id: UUID) -> list[int]:
+        """The indices of the circuits of a stored job.
+
+        Raises:
+            KeyError: if the job isn't stored.
+        """
+        with self._lock:
+            self._refresh()
+            return list(self._jobs[job_id])
+
+    def result_array(self, job_id: UUID, circuit: int) -> NDArray[np.uint8]:
+        """The shots of a circuit of a stored job, without copying them.
+
+        Args:
+            job_id (UUID): the unique identifier of the job.
+            circuit (int): the index of the circuit.
+
+        Raises:
+            KeyError: if the job or circuit isn't stored.
+
+        Returns:
+            NDArray[np.uint8]: a read-only memory-mapped array of bits of shape (shots, qubits).
+        """
+        with self._lock:
+            self._refresh()
+            offset, shots, qubits = self._jobs[job_id][circuit]
+            data = self._mapped_data(offset + shots * qubits)
+        return data[offset : offset + shots * qubits].reshape(shots, qubits)
+
+    def result_arrays(self, job_id: UUID) -> dict[int, NDArray[np.uint8]]:
+        """The shots of every circuit of a stored job, without copying them.
+
+        Raises:
+            KeyError: if the job isn't stored.
+
+        Returns:
+            dict[int, NDArray[np.uint8]]: the shots of each circuit, see `result_array`.
+        """
+        return {circuit: self.result_array(job_id, circuit) for circuit in self.circuits(job_id)}
+
+    def __call__(self, event: WaitEvent) -> None:
+        """Stores the results of a job that finished successfully, so that the store can be used as a sink."""
+        if isinstance(event, JobFinished) and isinstance(event.state, RRFinished):
+            self.append(event.job_id, event.state)
+
+    def _refresh(self) -> None:
+        """Reads the index records appended since the last read, possibly by another process."""
+        np = import_numpy()
+        index_path = self.directory / _INDEX_FILE
+        try:
+            size = index_path.stat().st_size
+        except FileNotFoundError:
+            return
+        dtype = _index_dtype()
+        complete = max(size - _HEADER_SIZE, 0) // dtype.itemsize
+        if complete <= self._records_read:
+            return
+        with open(index_path, "rb") as index:
+            header = index.read(_HEADER_SIZE)
+            if not header.startswith(_MAGIC):
+                raise ValueError(f"{index_path} is not the index of a result store.")
+            index.seek(_HEADER_SIZE + self._records_read * dtype.itemsize)
+            records = np.frombuffer(index.read((complete - self._records_read) * dtype.itemsize), dtype=dtype)
+        for record in records.tolist():
+            job_bytes, circuit, qubits, shots, offset = record
+            self._jobs.setdefault(UUID(bytes=bytes(job_bytes)), {})[circuit] = (offset, shots, qubits)
+        self._records_read = complete
+
+    def _mapped_data(self, end: int) -> NDArray[np.uint8]:
+        """The data file mapped to memory, mapped again if it has grown past the end of the requested array."""
+        if self._data is not None and len(self._data) >= end:
+            return self._data
+        if end == 0:
+            return import_numpy().zeros(0, dtype="uint8")
+        data: NDArray[np.uint8] = import_numpy().memmap(self.directory / _DATA_FILE, dtype="uint8", mode="r")
+        self._data = data
+        return data
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Pickles as its directory, e.g. to be read from by the workers of a process pool
+        return {"directory": self.directory}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.directory = state["directory"]
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._records_read = 0
+        self._data = None
@@ -0,0 +1,143 @@
+"""Incremental parsing of result responses, decoding the shots of each circuit to an array as soon as it arrives."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from aqt_connector._infrastructure.result_payload import ResultStartScanner
+from aqt_connector.models.arnica.response_bodies.shot_arrays import CIRCUIT_KEY, decode_circuit_shots, import_numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+ShotSink = Callable[[int, "NDArray[np.uint8]"], "NDArray[np.uint8]"]
+"""Receives the shots of each circuit as soon as they are decoded, and returns the array to keep in the state."""
+
+_MAX_KEY_LENGTH = 64
+_OPEN, _CLOSE = ord("["), ord("]")
+
+
+class NpyDirectorySink:
+    """Writes the shots of each circuit to a `.npy` file in a directory, keeping them memory-mapped from there.
+
+    Streamed into this sink, a result never needs to be held in memory as a whole.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """
+        Args:
+            directory (Path): the directory to write to, created if missing. Existing files are overwritten.
+        """
+        self.directory = directory
+
+    def __call__(self, circuit: int, shots: NDArray[np.uint8]) -> NDArray[np.uint8]:
+        np = import_numpy()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{circuit}.npy"
+        np.save(path, shots)
+        return np.load(path, mmap_mode="r")
+
+
+class ResultStreamParser:
+    """Parses a result response body fed chunk by chunk.
+
+    The parts of the body around the result are kept to be validated once complete, while the shots of each circuit
+    are decoded as soon as its last chunk arrives, so that at most one circuit is held as JSON at any time.
+    """
+
+    def __init__(self, sink: ShotSink | None = None) -> None:
+        """
+        Args:
+            sink (ShotSink | None, optional): receives the shots of each circuit once decoded. Defaults to None, to
+                keep the arrays in memory.
+        """
+        self.sink = sink
+        self.arrays: dict[int, NDArray[np.uint8]] = {}
+        self._before_result = bytearray()
+        self._result_scanner = ResultStartScanner()
+        self._after_result = bytearray()
+        self._result_start: int | None = None
+        self._result_ended = False
+        self._pending = bytearray()
+        self._circuit: int | None = None
+        self._depth = 0
+
+    def feed(self, chunk: bytes) -> None:
+        """Parses the next chunk of the body.
+
+        Raises:
+            ValueError: if the result is not made of rectangular arrays of bits.
+        """
+        if self._result_ended:
+            self._after_result += chunk
+        elif self._result_start is None:
+            self._before_result += chunk
+            self._result_start = self._result_scanner.scan(self._before_result)
+            if self._result_start is not None:
+                rest = self._before_result[self._result_start + 1 :]
+                del self._before_result[self._result_start :]
+                self._parse_result(bytes(rest))
+        else:
+            self._parse_result(chunk)
+
+    def close(self) -> bytes:
+        """Ends the parsing of the body.
+
+        Raises:
+            ValueError: if the result is incomplete.
+
+        Returns:
+            bytes: the body with an empty result object, or the whole body if it has no result.
+        """
+        if self._result_start is None:
+            return bytes(self._before_result)
+        if not self._result_ended:
+            raise ValueError("The result of the response is incomplete.")
+        return bytes(self._before_result) + b"{}" + bytes(self._after_result)
+
+    def _parse_result(self, data: bytes) -> None:
+        while data and not self._result_ended:
+            data = self._parse_shots(data) if self._circuit is not None else self._parse_key(data)
+
+    def _parse_key(self, data: bytes) -> bytes:
+        """Parses the key of the next circuit or the end of the result, returning the data after it."""
+        self._pending += data
+        # The separators between circuits are dropped so as not to accumulate
+        del self._pending[: len(self._pending) - len(self._pending.lstrip(b" \t\r\n,"))]
+        match = CIRCUIT_KEY.match(self._pending)
+        if match:
+            self._circuit = int(match.group(1))
+            rest = bytes(self._pending[match.end() - 1 :])
+            self._pending.clear()
+            return rest
+        if self._pending.startswith(b"}"):
+            self._result_ended = True
+            self._after_result += self._pending[1:]
+            self._pending.clear()
+        elif len(self._pending) > _MAX_KEY_LENGTH:
+            raise ValueError("The result of the response may only contain arrays of shots keyed by circuit index.")
+        return b""
+
+    def _parse_shots(self, data: bytes) -> bytes:
+        """Parses the shots of the current circuit, returning the data after them once they are complete."""
+        np = import_numpy()
+        buffer = np.frombuffer(data, dtype=np.uint8)
+        depth = self._depth + np.cumsum((buffer == _OPEN).astype(np.int32) - (buffer == _CLOSE))
+        closed = np.flatnonzero(depth == 0)
+        if len(closed) == 0:
+            self._pending += data
+            self._depth = int(depth[-1])
+            return b""
+
+        end = int(closed[0]) + 1
+        self._pending += data[:end]
+        assert self._circuit is not None
+        shots = decode_circuit_shots(bytes(self._pending))
+        self.arrays[self._circuit] = self.sink(self._circuit, shots) if self.sink else shots
+        self._pending.clear()
+        self._circuit = None
+        self._depth = 0
+        return data[end:]
@@ -0,0 +1,170 @@
+"""Hand-off of the results of finished jobs to other processes through shared memory, without copying them."""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import sys
+import threading
+import weakref
+from collections.abc import Iterator
+from dataclasses import dataclass
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+from aqt_connector.models.arnica.response_bodies.jobs import RRFinished
+from aqt_connector.models.arnica.response_bodies.shot_arrays import import_numpy
+
+if TYPE_CHECKING:
+    from multiprocessing import shared_memory
+
+# Shared memory is only tracked by the resource tracker on POSIX, which can't be started on Windows
+_TRACKED = os.name == "posix"
+
+
+@dataclass(frozen=True)
+class SharedResult:
+    """Describes the results of a finished job held in shared memory, small enough to be sent to other processes.
+
+    Attributes:
+        name (str): the name of the shared memory block.
+        circuits (tuple[tuple[int, int, int, int], ...]): the index, offset in the block, number of shots and number
+            of qubits of each circuit.
+    """
+
+    name: str
+    circuits: tuple[tuple[int, int, int, int], ...]
+
+    @contextlib.contextmanager
+    def attach(self) -> Iterator[RRFinished]:
+        """Attaches to the shared memory block, e.g. in a worker process, viewing the results without copying them.
+
+        The state and its arrays are only valid within the block: copy what must outlive it.
+
+        Yields:
+            RRFinished: a finished state whose results are read-only views of the shared memory.
+        """
+        from multiprocessing import resource_tracker, shared_memory
+
+        np = import_numpy()
+        # Only the process that shared the results removes the block: before Python 3.13, attaching registers it with
+        # the resource tracker of this process, which would otherwise remove it when this process exits
+        if sys.version_info >= (3, 13):
+            block = shared_memory.SharedMemory(self.name, track=False)  # type: ignore[call-arg, unused-ignore]
+        else:
+            block = shared_memory.SharedMemory(self.name)
+            if _TRACKED:
+                resource_tracker.unregister(block._name, "shared_memory")  # type: ignore[attr-defined]
+        state = RRFinished(result={})
+        try:
+            buffer = np.frombuffer(block.buf, dtype=np.uint8)
+            buffer.flags.writeable = False
+            state.attach_result_arrays(
+                {
+                    circuit: buffer[offset : offset + shots * qubits].reshape(shots, qubits)
+                    for circuit, offset, shots, qubits in self.circuits
+                }
+            )
+            del buffer
+            yield state
+        finally:
+            # The views are dropped so that the block can be closed, unless some were kept beyond it
+            state.attach_result_arrays({})
+            with contextlib.suppress(BufferError):
+                block.close()
+
+
+class SharedResults:
+    """Shares the results of finished jobs with other processes, e.g. the workers of a process pool.
+
+    Each shared state is copied once into a shared memory block, described by a `SharedResult` that pickles as a few
+    bytes: workers attach to the block rather than receiving a copy of the shots. The blocks are removed when released,
+    when the owner is closed or garbage collected, or at the latest when the interpreter exits. Requires the `numpy`
+    extra.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._blocks: dict[str, shared_memory.SharedMemory] = {}
+        self._finalizer = weakref.finalize(self, _remove_blocks, self._blocks)
+
+    def share(self, state: RRFinished) -> SharedResult:
+        """Copies the results of a finished job into shared memory.
+
+        Args:
+            state (RRFinished): the final state of the job.
+
+        Raises:
+            RuntimeError: if the shared results are closed.
+
+        Returns:
+            SharedResult: the descriptor of the shared results, to send to other processes.
+        """
+        # Imported on first use, as multiprocessing takes long to import
+        from multiprocessing import shared_memory
+
+        np = import_numpy()
+        arrays = state.result_arrays()
+        circuits = []
+        offset = 0
+        for circuit, shots in arrays.items():
+            circuits.append((circuit, offset, *shots.shape))
+            offset += shots.size
+        # A block can't be empty
+        block = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        try:
+            buffer = np.frombuffer(block.buf, dtype=np.uint8)
+            for (_, start, _, _), shots in zip(circuits, arrays.values(), strict=True):
+                buffer[start : start + shots.size] = shots.reshape(-1)
+            del buffer
+        except BaseException:
+            _remove_block(block)
+            raise
+        with self._lock:
+            if self._finalizer.alive:
+                self._blocks[block.name] = block
+                return SharedResult(block.name, tuple(circuits))
+        _remove_block(block)
+        raise RuntimeError("Results can't be shared once closed.")
+
+    def release(self, shared: SharedResult) -> None:
+        """Removes the shared memory block of shared results, once no process needs them anymore."""
+        with self._lock:
+            block = self._blocks.pop(shared.name, None)
+        if block is not None:
+            _remove_block(block)
+
+    def close(self) -> None:
+        """Removes the shared memory blocks of all the results shared, after which no more results can be shared."""
+        with self._lock:
+            self._finalizer()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._blocks)
+
+    def __enter__(self) -> SharedResults:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+
+def _remove_block(block: shared_memory.SharedMemory) -> None:
+    with contextlib.suppress(BufferError):
+        block.close()
+    if sys.version_info < (3, 13) and _TRACKED:
+        from multiprocessing import resource_tracker
+
+        # Workers sharing the resource tracker of this process unregister the block when attaching to it, while
+        # removing it unregisters it again
+        resource_tracker.register(block._name, "shared_memory")  # type: ignore[attr-defined]
+    with contextlib.suppress(FileNotFoundError):
+        block.unlink()
+
+
+def _remove_blocks(blocks: dict[str, shared_memory.SharedMemory]) -> None:
+    while blocks:
+        _remove_block(blocks.popitem()[1])
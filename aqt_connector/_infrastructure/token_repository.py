@@ -1,9 +1,14 @@
+import os
+import tempfile
 from pathlib import Path
 
 
 class TokenRepository:
     """Stores access and refresh tokens on disk.
 
+    Tokens are replaced atomically, so concurrent readers, in any thread or process, never see a partially written
+    token.
+
     Attributes:
         access_token_path (Path): the filepath where the access token is stored.
         refresh_token_path (Path): the filepath where the refresh token is stored.
@@ -57,8 +62,14 @@ class TokenRepository:
             path (Path): the file path to save the token.
             token (str): the token to save.
         """
-        with open(path, "w") as f:
-            f.write(token)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(token)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
 
     def _load_token(self, path: Path) -> str | None:
         """Loads a token from disk at the specified path.
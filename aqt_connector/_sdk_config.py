@@ -25,6 +25,16 @@ class ArnicaConfig:
         client_id (str | None): the ID to use for authentication with client credentials. Defaults to None.
         client_secret (str | None): the secret to use for authentication with client credentials. Defaults to None.
         store_access_token (bool): when True, the access token will be persisted to disk. Defaults to True.
+        max_polls_per_second (float | None): the budget of job state queries per second, shared between all waits
+            of an application, None or 0 for no budget. Defaults to 20.
+        journal (bool): when True, the jobs, their metadata and last known statuses are recorded in a local
+            journal, so that the jobs still running can be listed after a restart. Defaults to False.
+        lazy_results (bool): when True, the shots of a finished job are only decoded when accessed, one circuit at a
+            time, rather than when its state is fetched. Defaults to False.
+        result_cache (bool): when True, the final states of jobs are cached in memory and compressed on disk, so
+            that fetching or waiting for a finished job again doesn't query it. Defaults to False.
+        result_cache_memory_mb (float): the size of the memory tier of the result cache, in MiB. Defaults to 64.
+        result_cache_disk_mb (float): the size of the disk tier of the result cache, in MiB. Defaults to 1024.
         oidc_config (AuthenticationConfig): configuration for the OIDC provider.
     """
 
@@ -40,6 +50,12 @@ class ArnicaConfig:
         self.client_id: str | None = None
         self.client_secret: str | None = None
         self.store_access_token = True
+        self.max_polls_per_second: float | None = 20.0
+        self.journal = False
+        self.lazy_results = False
+        self.result_cache = False
+        self.result_cache_memory_mb = 64.0
+        self.result_cache_disk_mb = 1024.0
         self.oidc_config = AuthenticationConfig()
 
         self._read_config()
@@ -54,6 +70,12 @@ class ArnicaConfig:
         self.client_id = config.get("client_id")
         self.client_secret = config.get("client_secret")
         self.store_access_token = bool(config.get("store_access_token", "true"))
+        self.max_polls_per_second = float(config.get("max_polls_per_second", 20.0)) or None
+        self.journal = _parse_flag("journal", config.get("journal", False))
+        self.lazy_results = _parse_flag("lazy_results", config.get("lazy_results", False))
+        self.result_cache = _parse_flag("result_cache", config.get("result_cache", False))
+        self.result_cache_memory_mb = float(config.get("result_cache_memory_mb", 64.0))
+        self.result_cache_disk_mb = float(config.get("result_cache_disk_mb", 1024.0))
 
     def _add_file_config(self, config: dict[str, str], config_filepath: Path) -> dict[str, str]:
         try:
@@ -80,3 +102,16 @@ class ArnicaConfig:
             _config[config_key] = value
 
         return _config
+
+
+def _parse_flag(name: str, value: object) -> bool:
+    """Parses a boolean option, given either as a TOML boolean or integer, or as a string such as "true" or "0"."""
+    if isinstance(value, int):
+        return bool(value)
+    if isinstance(value, str):
+        spelling = value.strip().lower()
+        if spelling in ("1", "true", "yes", "on"):
+            return True
+        if spelling in ("0", "false", "no", "off", ""):
+            return False
+    raise ValueError(f"The {name} option must be a boolean, got {value!r}.")
@@ -28,3 +28,7 @@ class UnknownServerError(RuntimeError):
 
 class RequestError(ConnectionError):
     """A failure due to issues with a request."""
+
+
+class WaitCancelledError(RuntimeError):
+    """A failure to wait for a job to finish, as the wait was cancelled."""
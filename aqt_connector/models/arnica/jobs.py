@@ -5,7 +5,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class JobStatus(str, Enum):
@@ -39,6 +39,8 @@ class JobType(str, Enum):
 class StatusChange(BaseModel):
     """Model for a job status change."""
 
+    model_config = ConfigDict(defer_build=True)
+
     new_status: JobStatus
     timestamp: datetime
 
@@ -46,6 +48,8 @@ class StatusChange(BaseModel):
 class BasicJobMetadata(BaseModel):
     """Metadata for a user-submitted job."""
 
+    model_config = ConfigDict(defer_build=True)
+
     job_id: uuid.UUID = Field(description="Id that uniquely identifies the job. This is used to request results.")
     job_type: Literal[JobType.QUANTUM_CIRCUIT] = JobType.QUANTUM_CIRCUIT
     label: str | None = None
@@ -2,7 +2,7 @@
 
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from aqt_connector.models import BaseModelSerialisable
 from aqt_connector.models.arnica.jobs import JobType
@@ -20,4 +20,6 @@ class SubmitJobRequest(BaseModelSerialisable):
 class QuantumCircuits(BaseModel):
     """Payload of a SubmitJobRequest with job_type 'quantum_circuit'."""
 
+    model_config = ConfigDict(defer_build=True)
+
     circuits: list[QuantumCircuit] = Field(min_length=1, max_length=50)
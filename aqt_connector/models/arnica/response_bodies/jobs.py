@@ -1,17 +1,41 @@
 """ARNICA API response bodies for jobs."""
 
-from typing import Literal, TypeAlias
+from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Annotated, Any, Literal, TypeAlias
 
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
+    TypeAdapter,
+    model_serializer,
+)
+
+from aqt_connector.exceptions import UnknownServerError
 from aqt_connector.models import BaseModelSerialisable
 from aqt_connector.models.arnica.jobs import BasicJobMetadata, JobStatus, StatusChange
+from aqt_connector.models.arnica.response_bodies import shot_arrays
 from aqt_connector.models.operations import Bit
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+RESULT_ENCODER_CONTEXT_KEY = "aqt_connector.result_encoder"
+"""The key of a serialization context entry taking a finished state and returning the serialized form of its result."""
+
 
 class BaseResponse(BaseModel):
     """Base model for job result metadata."""
 
+    model_config = ConfigDict(defer_build=True)
+
     status: JobStatus
     timing_data: list[StatusChange] | None = None
 
@@ -34,11 +58,201 @@ class RROngoing(BaseResponse):  # type: ignore[override, unused-ignore]
 
 
 class RRFinished(BaseResponse):  # type: ignore[override, unused-ignore]
-    """Result metadata for a finished job."""
+    """Result metadata for a finished job.
+
+    A state fetched with lazy results keeps the raw JSON of its result and only decodes the shots of a circuit when
+    they are first accessed, through `circuit_result`, `result_array` or `result`, which decodes all circuits. Until
+    then, the shots are not validated either, so that invalid shots raise an `UnknownServerError` on access, as they
+    would when fetched eagerly. Likewise, a state
+    streamed from the Arnica API holds its results as arrays, and only converts them to lists when accessed.
+    """
 
     status: Literal[JobStatus.FINISHED] = JobStatus.FINISHED
     result: dict[int, list[list[Bit]]]
 
+    # The JSON of the result as received from the Arnica API, the offsets of each circuit's shots in it, and the
+    # lists and arrays decoded from it so far. Without a raw result, the arrays may instead be the only results held
+    _raw_result: bytes | None = PrivateAttr(default=None)
+    _arrays_only: bool = PrivateAttr(default=False)
+    _circuit_spans: dict[int, tuple[int, int]] | None = PrivateAttr(default=None)
+    _circuit_results: dict[int, list[list[int]]] = PrivateAttr(default_factory=dict)
+    _circuit_arrays: dict[int, NDArray[np.uint8]] = PrivateAttr(default_factory=dict)
+
+    def attach_raw_result(self, raw_result: bytes, *, lazy: bool = False) -> None:
+        """Keeps the JSON of the result as received from the Arnica API, to decode arrays from it.
+
+        Args:
+            raw_result (bytes): the JSON result object, which must hold the same results as `result`.
+            lazy (bool, optional): whether to drop `result` and decode it from the raw result when accessed. Defaults
+                to False.
+        """
+        self._raw_result = raw_result
+        if lazy:
+            self.__dict__.pop("result", None)
+
+    def attach_result_arrays(self, arrays: Mapping[int, NDArray[np.uint8]]) -> None:
+        """Replaces `result` with arrays, from which it is converted when accessed.
+
+        Args:
+            arrays (Mapping[int, NDArray[np.uint8]]): the shots of each circuit, as arrays of bits of shape
+                (shots, qubits).
+        """
+        self._circuit_arrays = dict(arrays)
+        self._arrays_only = True
+        self.__dict__.pop("result", None)
+
+    def is_lazy(self) -> bool:
+        """Returns whether some of the shots are still to be decoded from the raw result or arrays."""
+        return "result" not in self.__dict__
+
+    def circuits(self) -> list[int]:
+        """The indices of the circuits of the job, without decoding their shots.
+
+        Raises:
+            UnknownServerError: if a lazy result is not valid.
+        """
+        if not self.is_lazy():
+            return list(self.result)
+        if self._raw_result is None:
+            return list(self._circuit_arrays)
+        return list(self._spans())
+
+    def circuit_result(self, circuit: int) -> list[list[Bit]]:
+        """The shots of a single circuit, decoding only these when the results are lazy.
+
+        Args:
+            circuit (int): the index of the circuit.
+
+        Raises:
+            KeyError: if the job has no such circuit.
+            UnknownServerError: if the shots of a lazy result are not valid.
+
+        Returns:
+            list[list[Bit]]: the shots of the circuit.
+        """
+        if not self.is_lazy():
+            return self.result[circuit]
+        shots = self._circuit_results.get(circuit)
+        if shots is None:
+            if self._raw_result is None:
+                shots = self._circuit_results[circuit] = self._circuit_arrays[circuit].tolist()
+            else:
+                with _invalid_shots_of(circuit):
+                    start, end = self._spans()[circuit]
+                    shots = self._circuit_results[circuit] = _SHOTS_ADAPTER.validate_json(self._raw_result[start:end])
+        return shots
+
+    def result_array(self, circuit: int) -> NDArray[np.uint8]:
+        """The shots of a single circuit as a NumPy array, which requires the `numpy` extra.
+
+        For a state fetched with lazy results, the array is decoded straight from the response body rather than
+        from `result`. It is decoded once and shared by all calls, so it should not be modified in place.
+
+        Args:
+            circuit (int): the index of the circuit.
+
+        Raises:
+            KeyError: if the job has no such circuit.
+            UnknownServerError: if the shots of a lazy result are not valid.
+
+        Returns:
+            NDArray[np.uint8]: the shots of the circuit, as an array of bits of shape (shots, qubits).
+        """
+        shots = self._circuit_arrays.get(circuit)
+        if shots is None:
+            if self._raw_result is not None:
+                with _invalid_shots_of(circuit):
+                    start, end = self._spans()[circuit]
+                    shots = shot_arrays.decode_circuit_shots(self._raw_result[start:end])
+            else:
+                shots = shot_arrays.shot_arrays_from_lists({circuit: self.result[circuit]})[circuit]
+            self._circuit_arrays[circuit] = shots
+        return shots
+
+    def result_arrays(self, *, packed: bool = False) -> dict[int, NDArray[np.uint8]]:
+        """The measurement results as NumPy arrays, which requires the `numpy` extra.
+
+        For a state fetched with lazy results, the arrays are decoded straight from the response body rather than
+        from `result`. They are decoded once and shared by all calls, so they should not be modified in place.
+
+        Args:
+            packed (bool, optional): whether to pack the shots to one bit per qubit, the first qubit of each shot being
+                the least significant bit of its first byte. Defaults to False.
+
+        Raises:
+            UnknownServerError: if the shots of a lazy result are not valid.
+
+        Returns:
+            dict[int, NDArray[np.uint8]]: the shots of each circuit, as an array of bits of shape (shots, qubits),
+                or of shape (shots, ceil(qubits / 8)) when packed.
+        """
+        arrays = {circuit: self.result_array(circuit) for circuit in self.circuits()}
+        if packed:
+            return {circuit: shot_arrays.pack_shots(shots) for circuit, shots in arrays.items()}
+        return arrays
+
+    def result_json(self) -> bytes:
+        """The JSON of the result object, without decoding the shots of lazy results.
+
+        The raw result is returned as received when it was kept, and the arrays of a streamed state are encoded
+        straight to JSON.
+        """
+        if self._raw_result is not None:
+            return self._raw_result
+        if self.is_lazy():
+            return shot_arrays.encode_shot_arrays(self._circuit_arrays)
+        return _RESULT_ADAPTER.dump_json(self.result)
+
+    def _spans(self) -> dict[int, tuple[int, int]]:
+        if self._circuit_spans is None:
+            assert self._raw_result is not None
+            try:
+                self._circuit_spans = shot_arrays.find_circuit_spans(self._raw_result)
+            except ValueError as exc:
+                raise UnknownServerError("The Arnica API returned an invalid result.") from exc
+        return self._circuit_spans
+
+    def _decode_result(self) -> None:
+        """Decodes the shots of the circuits not accessed yet, if the results are lazy."""
+        if self.is_lazy():
+            self.__dict__["result"] = {circuit: self.circuit_result(circuit) for circuit in self.circuits()}
+            self._circuit_results = {}
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for a lazy `result`, which isn't in the instance dict, and for private attributes
+        if name == "result" and (self._raw_result is not None or self._arrays_only):
+            self._decode_result()
+            return self.__dict__["result"]
+        return super().__getattr__(name)  # type: ignore[misc]
+
+    @model_serializer(mode="wrap")
+    def _serialize_decoded(self, handler: SerializerFunctionWrapHandler, info: SerializationInfo) -> Any:
+        # A result encoder in the context serializes the result itself, e.g. from its arrays, without decoding it
+        encode_result = info.context.get(RESULT_ENCODER_CONTEXT_KEY) if isinstance(info.context, dict) else None
+        if encode_result is None:
+            self._decode_result()
+            return handler(self)
+        data = handler(self.model_copy(update={"result": {}}))
+        data["result"] = encode_result(self)
+        return data
+
+    def __eq__(self, other: object) -> bool:
+        # The raw result and decoded arrays are a cache of `result`, which is compared instead
+        if not isinstance(other, RRFinished):
+            return super().__eq__(other)
+        self._decode_result()
+        other._decode_result()
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
+
+@contextmanager
+def _invalid_shots_of(circuit: int) -> Iterator[None]:
+    """Raises the error of an invalid response for invalid shots decoded from a raw result."""
+    try:
+        yield
+    except ValueError as exc:
+        raise UnknownServerError(f"The Arnica API returned invalid shots for circuit {circuit}.") from exc
+
 
 class RRError(BaseResponse):  # type: ignore[override, unused-ignore]
     """Result metadata for a failed job."""
@@ -53,9 +267,18 @@ class RRCancelled(BaseResponse):  # type: ignore[override, unused-ignore]
     status: Literal[JobStatus.CANCELLED] = JobStatus.CANCELLED
 
 
-JobState: TypeAlias = RRQueued | RROngoing | RRFinished | RRError | RRCancelled
-FinalJobState: TypeAlias = RRFinished | RRError | RRCancelled
-NonFinalJobState: TypeAlias = RRQueued | RROngoing
+# Discriminated on the status, so that a state is validated against a single member of the union
+JobState: TypeAlias = Annotated[
+    RRQueued | RROngoing | RRFinished | RRError | RRCancelled, Field(discriminator="status")
+]
+FinalJobState: TypeAlias = Annotated[RRFinished | RRError | RRCancelled, Field(discriminator="status")]
+NonFinalJobState: TypeAlias = Annotated[RRQueued | RROngoing, Field(discriminator="status")]
+
+
+_SHOTS_ADAPTER: TypeAdapter[list[list[Bit]]] = TypeAdapter(list[list[Bit]], config=ConfigDict(defer_build=True))
+_RESULT_ADAPTER: TypeAdapter[dict[int, list[list[Bit]]]] = TypeAdapter(
+    dict[int, list[list[Bit]]], config=ConfigDict(defer_build=True)
+)
 
 
 class SubmitJobResponse(BaseModelSerialisable):
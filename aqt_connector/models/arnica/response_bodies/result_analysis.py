@@ -0,0 +1,185 @@
+"""Vectorised analysis of measurement results: counts, marginals and parity expectations.
+
+The routines take the shots of one circuit as an array of bits of shape (shots, qubits), as returned by
+`RRFinished.result_array`, or a whole finished job, analysing each of its circuits. Measurement outcomes are encoded
+as integers, the first qubit being the least significant bit, so that the outcome of a shot `[1, 0, 1]` is 5.
+
+They require the `numpy` extra, install it with `pip install aqt-connector[numpy]`.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING
+
+from aqt_connector.models.arnica.response_bodies.shot_arrays import import_numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+    from aqt_connector.models.arnica.response_bodies.jobs import RRFinished
+
+MAX_QUBITS = 64
+"""The largest number of qubits whose outcomes can be encoded as integers."""
+
+
+def outcomes(shots: NDArray[np.uint8]) -> NDArray[np.uint64]:
+    """Encodes the outcome of each shot as an integer.
+
+    Args:
+        shots (NDArray[np.uint8]): the shots of a circuit, as an array of bits of shape (shots, qubits).
+
+    Raises:
+        ValueError: if the shots measure more than `MAX_QUBITS` qubits.
+
+    Returns:
+        NDArray[np.uint64]: the outcome of each shot, the first qubit being the least significant bit.
+    """
+    np = import_numpy()
+    qubit_count = shots.shape[1]
+    if qubit_count > MAX_QUBITS:
+        raise ValueError(f"Outcomes of more than {MAX_QUBITS} qubits can't be encoded as integers.")
+    weights = np.left_shift(np.uint64(1), np.arange(qubit_count, dtype=np.uint64))
+    return shots.astype(np.uint64) @ weights
+
+
+def counts(shots: NDArray[np.uint8]) -> dict[int, int]:
+    """Counts the occurrences of each measurement outcome.
+
+    Args:
+        shots (NDArray[np.uint8]): the shots of a circuit, as an array of bits of shape (shots, qubits).
+
+    Returns:
+        dict[int, int]: the number of shots of each outcome that occurred, by increasing outcome.
+    """
+    np = import_numpy()
+    values, occurrences = np.unique(outcomes(shots), return_counts=True)
+    return dict(zip(values.tolist(), occurrences.tolist(), strict=True))
+
+
+def marginal_counts(shots: NDArray[np.uint8], qubits: Sequence[int]) -> dict[int, int]:
+    """Counts the occurrences of each measurement outcome of a subset of the qubits.
+
+    Args:
+        shots (NDArray[np.uint8]): the shots of a circuit, as an array of bits of shape (shots, qubits).
+        qubits (Sequence[int]): the qubits to keep, the first of which is the least significant bit of the outcomes.
+
+    Returns:
+        dict[int, int]: the number of shots of each outcome of the qubits that occurred, by increasing outcome.
+    """
+    return counts(shots[:, list(qubits)])
+
+
+def parity_expectation(shots: NDArray[np.uint8], qubits: Sequence[int]) -> float:
+    """The expectation value of the product of Pauli Z operators on a subset of the qubits, e.g. Z or ZZ.
+
+    Args:
+        shots (NDArray[np.uint8]): the shots of a circuit, as an array of bits of shape (shots, qubits).
+        qubits (Sequence[int]): the qubits the operators act on. A qubit given twice cancels out, as the product of
+            two Z operators on the same qubit is the identity.
+
+    Raises:
+        ValueError: if the circuit has no shots.
+
+    Returns:
+        float: the expectation value, between -1 and 1.
+    """
+    np = import_numpy()
+    if len(shots) == 0:
+        raise ValueError("The expectation value of a circuit without shots is undefined.")
+    acted_on = _parity_qubits(qubits)
+    if not acted_on:
+        return 1.0
+    if hasattr(np, "bitwise_count"):
+        odd = np.bitwise_count(outcomes(shots[:, acted_on])) & 1
+    else:
+        odd = shots[:, acted_on].sum(axis=1, dtype=np.uint64) & 1
+    return (len(shots) - 2 * int(odd.sum())) / len(shots)
+
+
+def counts_parity_expectation(counts: Mapping[int, int], qubits: Sequence[int]) -> float:
+    """The expectation value of the product of Pauli Z operators on a subset of the qubits, from counts of outcomes.
+
+    Args:
+        counts (Mapping[int, int]): the number of shots of each outcome, as returned by `counts`.
+        qubits (Sequence[int]): the qubits the operators act on. A qubit given twice cancels out, as for
+            `parity_expectation`.
+
+    Raises:
+        ValueError: if there are no shots.
+
+    Returns:
+        float: the expectation value, between -1 and 1.
+    """
+    total = sum(counts.values())
+    if total == 0:
+        raise ValueError("The expectation value of a circuit without shots is undefined.")
+    mask = sum(1 << qubit for qubit in _parity_qubits(qubits))
+    odd = sum(count for outcome, count in counts.items() if (outcome & mask).bit_count() % 2)
+    return (total - 2 * odd) / total
+
+
+def z_expectations(shots: NDArray[np.uint8]) -> NDArray[np.float64]:
+    """The expectation value of the Pauli Z operator on each qubit.
+
+    Args:
+        shots (NDArray[np.uint8]): the shots of a circuit, as an array of bits of shape (shots, qubits).
+
+    Raises:
+        ValueError: if the circuit has no shots.
+
+    Returns:
+        NDArray[np.float64]: the expectation value on each qubit, between -1 and 1.
+    """
+    np = import_numpy()
+    if len(shots) == 0:
+        raise ValueError("The expectation value of a circuit without shots is undefined.")
+    return (len(shots) - 2 * shots.sum(axis=0, dtype=np.int64)) / len(shots)
+
+
+def job_counts(state: RRFinished) -> dict[int, dict[int, int]]:
+    """Counts the occurrences of each measurement outcome of every circuit of a job.
+
+    Args:
+        state (RRFinished): the final state of the job.
+
+    Returns:
+        dict[int, dict[int, int]]: the counts of each circuit, see `counts`.
+    """
+    return {circuit: counts(state.result_array(circuit)) for circuit in state.circuits()}
+
+
+def job_marginal_counts(state: RRFinished, qubits: Sequence[int]) -> dict[int, dict[int, int]]:
+    """Counts the occurrences of each measurement outcome of a subset of the qubits, for every circuit of a job.
+
+    Args:
+        state (RRFinished): the final state of the job.
+        qubits (Sequence[int]): the qubits to keep, the first of which is the least significant bit of the outcomes.
+
+    Returns:
+        dict[int, dict[int, int]]: the marginal counts of each circuit, see `marginal_counts`.
+    """
+    return {circuit: marginal_counts(state.result_array(circuit), qubits) for circuit in state.circuits()}
+
+
+def job_parity_expectations(state: RRFinished, qubits: Sequence[int]) -> dict[int, float]:
+    """The expectation value of the product of Pauli Z operators on a subset of the qubits, for every circuit of a job.
+
+    Args:
+        state (RRFinished): the final state of the job.
+        qubits (Sequence[int]): the qubits the operators act on, see `parity_expectation`.
+
+    Raises:
+        ValueError: if a circuit has no shots.
+
+    Returns:
+        dict[int, float]: the expectation value of each circuit, see `parity_expectation`.
+    """
+    return {circuit: parity_expectation(state.result_array(circuit), qubits) for circuit in state.circuits()}
+
+
+def _parity_qubits(qubits: Sequence[int]) -> list[int]:
+    """The qubits a product of Pauli Z operators acts on nontrivially, i.e. those given an odd number of times."""
+    return sorted(qubit for qubit, times in Counter(qubits).items() if times % 2)
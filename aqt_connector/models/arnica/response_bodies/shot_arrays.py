@@ -0,0 +1,185 @@
+"""Measurement results decoded straight from the raw JSON of a result object, as NumPy arrays.
+
+NumPy is an optional dependency of aqt-connector, install it with `pip install aqt-connector[numpy]`. Finding the
+circuits in a result object doesn't require it.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+CIRCUIT_KEY = re.compile(rb'"(\d+)"\s*:\s*\[')
+"""Matches the key of a circuit in a result object and the opening bracket of its array of shots."""
+_ZERO, _OPEN, _CLOSE, _COMMA = ord("0"), ord("["), ord("]"), ord(",")
+_OBJECT_START, _OBJECT_END = re.compile(rb"\s*\{\s*"), re.compile(rb"\s*\}\s*")
+_SEPARATOR, _NOTHING = re.compile(rb"\s*,\s*"), re.compile(rb"")
+
+
+def import_numpy() -> Any:
+    """Imports NumPy, explaining how to install it if it is missing."""
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError(
+            "Array-backed results require NumPy. Install it with `pip install aqt-connector[numpy]`."
+        ) from exc
+    return numpy
+
+
+def find_circuit_spans(raw_result: bytes) -> dict[int, tuple[int, int]]:
+    """Finds the array of shots of each circuit in the JSON of a result object, without parsing them.
+
+    Args:
+        raw_result (bytes): the JSON result object, mapping circuit indices to their shots.
+
+    Raises:
+        ValueError: if the result is not an object mapping circuit indices to arrays.
+
+    Returns:
+        dict[int, tuple[int, int]]: the start and end offsets of the array of shots of each circuit.
+    """
+    opening = _OBJECT_START.match(raw_result)
+    if opening is None:
+        raise ValueError("The result is not a JSON object.")
+    spans: dict[int, tuple[int, int]] = {}
+    matches = list(CIRCUIT_KEY.finditer(raw_result, opening.end()))
+    # Only separators may come between the arrays of shots, which end at the last bracket before the next circuit
+    position, separator = opening.end(), _NOTHING
+    for nth, match in enumerate(matches):
+        end = matches[nth + 1].start() if nth + 1 < len(matches) else len(raw_result)
+        close = raw_result.rfind(b"]", match.end(), end) + 1
+        if not close or not separator.fullmatch(raw_result, position, match.start()):
+            raise ValueError(f"The result is malformed at offset {position}.")
+        spans[int(match.group(1))] = (match.end() - 1, close)
+        position, separator = close, _SEPARATOR
+    if not _OBJECT_END.fullmatch(raw_result, position):
+        raise ValueError(f"The result is malformed at offset {position}.")
+    return spans
+
+
+def decode_shot_arrays(raw_result: bytes) -> dict[int, NDArray[np.uint8]]:
+    """Decodes the measurement results of a finished job straight from the JSON of its result object.
+
+    Args:
+        raw_result (bytes): the JSON result object, mapping circuit indices to their shots.
+
+    Raises:
+        ValueError: if the result object is not made of rectangular arrays of bits.
+
+    Returns:
+        dict[int, NDArray[np.uint8]]: the shots of each circuit, as an array of bits of shape (shots, qubits).
+    """
+    return {
+        circuit: decode_circuit_shots(raw_result[start:end])
+        for circuit, (start, end) in find_circuit_spans(raw_result).items()
+    }
+
+
+def decode_circuit_shots(raw_shots: bytes) -> NDArray[np.uint8]:
+    """Decodes the JSON array of shots of a single circuit.
+
+    Args:
+        raw_shots (bytes): the JSON array of shots, each an array of bits.
+
+    Raises:
+        ValueError: if the array is not a rectangular array of bits.
+
+    Returns:
+        NDArray[np.uint8]: the shots, as an array of bits of shape (shots, qubits).
+    """
+    np = import_numpy()
+    buffer = np.frombuffer(raw_shots, dtype=np.uint8)
+    if np.bincount(buffer, minlength=256)[_disallowed_bytes()].any():
+        raise ValueError("The shots of a circuit may only contain arrays of bits.")
+
+    # Wrapping around, the bytes other than "0" and "1" become greater than one
+    values = buffer - np.uint8(_ZERO)
+    bit_positions = np.flatnonzero(values <= 1)
+    if (np.diff(bit_positions) < 2).any():
+        raise ValueError("The shots of a circuit may only contain arrays of bits.")
+    bits = values[bit_positions]
+
+    # The first opening bracket is the array of shots, each following one starts a shot
+    shot_starts = np.flatnonzero(buffer == _OPEN)[1:]
+    if len(shot_starts) == 0:
+        if len(bits):
+            raise ValueError("The shots of a circuit may only contain arrays of bits.")
+        return np.zeros((0, 0), dtype=np.uint8)
+    bits_per_shot = np.diff(np.searchsorted(bit_positions, shot_starts), append=len(bits))
+    if (bits_per_shot != bits_per_shot[0]).any():
+        raise ValueError("All shots of a circuit must measure the same number of qubits.")
+    return bits.reshape(len(shot_starts), int(bits_per_shot[0]))
+
+
+def shot_arrays_from_lists(result: Mapping[int, Sequence[Sequence[int]]]) -> dict[int, NDArray[np.uint8]]:
+    """Converts measurement results from lists of bits, for results that were not received from the Arnica API.
+
+    Args:
+        result (Mapping[int, Sequence[Sequence[int]]]): the shots of each circuit.
+
+    Returns:
+        dict[int, NDArray[np.uint8]]: the shots of each circuit, as an array of bits of shape (shots, qubits).
+    """
+    np = import_numpy()
+    return {
+        circuit: np.array(shots, dtype=np.uint8) if shots else np.zeros((0, 0), dtype=np.uint8)
+        for circuit, shots in result.items()
+    }
+
+
+def encode_shot_arrays(arrays: Mapping[int, NDArray[np.uint8]]) -> bytes:
+    """Encodes measurement results as the JSON of a result object, straight from their arrays.
+
+    Args:
+        arrays (Mapping[int, NDArray[np.uint8]]): the shots of each circuit, as arrays of bits of shape
+            (shots, qubits).
+
+    Returns:
+        bytes: the JSON result object, mapping circuit indices to their shots.
+    """
+    return b"{%s}" % b",".join(
+        b'"%d":%s' % (circuit, _encode_circuit_shots(shots)) for circuit, shots in arrays.items()
+    )
+
+
+def _encode_circuit_shots(shots: NDArray[np.uint8]) -> bytes:
+    """Encodes the shots of a single circuit as a JSON array."""
+    count, qubits = shots.shape
+    if count == 0 or qubits == 0:
+        return b"[%s]" % b",".join([b"[]"] * count)
+    # Each shot is written as "[b,...,b]," into a row of bytes, whose last comma is dropped
+    np = import_numpy()
+    rows = np.full((count, 2 * qubits + 2), _COMMA, dtype=np.uint8)
+    rows[:, 0] = _OPEN
+    rows[:, 1 : 2 * qubits : 2] = shots + np.uint8(_ZERO)
+    rows[:, 2 * qubits] = _CLOSE
+    return b"[%s]" % rows.tobytes()[:-1]
+
+
+def pack_shots(shots: NDArray[np.uint8]) -> NDArray[np.uint8]:
+    """Packs an array of shots to one bit per qubit.
+
+    Args:
+        shots (NDArray[np.uint8]): the shots of a circuit, as an array of bits of shape (shots, qubits).
+
+    Returns:
+        NDArray[np.uint8]: the packed shots, of shape (shots, ceil(qubits / 8)). The first qubit of each shot is the
+            least significant bit of its first byte.
+    """
+    return import_numpy().packbits(shots, axis=1, bitorder="little")
+
+
+@functools.cache
+def _disallowed_bytes() -> Any:
+    """The mask of the bytes that may not appear in an array of shots."""
+    np = import_numpy()
+    disallowed = np.ones(256, dtype=bool)
+    disallowed[list(b"01[], \t\r\n")] = False
+    return disallowed
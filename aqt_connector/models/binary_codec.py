@@ -0,0 +1,160 @@
+"""A compact binary encoding of the models, e.g. to pass job states, results and circuits between processes.
+
+Models are encoded as MessagePack, their UUIDs as 16 bytes, and the shots of finished jobs are bit-packed, straight
+from their arrays, rather than encoded as nested lists. Decoding validates the models like `model_validate_json`,
+except for shots, which were validated when first received and are kept as arrays: the state of a finished job only
+converts them to lists when its `result` is accessed.
+
+It requires the `msgpack` extra, install it with `pip install aqt-connector[msgpack]`.
+"""
+
+from __future__ import annotations
+
+import struct
+from collections.abc import Iterator
+from datetime import date, datetime, time
+from enum import Enum
+from typing import TYPE_CHECKING, Any, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel, TypeAdapter
+
+from aqt_connector.models.arnica.response_bodies.jobs import RESULT_ENCODER_CONTEXT_KEY, RRFinished
+from aqt_connector.models.arnica.response_bodies.shot_arrays import import_numpy, pack_shots
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+T = TypeVar("T")
+
+_PACKED_SHOTS = 1
+# The number of circuits, then the index, number of shots and number of qubits of each circuit
+_COUNT = struct.Struct("<I")
+_CIRCUIT = struct.Struct("<III")
+# Built once per decoded type, e.g. for a union such as `JobState`
+_ADAPTERS: dict[Any, TypeAdapter[Any]] = {}
+
+
+def import_msgpack() -> Any:
+    """Imports msgpack, explaining how to install it if it is missing."""
+    try:
+        import msgpack  # type: ignore[import-untyped]
+    except ImportError as exc:
+        raise ImportError(
+            "The binary encoding requires msgpack. Install it with `pip install aqt-connector[msgpack]`."
+        ) from exc
+    return msgpack
+
+
+def encode(model: BaseModel) -> bytes:
+    """Encodes a model, e.g. a `JobState`, `ResultResponse` or `QuantumCircuit`.
+
+    Args:
+        model (BaseModel): the model to encode.
+
+    Returns:
+        bytes: the encoded model, decoded with `decode`.
+    """
+    data = model.model_dump(context={RESULT_ENCODER_CONTEXT_KEY: _encode_result})
+    return bytes(import_msgpack().packb(data, default=_encode_value, use_bin_type=True))
+
+
+def decode(data: bytes, type_: type[T]) -> T:
+    """Decodes and validates a model encoded with `encode`.
+
+    Args:
+        data (bytes): the encoded model.
+        type_ (type[T]): the type of the model, or a union of models, e.g. `JobState`.
+
+    Raises:
+        ValueError: if the data is not an encoded model.
+        pydantic.ValidationError: if the encoded model is not valid.
+
+    Returns:
+        T: the model.
+    """
+    msgpack = import_msgpack()
+    results: list[dict[int, NDArray[np.uint8]]] = []
+
+    def decode_ext(code: int, payload: bytes) -> Any:
+        if code != _PACKED_SHOTS:
+            raise ValueError(f"Unknown extension type {code} in an encoded model.")
+        # Validated as an empty result, then replaced with the arrays
+        results.append(_decode_result(payload))
+        return {}
+
+    try:
+        unpacked = msgpack.unpackb(data, ext_hook=decode_ext, strict_map_key=False)
+    except (msgpack.UnpackException, msgpack.ExtraData, struct.error) as exc:
+        raise ValueError("The data is not an encoded model.") from exc
+    adapter = _ADAPTERS.get(type_) or _ADAPTERS.setdefault(type_, TypeAdapter(type_))
+    model = adapter.validate_python(unpacked)
+    if results:
+        for state, arrays in zip(_finished_states(model), results, strict=True):
+            state.attach_result_arrays(arrays)
+    return model
+
+
+def _encode_value(value: Any) -> Any:
+    """Encodes the values the dump of a model may contain besides the MessagePack types."""
+    if isinstance(value, UUID):
+        return value.bytes
+    if isinstance(value, datetime | date | time):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, _PackedShots):
+        return import_msgpack().ExtType(_PACKED_SHOTS, value.payload)
+    raise TypeError(f"Can't encode a value of type {type(value).__name__}.")
+
+
+class _PackedShots:
+    """The bit-packed shots of a finished state, passed through the dump of a model as is."""
+
+    __slots__ = ("payload",)
+
+    def __init__(self, payload: bytes) -> None:
+        self.payload = payload
+
+
+def _encode_result(state: RRFinished) -> _PackedShots:
+    arrays = state.result_arrays()
+    header = [_COUNT.pack(len(arrays))]
+    header += [_CIRCUIT.pack(circuit, *shots.shape) for circuit, shots in arrays.items()]
+    packed = [pack_shots(shots).tobytes() for shots in arrays.values()]
+    return _PackedShots(b"".join(header + packed))
+
+
+def _decode_result(payload: bytes) -> dict[int, NDArray[np.uint8]]:
+    np = import_numpy()
+    (count,) = _COUNT.unpack_from(payload)
+    circuits = [_CIRCUIT.unpack_from(payload, _COUNT.size + i * _CIRCUIT.size) for i in range(count)]
+    offset = _COUNT.size + count * _CIRCUIT.size
+    arrays = {}
+    for circuit, shots, qubits in circuits:
+        if shots == 0:
+            arrays[circuit] = np.zeros((0, 0), dtype=np.uint8)
+            continue
+        row_size = (qubits + 7) // 8
+        packed = np.frombuffer(payload, dtype=np.uint8, count=shots * row_size, offset=offset)
+        arrays[circuit] = np.unpackbits(packed.reshape(shots, row_size), axis=1, count=qubits, bitorder="little")
+        offset += shots * row_size
+    if offset != len(payload):
+        raise ValueError("The packed shots of an encoded model are incomplete.")
+    return arrays
+
+
+def _finished_states(value: Any) -> Iterator[RRFinished]:
+    """The finished states in a model, in the order they are encoded."""
+    if isinstance(value, RRFinished):
+        yield value
+    elif isinstance(value, BaseModel):
+        for name in type(value).model_fields:
+            yield from _finished_states(getattr(value, name))
+    elif isinstance(value, list | tuple):
+        for item in value:
+            yield from _finished_states(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _finished_states(item)
@@ -0,0 +1,204 @@
+"""A builder of quantum circuits that keeps their operations in typed arrays rather than as models.
+
+Generating many circuits, e.g. for a sweep, as `GateR`, `GateRZ` and `GateRXX` models validates each operation as it is
+created. A `CircuitBuilder` instead appends the opcode, qubits and angles of each gate to arrays, checks them all at
+once against the same limits as the models, and writes the JSON of a `QuantumCircuit` directly. The models are only
+built when asked for, with `to_model`.
+
+The checks require the `numpy` extra, install it with `pip install aqt-connector[numpy]`.
+"""
+
+from __future__ import annotations
+
+from array import array
+from math import inf
+from typing import Any
+
+import annotated_types
+from pydantic import BaseModel
+from typing_extensions import Self
+
+from aqt_connector.models.arnica.response_bodies.shot_arrays import import_numpy
+from aqt_connector.models.circuits import Circuit, QuantumCircuit
+from aqt_connector.models.operations import GateR, GateRXX, GateRZ
+
+_RZ, _R, _RXX = 0, 1, 2
+# Formatted with the first qubit, second qubit, phi and theta of each gate, in the field order of the models
+_TEMPLATES = {
+    _RZ: '{{"qubit":{0},"phi":{2!r},"operation":"RZ"}}',
+    _R: '{{"qubit":{0},"phi":{2!r},"theta":{3!r},"operation":"R"}}',
+    _RXX: '{{"qubits":[{0},{1}],"theta":{3!r},"operation":"RXX"}}',
+}
+_MEASURE = '{"operation":"MEASURE"}'
+
+
+def _bounds(model: type[BaseModel], field: str) -> tuple[float, bool, float, bool]:
+    """The lower bound, whether it is inclusive, the upper bound and whether it is inclusive, of a field of a model."""
+    lower: Any = -inf
+    upper: Any = inf
+    lower_inclusive = upper_inclusive = True
+    for constraint in model.model_fields[field].metadata:
+        if isinstance(constraint, annotated_types.Ge):
+            lower, lower_inclusive = constraint.ge, True
+        elif isinstance(constraint, annotated_types.Gt):
+            lower, lower_inclusive = constraint.gt, False
+        elif isinstance(constraint, annotated_types.Le):
+            upper, upper_inclusive = constraint.le, True
+        elif isinstance(constraint, annotated_types.Lt):
+            upper, upper_inclusive = constraint.lt, False
+    return lower, lower_inclusive, upper, upper_inclusive
+
+
+def _max_length(model: type[BaseModel], field: str) -> int:
+    return next(c.max_length for c in model.model_fields[field].metadata if isinstance(c, annotated_types.MaxLen))
+
+
+# The angles checked for each gate, as the index of their array, 0 for phi and 1 for theta, with their bounds
+_ANGLE_BOUNDS = [
+    (_RZ, 0, _bounds(GateRZ, "phi")),
+    (_R, 0, _bounds(GateR, "phi")),
+    (_R, 1, _bounds(GateR, "theta")),
+    (_RXX, 1, _bounds(GateRXX, "theta")),
+]
+# The measurement at the end of a circuit counts as one of its operations
+_MAX_GATES = _max_length(Circuit, "root") - 1
+
+
+class CircuitBuilder:
+    """Builds a quantum circuit gate by gate, ending with the measurement of all qubits.
+
+    Gates are only appended to arrays when added, and checked when the circuit is written: an invalid gate raises a
+    `ValueError` from `to_json` or `to_model`, naming its index. Copy a builder to build circuits sharing their first
+    gates, e.g. the preparation of each point of a sweep.
+    """
+
+    def __init__(self) -> None:
+        self._opcodes = array("B")
+        self._first_qubits = array("q")
+        self._second_qubits = array("q")
+        self._phis = array("d")
+        self._thetas = array("d")
+
+    def rz(self, qubit: int, phi: float) -> Self:
+        """Adds a rotation around the z-axis, see `GateRZ`."""
+        return self._add(_RZ, qubit, qubit, phi, 0.0)
+
+    def r(self, qubit: int, phi: float, theta: float) -> Self:
+        """Adds a rotation around an axis on the equatorial plane, see `GateR`."""
+        return self._add(_R, qubit, qubit, phi, theta)
+
+    def rxx(self, first_qubit: int, second_qubit: int, theta: float) -> Self:
+        """Adds a Mølmer-Sørensen gate between two qubits, see `GateRXX`."""
+        return self._add(_RXX, first_qubit, second_qubit, 0.0, theta)
+
+    def extend(self, other: CircuitBuilder) -> Self:
+        """Adds the gates of another builder, after those of this one."""
+        self._opcodes.extend(other._opcodes)
+        self._first_qubits.extend(other._first_qubits)
+        self._second_qubits.extend(other._second_qubits)
+        self._phis.extend(other._phis)
+        self._thetas.extend(other._thetas)
+        return self
+
+    def copy(self) -> CircuitBuilder:
+        """A builder with the same gates, to which gates are added independently."""
+        return CircuitBuilder().extend(self)
+
+    def __len__(self) -> int:
+        return len(self._opcodes)
+
+    def to_json(self, repetitions: int, number_of_qubits: int | None = None) -> bytes:
+        """Writes the circuit as the JSON of a `QuantumCircuit`, e.g. in the payload of a job.
+
+        Args:
+            repetitions (int): the number of repetitions of the circuit.
+            number_of_qubits (int | None, optional): the size of the quantum register. Defaults to the number of
+                qubits used by the gates, or 1 if there are none.
+
+        Raises:
+            ValueError: if a gate, the number of gates, the number of repetitions or the number of qubits is invalid.
+
+        Returns:
+            bytes: the JSON of the circuit, that of `QuantumCircuit.model_dump_json` up to the formatting of floats.
+        """
+        number_of_qubits = self._check(repetitions, number_of_qubits)
+        gates = [
+            _TEMPLATES[opcode].format(first, second, phi, theta)
+            for opcode, first, second, phi, theta in zip(
+                self._opcodes, self._first_qubits, self._second_qubits, self._phis, self._thetas, strict=True
+            )
+        ]
+        operations = ",".join([*gates, _MEASURE])
+        return (
+            f'{{"repetitions":{repetitions},"quantum_circuit":[{operations}],"number_of_qubits":{number_of_qubits}}}'
+        ).encode()
+
+    def to_model(self, repetitions: int, number_of_qubits: int | None = None) -> QuantumCircuit:
+        """Converts the circuit to a `QuantumCircuit`, validated from its JSON.
+
+        Args:
+            repetitions (int): the number of repetitions of the circuit.
+            number_of_qubits (int | None, optional): the size of the quantum register, see `to_json`.
+
+        Raises:
+            ValueError: if the circuit is invalid, see `to_json`.
+
+        Returns:
+            QuantumCircuit: the circuit.
+        """
+        return QuantumCircuit.model_validate_json(self.to_json(repetitions, number_of_qubits))
+
+    def _add(self, opcode: int, first_qubit: int, second_qubit: int, phi: float, theta: float) -> Self:
+        self._opcodes.append(opcode)
+        self._first_qubits.append(first_qubit)
+        self._second_qubits.append(second_qubit)
+        self._phis.append(phi)
+        self._thetas.append(theta)
+        return self
+
+    def _check(self, repetitions: int, number_of_qubits: int | None) -> int:
+        """Checks the gates all at once against the limits of the models, returning the size of the register."""
+        if len(self._opcodes) > _MAX_GATES:
+            raise ValueError(f"A circuit can have at most {_MAX_GATES} gates besides its measurement.")
+        np = import_numpy()
+        # Copied through the buffer protocol, as views would keep the arrays from growing while an error is handled
+        opcodes = np.array(self._opcodes)
+        first_qubits = np.array(self._first_qubits)
+        second_qubits = np.array(self._second_qubits)
+        angles = (np.array(self._phis), np.array(self._thetas))
+
+        invalid = (first_qubits < 0) | (second_qubits < 0) | ((opcodes == _RXX) & (first_qubits == second_qubits))
+        for opcode, angle, (lower, lower_inclusive, upper, upper_inclusive) in _ANGLE_BOUNDS:
+            values = angles[angle]
+            above = values >= lower if lower_inclusive else values > lower
+            below = values <= upper if upper_inclusive else values < upper
+            invalid |= (opcodes == opcode) & ~(above & below)
+        if invalid.any():
+            index = int(np.argmax(invalid))
+            raise ValueError(f"Gate {index} is invalid: {self._describe(index)}.")
+
+        used_qubits = int(max(first_qubits.max(), second_qubits.max())) + 1 if len(opcodes) else 0
+        _check_range(QuantumCircuit, "repetitions", repetitions)
+        if number_of_qubits is None:
+            number_of_qubits = max(used_qubits, 1)
+        _check_range(QuantumCircuit, "number_of_qubits", number_of_qubits)
+        if number_of_qubits < used_qubits:
+            raise ValueError(f"Operations address qubits outside of given quantum register of size {number_of_qubits}")
+        return number_of_qubits
+
+    def _describe(self, index: int) -> str:
+        opcode = self._opcodes[index]
+        first, second = self._first_qubits[index], self._second_qubits[index]
+        phi, theta = self._phis[index], self._thetas[index]
+        if opcode == _RZ:
+            return f"RZ(qubit={first}, phi={phi!r})"
+        if opcode == _R:
+            return f"R(qubit={first}, phi={phi!r}, theta={theta!r})"
+        return f"RXX(qubits=[{first}, {second}], theta={theta!r})"
+
+
+def _check_range(model: type[BaseModel], field: str, value: Any) -> None:
+    """Checks a value against the inclusive bounds of a field of a model."""
+    lower, _, upper, _ = _bounds(model, field)
+    if not lower <= value <= upper:
+        raise ValueError(f"{field} must be between {lower} and {upper}, got {value}.")
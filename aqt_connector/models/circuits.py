@@ -2,30 +2,27 @@
 
 from collections.abc import Iterator
 
-from pydantic import BaseModel, Field, RootModel, model_validator
+from pydantic import BaseModel, ConfigDict, Field, RootModel, model_validator
 from typing_extensions import Self
 
-from aqt_connector.models.operations import Gate, Measure, OperationModel, is_gate
+from aqt_connector.models.operations import Gate, GateRXX, Measure, OperationModel, SingleQubitGate, is_gate
 
 
 class Circuit(RootModel[list[OperationModel]]):
     """Json encoding of a quantum circuit."""
 
+    model_config = ConfigDict(defer_build=True)
+
     root: list[OperationModel] = Field(..., min_length=1, max_length=2000)
 
     @model_validator(mode="after")
     def ensure_measurement_at_the_end(self) -> Self:
         """Accept exactly one `Measure` instruction as last operation in the circuit."""
         operations = self.root
-        validation_error = ValueError("Need exactly one `MEASURE` operation at the end of the circuit.")
-
-        if not isinstance(operations[-1].root, Measure):
-            raise validation_error
-
-        for operation in operations[:-1]:
-            if isinstance(operation.root, Measure):
-                raise validation_error
-
+        last = len(operations) - 1
+        for index, operation in enumerate(operations):
+            if isinstance(operation.root, Measure) != (index == last):
+                raise ValueError("Need exactly one `MEASURE` operation at the end of the circuit.")
         return self
 
     def gates(self) -> Iterator[Gate]:
@@ -33,19 +30,28 @@ class Circuit(RootModel[list[OperationModel]]):
 
     @property
     def number_of_qubits(self) -> int:
-        """Number of qubits used by this circuit."""
-        # The circuit consists only of one MEASURE operation
-        if len(self.root) == 1:
-            return 0
-        qubits: set[int] = set()
-        for gate in self.gates():
-            qubits = qubits.union(gate.get_qubits())
-        return max(qubits) + 1
+        """Number of qubits used by this circuit.
+
+        It is counted on every access, in a single pass building no sets: the operations are mutable, down to the
+        qubits of each gate, so a count kept from validation could go stale.
+        """
+        highest = -1
+        for operation in self.root:
+            op = operation.root
+            if isinstance(op, SingleQubitGate):
+                if op.qubit > highest:
+                    highest = op.qubit
+            elif isinstance(op, GateRXX):
+                highest = max(highest, *op.qubits)
+        # A circuit with no gates uses no qubits
+        return highest + 1
 
 
 class QuantumCircuit(BaseModel):
     """A quantum circuit-type job that can run on a computing resource."""
 
+    model_config = ConfigDict(defer_build=True)
+
     repetitions: int = Field(ge=1, le=2000)
     """Number of repetitions of the circuit, for statistics sampling."""
 
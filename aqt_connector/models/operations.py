@@ -1,5 +1,6 @@
 """AQT-connector models for quantum operations."""
 
+import functools
 from abc import ABC, abstractmethod
 from math import inf
 from typing import (
@@ -10,6 +11,7 @@ from typing import (
     TypeAlias,
     TypeGuard,
     final,
+    get_args,
 )
 
 from pydantic import (
@@ -19,6 +21,7 @@ from pydantic import (
     RootModel,
     ValidationError,
     field_validator,
+    model_validator,
 )
 from pydantic.types import NonNegativeInt, conint
 
@@ -31,7 +34,23 @@ else:
 class AbstractOperation(ABC, BaseModel):
     """Abstract operation on the quantum register."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def set_operation(cls, data: Any) -> Any:
+        """Tags the operation with its type, so that it needn't be given and is always part of the fields set."""
+        tag = _operation_tag(cls)
+        if tag is None or not isinstance(data, dict) or data.get("operation") == tag:
+            return data
+        return {**data, "operation": tag}
+
+
+@functools.cache
+def _operation_tag(cls: type[AbstractOperation]) -> str | None:
+    """The tag of a type of operation, None for the abstract ones."""
+    field = cls.model_fields.get("operation")
+    return None if field is None else str(get_args(field.annotation)[0])
 
 
 class AbstractGate(AbstractOperation):
@@ -59,9 +78,9 @@ class GateRZ(SingleQubitGate):
     Details can be found in the description of `GateRZ` in https://arnica.aqt.eu/api/v1/docs
     """
 
-    def __init__(self, **data: Any) -> None:
-        data["operation"] = "RZ"
-        super().__init__(**data)
+    if TYPE_CHECKING:
+
+        def __init__(self, **data: Any) -> None: ...
 
     phi: float = Field(gt=-inf, lt=inf)
     operation: Literal["RZ"]
@@ -73,9 +92,9 @@ class GateR(SingleQubitGate):
     Details can be found in the description of `GateR` in https://arnica.aqt.eu/api/v1/docs
     """
 
-    def __init__(self, **data: Any) -> None:
-        data["operation"] = "R"
-        super().__init__(**data)
+    if TYPE_CHECKING:
+
+        def __init__(self, **data: Any) -> None: ...
 
     phi: float = Field(ge=0.0, le=2.0)
     theta: float = Field(ge=0.0, le=1.0)
@@ -88,9 +107,9 @@ class GateRXX(AbstractGate):
     Details can be found in the description of `GateRXX` in https://arnica.aqt.eu/api/v1/docs
     """
 
-    def __init__(self, **data: Any) -> None:
-        data["operation"] = "RXX"
-        super().__init__(**data)
+    if TYPE_CHECKING:
+
+        def __init__(self, **data: Any) -> None: ...
 
     qubits: list[NonNegativeInt] = Field(min_length=2, max_length=2)
     theta: float = Field(ge=0.0, le=0.5)
@@ -116,9 +135,9 @@ class Measure(AbstractOperation):
     to perform a projective measurement of all qubits.
     """
 
-    def __init__(self, **data: Any) -> None:
-        data["operation"] = "MEASURE"
-        super().__init__(**data)
+    if TYPE_CHECKING:
+
+        def __init__(self, **data: Any) -> None: ...
 
     operation: Literal["MEASURE"]
 
@@ -134,6 +153,8 @@ class OperationModel(RootModel[Operation]):
     tagged-union parser.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     root: Operation = Field(..., discriminator="operation")
 
 
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Annotated
 
-from pydantic import AfterValidator, BaseModel, Field, model_validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, model_validator
 from typing_extensions import Self
 
 
@@ -14,6 +14,8 @@ class GateFidelity(BaseModel):
     uncertainty value. The sum of these two values cannot exceed 100.
     """  # noqa: D415
 
+    model_config = ConfigDict(defer_build=True)
+
     value: float = Field(ge=0, le=100)
     uncertainty: float = Field(ge=0, le=100)
 
@@ -32,6 +34,8 @@ def keys_are_contiguous(fidelity_dict: dict[str, GateFidelity]) -> dict[str, Gat
 
 
 class PositiveFloatValueWithUncertainty(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     value: float = Field(gt=0)
     uncertainty: float = Field(ge=0)
 
@@ -53,6 +57,8 @@ class Characterisation(BaseModel):
         updated_at: Timestamp when this was last updated.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     single_qubit_gate_fidelity: Annotated[dict[str, GateFidelity], AfterValidator(keys_are_contiguous)]
     mean_two_qubit_gate_fidelity: GateFidelity
     spam_fidelity_lower_bound: float = Field(..., ge=0, le=100)
@@ -11,7 +11,7 @@ import json
 import time
 from collections.abc import Generator
 from pathlib import Path
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import jwt as pyjwt
 import pytest
@@ -101,19 +101,7 @@ def make_jwt(rsa_private_key: rsa.RSAPrivateKey, auth_server: HTTPServer) -> JWT
     issuer = f"http://127.0.0.1:{auth_server.port}/"
 
     def _factory(audience: str = TEST_DEVICE_CLIENT_ID) -> str:
-        now = int(time.time())
-        return pyjwt.encode(
-            {
-                "iss": issuer,
-                "sub": "acceptance-test|user",
-                "aud": audience,
-                "iat": now,
-                "exp": now + 3600,
-            },
-            rsa_private_key,
-            algorithm="RS256",
-            headers={"kid": TEST_KID},
-        )
+        return mint_jwt(rsa_private_key, issuer, audience)
 
     return _factory
 
@@ -127,18 +115,42 @@ def arnica_app(auth_server: HTTPServer, arnica_server: HTTPServer, tmp_path: Pat
     that outbound HTTP connects to the in-process test servers instead of the
     real Auth0 and Arnica services.
     """
+    with ArnicaApp(local_config(auth_server, arnica_server, tmp_path)) as app:
+        yield app
+
+
+def local_config(auth_server: HTTPServer, arnica_server: HTTPServer, app_dir: Path) -> ArnicaConfig:
+    """``ArnicaConfig`` pointing the library at the given local test servers."""
     issuer = f"http://127.0.0.1:{auth_server.port}/"
     arnica_base = f"http://127.0.0.1:{arnica_server.port}"
 
-    config = ArnicaConfig(app_dir=tmp_path)
+    config = ArnicaConfig(app_dir=app_dir)
     config.arnica_url = arnica_base
     config.oidc_config.issuer = issuer
     config.oidc_config.jwks_url = f"http://127.0.0.1:{auth_server.port}/.well-known/jwks.json"
     config.oidc_config.audience = arnica_base
     config.oidc_config.device_client_id = TEST_DEVICE_CLIENT_ID
-
-    with ArnicaApp(config) as app:
-        yield app
+    return config
+
+
+def mint_jwt(
+    private_key: rsa.RSAPrivateKey, issuer: str, audience: str = TEST_DEVICE_CLIENT_ID, *, lifetime_seconds: int = 3600
+) -> str:
+    """Mint a unique RS256 JWT signed with ``private_key``, as the fake Auth0 server would issue it."""
+    now = int(time.time())
+    return pyjwt.encode(
+        {
+            "iss": issuer,
+            "sub": "acceptance-test|user",
+            "aud": audience,
+            "iat": now,
+            "exp": now + lifetime_seconds,
+            "jti": uuid4().hex,
+        },
+        private_key,
+        algorithm="RS256",
+        headers={"kid": TEST_KID},
+    )
 
 
 def job_state_response_json(job_id: UUID, state: JobState) -> str:
@@ -0,0 +1,144 @@
+"""Acceptance tests for sharing one application between many threads."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import json
+import re
+import threading
+import time
+import uuid
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from aqt_connector import fetch_job_state, wait_for_final_state
+from aqt_connector._arnica_app import ArnicaApp
+from aqt_connector.models.arnica.response_bodies.jobs import RRFinished, RRQueued
+from tests.acceptance.conftest import job_state_response_json, local_config, mint_jwt
+
+THREADS = 16
+DURATION_SECONDS = 4.0
+TOKEN_LIFETIME_SECONDS = 1
+SERVER_GRACE_SECONDS = 5
+"""How long the stand-in Arnica API keeps accepting expired tokens, as a real server allows for clock skew."""
+
+
+class TokenAuthority:
+    """The state shared by the stand-in servers: the tokens issued so far and the only refresh token still valid."""
+
+    def __init__(self, private_key: rsa.RSAPrivateKey, issuer: str) -> None:
+        self.private_key = private_key
+        self.issuer = issuer
+        self.lock = threading.Lock()
+        self.refresh_token = "refresh-0"
+        self.issued: dict[str, float] = {}
+        self.reused_refresh_tokens = 0
+        self.rejected_requests = 0
+
+    def refresh(self, request: Request) -> Response:
+        with self.lock:
+            if request.form["refresh_token"] != self.refresh_token:
+                self.reused_refresh_tokens += 1
+                return Response(json.dumps({"error_description": "Refresh token reused."}), status=403)
+            access_token = mint_jwt(self.private_key, self.issuer, lifetime_seconds=TOKEN_LIFETIME_SECONDS)
+            self.issued[access_token] = time.time() + TOKEN_LIFETIME_SECONDS
+            self.refresh_token = f"refresh-{len(self.issued)}"
+            body = {"access_token": access_token, "refresh_token": self.refresh_token, "token_type": "Bearer"}
+        return Response(json.dumps(body), content_type="application/json")
+
+    def accepts(self, request: Request) -> bool:
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        with self.lock:
+            expiry = self.issued.get(token)
+            if expiry is None or time.time() > expiry + SERVER_GRACE_SECONDS:
+                self.rejected_requests += 1
+                return False
+            return True
+
+
+class JobsBackend:
+    """Serves jobs that are queued for two polls, then finished."""
+
+    def __init__(self, authority: TokenAuthority) -> None:
+        self.authority = authority
+        self.lock = threading.Lock()
+        self.polls: dict[uuid.UUID, int] = {}
+
+    def handle(self, request: Request) -> Response:
+        if not self.authority.accepts(request):
+            return Response(status=401)
+        job_id = uuid.UUID(request.path.rsplit("/", 1)[-1])
+        with self.lock:
+            polls = self.polls[job_id] = self.polls.get(job_id, 0) + 1
+        state = RRQueued() if polls <= 2 else RRFinished(result={0: [[polls % 2]]})
+        return Response(job_state_response_json(job_id, state), content_type="application/json")
+
+
+@pytest.fixture()
+def threaded_auth_server(jwks_document: dict) -> Generator[HTTPServer, None, None]:
+    server = HTTPServer(host="127.0.0.1", port=0, threaded=True)
+    server.start()
+    server.expect_request("/.well-known/jwks.json").respond_with_json(jwks_document)
+    yield server
+    try:
+        server.check_assertions()
+    finally:
+        server.stop()
+
+
+@pytest.fixture()
+def threaded_arnica_server() -> Generator[HTTPServer, None, None]:
+    server = HTTPServer(host="127.0.0.1", port=0, threaded=True)
+    server.start()
+    yield server
+    try:
+        server.check_assertions()
+    finally:
+        server.stop()
+
+
+def test_one_app_serves_many_threads_while_tokens_rotate(
+    threaded_auth_server: HTTPServer,
+    threaded_arnica_server: HTTPServer,
+    rsa_private_key: rsa.RSAPrivateKey,
+    tmp_path: Path,
+) -> None:
+    """Many threads share one app, fetching and waiting for jobs while short-lived tokens keep being refreshed.
+
+    The stand-in Auth0 server rotates refresh tokens and rejects any reuse, so concurrent refreshes of the same token
+    would fail.
+    """
+    authority = TokenAuthority(rsa_private_key, f"http://127.0.0.1:{threaded_auth_server.port}/")
+    backend = JobsBackend(authority)
+    threaded_auth_server.expect_request("/oauth/token", method="POST").respond_with_handler(authority.refresh)
+    threaded_arnica_server.expect_request(re.compile(r"/v1/result/.+")).respond_with_handler(backend.handle)
+    (tmp_path / "refresh_token").write_text(authority.refresh_token)
+    config = local_config(threaded_auth_server, threaded_arnica_server, tmp_path)
+    config.max_polls_per_second = 10_000
+
+    def drive(app: ArnicaApp) -> int:
+        completed = 0
+        stop_at = time.monotonic() + DURATION_SECONDS
+        while time.monotonic() < stop_at:
+            waited_for = uuid.uuid4()
+            final_state = wait_for_final_state(app, waited_for, query_interval_seconds=0.01, out=None)
+            assert isinstance(final_state, RRFinished)
+            assert isinstance(fetch_job_state(app, waited_for), RRFinished)
+            completed += 1
+        return completed
+
+    with ArnicaApp(config) as app, concurrent.futures.ThreadPoolExecutor(max_workers=THREADS) as executor:
+        completed = list(executor.map(drive, [app] * THREADS))
+
+    assert all(completed)
+    assert authority.reused_refresh_tokens == 0
+    assert authority.rejected_requests == 0
+    # The tokens have been rotated several times, once per expiry rather than once per thread
+    assert 2 <= len(authority.issued) <= DURATION_SECONDS / TOKEN_LIFETIME_SECONDS + 2
+    assert (tmp_path / "access_token").read_text() in authority.issued
+    assert (tmp_path / "refresh_token").read_text() == authority.refresh_token
@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import uuid
+from pathlib import Path
 
 import pytest
 from pytest_httpserver import HTTPServer
 
-from aqt_connector import fetch_job_state, wait_for_final_state
+from aqt_connector import (
+    NpyDirectorySink,
+    fetch_job_state,
+    stream_job_state,
+    wait_for_final_state,
+    wait_for_final_states,
+    watch_jobs,
+)
 from aqt_connector._arnica_app import ArnicaApp
-from aqt_connector.exceptions import JobNotFoundError, NotAuthenticatedError
+from aqt_connector.exceptions import JobNotFoundError, NotAuthenticatedError, UnknownServerError
 from aqt_connector.models.arnica.response_bodies.jobs import RRFinished, RRQueued
-from tests.acceptance.conftest import JWTFactory, job_state_response_json
+from tests.acceptance.conftest import JWTFactory, job_state_response_json, local_config
 
 A_JOB_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
 
@@ -61,6 +70,108 @@ def test_fetch_finished_job_returns_results(
     assert state.result == expected_result
 
 
+def test_fetch_finished_job_returns_result_arrays(
+    arnica_app: ArnicaApp, arnica_server: HTTPServer, make_jwt: JWTFactory
+) -> None:
+    """The results of a fetched job are also available as arrays of bits, one per circuit."""
+    api_token = make_jwt()
+    expected_result = {0: [[0, 1], [1, 0]], 1: [[1, 1]]}
+
+    arnica_server.expect_ordered_request(f"/v1/result/{A_JOB_ID}", method="GET").respond_with_data(
+        job_state_response_json(A_JOB_ID, RRFinished(result=expected_result)),
+        content_type="application/json",
+    )
+
+    state = fetch_job_state(arnica_app, A_JOB_ID, api_token=api_token)
+
+    assert isinstance(state, RRFinished)
+    assert {circuit: shots.tolist() for circuit, shots in state.result_arrays().items()} == expected_result
+
+
+def test_fetch_finished_job_with_lazy_results(
+    auth_server: HTTPServer, arnica_server: HTTPServer, make_jwt: JWTFactory, tmp_path: Path
+) -> None:
+    """With lazy results, the shots of a fetched job are decoded on access, one circuit at a time."""
+    config = local_config(auth_server, arnica_server, tmp_path)
+    config.lazy_results = True
+    api_token = make_jwt()
+    expected_result = {0: [[0, 1], [1, 0]], 1: [[1, 1]]}
+
+    arnica_server.expect_ordered_request(f"/v1/result/{A_JOB_ID}", method="GET").respond_with_data(
+        job_state_response_json(A_JOB_ID, RRFinished(result=expected_result)),
+        content_type="application/json",
+    )
+
+    with ArnicaApp(config) as app:
+        state = fetch_job_state(app, A_JOB_ID, api_token=api_token)
+
+    assert isinstance(state, RRFinished)
+    assert state.is_lazy()
+    assert state.circuits() == [0, 1]
+    assert state.circuit_result(1) == expected_result[1]
+    assert state.result == expected_result
+
+
+@pytest.mark.parametrize("lazy_results", [False, True])
+def test_fetch_finished_job_with_invalid_shots_raises_unknown_server_error(
+    auth_server: HTTPServer, arnica_server: HTTPServer, make_jwt: JWTFactory, tmp_path: Path, lazy_results: bool
+) -> None:
+    """Invalid shots raise an UnknownServerError, when fetched or, with lazy results, when accessed."""
+    config = local_config(auth_server, arnica_server, tmp_path)
+    config.lazy_results = lazy_results
+    api_token = make_jwt()
+    body = job_state_response_json(A_JOB_ID, RRFinished(result={0: [[0]], 1: [[1]]})).replace("[[1]]", "[[2]]")
+    arnica_server.expect_request(f"/v1/result/{A_JOB_ID}", method="GET").respond_with_data(
+        body, content_type="application/json"
+    )
+
+    with ArnicaApp(config) as app:
+        if not lazy_results:
+            with pytest.raises(UnknownServerError):
+                fetch_job_state(app, A_JOB_ID, api_token=api_token)
+            return
+        state = fetch_job_state(app, A_JOB_ID, api_token=api_token)
+
+    assert isinstance(state, RRFinished)
+    assert state.circuit_result(0) == [[0]]
+    with pytest.raises(UnknownServerError):
+        _ = state.result
+    with pytest.raises(UnknownServerError):
+        state.result_array(1)
+
+
+def test_stream_finished_job_returns_result_arrays(
+    arnica_app: ArnicaApp, arnica_server: HTTPServer, make_jwt: JWTFactory, tmp_path: Path
+) -> None:
+    """stream_job_state decodes the results of a finished job to arrays as they arrive, optionally onto disk."""
+    api_token = make_jwt()
+    expected_result = {0: [[0, 1], [1, 0]], 1: [[1, 1]]}
+
+    arnica_server.expect_request(f"/v1/result/{A_JOB_ID}", method="GET").respond_with_data(
+        job_state_response_json(A_JOB_ID, RRFinished(result=expected_result)),
+        content_type="application/json",
+    )
+
+    in_memory = stream_job_state(arnica_app, A_JOB_ID, api_token=api_token)
+    on_disk = stream_job_state(arnica_app, A_JOB_ID, api_token=api_token, sink=NpyDirectorySink(tmp_path))
+
+    for state in (in_memory, on_disk):
+        assert isinstance(state, RRFinished)
+        assert {circuit: shots.tolist() for circuit, shots in state.result_arrays().items()} == expected_result
+        assert state.result == expected_result
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["0.npy", "1.npy"]
+
+
+def test_stream_unknown_job_raises_job_not_found(
+    arnica_app: ArnicaApp, arnica_server: HTTPServer, make_jwt: JWTFactory
+) -> None:
+    """stream_job_state raises the same errors as fetch_job_state."""
+    arnica_server.expect_request(f"/v1/result/{A_JOB_ID}", method="GET").respond_with_data("", status=404)
+
+    with pytest.raises(JobNotFoundError):
+        stream_job_state(arnica_app, A_JOB_ID, api_token=make_jwt())
+
+
 def test_fetch_job_state_raises_not_authenticated_when_no_token(arnica_app: ArnicaApp) -> None:
     """fetch_job_state raises NotAuthenticatedError when no token is available."""
     with pytest.raises(NotAuthenticatedError):
@@ -116,3 +227,50 @@ def test_wait_for_final_state_raises_timeout_when_max_attempts_exceeded(
 
     with pytest.raises(TimeoutError):
         wait_for_final_state(arnica_app, A_JOB_ID, api_token=api_token, query_interval_seconds=0, max_attempts=2)
+
+
+def test_wait_for_final_states_yields_each_job_as_it_finishes(
+    arnica_app: ArnicaApp, arnica_server: HTTPServer, make_jwt: JWTFactory
+) -> None:
+    """wait_for_final_states polls several jobs and yields them in order of completion."""
+    api_token = make_jwt()
+    other_job_id = uuid.UUID("00000000-0000-0000-0000-000000000002")
+    finished = RRFinished(result={0: [[1], [0]]})
+
+    arnica_server.expect_request(f"/v1/result/{A_JOB_ID}", method="GET").respond_with_data(
+        job_state_response_json(A_JOB_ID, finished), content_type="application/json"
+    )
+    for body in [job_state_response_json(other_job_id, RRQueued()), job_state_response_json(other_job_id, finished)]:
+        arnica_server.expect_oneshot_request(f"/v1/result/{other_job_id}", method="GET").respond_with_data(
+            body, content_type="application/json"
+        )
+
+    completed = list(
+        wait_for_final_states(arnica_app, [other_job_id, A_JOB_ID], api_token=api_token, query_interval_seconds=0)
+    )
+
+    assert [job_id for job_id, _ in completed] == [A_JOB_ID, other_job_id]
+    assert all(state == finished for _, state in completed)
+
+
+def test_watch_jobs_resolves_handles_in_the_background(
+    arnica_app: ArnicaApp, arnica_server: HTTPServer, make_jwt: JWTFactory
+) -> None:
+    """watch_jobs returns handles that resolve once their jobs finish."""
+    api_token = make_jwt()
+    other_job_id = uuid.UUID("00000000-0000-0000-0000-000000000002")
+    finished = RRFinished(result={0: [[1], [0]]})
+
+    arnica_server.expect_request(f"/v1/result/{A_JOB_ID}", method="GET").respond_with_data(
+        job_state_response_json(A_JOB_ID, finished), content_type="application/json"
+    )
+    for body in [job_state_response_json(other_job_id, RRQueued()), job_state_response_json(other_job_id, finished)]:
+        arnica_server.expect_oneshot_request(f"/v1/result/{other_job_id}", method="GET").respond_with_data(
+            body, content_type="application/json"
+        )
+
+    handles = watch_jobs(arnica_app, [other_job_id, A_JOB_ID], api_token=api_token, query_interval_seconds=0)
+    done, not_done = concurrent.futures.wait(handles, timeout=10)
+
+    assert not not_done
+    assert [handle.result() for handle in handles] == [finished, finished]
@@ -0,0 +1,93 @@
+"""Acceptance tests for using an application from several processes."""
+
+from __future__ import annotations
+
+import multiprocessing
+import pickle
+import sys
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from aqt_connector import fetch_job_state
+from aqt_connector._arnica_app import ArnicaApp
+from aqt_connector._data_types import OfflineAccessTokens
+from aqt_connector.models.arnica.response_bodies.jobs import RRFinished
+from tests.acceptance.conftest import JWTFactory, job_state_response_json
+
+JOB_IDS = [uuid.UUID(f"00000000-0000-0000-0000-00000000000{i}") for i in range(1, 5)]
+FINISHED = RRFinished(result={0: [[0, 1]]})
+
+# Inherited by forked workers rather than passed to them
+_forked_app: ArnicaApp | None = None
+
+
+def _fetch_with_inherited_app(job_id: uuid.UUID, api_token: str) -> object:
+    assert _forked_app is not None
+    return fetch_job_state(_forked_app, job_id, api_token=api_token)
+
+
+def _inherited_client_was_dropped() -> bool:
+    assert _forked_app is not None
+    return _forked_app._arnica_adapter._client is None
+
+
+def _serve_finished_jobs(arnica_server: HTTPServer) -> None:
+    for job_id in JOB_IDS:
+        arnica_server.expect_request(f"/v1/result/{job_id}", method="GET").respond_with_data(
+            job_state_response_json(job_id, FINISHED), content_type="application/json"
+        )
+
+
+def test_app_pickles_as_its_config_and_token_session(arnica_app: ArnicaApp) -> None:
+    """An app is pickled without any client or lock, and restored with the same config and token session."""
+    arnica_app.auth_service.session_tokens = OfflineAccessTokens("access", "refresh")
+
+    restored = pickle.loads(pickle.dumps(arnica_app))
+
+    assert restored.config.arnica_url == arnica_app.config.arnica_url
+    assert restored.config._app_dir == arnica_app.config._app_dir
+    assert restored.auth_service.session_tokens == ("access", "refresh")
+    restored.close()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fork is not available")
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_forked_workers_use_the_inherited_app(
+    arnica_app: ArnicaApp, arnica_server: HTTPServer, make_jwt: JWTFactory
+) -> None:
+    """Workers forked after the app has been used get working clients of their own."""
+    global _forked_app
+    api_token = make_jwt()
+    _serve_finished_jobs(arnica_server)
+    # Open a connection in the parent before forking
+    assert fetch_job_state(arnica_app, JOB_IDS[0], api_token=api_token) == FINISHED
+    _forked_app = arnica_app
+
+    try:
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("fork")) as executor:
+            assert executor.submit(_inherited_client_was_dropped).result(timeout=60)
+        with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("fork")) as executor:
+            states = list(executor.map(_fetch_with_inherited_app, JOB_IDS, [api_token] * len(JOB_IDS)))
+    finally:
+        _forked_app = None
+
+    assert states == [FINISHED] * len(JOB_IDS)
+    # The parent's connection is still usable
+    assert fetch_job_state(arnica_app, JOB_IDS[0], api_token=api_token) == FINISHED
+
+
+def test_spawned_workers_receive_the_app_pickled(
+    arnica_app: ArnicaApp, arnica_server: HTTPServer, make_jwt: JWTFactory
+) -> None:
+    """The app can be passed to workers of a spawn-based pool."""
+    api_token = make_jwt()
+    _serve_finished_jobs(arnica_server)
+
+    with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = [executor.submit(fetch_job_state, arnica_app, job_id, api_token=api_token) for job_id in JOB_IDS]
+        states = [future.result(timeout=60) for future in futures]
+
+    assert states == [FINISHED] * len(JOB_IDS)
@@ -0,0 +1,35 @@
+import random
+import time
+from collections.abc import Callable
+from uuid import UUID
+
+from aqt_connector.models.arnica.jobs import BasicJobMetadata
+from aqt_connector.models.arnica.response_bodies.jobs import ResultResponse, RRFinished
+
+
+def best_of(repeat: int, run: Callable[[], object]) -> float:
+    """The shortest duration of `repeat` runs, in seconds."""
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        durations.append(time.perf_counter() - started)
+    return min(durations)
+
+
+def finished_result(circuits: int, shots: int, qubits: int, *, seed: int = 0) -> RRFinished:
+    """A finished state with random measurements."""
+    rng = random.Random(seed)
+    return RRFinished(
+        result={
+            circuit: [[rng.getrandbits(1) for _ in range(qubits)] for _ in range(shots)] for circuit in range(circuits)
+        }
+    )
+
+
+def result_response_body(state: RRFinished) -> bytes:
+    """The body the Arnica API responds with for a job in the given state."""
+    metadata = BasicJobMetadata(
+        job_id=UUID("00000000-0000-0000-0000-000000000001"), resource_id="resource", workspace_id="workspace"
+    )
+    return ResultResponse(job=metadata, response=state).model_dump_json().encode()
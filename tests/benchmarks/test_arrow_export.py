@@ -0,0 +1,47 @@
+"""Benchmark of exporting results to Parquet, run with `pytest -s tests/benchmarks` to see the figures."""
+
+from pathlib import Path
+from uuid import uuid4
+
+import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.parquet as pq  # type: ignore[import-untyped]
+
+from aqt_connector._infrastructure.arrow_export import ParquetResultWriter
+from tests.benchmarks.helpers import best_of, finished_result
+
+JOBS = 50
+CIRCUITS = 5
+SHOTS = 500
+QUBITS = 8
+
+
+def test_exporting_columns_is_faster_and_smaller_than_rows(tmp_path: Path) -> None:
+    """Building the shot columns from arrays should beat converting the results to rows of Python objects."""
+    state = finished_result(CIRCUITS, SHOTS, QUBITS)
+    state.result_arrays()  # Decoded once, as for states fetched from the Arnica API
+    results = [(uuid4(), state) for _ in range(JOBS)]
+
+    def export_rows() -> None:
+        rows = [
+            {"job_id": str(job_id), "status": state.status.value, "circuit": circuit, "shots": shots}
+            for job_id, state in results
+            for circuit, shots in state.result.items()
+        ]
+        pq.write_table(pa.Table.from_pylist(rows), tmp_path / "rows.parquet")
+
+    def export_columns(shot_encoding: str) -> None:
+        with ParquetResultWriter(tmp_path / f"{shot_encoding}.parquet", shot_encoding=shot_encoding) as writer:  # type: ignore[arg-type]
+            writer.write_all(results)
+
+    rows = best_of(3, export_rows)
+    outcomes = best_of(3, lambda: export_columns("outcomes"))
+    packed = best_of(3, lambda: export_columns("packed"))
+    sizes = {name: (tmp_path / f"{name}.parquet").stat().st_size for name in ("rows", "outcomes", "packed")}
+
+    print(
+        f"\nexporting {JOBS} jobs: rows {rows * 1e3:.1f} ms ({sizes['rows']} B), "
+        f"outcomes {outcomes * 1e3:.1f} ms ({sizes['outcomes']} B), packed {packed * 1e3:.1f} ms ({sizes['packed']} B)"
+    )
+    assert outcomes < rows / 3
+    assert packed < rows / 3
+    assert sizes["outcomes"] < sizes["rows"]
@@ -0,0 +1,43 @@
+"""Benchmark of the binary encoding of models, run with `pytest -s tests/benchmarks` to see the figures."""
+
+import pickle
+
+import pytest
+
+from aqt_connector.models.arnica.response_bodies.jobs import ResultResponse, RRFinished
+from aqt_connector.models.binary_codec import decode, encode
+from tests.benchmarks.helpers import best_of, finished_result, result_response_body
+
+# A typical job, and the largest the Arnica API accepts: 50 circuits of 2000 shots on up to 31 qubits
+PAYLOADS = {"typical": (1, 200, 5), "maximum": (50, 2000, 31)}
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_binary_encoding_is_faster_and_smaller_than_json(payload: str) -> None:
+    """Round trips through the binary encoding should beat JSON and pickle, in time and size."""
+    body = result_response_body(finished_result(*PAYLOADS[payload]))
+    response = ResultResponse.model_validate_json(body)
+
+    encoded = encode(response)
+    pickled = pickle.dumps(response)
+    assert decode(encoded, ResultResponse) == response
+
+    json_seconds = best_of(3, lambda: ResultResponse.model_validate_json(response.model_dump_json()))
+    pickle_seconds = best_of(3, lambda: pickle.loads(pickle.dumps(response)))
+    binary_seconds = best_of(3, lambda: decode(encode(response), ResultResponse))
+
+    def round_trip_with_lists() -> object:
+        state = decode(encode(response), ResultResponse).response
+        assert isinstance(state, RRFinished)
+        return state.result
+
+    lists_seconds = best_of(3, round_trip_with_lists)
+
+    print(
+        f"\n{payload} result response ({len(body) / 1e3:.0f} kB of JSON): "
+        f"JSON {json_seconds * 1e3:.2f} ms, pickle {pickle_seconds * 1e3:.2f} ms ({len(pickled) / 1e3:.0f} kB), "
+        f"binary {binary_seconds * 1e3:.2f} ms ({len(encoded) / 1e3:.1f} kB), "
+        f"binary with lists {lists_seconds * 1e3:.2f} ms"
+    )
+    assert len(encoded) * 5 < len(body)
+    assert binary_seconds < json_seconds
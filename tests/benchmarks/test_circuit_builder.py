@@ -0,0 +1,54 @@
+"""Benchmark of building circuits for a sweep, run with `pytest -s tests/benchmarks` to see the timings."""
+
+import json
+
+from aqt_connector.models.circuit_builder import CircuitBuilder
+from aqt_connector.models.circuits import Circuit, QuantumCircuit
+from aqt_connector.models.operations import GateR, GateRXX, GateRZ, Measure, OperationModel
+from tests.benchmarks.helpers import best_of
+
+CIRCUITS = 50
+LAYERS = 666
+QUBITS = 20
+
+
+def build_models() -> list[bytes]:
+    circuits = []
+    for point in range(CIRCUITS):
+        angle = point / CIRCUITS
+        operations = []
+        for layer in range(LAYERS):
+            qubit = layer % QUBITS
+            operations.append(OperationModel(root=GateR(qubit=qubit, phi=angle, theta=0.5)))
+            operations.append(OperationModel(root=GateRZ(qubit=qubit, phi=angle)))
+            operations.append(OperationModel(root=GateRXX(qubits=[qubit, (qubit + 1) % QUBITS], theta=angle / 2)))
+        operations.append(OperationModel(root=Measure()))
+        circuit = QuantumCircuit(repetitions=100, number_of_qubits=QUBITS, quantum_circuit=Circuit(root=operations))
+        circuits.append(circuit.model_dump_json().encode())
+    return circuits
+
+
+def build_arrays() -> list[bytes]:
+    circuits = []
+    for point in range(CIRCUITS):
+        angle = point / CIRCUITS
+        builder = CircuitBuilder()
+        for layer in range(LAYERS):
+            qubit = layer % QUBITS
+            builder.r(qubit, angle, 0.5).rz(qubit, angle).rxx(qubit, (qubit + 1) % QUBITS, angle / 2)
+        circuits.append(builder.to_json(100, QUBITS))
+    return circuits
+
+
+def test_the_builder_writes_circuits_faster_than_the_models() -> None:
+    """Building a sweep of maximum-size circuits should not create and validate a model per operation."""
+    assert [json.loads(circuit) for circuit in build_arrays()] == [json.loads(circuit) for circuit in build_models()]
+
+    models_seconds = best_of(3, build_models)
+    arrays_seconds = best_of(3, build_arrays)
+
+    print(
+        f"\n{CIRCUITS} circuits x {LAYERS * 3} gates: models {models_seconds * 1e3:.1f} ms, "
+        f"builder {arrays_seconds * 1e3:.1f} ms"
+    )
+    assert arrays_seconds < models_seconds / 2
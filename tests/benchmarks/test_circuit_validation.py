@@ -0,0 +1,44 @@
+"""Benchmark of the validation of circuits, run with `pytest -s tests/benchmarks` to see the timings."""
+
+from aqt_connector.models.arnica.request_bodies.jobs import QuantumCircuits
+from aqt_connector.models.circuits import Circuit
+from tests.benchmarks.helpers import best_of
+
+CIRCUITS = 50
+OPERATIONS = 2000
+QUBITS = 20
+
+
+def set_union_qubit_count(circuit: Circuit) -> int:
+    """How the number of qubits used to be counted, rebuilding a set for every gate."""
+    qubits: set[int] = set()
+    for gate in circuit.gates():
+        qubits = qubits.union(gate.get_qubits())
+    return max(qubits) + 1
+
+
+def test_circuits_are_counted_without_building_sets() -> None:
+    """Validating a maximum-size batch, then counting its qubits, should not build a set per gate."""
+    operations: list[dict] = []
+    for i in range(OPERATIONS - 1):
+        if i % 3 == 0:
+            operations.append({"operation": "RXX", "qubits": [i % QUBITS, (i + 1) % QUBITS], "theta": 0.25})
+        elif i % 3 == 1:
+            operations.append({"operation": "R", "qubit": i % QUBITS, "phi": 0.5, "theta": 0.5})
+        else:
+            operations.append({"operation": "RZ", "qubit": i % QUBITS, "phi": 0.5})
+    operations.append({"operation": "MEASURE"})
+    body = {"circuits": [{"repetitions": 100, "number_of_qubits": QUBITS, "quantum_circuit": operations}] * CIRCUITS}
+
+    validate_seconds = best_of(3, lambda: QuantumCircuits.model_validate(body))
+    circuits = [circuit.quantum_circuit for circuit in QuantumCircuits.model_validate(body).circuits]
+    assert [circuit.number_of_qubits for circuit in circuits] == [set_union_qubit_count(c) for c in circuits]
+
+    set_union_seconds = best_of(3, lambda: [set_union_qubit_count(circuit) for circuit in circuits])
+    single_pass_seconds = best_of(3, lambda: [circuit.number_of_qubits for circuit in circuits])
+
+    print(
+        f"\n{CIRCUITS} x {OPERATIONS} operations: validation {validate_seconds * 1e3:.1f} ms, qubit count with set "
+        f"unions {set_union_seconds * 1e3:.2f} ms, single pass {single_pass_seconds * 1e3:.2f} ms"
+    )
+    assert single_pass_seconds < set_union_seconds
@@ -0,0 +1,43 @@
+"""Benchmark of the memory used to aggregate many jobs, run with `pytest -s tests/benchmarks` to see the figures."""
+
+import tracemalloc
+from collections.abc import Callable
+
+from aqt_connector import CountsAccumulator
+from aqt_connector.models.arnica.response_bodies.jobs import RRFinished
+from tests.benchmarks.helpers import finished_result
+
+JOBS = 60
+CIRCUITS = 5
+SHOTS = 500
+QUBITS = 4
+
+
+def peak_memory(run: Callable[[], object]) -> int:
+    """The peak memory allocated by a run, in bytes."""
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_accumulating_counts_uses_less_memory_than_keeping_the_results() -> None:
+    """Folding each job into the counts as it arrives should keep the peak memory of a sweep low."""
+
+    def keep_results() -> list[RRFinished]:
+        return [finished_result(CIRCUITS, SHOTS, QUBITS, seed=job) for job in range(JOBS)]
+
+    def accumulate() -> CountsAccumulator:
+        accumulator = CountsAccumulator()
+        for job in range(JOBS):
+            accumulator.add(finished_result(CIRCUITS, SHOTS, QUBITS, seed=job))
+        return accumulator
+
+    accumulate()  # Imports NumPy and warms its caches, which is not part of the footprint
+    kept_bytes = peak_memory(keep_results)
+    accumulated_bytes = peak_memory(accumulate)
+
+    print(f"\nPeak memory of {JOBS} jobs: kept {kept_bytes / 1e6:.1f} MB, accumulated {accumulated_bytes / 1e6:.1f} MB")
+    assert accumulated_bytes * 5 < kept_bytes
@@ -0,0 +1,64 @@
+"""Benchmark of importing aqt_connector, run with `pytest -s tests/benchmarks` to see the timings."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Times a cold import, with the dependencies of aqt_connector imported by it as in any new process
+IMPORT_SCRIPT = """
+import sys, time
+started = time.perf_counter()
+import aqt_connector
+imported = time.perf_counter()
+from aqt_connector.models.arnica.response_bodies.jobs import ResultResponse
+deferred = not ResultResponse.__pydantic_complete__
+ResultResponse.model_validate_json(sys.stdin.read())
+print((imported - started) * 1e3, (time.perf_counter() - imported) * 1e3, deferred)
+"""
+
+BODY = (
+    '{"job": {"job_id": "00000000-0000-0000-0000-000000000001", "resource_id": "r", "workspace_id": "w"},'
+    ' "response": {"status": "queued"}}'
+)
+
+# Imported by the optional subsystems on first use only
+OPTIONAL_MODULES = ["asyncio", "sqlite3", "multiprocessing", "gzip", "concurrent.futures"]
+
+
+@pytest.fixture
+def env(tmp_path: Path) -> dict[str, str]:
+    env = {key: value for key, value in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"}
+    # Caches the bytecode out of the tree, so that compiling it isn't timed
+    env["PYTHONPYCACHEPREFIX"] = str(tmp_path)
+    return env
+
+
+def test_schemas_are_built_on_first_use_rather_than_on_import(env: dict[str, str]) -> None:
+    """Importing aqt_connector should not build the validators of its models, only their first use should."""
+    runs = []
+    for _ in range(7):
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT], input=BODY, capture_output=True, text=True, check=True, env=env
+        ).stdout.split()
+        runs.append((float(output[0]), float(output[1]), output[2] == "True"))
+
+    import_ms = min(run[0] for run in runs)
+    first_use_ms = min(run[1] for run in runs)
+    print(f"\nimport aqt_connector: {import_ms:.1f} ms, first validation of a result response: {first_use_ms:.1f} ms")
+    assert all(run[2] for run in runs)
+
+
+def test_optional_subsystems_are_imported_on_first_use_rather_than_on_import(env: dict[str, str]) -> None:
+    """Importing aqt_connector should not import the modules only its optional subsystems need."""
+    imported = subprocess.run(
+        [sys.executable, "-c", "import sys, aqt_connector; print(*sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    ).stdout.split()
+
+    assert [module for module in OPTIONAL_MODULES if module in imported] == []
@@ -0,0 +1,45 @@
+"""Benchmark of lazy results, run with `pytest -s tests/benchmarks` to see the timings."""
+
+from uuid import UUID
+
+import httpx
+
+from aqt_connector._infrastructure.arnica_adapter import ArnicaAdapter
+from aqt_connector.models.arnica.response_bodies.jobs import RRFinished
+from tests.benchmarks.helpers import best_of, finished_result, result_response_body
+
+CIRCUITS = 50
+SHOTS = 200
+QUBITS = 20
+JOB_ID = UUID("00000000-0000-0000-0000-000000000001")
+
+
+def adapter_serving(body: bytes, *, lazy_results: bool) -> ArnicaAdapter:
+    adapter = ArnicaAdapter("http://arnica.test", lazy_results=lazy_results)
+    adapter._http_client = httpx.Client(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+    )
+    return adapter
+
+
+def test_lazy_results_only_decode_the_accessed_circuits() -> None:
+    """Fetching a finished job and reading one circuit should be much faster with lazy results."""
+    state = finished_result(CIRCUITS, SHOTS, QUBITS)
+    body = result_response_body(state)
+    eager = adapter_serving(body, lazy_results=False)
+    lazy = adapter_serving(body, lazy_results=True)
+
+    def fetch_one_circuit(adapter: ArnicaAdapter) -> None:
+        fetched = adapter.fetch_job_state("token", JOB_ID)
+        assert isinstance(fetched, RRFinished)
+        assert fetched.circuit_result(7) == state.result[7]
+
+    eager_seconds = best_of(3, lambda: fetch_one_circuit(eager))
+    lazy_seconds = best_of(3, lambda: fetch_one_circuit(lazy))
+    lazy_status_seconds = best_of(3, lambda: lazy.fetch_job_state("token", JOB_ID).is_finished())
+
+    print(
+        f"\nOne circuit of {CIRCUITS}: eager {eager_seconds * 1e3:.1f} ms, lazy {lazy_seconds * 1e3:.1f} ms, "
+        f"lazy status only {lazy_status_seconds * 1e3:.1f} ms"
+    )
+    assert lazy_seconds * 2 < eager_seconds
@@ -0,0 +1,37 @@
+"""Benchmark of the analysis of results, run with `pytest -s tests/benchmarks` to see the timings."""
+
+from collections import Counter
+
+from aqt_connector.models.arnica.response_bodies.result_analysis import job_counts, job_parity_expectations
+from tests.benchmarks.helpers import best_of, finished_result
+
+CIRCUITS = 50
+SHOTS = 2000
+QUBITS = 20
+
+
+def test_vectorised_analysis_beats_python_loops() -> None:
+    """Counts and ZZ expectations of a whole job should be faster than the equivalent loops over the lists."""
+    state = finished_result(CIRCUITS, SHOTS, QUBITS)
+    state.result_arrays()
+
+    def loop_counts() -> dict[int, Counter[int]]:
+        return {
+            circuit: Counter(sum(bit << qubit for qubit, bit in enumerate(shot)) for shot in shots)
+            for circuit, shots in state.result.items()
+        }
+
+    def loop_expectations() -> dict[int, float]:
+        return {
+            circuit: sum(1 - 2 * ((shot[0] + shot[1]) % 2) for shot in shots) / len(shots)
+            for circuit, shots in state.result.items()
+        }
+
+    assert job_counts(state) == loop_counts()
+    assert job_parity_expectations(state, [0, 1]) == loop_expectations()
+    vector_seconds = best_of(3, lambda: (job_counts(state), job_parity_expectations(state, [0, 1])))
+    loop_seconds = best_of(3, lambda: (loop_counts(), loop_expectations()))
+
+    print(f"\nCounts and ZZ of {CIRCUITS}x{SHOTS}x{QUBITS}: vectorised {vector_seconds * 1e3:.1f} ms, ", end="")
+    print(f"loops {loop_seconds * 1e3:.1f} ms")
+    assert vector_seconds * 5 < loop_seconds
@@ -0,0 +1,38 @@
+"""Benchmark of loading the results of a sweep, run with `pytest -s tests/benchmarks` to see the figures."""
+
+from pathlib import Path
+from uuid import uuid4
+
+from aqt_connector import ResultStore
+from aqt_connector.models.arnica.response_bodies.jobs import RRFinished
+from tests.benchmarks.helpers import best_of, finished_result
+
+JOBS = 100
+CIRCUITS = 5
+SHOTS = 200
+QUBITS = 8
+
+
+def test_reading_a_result_store_is_faster_than_parsing_json(tmp_path: Path) -> None:
+    """Mapping the stored shots of many jobs should be much faster than validating their JSON again."""
+    state = finished_result(CIRCUITS, SHOTS, QUBITS)
+    body = state.model_dump_json()
+    job_ids = [uuid4() for _ in range(JOBS)]
+    store = ResultStore(tmp_path)
+    for job_id in job_ids:
+        store.append(job_id, state)
+
+    def parse() -> None:
+        for _ in job_ids:
+            RRFinished.model_validate_json(body).result_arrays()
+
+    def read() -> None:
+        reader = ResultStore(tmp_path)
+        for job_id in job_ids:
+            reader.result_arrays(job_id)
+
+    parsing = best_of(3, parse)
+    reading = best_of(3, read)
+
+    print(f"\nloading {JOBS} jobs: parsing JSON {parsing * 1e3:.1f} ms, reading the store {reading * 1e3:.1f} ms")
+    assert reading < parsing / 3
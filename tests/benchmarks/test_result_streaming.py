@@ -0,0 +1,96 @@
+"""Benchmarks of streaming a maximum-size result, run with `pytest -s tests/benchmarks` to see them."""
+
+import time
+import tracemalloc
+from collections.abc import Callable, Generator
+from datetime import datetime, timezone
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from aqt_connector._infrastructure.arnica_adapter import ArnicaAdapter
+from aqt_connector._infrastructure.result_stream import NpyDirectorySink, ResultStreamParser, ShotSink
+from aqt_connector.models.arnica.jobs import JobStatus, StatusChange
+from aqt_connector.models.arnica.response_bodies.jobs import RRFinished
+from tests.benchmarks.helpers import finished_result, result_response_body
+
+# The largest job the Arnica API accepts
+CIRCUITS = 50
+SHOTS = 2000
+QUBITS = 20
+JOB_ID = UUID("00000000-0000-0000-0000-000000000001")
+
+
+@pytest.fixture()
+def arnica_server() -> Generator[HTTPServer, None, None]:
+    server = HTTPServer(host="127.0.0.1", port=0)
+    server.start()
+    yield server
+    server.stop()
+
+
+def peak_memory(run: Callable[[], object]) -> int:
+    """The peak memory allocated by a run, in bytes."""
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_streaming_a_maximum_size_result_keeps_the_peak_memory_low(arnica_server: HTTPServer, tmp_path: Path) -> None:
+    """Streaming a result into arrays should use a fraction of the memory of parsing the whole body, and even less
+    when streamed to disk."""
+    state = finished_result(CIRCUITS, SHOTS, QUBITS)
+    body = result_response_body(state)
+    del state
+    arnica_server.expect_request(f"/v1/result/{JOB_ID}").respond_with_data(body, content_type="application/json")
+    adapter = ArnicaAdapter(arnica_server.url_for("").rstrip("/"))
+
+    def stream(sink: ShotSink | None = None) -> None:
+        streamed = adapter.stream_job_state("token", JOB_ID, sink=sink)
+        assert isinstance(streamed, RRFinished)
+        assert streamed.result_array(CIRCUITS - 1).shape == (SHOTS, QUBITS)
+
+    stream()  # Imports NumPy and opens the connection, which is not part of the footprint
+    fetched_bytes = peak_memory(lambda: adapter.fetch_job_state("token", JOB_ID))
+    streamed_bytes = peak_memory(stream)
+    on_disk_bytes = peak_memory(lambda: stream(NpyDirectorySink(tmp_path)))
+    adapter.close()
+
+    print(
+        f"\nPeak memory of a {len(body) / 1e6:.1f} MB result: parsed {fetched_bytes / 1e6:.1f} MB, "
+        f"streamed {streamed_bytes / 1e6:.1f} MB, streamed to disk {on_disk_bytes / 1e6:.1f} MB"
+    )
+    assert streamed_bytes * 5 < fetched_bytes
+    assert on_disk_bytes < streamed_bytes
+
+
+def test_parsing_stays_linear_in_the_size_of_the_metadata() -> None:
+    """Feeding a body with large metadata before the result in small chunks should take about as long as feeding it
+    whole, as each chunk is only scanned once."""
+    state = finished_result(1, 1, 1)
+    state.timing_data = [
+        StatusChange(new_status=JobStatus.QUEUED, timestamp=datetime.now(timezone.utc)) for _ in range(5000)
+    ]
+    body = result_response_body(state)
+
+    def parse(chunk_size: int) -> float:
+        parser = ResultStreamParser()
+        started = time.perf_counter()
+        for start in range(0, len(body), chunk_size):
+            parser.feed(body[start : start + chunk_size])
+        parser.close()
+        assert parser.arrays[0].shape == (1, 1)
+        return time.perf_counter() - started
+
+    whole = min(parse(len(body)) for _ in range(3))
+    chunked = min(parse(256) for _ in range(3))
+
+    print(
+        f"\nParsing a {len(body) / 1e6:.2f} MB body: whole {whole * 1e3:.1f} ms, in 256 B chunks {chunked * 1e3:.1f} ms"
+    )
+    assert chunked < whole * 10 + 0.05
@@ -0,0 +1,49 @@
+"""Benchmark of the validation of large finished results, run with `pytest -s tests/benchmarks` to see the timings."""
+
+from pydantic import TypeAdapter
+
+from aqt_connector.models.arnica.response_bodies.jobs import (
+    JobState,
+    ResultResponse,
+    RRCancelled,
+    RRError,
+    RRFinished,
+    RROngoing,
+    RRQueued,
+)
+from tests.benchmarks.helpers import best_of, finished_result, result_response_body
+
+CIRCUITS = 20
+SHOTS = 1000
+QUBITS = 20
+
+
+def test_discriminated_job_state_validates_large_results_faster_than_a_plain_union() -> None:
+    """Validating a large finished state should only walk its result once."""
+    state = finished_result(CIRCUITS, SHOTS, QUBITS)
+    body = state.model_dump_json().encode()
+    discriminated: TypeAdapter[JobState] = TypeAdapter(JobState)
+    plain: TypeAdapter[RRQueued | RROngoing | RRFinished | RRError | RRCancelled] = TypeAdapter(
+        RRQueued | RROngoing | RRFinished | RRError | RRCancelled
+    )
+
+    assert discriminated.validate_json(body) == plain.validate_json(body) == state
+    discriminated_seconds = best_of(3, lambda: discriminated.validate_json(body))
+    plain_seconds = best_of(3, lambda: plain.validate_json(body))
+
+    print(
+        f"\n{len(body) / 1e6:.1f} MB finished result: discriminated {discriminated_seconds * 1e3:.1f} ms, "
+        f"plain union {plain_seconds * 1e3:.1f} ms"
+    )
+    assert discriminated_seconds < plain_seconds
+
+
+def test_result_responses_validate_from_bytes() -> None:
+    """Validating the response body from bytes should be no slower than decoding it to a string first."""
+    body = result_response_body(finished_result(CIRCUITS, SHOTS, QUBITS))
+
+    bytes_seconds = best_of(3, lambda: ResultResponse.model_validate_json(body))
+    text_seconds = best_of(3, lambda: ResultResponse.model_validate_json(body.decode()))
+
+    print(f"\nResult response: from bytes {bytes_seconds * 1e3:.1f} ms, from text {text_seconds * 1e3:.1f} ms")
+    assert bytes_seconds < text_seconds * 1.25
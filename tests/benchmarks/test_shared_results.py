@@ -0,0 +1,50 @@
+"""Benchmark of handing results off to a process pool, run with `pytest -s tests/benchmarks` to see the timings."""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from aqt_connector._infrastructure.shared_results import SharedResult, SharedResults
+from aqt_connector.models.arnica.response_bodies import result_analysis
+from aqt_connector.models.arnica.response_bodies.jobs import ResultResponse, RRFinished
+from tests.benchmarks.helpers import finished_result, result_response_body
+
+JOBS = 8
+CIRCUITS = 20
+SHOTS = 1000
+QUBITS = 20
+
+
+def parity_of_pickled(state: RRFinished) -> list[float]:
+    return list(result_analysis.job_parity_expectations(state, [0, 1]).values())
+
+
+def parity_of_shared(shared: SharedResult) -> list[float]:
+    with shared.attach() as state:
+        return list(result_analysis.job_parity_expectations(state, [0, 1]).values())
+
+
+def test_shared_results_are_handed_off_faster_than_pickled_ones() -> None:
+    """Workers attaching to shared memory should avoid the cost of pickling and copying each job's shots."""
+    body = result_response_body(finished_result(CIRCUITS, SHOTS, QUBITS))
+    states = []
+    for _ in range(JOBS):
+        state = ResultResponse.model_validate_json(body).response
+        assert isinstance(state, RRFinished)
+        state.result_arrays()
+        states.append(state)
+
+    with ProcessPoolExecutor(2) as pool:
+        list(pool.map(parity_of_pickled, states[:2]))  # Starts the workers and imports NumPy in them
+
+        started = time.perf_counter()
+        pickled = list(pool.map(parity_of_pickled, states))
+        pickled_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        with SharedResults() as shared_results:
+            shared = list(pool.map(parity_of_shared, [shared_results.share(state) for state in states]))
+        shared_seconds = time.perf_counter() - started
+
+    print(f"\n{JOBS} jobs to 2 workers: pickled {pickled_seconds * 1e3:.1f} ms, shared {shared_seconds * 1e3:.1f} ms")
+    assert shared == pickled
+    assert shared_seconds < pickled_seconds / 2
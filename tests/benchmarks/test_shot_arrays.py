@@ -0,0 +1,37 @@
+"""Benchmark of array-backed results, run with `pytest -s tests/benchmarks` to see the timings."""
+
+import sys
+
+import numpy as np
+
+from aqt_connector._infrastructure.result_payload import find_result_span
+from aqt_connector.models.arnica.response_bodies.shot_arrays import decode_shot_arrays, shot_arrays_from_lists
+from tests.benchmarks.helpers import best_of, finished_result, result_response_body
+
+CIRCUITS = 20
+SHOTS = 1000
+QUBITS = 20
+
+
+def test_shot_arrays_decode_from_the_response_faster_than_from_lists() -> None:
+    """Decoding the arrays from the response body should beat converting the validated lists."""
+    state = finished_result(CIRCUITS, SHOTS, QUBITS)
+    body = result_response_body(state)
+    span = find_result_span(body)
+    assert span is not None
+    raw_result = body[span[0] : span[1]]
+
+    arrays = decode_shot_arrays(raw_result)
+    assert all(np.array_equal(arrays[circuit], shots) for circuit, shots in state.result.items())
+    raw_seconds = best_of(3, lambda: decode_shot_arrays(raw_result))
+    lists_seconds = best_of(3, lambda: shot_arrays_from_lists(state.result))
+
+    list_bytes = sum(sys.getsizeof(shot) for shots in state.result.values() for shot in shots)
+    array_bytes = sum(shots.nbytes for shots in arrays.values())
+    print(
+        f"\n{CIRCUITS}x{SHOTS}x{QUBITS} shots: from response {raw_seconds * 1e3:.1f} ms, "
+        f"from lists {lists_seconds * 1e3:.1f} ms; arrays {array_bytes / 1e6:.1f} MB, "
+        f"lists {list_bytes / 1e6:.1f} MB"
+    )
+    assert raw_seconds < lists_seconds
+    assert array_bytes < list_bytes
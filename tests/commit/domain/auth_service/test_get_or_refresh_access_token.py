@@ -1,3 +1,6 @@
+import concurrent.futures
+import time
+
 import pytest
 
 from aqt_connector._data_types import OfflineAccessTokens
@@ -5,7 +8,7 @@ from aqt_connector._domain.auth_service import AuthService
 from aqt_connector._domain.oidc_service import OIDCService
 from aqt_connector._infrastructure.access_token_verifier import AccessTokenVerifier
 from aqt_connector._infrastructure.token_repository import TokenRepository
-from aqt_connector.exceptions import TokenValidationError
+from aqt_connector.exceptions import AuthenticationError, TokenValidationError
 
 
 class AccessTokenVerifierAlwaysVerifies(AccessTokenVerifier):
@@ -136,3 +139,74 @@ def test_it_respects_store_parameter_when_refreshing_token(store: bool) -> None:
     else:
         assert token_repo.saved_access_token is None
         assert token_repo.saved_refresh_token is None
+
+
+class TokenRepositoryInMemory(TokenRepository):
+    def __init__(self, access_token: str | None, refresh_token: str | None) -> None:
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+
+    def load_access_token(self) -> str | None:
+        return self.access_token
+
+    def save_access_token(self, token: str) -> None:
+        self.access_token = token
+
+    def load_refresh_token(self) -> str | None:
+        return self.refresh_token
+
+    def save_refresh_token(self, refresh_token: str) -> None:
+        self.refresh_token = refresh_token
+
+
+class OIDCServiceRotating(OIDCService):
+    """Hands out numbered tokens, only accepting the latest refresh token."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.refresh_count = 0
+        self.valid_refresh_token = "refresh-0"
+
+    def authenticate_with_refresh_token(self, refresh_token: str) -> OfflineAccessTokens:
+        time.sleep(self.delay)
+        if refresh_token != self.valid_refresh_token:
+            raise AuthenticationError("Refresh token reused.")
+        self.refresh_count += 1
+        self.valid_refresh_token = f"refresh-{self.refresh_count}"
+        return OfflineAccessTokens(access_token=f"access-{self.refresh_count}", refresh_token=self.valid_refresh_token)
+
+
+def test_it_refreshes_a_rejected_token_even_if_it_looks_valid() -> None:
+    """It should refresh the access token when the given one was rejected, even though it verifies."""
+    token_repo = TokenRepositoryInMemory("access-0", "refresh-0")
+    auth_service = AuthService(AccessTokenVerifierAlwaysVerifies(), token_repo, OIDCServiceRotating())
+
+    assert auth_service.get_or_refresh_access_token(True) == "access-0"
+    assert auth_service.get_or_refresh_access_token(True, rejected="access-0") == "access-1"
+    assert token_repo.access_token == "access-1"
+
+
+def test_it_keeps_rotated_refresh_tokens_for_the_session_when_not_storing() -> None:
+    """It should keep refreshing with the latest refresh token when tokens aren't stored."""
+    token_repo = TokenRepositoryInMemory(None, "refresh-0")
+    oidc_service = OIDCServiceRotating()
+    auth_service = AuthService(AccessTokenVerifierAlwaysVerifies(), token_repo, oidc_service)
+
+    assert auth_service.get_or_refresh_access_token(False) == "access-1"
+    assert auth_service.get_or_refresh_access_token(False, rejected="access-1") == "access-2"
+    assert token_repo.refresh_token == "refresh-0"
+
+
+def test_concurrent_refreshes_of_a_rejected_token_are_coalesced() -> None:
+    """It should refresh a rejected token once, however many threads ask for a new one at the same time."""
+    token_repo = TokenRepositoryInMemory("access-0", "refresh-0")
+    oidc_service = OIDCServiceRotating(delay=0.05)
+    auth_service = AuthService(AccessTokenVerifierAlwaysVerifies(), token_repo, oidc_service)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+        refreshed = list(
+            executor.map(lambda _: auth_service.get_or_refresh_access_token(True, rejected="access-0"), range(32))
+        )
+
+    assert refreshed == ["access-1"] * 32
+    assert oidc_service.refresh_count == 1
@@ -0,0 +1,108 @@
+import pickle
+import threading
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from aqt_connector._domain.counts_accumulator import CountsAccumulator
+from aqt_connector._domain.wait_events import JobFinished
+from aqt_connector.models.arnica.response_bodies import result_analysis
+from aqt_connector.models.arnica.response_bodies.jobs import RRCancelled, RRFinished
+
+
+def test_it_aggregates_the_circuits_of_jobs_by_index() -> None:
+    """It should add up the counts of the circuits of several jobs with the same index."""
+    accumulator = CountsAccumulator()
+
+    accumulator.add(RRFinished(result={0: [[1, 0], [1, 0]], 1: [[1, 1]]}))
+    accumulator.add(RRFinished(result={0: [[0, 1]]}))
+
+    assert accumulator.keys() == [0, 1]
+    assert accumulator.counts(0) == {1: 2, 2: 1}
+    assert accumulator.counts(1) == {3: 1}
+    assert accumulator.total_shots(0) == 3
+    assert accumulator.jobs_added == 2
+
+
+def test_it_aggregates_by_circuit_key() -> None:
+    """It should key the circuits with the given keys, falling back to their index."""
+    accumulator = CountsAccumulator()
+
+    accumulator.add(RRFinished(result={0: [[1]], 1: [[0]]}), circuit_keys={0: ("theta", 0.5)})
+    accumulator.add(RRFinished(result={0: [[1]]}), circuit_keys={0: ("theta", 0.5)})
+
+    assert accumulator.counts(("theta", 0.5)) == {1: 2}
+    assert accumulator.counts(1) == {0: 1}
+
+
+def test_it_drops_shots_unless_asked_to_keep_them() -> None:
+    """It should only keep the shots when created with keep_shots."""
+    dropping = CountsAccumulator()
+    keeping = CountsAccumulator(keep_shots=True)
+    for accumulator in (dropping, keeping):
+        accumulator.add(RRFinished(result={0: [[1, 0]]}))
+        accumulator.add_shots(0, np.array([[0, 1], [1, 1]], dtype=np.uint8))
+
+    with pytest.raises(RuntimeError):
+        dropping.shots(0)
+    assert keeping.shots(0).tolist() == [[1, 0], [0, 1], [1, 1]]
+
+
+def test_it_computes_parity_expectations_from_the_counts() -> None:
+    """It should compute Z and ZZ expectation values without the shots."""
+    accumulator = CountsAccumulator()
+    accumulator.add(RRFinished(result={0: [[1, 0], [1, 1], [0, 0], [0, 0]]}))
+
+    assert accumulator.parity_expectation(0, [0]) == 0.0
+    assert accumulator.parity_expectation(0, [0, 1]) == 0.5
+    with pytest.raises(KeyError):
+        accumulator.parity_expectation(1, [0])
+
+
+def test_repeated_qubits_cancel_out_in_parity_expectations() -> None:
+    """It should treat a qubit given twice as the identity, as the expectations of the shots do."""
+    shots = [[1, 0], [1, 1], [0, 0], [0, 0]]
+    accumulator = CountsAccumulator()
+    accumulator.add(RRFinished(result={0: shots}))
+
+    assert accumulator.parity_expectation(0, [0, 0]) == 1.0
+    assert accumulator.parity_expectation(0, [0, 1, 0]) == accumulator.parity_expectation(0, [1]) == 0.5
+    assert accumulator.parity_expectation(0, [1, 0, 1]) == result_analysis.parity_expectation(
+        np.array(shots, dtype=np.uint8), [1, 0, 1]
+    )
+
+
+def test_it_merges_accumulators_across_threads_and_processes() -> None:
+    """It should merge accumulators filled by different threads, including pickled ones."""
+    merged = CountsAccumulator(keep_shots=True)
+    partials = [CountsAccumulator(keep_shots=True) for _ in range(4)]
+
+    def fill(accumulator: CountsAccumulator) -> None:
+        for _ in range(50):
+            accumulator.add(RRFinished(result={0: [[1, 0]], 1: [[0, 0]]}))
+            merged.add(RRFinished(result={0: [[1, 0]]}))
+
+    threads = [threading.Thread(target=fill, args=(partial,)) for partial in partials]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for partial in partials:
+        merged.merge(pickle.loads(pickle.dumps(partial)))
+
+    assert merged.counts(0) == {1: 400}
+    assert merged.counts(1) == {0: 200}
+    assert merged.jobs_added == 400
+    assert merged.shots(1).shape == (200, 2)
+
+
+def test_it_folds_finished_jobs_as_an_event_sink() -> None:
+    """It should fold the results of jobs that finished successfully, ignoring other events."""
+    accumulator = CountsAccumulator()
+
+    accumulator(JobFinished(uuid4(), RRFinished(result={0: [[1]]}), attempts=1))
+    accumulator(JobFinished(uuid4(), RRCancelled(), attempts=1))
+
+    assert accumulator.counts(0) == {1: 1}
+    assert accumulator.jobs_added == 1
@@ -0,0 +1,260 @@
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from aqt_connector._domain import job_service
+from aqt_connector._domain.cancellation import CancelEvent
+from aqt_connector._domain.job_service import JobService
+from aqt_connector._domain.polling import FixedIntervalPolling
+from aqt_connector._infrastructure.arnica_adapter import ArnicaAdapter
+from aqt_connector.exceptions import JobNotFoundError, NotAuthenticatedError, WaitCancelledError
+from aqt_connector.models.arnica.response_bodies.jobs import (
+    FinalJobState,
+    JobState,
+    NonFinalJobState,
+    RRFinished,
+    RROngoing,
+    RRQueued,
+)
+
+POLLING = FixedIntervalPolling(0.01)
+
+
+class ArnicaAdapterGated(ArnicaAdapter):
+    """A double for the ArnicaAdapter reporting jobs as queued until they are released."""
+
+    def __init__(self) -> None:
+        self.released = threading.Event()
+        self.outcome: JobState | Exception = RRFinished(result={0: [[1]]})
+        self.rejected_tokens: set[str] = set()
+        self.fetch_job_state_called_with: list[tuple[str, UUID]] = []
+        self.polled = threading.Event()
+
+    def fetch_job_state(self, token: str, job_id: UUID) -> JobState:
+        self.fetch_job_state_called_with.append((token, job_id))
+        self.polled.set()
+        if token in self.rejected_tokens:
+            raise NotAuthenticatedError
+        if not self.released.is_set():
+            return RRQueued()
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+    def polls_after(self, duration: float) -> int:
+        count = len(self.fetch_job_state_called_with)
+        time.sleep(duration)
+        return len(self.fetch_job_state_called_with) - count
+
+
+class Waiter(threading.Thread):
+    """Waits for a job in a thread of its own, recording the outcome and the reported states."""
+
+    def __init__(self, service: JobService, job_id: UUID, token: str = "some-token", **kwargs: object) -> None:
+        super().__init__()
+        self.service = service
+        self.job_id = job_id
+        self.token = token
+        self.kwargs = kwargs
+        self.reported: list[NonFinalJobState] = []
+        self.outcome: FinalJobState | BaseException | None = None
+
+    def run(self) -> None:
+        try:
+            self.outcome = self.service.wait_for_result(
+                self.token,
+                self.job_id,
+                report_state=self.reported.append,
+                **{"polling": POLLING, **self.kwargs},  # type: ignore[arg-type]
+            )
+        except BaseException as err:
+            self.outcome = err
+
+
+def start_waiters(adapter: ArnicaAdapterGated, *waiters: Waiter) -> None:
+    """Starts the waiters one after the other, once the first one polls."""
+    for waiter in waiters:
+        waiter.start()
+        adapter.polled.wait(timeout=5.0)
+
+
+def join(*waiters: Waiter) -> None:
+    for waiter in waiters:
+        waiter.join(timeout=5.0)
+        assert not waiter.is_alive()
+
+
+def eventually(condition: Callable[[], bool]) -> None:
+    give_up_at = time.monotonic() + 5.0
+    while not condition():
+        assert time.monotonic() < give_up_at
+        time.sleep(0.01)
+
+
+def test_concurrent_waits_on_a_job_share_a_single_poller() -> None:
+    """It should poll a job once per interval however many waits there are on it."""
+    adapter = ArnicaAdapterGated()
+    service = JobService(adapter)
+    job_id = uuid4()
+    waiters = [Waiter(service, job_id) for _ in range(5)]
+
+    start_waiters(adapter, *waiters)
+    polls = adapter.polls_after(0.2)
+    adapter.released.set()
+    join(*waiters)
+
+    # A poller per wait would poll about 100 times at the given interval
+    assert polls < 40
+    assert all(waiter.outcome == adapter.outcome for waiter in waiters)
+
+
+def test_it_fans_out_every_state_change_to_every_wait() -> None:
+    """It should report each change of state to every wait, catching up waits that join later."""
+
+    class ArnicaAdapterProgressing(ArnicaAdapterGated):
+        def fetch_job_state(self, token: str, job_id: UUID) -> JobState:
+            state = super().fetch_job_state(token, job_id)
+            polls = len(self.fetch_job_state_called_with)
+            return RROngoing(finished_count=polls // 2) if isinstance(state, RRQueued) else state
+
+    adapter = ArnicaAdapterProgressing()
+    service = JobService(adapter)
+    job_id = uuid4()
+    first, second = Waiter(service, job_id), Waiter(service, job_id)
+
+    start_waiters(adapter, first, second)
+    eventually(lambda: len(second.reported) >= 3)
+    adapter.released.set()
+    join(first, second)
+
+    polls = len(adapter.fetch_job_state_called_with)
+    # The last poll finds the job finished
+    assert first.reported == [RROngoing(finished_count=count) for count in range((polls - 1) // 2 + 1)]
+    assert second.reported == first.reported[-len(second.reported) :]
+
+
+def test_another_wait_takes_over_polling_when_the_polling_one_ends() -> None:
+    """It should keep polling for the remaining waits when the polling wait is cancelled."""
+    adapter = ArnicaAdapterGated()
+    service = JobService(adapter)
+    job_id = uuid4()
+    cancel = threading.Event()
+    first, second = Waiter(service, job_id, cancel=cancel), Waiter(service, job_id)
+
+    start_waiters(adapter, first, second)
+    cancel.set()
+    first.join(timeout=5.0)
+    assert adapter.polls_after(0.1) > 0
+    adapter.released.set()
+    join(second)
+
+    assert isinstance(first.outcome, WaitCancelledError)
+    assert second.outcome == adapter.outcome
+
+
+def test_a_cancel_event_wakes_a_wait_sharing_another_wait_s_poll(monkeypatch: pytest.MonkeyPatch) -> None:
+    """It should end a wait blocked on another wait's poll as soon as its CancelEvent is set."""
+    # Plain events would only be checked after a minute
+    monkeypatch.setattr(job_service, "CANCEL_CHECK_SECONDS", 60.0)
+    adapter = ArnicaAdapterGated()
+    service = JobService(adapter)
+    job_id = uuid4()
+    stop_polling, cancel = threading.Event(), CancelEvent()
+    polling = FixedIntervalPolling(60.0)
+    first = Waiter(service, job_id, cancel=stop_polling, polling=polling)
+    second = Waiter(service, job_id, cancel=cancel, polling=polling)
+
+    start_waiters(adapter, first)
+    second.start()
+    eventually(lambda: len(service._shared_waits[job_id].subscribers) == 2)
+    cancel.set()
+    join(second)
+    stop_polling.set()
+    join(first)
+
+    assert isinstance(second.outcome, WaitCancelledError)
+    assert len(adapter.fetch_job_state_called_with) == 1
+
+
+def test_polling_stops_when_the_last_wait_ends() -> None:
+    """It should stop polling the job once no wait is left."""
+    adapter = ArnicaAdapterGated()
+    service = JobService(adapter)
+    job_id = uuid4()
+    cancels = [threading.Event(), threading.Event()]
+    waiters = [Waiter(service, job_id, cancel=cancel) for cancel in cancels]
+
+    start_waiters(adapter, *waiters)
+    for cancel in cancels:
+        cancel.set()
+    join(*waiters)
+
+    assert all(isinstance(waiter.outcome, WaitCancelledError) for waiter in waiters)
+    assert adapter.polls_after(0.1) == 0
+
+
+def test_an_expired_token_only_ends_the_wait_using_it() -> None:
+    """It should let the other waits poll with their own tokens when the token of the polling wait is rejected."""
+    adapter = ArnicaAdapterGated()
+    service = JobService(adapter)
+    job_id = uuid4()
+    first, second = Waiter(service, job_id, token="first-token"), Waiter(service, job_id, token="second-token")
+
+    start_waiters(adapter, first, second)
+    adapter.rejected_tokens.add("first-token")
+    first.join(timeout=5.0)
+    adapter.released.set()
+    join(second)
+
+    assert isinstance(first.outcome, NotAuthenticatedError)
+    assert second.outcome == adapter.outcome
+    assert adapter.fetch_job_state_called_with[-1] == ("second-token", job_id)
+
+
+def test_it_hands_non_transient_errors_to_every_wait() -> None:
+    """It should end every wait on the job with a non-transient error of the poller."""
+    adapter = ArnicaAdapterGated()
+    adapter.outcome = JobNotFoundError()
+    service = JobService(adapter)
+    job_id = uuid4()
+    waiters = [Waiter(service, job_id) for _ in range(3)]
+
+    start_waiters(adapter, *waiters)
+    adapter.released.set()
+    join(*waiters)
+
+    assert all(isinstance(waiter.outcome, JobNotFoundError) for waiter in waiters)
+
+
+@pytest.mark.parametrize("limit", [{"max_attempts": 2}, {"deadline": 0.0}])
+def test_a_wait_that_times_out_leaves_the_others_waiting(limit: dict[str, Any]) -> None:
+    """It should apply the attempt limit and deadline of each wait to that wait only."""
+    adapter = ArnicaAdapterGated()
+    service = JobService(adapter)
+    job_id = uuid4()
+    first, second = Waiter(service, job_id), Waiter(service, job_id, **limit)
+
+    start_waiters(adapter, first, second)
+    second.join(timeout=5.0)
+    adapter.released.set()
+    join(first)
+
+    assert isinstance(second.outcome, TimeoutError)
+    assert first.outcome == adapter.outcome
+
+
+def test_waits_on_different_jobs_poll_separately() -> None:
+    """It should not share a poller between waits on different jobs."""
+    adapter = ArnicaAdapterGated()
+    adapter.released.set()
+    service = JobService(adapter)
+    first, second = Waiter(service, uuid4()), Waiter(service, uuid4())
+
+    start_waiters(adapter, first, second)
+    join(first, second)
+
+    assert {job_id for _, job_id in adapter.fetch_job_state_called_with} == {first.job_id, second.job_id}
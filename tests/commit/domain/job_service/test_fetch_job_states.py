@@ -0,0 +1,81 @@
+from collections.abc import Callable, Iterable
+from uuid import UUID, uuid4
+
+from aqt_connector._domain.job_service import JobService
+from aqt_connector._infrastructure.arnica_adapter import ArnicaAdapter
+from aqt_connector.exceptions import JobNotFoundError
+from aqt_connector.models.arnica.response_bodies.jobs import JobState, RRQueued
+
+
+class ArnicaAdapterSpy(ArnicaAdapter):
+    """A spy for the ArnicaAdapter to be used in tests."""
+
+    def __init__(self) -> None:
+        self.fetch_job_state_called_with: list[tuple[str, UUID]] = []
+        self.missing_job_ids: set[UUID] = set()
+
+    def fetch_job_state(self, token: str, job_id: UUID) -> JobState:
+        self.fetch_job_state_called_with.append((token, job_id))
+        if job_id in self.missing_job_ids:
+            raise JobNotFoundError
+        return RRQueued()
+
+
+def test_it_fetches_every_job_once_with_the_given_token() -> None:
+    """It should fetch the state of every unique job with the given token."""
+    adapter_spy = ArnicaAdapterSpy()
+    service = JobService(adapter_spy)
+    job_ids = [uuid4() for _ in range(50)]
+
+    service.fetch_job_states("some-token", job_ids + job_ids[:10], max_concurrency=4)
+
+    assert sorted(adapter_spy.fetch_job_state_called_with) == sorted(("some-token", job_id) for job_id in job_ids)
+
+
+def test_it_returns_states_in_order_of_the_given_job_ids() -> None:
+    """It should return a mapping keyed by job ID, in the order the IDs were given."""
+    service = JobService(ArnicaAdapterSpy())
+    job_ids = [uuid4() for _ in range(20)]
+
+    states = service.fetch_job_states("some-token", job_ids)
+
+    assert list(states) == job_ids
+    assert all(state == RRQueued() for state in states.values())
+
+
+def test_it_returns_per_job_errors_without_failing_other_jobs() -> None:
+    """It should map jobs that could not be fetched to the raised exception."""
+    adapter_spy = ArnicaAdapterSpy()
+    missing_job_id, existing_job_id = uuid4(), uuid4()
+    adapter_spy.missing_job_ids = {missing_job_id}
+    service = JobService(adapter_spy)
+
+    states = service.fetch_job_states("some-token", [missing_job_id, existing_job_id])
+
+    assert isinstance(states[missing_job_id], JobNotFoundError)
+    assert states[existing_job_id] == RRQueued()
+
+
+def test_it_delegates_to_the_adapter_bulk_fetch() -> None:
+    """It should use the adapter's bulk fetch, so that a server-side batch endpoint can be adopted transparently."""
+
+    class BatchingArnicaAdapter(ArnicaAdapterSpy):
+        def fetch_job_states(
+            self,
+            token: str,
+            job_ids: Iterable[UUID],
+            *,
+            max_concurrency: int = 8,
+            pace: Callable[[], None] | None = None,
+        ) -> dict[UUID, JobState | Exception]:
+            self.batch_called_with = (token, list(job_ids), max_concurrency)
+            return {}
+
+    adapter = BatchingArnicaAdapter()
+    service = JobService(adapter)
+    job_ids = [uuid4(), uuid4()]
+
+    service.fetch_job_states("some-token", job_ids, max_concurrency=3)
+
+    assert adapter.batch_called_with == ("some-token", job_ids, 3)
+    assert adapter.fetch_job_state_called_with == []
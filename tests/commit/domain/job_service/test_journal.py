@@ -0,0 +1,89 @@
+from pathlib import Path
+from uuid import UUID, uuid4
+
+from aqt_connector._domain.job_service import JobService
+from aqt_connector._infrastructure.arnica_adapter import ArnicaAdapter
+from aqt_connector._infrastructure.job_journal import JobJournal
+from aqt_connector._infrastructure.result_cache import ResultCache
+from aqt_connector.models.arnica.jobs import JobStatus
+from aqt_connector.models.arnica.response_bodies.jobs import JobState, RRFinished, RROngoing, RRQueued
+
+
+class ArnicaAdapterScripted(ArnicaAdapter):
+    """A double for the ArnicaAdapter replaying a scripted sequence of states, repeating the last one."""
+
+    def __init__(self, *states: JobState) -> None:
+        self.states = list(states)
+        self.fetch_job_state_called_with: list[tuple[str, UUID]] = []
+
+    def fetch_job_state(self, token: str, job_id: UUID) -> JobState:
+        self.fetch_job_state_called_with.append((token, job_id))
+        return self.states.pop(0) if len(self.states) > 1 else self.states[0]
+
+
+def test_it_records_state_changes_and_the_final_status(tmp_path: Path) -> None:
+    """It should record the status of the job in the journal while waiting for it."""
+    journal = JobJournal(tmp_path / "journal.sqlite3")
+    job_id = uuid4()
+    seen: list[JobStatus | None] = []
+    adapter = ArnicaAdapterScripted(RRQueued(), RROngoing(finished_count=0), RRFinished(result={}))
+    service = JobService(adapter, journal=journal)
+
+    def wait_mock(duration: float) -> None:
+        entry = journal.get(job_id)
+        seen.append(entry.status if entry else None)
+
+    service.wait_for_result("some-token", job_id, wait=wait_mock, out=None)
+
+    entry = journal.get(job_id)
+    assert seen == [JobStatus.QUEUED, JobStatus.ONGOING]
+    assert entry is not None
+    assert entry.status == JobStatus.FINISHED
+    assert entry.result_location is None
+
+
+def test_it_records_where_the_result_cache_stored_the_final_state(tmp_path: Path) -> None:
+    """It should record the file the result cache wrote the final state of a job to."""
+    journal = JobJournal(tmp_path / "journal.sqlite3")
+    cache = ResultCache(tmp_path / "cache")
+    job_id = uuid4()
+    service = JobService(ArnicaAdapterScripted(RRFinished(result={0: [[1]]})), journal=journal, result_cache=cache)
+
+    service.wait_for_result("some-token", job_id, out=None)
+
+    entry = journal.get(job_id)
+    assert entry is not None
+    assert entry.result_location is not None
+    assert Path(entry.result_location).parent == tmp_path / "cache"
+    assert Path(entry.result_location).is_file()
+
+
+def test_it_resumes_several_jobs_skipping_cached_ones(tmp_path: Path) -> None:
+    """It should yield the cached jobs first and only poll the others, recording their statuses."""
+    journal = JobJournal(tmp_path / "journal.sqlite3")
+    cache = ResultCache(tmp_path / "cache")
+    finished, running = uuid4(), uuid4()
+    journal.record_state(finished, RRFinished(result={}))
+    cache.put(finished, RRFinished(result={}))
+    journal.record_state(running, RROngoing(finished_count=0))
+    adapter = ArnicaAdapterScripted(RRFinished(result={0: [[0]]}))
+    service = JobService(adapter, journal=journal, result_cache=cache)
+
+    results = list(service.wait_for_results("some-token", [finished, running], out=None))
+
+    assert [job_id for job_id, _ in results] == [finished, running]
+    assert adapter.fetch_job_state_called_with == [("some-token", running)]
+    assert journal.unfinished() == []
+
+
+def test_fetching_a_state_records_its_status(tmp_path: Path) -> None:
+    """It should record the statuses of fetched states in the journal."""
+    journal = JobJournal(tmp_path / "journal.sqlite3")
+    job_id = uuid4()
+    service = JobService(ArnicaAdapterScripted(RROngoing(finished_count=3)), journal=journal)
+
+    service.fetch_job_state("some-token", job_id)
+
+    entry = journal.get(job_id)
+    assert entry is not None
+    assert entry.status == JobStatus.ONGOING
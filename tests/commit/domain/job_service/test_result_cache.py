@@ -0,0 +1,59 @@
+from pathlib import Path
+from uuid import UUID, uuid4
+
+from aqt_connector._domain.job_service import JobService
+from aqt_connector._infrastructure.arnica_adapter import ArnicaAdapter
+from aqt_connector._infrastructure.result_cache import ResultCache
+from aqt_connector.models.arnica.response_bodies.jobs import JobState, RRFinished, RRQueued
+
+
+class ArnicaAdapterSpy(ArnicaAdapter):
+    """A spy for the ArnicaAdapter returning a fixed state per job."""
+
+    def __init__(self, states: dict[UUID, JobState]) -> None:
+        self.states = states
+        self.fetch_job_state_called_with: list[UUID] = []
+
+    def fetch_job_state(self, token: str, job_id: UUID) -> JobState:
+        self.fetch_job_state_called_with.append(job_id)
+        return self.states[job_id]
+
+
+def test_repeat_fetches_of_final_states_dont_query_the_job(tmp_path: Path) -> None:
+    """It should only query a finished job once, and keep querying unfinished ones."""
+    finished, queued = uuid4(), uuid4()
+    adapter = ArnicaAdapterSpy({finished: RRFinished(result={0: [[1]]}), queued: RRQueued()})
+    service = JobService(adapter, result_cache=ResultCache(tmp_path))
+
+    for _ in range(3):
+        assert service.fetch_job_state("some-token", finished) == RRFinished(result={0: [[1]]})
+        service.fetch_job_state("some-token", queued)
+
+    assert adapter.fetch_job_state_called_with == [finished, queued, queued, queued]
+
+
+def test_waits_on_cached_jobs_dont_query_them(tmp_path: Path) -> None:
+    """It should return the cached final state of a job, including one cached before a restart."""
+    job_id = uuid4()
+    ResultCache(tmp_path).put(job_id, RRFinished(result={0: [[0]]}))
+    adapter = ArnicaAdapterSpy({})
+    service = JobService(adapter, result_cache=ResultCache(tmp_path))
+
+    assert service.wait_for_result("some-token", job_id, out=None) == RRFinished(result={0: [[0]]})
+    assert list(service.wait_for_results("some-token", [job_id], out=None)) == [(job_id, RRFinished(result={0: [[0]]}))]
+    assert adapter.fetch_job_state_called_with == []
+
+
+def test_fetching_several_jobs_only_queries_uncached_ones(tmp_path: Path) -> None:
+    """It should only query the jobs that are not cached, returning all states in the given order."""
+    cached, uncached = uuid4(), uuid4()
+    cache = ResultCache(tmp_path)
+    cache.put(cached, RRFinished(result={0: [[1]]}))
+    adapter = ArnicaAdapterSpy({uncached: RRQueued()})
+    service = JobService(adapter, result_cache=cache)
+
+    states = service.fetch_job_states("some-token", [uncached, cached])
+
+    assert states == {uncached: RRQueued(), cached: RRFinished(result={0: [[1]]})}
+    assert list(states) == [uncached, cached]
+    assert adapter.fetch_job_state_called_with == [uncached]
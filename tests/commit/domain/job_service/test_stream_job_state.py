@@ -0,0 +1,32 @@
+from pathlib import Path
+from uuid import UUID, uuid4
+
+from aqt_connector._domain.job_service import JobService
+from aqt_connector._infrastructure.arnica_adapter import ArnicaAdapter
+from aqt_connector._infrastructure.result_stream import NpyDirectorySink, ShotSink
+from aqt_connector.models.arnica.response_bodies.jobs import JobState, RRQueued
+
+
+class ArnicaAdapterSpy(ArnicaAdapter):
+    """A spy for the ArnicaAdapter to be used in tests."""
+
+    def __init__(self) -> None:
+        self.stream_job_state_called_with: list[tuple[str, UUID, ShotSink | None]] = []
+        self.returned_state = RRQueued()
+
+    def stream_job_state(self, token: str, job_id: UUID, *, sink: ShotSink | None = None) -> JobState:
+        self.stream_job_state_called_with.append((token, job_id, sink))
+        return self.returned_state
+
+
+def test_it_passes_given_parameters_and_returns_adapter_result() -> None:
+    """It should pass the given parameters, including the sink, to the adapter and return its result."""
+    adapter_spy = ArnicaAdapterSpy()
+    service = JobService(adapter_spy)
+    job_id = uuid4()
+    sink = NpyDirectorySink(Path("unused"))
+
+    state = service.stream_job_state("some-token", job_id, sink=sink)
+
+    assert adapter_spy.stream_job_state_called_with == [("some-token", job_id, sink)]
+    assert state is adapter_spy.returned_state
@@ -0,0 +1,139 @@
+from uuid import UUID, uuid4
+
+from aqt_connector._domain.job_service import JobService
+from aqt_connector._domain.polling import FixedIntervalPolling
+from aqt_connector._domain.wait_events import (
+    BackedOff,
+    JobFinished,
+    PollFinished,
+    PollStarted,
+    StateChanged,
+    TransientErrorEncountered,
+    WaitEvent,
+)
+from aqt_connector._infrastructure.arnica_adapter import ArnicaAdapter
+from aqt_connector.exceptions import RequestError
+from aqt_connector.models.arnica.jobs import JobStatus
+from aqt_connector.models.arnica.response_bodies.jobs import (
+    JobState,
+    NonFinalJobState,
+    RRFinished,
+    RROngoing,
+    RRQueued,
+)
+from tests.commit.domain.stdout_spy import StdoutSpy
+
+FINISHED = RRFinished(result={0: [[0, 1]]})
+
+
+class ArnicaAdapterScripted(ArnicaAdapter):
+    """A double for the ArnicaAdapter that replays a scripted sequence of states per job."""
+
+    def __init__(self, scripts: dict[UUID, list[JobState | Exception]]) -> None:
+        self.scripts = scripts
+
+    def fetch_job_state(self, token: str, job_id: UUID) -> JobState:
+        outcome = self.scripts[job_id].pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def no_wait(duration: float) -> None: ...
+
+
+def without_latency(events: list[WaitEvent]) -> list[WaitEvent]:
+    return [
+        PollFinished(event.job_id, event.attempt, 0.0) if isinstance(event, PollFinished) else event for event in events
+    ]
+
+
+def test_it_sends_events_of_the_wait() -> None:
+    """It should send the polls and the state changes of the job to the sink, ending with its final state."""
+    job_id = uuid4()
+    service = JobService(ArnicaAdapterScripted({job_id: [RRQueued(), RROngoing(finished_count=0), FINISHED]}))
+    events: list[WaitEvent] = []
+
+    service.wait_for_result("some-token", job_id, wait=no_wait, events=events.append)
+
+    assert without_latency(events) == [
+        PollStarted(job_id, 1),
+        PollFinished(job_id, 1, 0.0),
+        StateChanged(job_id, RRQueued(), None),
+        PollStarted(job_id, 2),
+        PollFinished(job_id, 2, 0.0),
+        StateChanged(job_id, RROngoing(finished_count=0), JobStatus.QUEUED),
+        PollStarted(job_id, 3),
+        PollFinished(job_id, 3, 0.0),
+        JobFinished(job_id, FINISHED, 3),
+    ]
+    assert all(event.latency_seconds >= 0 for event in events if isinstance(event, PollFinished))
+
+
+def test_it_only_reports_changes_of_state() -> None:
+    """It should neither send events for nor report states that are the same as the previous one."""
+    job_id = uuid4()
+    states: list[JobState | Exception] = [RRQueued(), RRQueued(), RROngoing(finished_count=1)]
+    states += [RROngoing(finished_count=1), RROngoing(finished_count=2), FINISHED]
+    service = JobService(ArnicaAdapterScripted({job_id: states}))
+    events: list[WaitEvent] = []
+    reported: list[NonFinalJobState] = []
+
+    service.wait_for_result("some-token", job_id, wait=no_wait, events=events.append, report_state=reported.append)
+
+    assert [event.state for event in events if isinstance(event, StateChanged)] == reported
+    assert reported == [RRQueued(), RROngoing(finished_count=1), RROngoing(finished_count=2)]
+
+
+def test_it_sends_transient_errors_and_backoff() -> None:
+    """It should send transient errors along with the backoff after them, and write them to `out`."""
+    job_id = uuid4()
+    error = RequestError("Simulated transient error")
+    service = JobService(ArnicaAdapterScripted({job_id: [error, error, FINISHED]}))
+    events: list[WaitEvent] = []
+    stdout = StdoutSpy()
+
+    service.wait_for_result(
+        "some-token", job_id, wait=no_wait, events=events.append, out=stdout, polling=FixedIntervalPolling(1.0)
+    )
+
+    errors = [event for event in events if isinstance(event, TransientErrorEncountered)]
+    backoffs = [event for event in events if isinstance(event, BackedOff)]
+    assert errors == [TransientErrorEncountered(job_id, error)] * 2
+    assert [backoff.consecutive_errors for backoff in backoffs] == [1, 2]
+    assert all(0.5 <= backoff.delay_seconds <= 1.5 for backoff in backoffs)
+    assert stdout.getvalue().count("Transient (RequestError) error encountered while fetching job state") == 2
+
+
+def test_it_writes_nothing_without_out() -> None:
+    """It should not write transient errors if no output stream is given."""
+    job_id = uuid4()
+    service = JobService(ArnicaAdapterScripted({job_id: [RequestError("Simulated transient error"), FINISHED]}))
+
+    assert service.wait_for_result("some-token", job_id, wait=no_wait, out=None) == FINISHED
+
+
+def test_it_sends_events_of_waits_on_several_jobs() -> None:
+    """It should send the events of each job when waiting for several jobs."""
+    first, second = uuid4(), uuid4()
+    service = JobService(ArnicaAdapterScripted({first: [RRQueued(), FINISHED], second: [FINISHED]}))
+    events: list[WaitEvent] = []
+    reported: list[tuple[UUID, NonFinalJobState]] = []
+
+    list(
+        service.wait_for_results(
+            "some-token",
+            [first, second],
+            wait=no_wait,
+            events=events.append,
+            report_state=lambda job_id, state: reported.append((job_id, state)),
+        )
+    )
+
+    assert [event for event in events if not isinstance(event, PollStarted | PollFinished)] == [
+        StateChanged(first, RRQueued(), None),
+        JobFinished(second, FINISHED, 1),
+        JobFinished(first, FINISHED, 2),
+    ]
+    assert sum(isinstance(event, PollStarted) for event in events) == 3
+    assert reported == [(first, RRQueued())]
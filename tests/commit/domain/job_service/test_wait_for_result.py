@@ -1,8 +1,13 @@
+import threading
+import time
 from uuid import UUID, uuid4
 
 import pytest
 
 from aqt_connector._domain.job_service import JobService
+from aqt_connector._domain.poll_scheduler import PollScheduler
+from aqt_connector._domain.polling import FixedIntervalPolling, PollContext, PollingStrategy
+from aqt_connector._domain.wait_events import TokenRefreshed, WaitEvent
 from aqt_connector._infrastructure.arnica_adapter import ArnicaAdapter
 from aqt_connector.exceptions import (
     InvalidJobIDError,
@@ -10,6 +15,7 @@ from aqt_connector.exceptions import (
     NotAuthenticatedError,
     RequestError,
     UnknownServerError,
+    WaitCancelledError,
 )
 from aqt_connector.models.arnica.response_bodies.jobs import (
     FinalJobState,
@@ -207,6 +213,67 @@ def test_it_raises_on_non_transient_errors(exception_type: type[Exception]) -> N
         service.wait_for_result("some-token", uuid4(), wait=wait_mock)
 
 
+class ArnicaAdapterRejectingTokens(ArnicaAdapterSpy):
+    """A double for the ArnicaAdapter that rejects some tokens, and leaves jobs queued for the others."""
+
+    def __init__(self, rejected_tokens: set[str]) -> None:
+        super().__init__()
+        self.rejected_tokens = rejected_tokens
+        self.returned_state = RRQueued()
+
+    def fetch_job_state(self, token: str, job_id: UUID) -> JobState:
+        self.fetch_job_state_called_with.append((token, job_id))
+        if token in self.rejected_tokens:
+            raise NotAuthenticatedError
+        return self.returned_state
+
+
+def test_it_refreshes_rejected_tokens_without_restarting_the_attempts() -> None:
+    """It should query the job again right away with a refreshed token, counting the rejected query as an attempt."""
+    adapter_spy = ArnicaAdapterRejectingTokens({"expired-token"})
+    service = JobService(adapter_spy)
+    job_id = uuid4()
+    refreshed: list[str] = []
+    events: list[WaitEvent] = []
+    wait_durations: list[float] = []
+
+    def refresh_token(rejected: str) -> str:
+        refreshed.append(rejected)
+        return "fresh-token"
+
+    class UnjitteredPolling(PollingStrategy):
+        def next_interval(self, context: PollContext) -> float:
+            return 1.0
+
+    with pytest.raises(TimeoutError, match="after 4 attempts"):
+        service.wait_for_result(
+            "expired-token",
+            job_id,
+            refresh_token=refresh_token,
+            wait=wait_durations.append,
+            max_attempts=4,
+            events=events.append,
+            polling=UnjitteredPolling(),
+        )
+
+    assert refreshed == ["expired-token"]
+    assert [token for token, _ in adapter_spy.fetch_job_state_called_with] == ["expired-token"] + ["fresh-token"] * 3
+    assert wait_durations == [1.0, 1.0]
+    assert TokenRefreshed(job_id) in events
+
+
+@pytest.mark.parametrize("refreshed", [None, "expired-token"])
+def test_it_raises_if_the_token_cannot_be_refreshed(refreshed: str | None) -> None:
+    """It should raise NotAuthenticatedError when no new token can be had."""
+    adapter_spy = ArnicaAdapterRejectingTokens({"expired-token"})
+    service = JobService(adapter_spy)
+
+    with pytest.raises(NotAuthenticatedError):
+        service.wait_for_result("expired-token", uuid4(), refresh_token=lambda rejected: refreshed, wait=lambda _: None)
+
+    assert len(adapter_spy.fetch_job_state_called_with) == 1
+
+
 @pytest.mark.parametrize("final_state", [RRFinished, RRError, RRCancelled])
 def test_it_calls_report_state_if_set(final_state: FinalJobState) -> None:
     """It should report the state if the callable is provided."""
@@ -224,3 +291,131 @@ def test_it_calls_report_state_if_set(final_state: FinalJobState) -> None:
     assert len(reported_states) == 2
     assert isinstance(reported_states[0], RRQueued)
     assert isinstance(reported_states[1], RROngoing)
+
+
+def test_it_waits_for_intervals_decided_by_polling_strategy() -> None:
+    """It should ask the polling strategy how long to wait, passing what is known about the job."""
+
+    class PollingSpy(PollingStrategy):
+        def __init__(self) -> None:
+            self.contexts: list[PollContext] = []
+
+        def next_interval(self, context: PollContext) -> float:
+            self.contexts.append(context)
+            return 42.0
+
+    polling = PollingSpy()
+    service = JobService(ArnicaAdapterFinishingSpy())
+
+    wait_durations: list[float] = []
+    service.wait_for_result("some-token", uuid4(), wait=wait_durations.append, polling=polling, number_of_circuits=5)
+
+    assert wait_durations == [42.0, 42.0]
+    assert polling.contexts == [
+        PollContext(RRQueued(), polls_in_state=1, number_of_circuits=5),
+        PollContext(RROngoing(finished_count=0), polls_in_state=1, number_of_circuits=5),
+    ]
+
+
+def test_it_shares_the_polling_budget_through_the_scheduler() -> None:
+    """It should register with the scheduler while waiting and let it pace and stretch the waits."""
+
+    class PollSchedulerSpy(PollScheduler):
+        def __init__(self) -> None:
+            super().__init__(1.0)
+            self.active_during_poll: list[set[UUID]] = []
+
+        def acquire(self) -> float:
+            self.active_during_poll.append(self.active_job_ids)
+            return 0.5
+
+    desired_interval = 0.5
+
+    class UnjitteredPolling(PollingStrategy):
+        def next_interval(self, context: PollContext) -> float:
+            return desired_interval
+
+    adapter_spy = ArnicaAdapterFinishingSpy()
+    scheduler = PollSchedulerSpy()
+    service = JobService(adapter_spy, scheduler)
+    other_wait = scheduler.register(uuid4())
+    other_wait.next_delay(0.5)
+    job_id = uuid4()
+
+    wait_durations: list[float] = []
+    service.wait_for_result("some-token", job_id, wait=wait_durations.append, polling=UnjitteredPolling())
+
+    assert all(job_id in active for active in scheduler.active_during_poll)
+    assert scheduler.active_job_ids == {other_wait.job_id}
+    # Every poll is paced, and the intervals are stretched as two waits share one request per second
+    assert wait_durations[0] == 0.5
+    assert all(duration >= desired_interval for duration in wait_durations)
+    assert len(wait_durations) == 5
+
+
+def test_it_raises_timeout_error_once_the_deadline_has_passed() -> None:
+    """It should stop polling once the deadline has passed, never sleeping beyond it."""
+    adapter_spy = ArnicaAdapterSpy()
+    adapter_spy.returned_state = RRQueued()
+    service = JobService(adapter_spy)
+    now = 0.0
+    wait_durations: list[float] = []
+
+    def wait_mock(duration: float) -> None:
+        nonlocal now
+        wait_durations.append(duration)
+        now += duration
+
+    with pytest.raises(TimeoutError, match="deadline has passed"):
+        service.wait_for_result(
+            "some-token",
+            uuid4(),
+            wait=wait_mock,
+            clock=lambda: now,
+            deadline=2.5,
+            polling=FixedIntervalPolling(1.0),
+        )
+
+    assert now == pytest.approx(2.5)
+    assert sum(wait_durations) == pytest.approx(2.5)
+
+
+def test_it_raises_wait_cancelled_error_when_cancelled() -> None:
+    """It should stop polling before the next query once the wait is cancelled."""
+    adapter_spy = ArnicaAdapterSpy()
+    adapter_spy.returned_state = RRQueued()
+    service = JobService(adapter_spy)
+    cancel = threading.Event()
+
+    def wait_mock(duration: float) -> None:
+        cancel.set()
+
+    with pytest.raises(WaitCancelledError):
+        service.wait_for_result("some-token", uuid4(), wait=wait_mock, cancel=cancel)
+
+    assert len(adapter_spy.fetch_job_state_called_with) == 1
+
+
+def test_cancelling_wakes_a_sleeping_wait() -> None:
+    """It should end a wait sleeping between polls as soon as it is cancelled from another thread."""
+    adapter_spy = ArnicaAdapterSpy()
+    adapter_spy.returned_state = RRQueued()
+    service = JobService(adapter_spy)
+    cancel = threading.Event()
+    outcome: list[BaseException] = []
+
+    def run() -> None:
+        try:
+            service.wait_for_result("some-token", uuid4(), polling=FixedIntervalPolling(60.0), cancel=cancel)
+        except BaseException as err:
+            outcome.append(err)
+
+    waiter = threading.Thread(target=run)
+    waiter.start()
+    time.sleep(0.05)
+    cancel.set()
+    waiter.join(timeout=5.0)
+
+    assert not waiter.is_alive()
+    assert len(outcome) == 1
+    assert isinstance(outcome[0], WaitCancelledError)
@@ -0,0 +1,298 @@
+import threading
+import time
+from uuid import UUID, uuid4
+
+import pytest
+
+from aqt_connector._domain.job_service import JobService
+from aqt_connector._domain.poll_scheduler import PollScheduler
+from aqt_connector._domain.wait_events import TokenRefreshed, WaitEvent
+from aqt_connector._infrastructure.arnica_adapter import ArnicaAdapter
+from aqt_connector.exceptions import JobNotFoundError, NotAuthenticatedError, RequestError, WaitCancelledError
+from aqt_connector.models.arnica.response_bodies.jobs import (
+    JobState,
+    NonFinalJobState,
+    RRCancelled,
+    RRFinished,
+    RROngoing,
+    RRQueued,
+)
+from tests.commit.domain.stdout_spy import StdoutSpy
+
+
+class FakeClock:
+    """A clock that only advances when waited on."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.waits: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def wait(self, duration: float) -> None:
+        self.waits.append(duration)
+        self.now += duration
+
+
+class ArnicaAdapterScripted(ArnicaAdapter):
+    """A double for the ArnicaAdapter that replays a scripted sequence of states per job."""
+
+    def __init__(self, scripts: dict[UUID, list[JobState | Exception]]) -> None:
+        self.scripts = scripts
+        self.fetch_job_state_called_with: list[tuple[str, UUID]] = []
+
+    def fetch_job_state(self, token: str, job_id: UUID) -> JobState:
+        self.fetch_job_state_called_with.append((token, job_id))
+        script = self.scripts[job_id]
+        outcome = script.pop(0) if len(script) > 1 else script[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def test_it_yields_jobs_in_order_of_completion() -> None:
+    """It should yield each job as soon as it reaches a final state."""
+    slow, fast = uuid4(), uuid4()
+    adapter = ArnicaAdapterScripted(
+        {
+            slow: [RRQueued(), RROngoing(finished_count=0), RRFinished(result={0: [[1]]})],
+            fast: [RRCancelled()],
+        }
+    )
+    service = JobService(adapter)
+    clock = FakeClock()
+
+    completed = list(service.wait_for_results("some-token", [slow, fast], wait=clock.wait, clock=clock))
+
+    assert [job_id for job_id, _ in completed] == [fast, slow]
+    assert completed[0][1] == RRCancelled()
+    assert completed[1][1] == RRFinished(result={0: [[1]]})
+
+
+def test_it_uses_the_given_token_for_all_jobs() -> None:
+    """It should query every job with the given token."""
+    job_ids = [uuid4() for _ in range(5)]
+    adapter = ArnicaAdapterScripted({job_id: [RRCancelled()] for job_id in job_ids})
+    service = JobService(adapter)
+
+    list(service.wait_for_results("some-token", job_ids))
+
+    assert sorted(adapter.fetch_job_state_called_with) == sorted(("some-token", job_id) for job_id in job_ids)
+
+
+def test_it_ignores_duplicate_job_ids() -> None:
+    """It should poll and yield each job only once."""
+    job_id = uuid4()
+    adapter = ArnicaAdapterScripted({job_id: [RRCancelled()]})
+    service = JobService(adapter)
+
+    completed = list(service.wait_for_results("some-token", [job_id, job_id]))
+
+    assert completed == [(job_id, RRCancelled())]
+    assert len(adapter.fetch_job_state_called_with) == 1
+
+
+def test_it_jitters_polls_around_the_query_interval() -> None:
+    """It should wait for a jittered duration around the query interval between polls of the same job."""
+    job_id = uuid4()
+    script: list[JobState | Exception] = [RRQueued() for _ in range(10)]
+    script.append(RRCancelled())
+    adapter = ArnicaAdapterScripted({job_id: script})
+    service = JobService(adapter)
+    clock = FakeClock()
+
+    list(service.wait_for_results("some-token", [job_id], wait=clock.wait, clock=clock, query_interval_seconds=2.0))
+
+    assert len(clock.waits) == 10
+    assert all(1.0 <= duration <= 3.0 for duration in clock.waits)
+
+
+def test_it_continues_polling_on_transient_request_errors() -> None:
+    """It should report transient errors and keep polling the affected job."""
+    job_id = uuid4()
+    adapter = ArnicaAdapterScripted({job_id: [RequestError("Simulated transient error"), RRCancelled()]})
+    service = JobService(adapter)
+    clock = FakeClock()
+    stdout_spy = StdoutSpy()
+
+    completed = list(service.wait_for_results("some-token", [job_id], wait=clock.wait, clock=clock, out=stdout_spy))
+
+    assert completed == [(job_id, RRCancelled())]
+    assert len(stdout_spy.output) == 1
+    assert str(job_id) in stdout_spy.output[0]
+
+
+def test_it_raises_timeout_error_when_a_job_exceeds_max_attempts() -> None:
+    """It should raise TimeoutError once a single job has been polled max_attempts times."""
+    stuck, done = uuid4(), uuid4()
+    adapter = ArnicaAdapterScripted({stuck: [RRQueued()], done: [RRCancelled()]})
+    service = JobService(adapter)
+    clock = FakeClock()
+
+    completed = []
+    with pytest.raises(TimeoutError, match=f"Timed out after 3 attempts waiting for job {stuck} to finish."):
+        for item in service.wait_for_results("some-token", [stuck, done], wait=clock.wait, clock=clock, max_attempts=3):
+            completed.append(item)
+
+    assert completed == [(done, RRCancelled())]
+    assert adapter.fetch_job_state_called_with.count(("some-token", stuck)) == 3
+
+
+@pytest.mark.parametrize("exception_type", [NotAuthenticatedError, JobNotFoundError, RuntimeError])
+def test_it_raises_on_non_transient_errors(exception_type: type[Exception]) -> None:
+    """It should raise on non-transient exceptions."""
+    job_id = uuid4()
+    adapter = ArnicaAdapterScripted({job_id: [exception_type()]})
+    service = JobService(adapter)
+
+    with pytest.raises(exception_type):
+        list(service.wait_for_results("some-token", [job_id]))
+
+
+@pytest.mark.parametrize("exception_type", [NotAuthenticatedError, JobNotFoundError])
+def test_it_yields_the_final_states_of_the_batch_before_raising(exception_type: type[Exception]) -> None:
+    """It should yield the final states fetched along with a job failing with a non-transient error, then raise."""
+    before, failing, after = uuid4(), uuid4(), uuid4()
+    adapter = ArnicaAdapterScripted({before: [RRCancelled()], failing: [exception_type()], after: [RRCancelled()]})
+    service = JobService(adapter)
+
+    completed = []
+    with pytest.raises(exception_type):
+        for item in service.wait_for_results("some-token", [before, failing, after]):
+            completed.append(item)
+
+    assert completed == [(before, RRCancelled()), (after, RRCancelled())]
+
+
+def test_it_reports_non_final_states_with_job_id() -> None:
+    """It should report the non-final states of each job together with its ID."""
+    job_id = uuid4()
+    adapter = ArnicaAdapterScripted({job_id: [RRQueued(), RROngoing(finished_count=1), RRCancelled()]})
+    service = JobService(adapter)
+    clock = FakeClock()
+
+    reported: list[tuple[UUID, NonFinalJobState]] = []
+    list(
+        service.wait_for_results(
+            "some-token",
+            [job_id],
+            wait=clock.wait,
+            clock=clock,
+            report_state=lambda reported_id, state: reported.append((reported_id, state)),
+        )
+    )
+
+    assert reported == [(job_id, RRQueued()), (job_id, RROngoing(finished_count=1))]
+
+
+def test_it_polls_many_jobs_with_bounded_concurrency() -> None:
+    """It should wait on many jobs at once, yielding every one of them."""
+    job_ids = [uuid4() for _ in range(200)]
+    adapter = ArnicaAdapterScripted({job_id: [RRQueued(), RRCancelled()] for job_id in job_ids})
+    service = JobService(adapter)
+    clock = FakeClock()
+
+    completed = dict(service.wait_for_results("some-token", job_ids, wait=clock.wait, clock=clock, max_concurrency=4))
+
+    assert set(completed) == set(job_ids)
+    assert len(adapter.fetch_job_state_called_with) == 400
+
+
+def test_it_raises_timeout_error_once_the_deadline_has_passed() -> None:
+    """It should stop polling all jobs once the deadline has passed."""
+    job_ids = [uuid4(), uuid4()]
+    adapter = ArnicaAdapterScripted({job_id: [RRQueued()] for job_id in job_ids})
+    service = JobService(adapter)
+    clock = FakeClock()
+
+    with pytest.raises(TimeoutError, match="deadline has passed"):
+        list(service.wait_for_results("some-token", job_ids, wait=clock.wait, clock=clock, deadline=5.0))
+
+    assert clock.now == pytest.approx(5.0)
+
+
+def test_it_raises_wait_cancelled_error_when_cancelled() -> None:
+    """It should stop polling all jobs once the wait is cancelled, after yielding the jobs already finished."""
+    finished, queued = uuid4(), uuid4()
+    adapter = ArnicaAdapterScripted({finished: [RRCancelled()], queued: [RRQueued()]})
+    service = JobService(adapter)
+    cancel = threading.Event()
+
+    def wait_mock(duration: float) -> None:
+        cancel.set()
+
+    completed = []
+    with pytest.raises(WaitCancelledError):
+        for job_id, _ in service.wait_for_results("some-token", [finished, queued], wait=wait_mock, cancel=cancel):
+            completed.append(job_id)
+
+    assert completed == [finished]
+
+
+def test_it_paces_each_request_of_a_batch_within_the_polling_budget() -> None:
+    """It should space the requests of jobs that are due together, rather than sending the whole batch at once."""
+    job_ids = [uuid4() for _ in range(10)]
+    sent_at: list[float] = []
+
+    class ArnicaAdapterTiming(ArnicaAdapterScripted):
+        def fetch_job_state(self, token: str, job_id: UUID) -> JobState:
+            sent_at.append(time.monotonic())
+            return super().fetch_job_state(token, job_id)
+
+    requests_per_second = 50.0
+    service = JobService(
+        ArnicaAdapterTiming({job_id: [RRCancelled()] for job_id in job_ids}), PollScheduler(requests_per_second)
+    )
+
+    started = time.monotonic()
+    completed = list(service.wait_for_results("some-token", job_ids, max_concurrency=8))
+
+    assert len(completed) == len(job_ids)
+    # The nth request can't be sent before n intervals of the budget have passed, however many run concurrently
+    for nth, sent in enumerate(sorted(sent_at)):
+        assert sent - started >= nth / requests_per_second - 1e-3
+
+
+def test_it_refreshes_a_rejected_token_once_per_batch_without_restarting_the_attempts() -> None:
+    """It should refresh the token once for all jobs rejected in a batch, counting their rejected queries."""
+    job_ids = [uuid4(), uuid4()]
+
+    class ArnicaAdapterRejectingTokens(ArnicaAdapterScripted):
+        def fetch_job_state(self, token: str, job_id: UUID) -> JobState:
+            if token == "expired-token":
+                self.fetch_job_state_called_with.append((token, job_id))
+                raise NotAuthenticatedError
+            return super().fetch_job_state(token, job_id)
+
+    adapter = ArnicaAdapterRejectingTokens({job_id: [RRQueued()] for job_id in job_ids})
+    service = JobService(adapter)
+    clock = FakeClock()
+    refreshed: list[str] = []
+    events: list[WaitEvent] = []
+
+    def refresh_token(rejected: str) -> str:
+        refreshed.append(rejected)
+        return "fresh-token"
+
+    with pytest.raises(TimeoutError):
+        list(
+            service.wait_for_results(
+                "expired-token",
+                job_ids,
+                refresh_token=refresh_token,
+                wait=clock.wait,
+                clock=clock,
+                max_attempts=2,
+                max_concurrency=1,
+                events=events.append,
+            )
+        )
+
+    assert refreshed == ["expired-token"]
+    for job_id in job_ids:
+        assert [token for token, polled in adapter.fetch_job_state_called_with if polled == job_id] == [
+            "expired-token",
+            "fresh-token",
+        ]
+        assert TokenRefreshed(job_id) in events
@@ -0,0 +1,352 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+from pathlib import Path
+from uuid import UUID, uuid4
+
+import pytest
+
+from aqt_connector._domain.job_watcher import JobHandle, JobWatcher
+from aqt_connector._domain.poll_scheduler import PollScheduler
+from aqt_connector._domain.polling import FixedIntervalPolling
+from aqt_connector._domain.wait_events import (
+    JobFinished,
+    PollFinished,
+    PollStarted,
+    StateChanged,
+    TokenRefreshed,
+    WaitEvent,
+)
+from aqt_connector._infrastructure.arnica_adapter import ArnicaAdapter
+from aqt_connector._infrastructure.job_journal import JobJournal
+from aqt_connector._infrastructure.result_cache import ResultCache
+from aqt_connector.exceptions import JobNotFoundError, NotAuthenticatedError, RequestError
+from aqt_connector.models.arnica.jobs import JobStatus
+from aqt_connector.models.arnica.response_bodies.jobs import JobState, RRCancelled, RRFinished, RROngoing, RRQueued
+from tests.commit.domain.stdout_spy import StdoutSpy
+
+POLLING = FixedIntervalPolling(0.01)
+
+
+class ArnicaAdapterScripted(ArnicaAdapter):
+    """A double for the ArnicaAdapter replaying a scripted sequence of states per job, repeating the last one."""
+
+    def __init__(self, scripts: dict[UUID, list[JobState | Exception]]) -> None:
+        self.scripts = scripts
+        self.lock = threading.Lock()
+        self.fetch_job_state_called_with: list[tuple[str, UUID]] = []
+        self.rejected_tokens: set[str] = set()
+
+    def fetch_job_state(self, token: str, job_id: UUID) -> JobState:
+        with self.lock:
+            self.fetch_job_state_called_with.append((token, job_id))
+            if token in self.rejected_tokens:
+                raise NotAuthenticatedError
+            script = self.scripts[job_id]
+            outcome = script.pop(0) if len(script) > 1 else script[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def polls_of(self, job_id: UUID) -> int:
+        with self.lock:
+            return sum(1 for _, polled in self.fetch_job_state_called_with if polled == job_id)
+
+
+def script(*outcomes: JobState | Exception) -> list[JobState | Exception]:
+    return list(outcomes)
+
+
+def test_handle_resolves_to_the_final_state() -> None:
+    """It should resolve the handle with the final state once the job finishes."""
+    job_id = uuid4()
+    adapter = ArnicaAdapterScripted({job_id: [RRQueued(), RROngoing(finished_count=1), RRFinished(result={0: [[1]]})]})
+    watcher = JobWatcher(adapter)
+
+    handle = watcher.watch("some-token", job_id, polling=POLLING)
+
+    assert handle.job_id == job_id
+    assert handle.result(timeout=5.0) == RRFinished(result={0: [[1]]})
+    assert handle.state == RRFinished(result={0: [[1]]})
+    assert adapter.polls_of(job_id) == 3
+
+
+def test_handle_reports_progress() -> None:
+    """It should expose the last state fetched for the job while it is running."""
+    job_id = uuid4()
+    adapter = ArnicaAdapterScripted({job_id: [RRQueued(), RROngoing(finished_count=3)]})
+    watcher = JobWatcher(adapter)
+
+    handle = watcher.watch("some-token", job_id, polling=POLLING)
+    give_up_at = time.monotonic() + 5.0
+    while handle.finished_count is None:
+        assert time.monotonic() < give_up_at
+        time.sleep(0.01)
+
+    assert handle.finished_count == 3
+    assert handle.state == RROngoing(finished_count=3)
+    assert not handle.done()
+    watcher.close()
+
+
+def test_it_calls_done_callbacks() -> None:
+    """It should call the callbacks added to a handle once it is resolved."""
+    job_id = uuid4()
+    watcher = JobWatcher(ArnicaAdapterScripted({job_id: [RRQueued(), RRCancelled()]}))
+    done = threading.Event()
+    called_with: list[concurrent.futures.Future] = []
+
+    def callback(future: concurrent.futures.Future) -> None:
+        called_with.append(future)
+        done.set()
+
+    handle = watcher.watch("some-token", job_id, polling=POLLING)
+    handle.add_done_callback(callback)
+
+    assert done.wait(timeout=5.0)
+    assert called_with == [handle]
+
+
+def test_handles_work_with_wait_and_as_completed() -> None:
+    """It should resolve many handles that can be waited on together."""
+    scripts = {uuid4(): script(*[RRQueued()] * polls, RRFinished(result={0: [[polls % 2]]})) for polls in range(10)}
+    adapter = ArnicaAdapterScripted(scripts)
+    watcher = JobWatcher(adapter)
+
+    handles = [watcher.watch("some-token", job_id, polling=POLLING) for job_id in scripts]
+    completed = list(concurrent.futures.as_completed(handles, timeout=5.0))
+    done, not_done = concurrent.futures.wait(handles, timeout=5.0)
+
+    assert set(completed) == set(handles)
+    assert done == set(handles)
+    assert not not_done
+
+
+def test_handles_are_awaitable() -> None:
+    """It should let async code await handles."""
+    job_ids = [uuid4(), uuid4()]
+    watcher = JobWatcher(ArnicaAdapterScripted({job_id: [RRQueued(), RRCancelled()] for job_id in job_ids}))
+
+    async def main() -> list[object]:
+        return await asyncio.gather(*(watcher.watch("some-token", job_id, polling=POLLING) for job_id in job_ids))
+
+    assert asyncio.run(main()) == [RRCancelled(), RRCancelled()]
+
+
+def test_watching_a_job_twice_shares_the_poll() -> None:
+    """It should poll a job once however many handles there are for it."""
+    job_id = uuid4()
+    adapter = ArnicaAdapterScripted({job_id: script(*[RRQueued()] * 5, RRCancelled())})
+    watcher = JobWatcher(adapter)
+
+    handles = [watcher.watch("some-token", job_id, polling=POLLING) for _ in range(3)]
+
+    assert [handle.result(timeout=5.0) for handle in handles] == [RRCancelled()] * 3
+    assert adapter.polls_of(job_id) == 6
+
+
+def test_a_second_watch_of_a_job_keeps_the_settings_of_the_first() -> None:
+    """It should keep polling a job with the token and polling strategy of its first watch."""
+    job_id = uuid4()
+    adapter = ArnicaAdapterScripted({job_id: script(*[RRQueued()] * 3, RRCancelled())})
+    watcher = JobWatcher(adapter)
+
+    first = watcher.watch("first-token", job_id, polling=POLLING)
+    second = watcher.watch("second-token", job_id, polling=FixedIntervalPolling(60.0))
+
+    assert second.result(timeout=5.0) == first.result(timeout=5.0) == RRCancelled()
+    assert adapter.fetch_job_state_called_with == [("first-token", job_id)] * 4
+
+
+def test_a_failing_sink_only_fails_its_own_handle() -> None:
+    """It should fail the handle whose sink raised, and keep polling the job for the other handles."""
+    job_id = uuid4()
+    adapter = ArnicaAdapterScripted({job_id: script(RRQueued(), RROngoing(finished_count=1), RRCancelled())})
+    watcher = JobWatcher(adapter)
+    events: list[WaitEvent] = []
+
+    def failing_sink(event: WaitEvent) -> None:
+        if isinstance(event, StateChanged):
+            raise ValueError("boom")
+
+    failing = watcher.watch("some-token", job_id, polling=POLLING, events=failing_sink)
+    other = watcher.watch("some-token", job_id, polling=POLLING, events=events.append)
+
+    assert isinstance(failing.exception(timeout=5.0), ValueError)
+    assert other.result(timeout=5.0) == RRCancelled()
+    assert [event for event in events if isinstance(event, StateChanged | JobFinished)] == [
+        StateChanged(job_id, RRQueued(), None),
+        StateChanged(job_id, RROngoing(finished_count=1), JobStatus.QUEUED),
+        JobFinished(job_id, RRCancelled(), 3),
+    ]
+
+
+def test_a_failing_sink_of_the_last_handle_stops_polling() -> None:
+    """It should stop polling a job once the sinks of all its handles have failed."""
+    job_id = uuid4()
+    adapter = ArnicaAdapterScripted({job_id: [RRQueued()]})
+    watcher = JobWatcher(adapter)
+
+    def failing_sink(event: WaitEvent) -> None:
+        raise ValueError("boom")
+
+    handle = watcher.watch("some-token", job_id, polling=POLLING, events=failing_sink)
+
+    assert isinstance(handle.exception(timeout=5.0), ValueError)
+    time.sleep(0.05)
+    polls = adapter.polls_of(job_id)
+    time.sleep(0.1)
+    assert adapter.polls_of(job_id) == polls
+
+
+def test_cancelling_the_last_handle_stops_polling() -> None:
+    """It should stop polling a job once all its handles are cancelled."""
+    job_id = uuid4()
+    adapter = ArnicaAdapterScripted({job_id: [RRQueued()]})
+    watcher = JobWatcher(adapter)
+
+    handles = [watcher.watch("some-token", job_id, polling=POLLING) for _ in range(2)]
+    assert handles[0].cancel()
+    time.sleep(0.05)
+    assert adapter.polls_of(job_id) > 1
+    assert handles[1].cancel()
+    time.sleep(0.05)
+    polls = adapter.polls_of(job_id)
+    time.sleep(0.1)
+
+    assert adapter.polls_of(job_id) == polls
+    assert all(handle.cancelled() for handle in handles)
+
+
+def test_it_paces_each_request_of_a_batch_within_the_polling_budget() -> None:
+    """It should space the requests of jobs that are due together, rather than sending the whole batch at once."""
+    job_ids = [uuid4() for _ in range(10)]
+    sent_at: list[float] = []
+
+    class ArnicaAdapterTiming(ArnicaAdapterScripted):
+        def fetch_job_state(self, token: str, job_id: UUID) -> JobState:
+            with self.lock:
+                sent_at.append(time.monotonic())
+            return super().fetch_job_state(token, job_id)
+
+    requests_per_second = 50.0
+    adapter = ArnicaAdapterTiming({job_id: script(RRCancelled()) for job_id in job_ids})
+    watcher = JobWatcher(adapter, PollScheduler(requests_per_second))
+
+    started = time.monotonic()
+    handles = [watcher.watch("some-token", job_id, polling=POLLING) for job_id in job_ids]
+
+    assert [handle.result(timeout=5.0) for handle in handles] == [RRCancelled()] * len(job_ids)
+    # The nth request can't be sent before n intervals of the budget have passed, however many run concurrently
+    for nth, sent in enumerate(sorted(sent_at)):
+        assert sent - started >= nth / requests_per_second - 1e-3
+
+
+def test_it_fails_handles_on_non_transient_errors() -> None:
+    """It should resolve the handle with a non-transient error, while retrying after transient ones."""
+    job_id = uuid4()
+    stdout = StdoutSpy()
+    watcher = JobWatcher(ArnicaAdapterScripted({job_id: [RequestError("timeout"), JobNotFoundError()]}))
+
+    handle = watcher.watch("some-token", job_id, polling=POLLING, out=stdout)
+
+    assert isinstance(handle.exception(timeout=5.0), JobNotFoundError)
+    assert stdout.getvalue().startswith("Transient (RequestError) error")
+
+
+def test_it_refreshes_rejected_tokens() -> None:
+    """It should poll with a refreshed token when the current one is rejected."""
+    job_id = uuid4()
+    adapter = ArnicaAdapterScripted({job_id: [RRCancelled()]})
+    adapter.rejected_tokens.add("old-token")
+    watcher = JobWatcher(adapter)
+
+    handle = watcher.watch("old-token", job_id, refresh_token=lambda _: "new-token", polling=POLLING)
+
+    assert handle.result(timeout=5.0) == RRCancelled()
+    assert adapter.fetch_job_state_called_with == [("old-token", job_id), ("new-token", job_id)]
+
+
+@pytest.mark.parametrize("refreshed", [None, "old-token"])
+def test_it_fails_handles_if_the_token_cannot_be_refreshed(refreshed: str | None) -> None:
+    """It should fail the handle with NotAuthenticatedError if no new token is available."""
+    job_id = uuid4()
+    adapter = ArnicaAdapterScripted({job_id: [RRCancelled()]})
+    adapter.rejected_tokens.add("old-token")
+    watcher = JobWatcher(adapter)
+
+    handle = watcher.watch("old-token", job_id, refresh_token=lambda _: refreshed, polling=POLLING)
+
+    assert isinstance(handle.exception(timeout=5.0), NotAuthenticatedError)
+
+
+def test_close_cancels_pending_handles() -> None:
+    """It should cancel pending handles and refuse new watches once closed."""
+    job_id = uuid4()
+    watcher = JobWatcher(ArnicaAdapterScripted({job_id: [RRQueued()]}))
+    handle = watcher.watch("some-token", job_id, polling=POLLING)
+
+    watcher.close()
+
+    assert handle.cancelled()
+    with pytest.raises(RuntimeError):
+        watcher.watch("some-token", job_id)
+
+
+def test_the_background_thread_ends_when_no_job_is_left() -> None:
+    """It should only run the background poller while jobs are being watched."""
+    job_id = uuid4()
+    watcher = JobWatcher(ArnicaAdapterScripted({job_id: [RRCancelled()]}))
+
+    watcher.watch("some-token", job_id, polling=POLLING).result(timeout=5.0)
+    give_up_at = time.monotonic() + 5.0
+    while any(thread.name == "aqt-connector-job-watcher" for thread in threading.enumerate()):
+        assert time.monotonic() < give_up_at
+        time.sleep(0.01)
+
+    assert JobHandle(job_id).state is None
+
+
+def test_it_sends_events_of_the_wait() -> None:
+    """It should send the state changes of a job, a token refresh and its final state to the sinks of its handles."""
+    job_id = uuid4()
+    adapter = ArnicaAdapterScripted({job_id: script(RRQueued(), RRQueued(), RRCancelled())})
+    adapter.rejected_tokens.add("old-token")
+    watcher = JobWatcher(adapter)
+    events: list[WaitEvent] = []
+
+    handle = watcher.watch(
+        "old-token", job_id, refresh_token=lambda _: "new-token", polling=POLLING, events=events.append
+    )
+    handle.result(timeout=5.0)
+
+    assert [event for event in events if not isinstance(event, PollStarted | PollFinished)] == [
+        TokenRefreshed(job_id),
+        StateChanged(job_id, RRQueued(), None),
+        JobFinished(job_id, RRCancelled(), 4),
+    ]
+
+
+def test_it_resolves_handles_of_cached_jobs_right_away_and_journals_the_others(tmp_path: Path) -> None:
+    """It should resolve the handle of a cached job without polling it, and record the status of the others."""
+    journal = JobJournal(tmp_path / "journal.sqlite3")
+    cache = ResultCache(tmp_path / "cache")
+    done, running = uuid4(), uuid4()
+    cache.put(done, RRCancelled())
+    adapter = ArnicaAdapterScripted({running: [RRQueued(), RRFinished(result={})]})
+    watcher = JobWatcher(adapter, journal=journal, result_cache=cache)
+
+    done_handle = watcher.watch("token", done, polling=POLLING, out=None)
+    running_handle = watcher.watch("token", running, polling=POLLING, out=None)
+
+    assert done_handle.done()
+    assert done_handle.result() == RRCancelled()
+    assert running_handle.result(timeout=5.0) == RRFinished(result={})
+    assert adapter.polls_of(done) == 0
+    entry = journal.get(running)
+    assert entry is not None
+    assert entry.is_finished()
+    assert entry.result_location is not None
+    assert Path(entry.result_location).is_file()
+    watcher.close()
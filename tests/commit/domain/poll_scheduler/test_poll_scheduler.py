@@ -0,0 +1,112 @@
+from uuid import uuid4
+
+import pytest
+
+from aqt_connector._domain.poll_scheduler import PollScheduler
+
+
+class FakeClock:
+    """A clock that only advances when told to."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_it_keeps_desired_intervals_within_budget() -> None:
+    """It should not stretch intervals while the requested rates fit into the budget."""
+    scheduler = PollScheduler(10.0)
+    registrations = [scheduler.register(uuid4()) for _ in range(5)]
+
+    delays = [registration.next_delay(1.0) for registration in registrations]
+
+    assert delays == [1.0] * 5
+
+
+def test_it_spreads_budget_when_exhausted() -> None:
+    """It should stretch intervals so that the total rate matches the budget once it is exhausted."""
+    scheduler = PollScheduler(10.0)
+    registrations = [scheduler.register(uuid4()) for _ in range(100)]
+    for registration in registrations:
+        registration.next_delay(1.0)
+
+    delays = [registration.next_delay(1.0) for registration in registrations for _ in range(20)]
+
+    # 100 waits sharing 10 requests per second -> 10s each on average
+    assert all(2.5 <= delay <= 12.5 for delay in delays)
+    assert sum(delays) / len(delays) == pytest.approx(10.0, rel=0.15)
+    assert len(set(delays)) > 1
+
+
+def test_it_favours_higher_priority_and_sooner_completion() -> None:
+    """It should give a larger share to waits with a higher priority or a shorter desired interval."""
+    scheduler = PollScheduler(1.0)
+    background = [scheduler.register(uuid4()) for _ in range(10)]
+    urgent = scheduler.register(uuid4(), priority=10.0)
+    nearly_done = scheduler.register(uuid4())
+    for registration in background:
+        registration.next_delay(1.0)
+    urgent.next_delay(1.0)
+    nearly_done.next_delay(0.1)
+
+    background_delay = sum(background[0].next_delay(1.0) for _ in range(100)) / 100
+    urgent_delay = sum(urgent.next_delay(1.0) for _ in range(100)) / 100
+    nearly_done_delay = sum(nearly_done.next_delay(0.1) for _ in range(100)) / 100
+
+    assert urgent_delay < background_delay / 5
+    assert nearly_done_delay < background_delay / 5
+
+
+def test_it_releases_budget_when_waits_end() -> None:
+    """It should stop sharing the budget with waits that have been closed."""
+    scheduler = PollScheduler(1.0)
+    job_id = uuid4()
+    remaining = scheduler.register(job_id)
+    with scheduler.register(uuid4()) as other:
+        other.next_delay(1.0)
+        assert sum(remaining.next_delay(1.0) for _ in range(100)) / 100 > 1.5
+
+    assert remaining.next_delay(1.0) == 1.0
+    assert scheduler.active_job_ids == {job_id}
+
+
+def test_it_paces_requests_to_the_budget() -> None:
+    """It should space out simultaneous requests so that the global rate never exceeds the budget."""
+    clock = FakeClock()
+    scheduler = PollScheduler(4.0, clock=clock)
+
+    paces = [scheduler.acquire() for _ in range(5)]
+
+    assert paces == pytest.approx([0.0, 0.25, 0.5, 0.75, 1.0])
+
+
+def test_it_allows_bursts() -> None:
+    """It should allow the configured number of back-to-back requests before pacing."""
+    clock = FakeClock()
+    scheduler = PollScheduler(4.0, burst=3, clock=clock)
+
+    paces = [scheduler.acquire() for _ in range(4)]
+
+    assert paces == pytest.approx([0.0, 0.0, 0.0, 0.25])
+
+
+def test_it_does_not_pace_requests_spread_over_time() -> None:
+    """It should not delay requests that are already sent slower than the budget."""
+    clock = FakeClock()
+    scheduler = PollScheduler(4.0, clock=clock)
+
+    paces = []
+    for _ in range(3):
+        paces.append(scheduler.acquire())
+        clock.now += 1.0
+
+    assert paces == [0.0, 0.0, 0.0]
+
+
+@pytest.mark.parametrize("budget", [0.0, -1.0])
+def test_it_rejects_non_positive_budget(budget: float) -> None:
+    """It should reject a budget that isn't positive."""
+    with pytest.raises(ValueError):
+        PollScheduler(budget)
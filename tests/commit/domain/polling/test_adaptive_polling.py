@@ -0,0 +1,139 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from aqt_connector._domain.polling import AdaptivePolling, PollContext
+from aqt_connector.models.arnica.jobs import JobStatus, StatusChange
+from aqt_connector.models.arnica.response_bodies.jobs import RRCancelled, RROngoing, RRQueued
+
+NOW = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def ongoing_for(seconds: float, finished_count: int) -> RROngoing:
+    """An ongoing state that has been processing for the given duration."""
+    return RROngoing(
+        finished_count=finished_count,
+        timing_data=[
+            StatusChange(new_status=JobStatus.QUEUED, timestamp=NOW - timedelta(hours=1)),
+            StatusChange(new_status=JobStatus.ONGOING, timestamp=NOW - timedelta(seconds=seconds)),
+        ],
+    )
+
+
+def midpoint(polling: AdaptivePolling, context: PollContext, samples: int = 200) -> float:
+    """The mean of many jittered intervals."""
+    return sum(polling.next_interval(context) for _ in range(samples)) / samples
+
+
+def test_it_uses_base_interval_before_first_state() -> None:
+    """It should use the base interval while nothing is known about the job."""
+    polling = AdaptivePolling(2.0)
+
+    assert all(1.5 <= polling.next_interval(PollContext()) <= 2.5 for _ in range(100))
+
+
+def test_it_backs_off_while_job_is_queued() -> None:
+    """It should grow the interval with every poll that finds the job still queued, up to the maximum."""
+    polling = AdaptivePolling(1.0, queued_backoff=2.0, max_interval_seconds=10.0)
+    context = PollContext()
+
+    intervals = []
+    for _ in range(6):
+        context = context.after_state(RRQueued())
+        intervals.append(midpoint(polling, context))
+
+    assert intervals[0] == pytest.approx(1.0, rel=0.1)
+    assert intervals[2] == pytest.approx(4.0, rel=0.1)
+    assert intervals[-1] == pytest.approx(10.0, rel=0.1)
+
+
+def test_it_tightens_as_ongoing_job_approaches_completion() -> None:
+    """It should poll more often as the number of finished circuits approaches the number of circuits."""
+    polling = AdaptivePolling(max_interval_seconds=1000.0, now=lambda: NOW)
+    context = PollContext(number_of_circuits=10)
+
+    early = midpoint(polling, context.after_state(ongoing_for(seconds=20, finished_count=2)))
+    late = midpoint(polling, context.after_state(ongoing_for(seconds=90, finished_count=9)))
+
+    # 10s per circuit: 8 circuits remaining -> 40s, 1 circuit remaining -> 5s
+    assert early == pytest.approx(40.0, rel=0.1)
+    assert late == pytest.approx(5.0, rel=0.1)
+
+
+def test_it_estimates_the_time_remaining_of_each_job_from_its_own_context() -> None:
+    """It should take the number of circuits from the context, so that a single instance serves jobs of any size."""
+    polling = AdaptivePolling(max_interval_seconds=1000.0, now=lambda: NOW)
+    ongoing = ongoing_for(seconds=20, finished_count=2)
+
+    small = midpoint(polling, PollContext(number_of_circuits=4).after_state(ongoing))
+    large = midpoint(polling, PollContext(number_of_circuits=20).after_error().after_state(ongoing))
+
+    # 10s per circuit: 2 circuits remaining -> 10s, 18 circuits remaining -> 90s
+    assert small == pytest.approx(10.0, rel=0.1)
+    assert large == pytest.approx(90.0, rel=0.1)
+
+
+def test_it_estimates_per_circuit_time_without_number_of_circuits() -> None:
+    """It should poll at half the time per circuit when the number of circuits is unknown."""
+    polling = AdaptivePolling(now=lambda: NOW)
+
+    interval = midpoint(polling, PollContext().after_state(ongoing_for(seconds=12, finished_count=3)))
+
+    assert interval == pytest.approx(2.0, rel=0.1)
+
+
+def test_it_handles_naive_timestamps() -> None:
+    """It should compare naive status change timestamps with the current time."""
+    polling = AdaptivePolling(now=lambda: NOW)
+    state = RROngoing(
+        finished_count=1,
+        timing_data=[
+            StatusChange(new_status=JobStatus.ONGOING, timestamp=NOW.replace(tzinfo=None) - timedelta(seconds=6))
+        ],
+    )
+
+    assert midpoint(polling, PollContext().after_state(state)) == pytest.approx(3.0, rel=0.1)
+
+
+def test_it_uses_base_interval_for_ongoing_job_without_progress() -> None:
+    """It should fall back to the base interval while no circuit has finished."""
+    polling = AdaptivePolling(3.0, now=lambda: NOW)
+
+    interval = midpoint(polling, PollContext().after_state(ongoing_for(seconds=100, finished_count=0)))
+
+    assert interval == pytest.approx(3.0, rel=0.1)
+
+
+def test_it_backs_off_exponentially_on_errors() -> None:
+    """It should double the interval for each consecutive transient error."""
+    polling = AdaptivePolling(1.0, max_interval_seconds=100.0)
+    context = PollContext().after_state(RRQueued())
+
+    intervals = []
+    for _ in range(3):
+        context = context.after_error()
+        intervals.append(midpoint(polling, context))
+
+    assert intervals == pytest.approx([2.0, 4.0, 8.0], rel=0.1)
+
+
+def test_it_clamps_to_minimum_interval() -> None:
+    """It should never wait less than the minimum interval."""
+    polling = AdaptivePolling(min_interval_seconds=0.5, now=lambda: NOW)
+    context = PollContext().after_state(ongoing_for(seconds=0.01, finished_count=9))
+
+    assert all(polling.next_interval(context) >= 0.5 * 0.75 for _ in range(100))
+
+
+def test_context_counts_polls_in_same_status() -> None:
+    """The poll context should count consecutive polls returning the same status, resetting on a change."""
+    context = PollContext().after_state(RRQueued()).after_state(RRQueued()).after_error()
+
+    assert context.polls_in_state == 2
+    assert context.consecutive_errors == 1
+
+    context = context.after_state(RROngoing(finished_count=0))
+
+    assert context.polls_in_state == 1
+    assert context.consecutive_errors == 0
+    assert context.after_state(RRCancelled()).polls_in_state == 1
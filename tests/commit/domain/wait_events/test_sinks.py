@@ -0,0 +1,92 @@
+import asyncio
+import threading
+from uuid import uuid4
+
+from aqt_connector._domain.wait_events import (
+    AsyncEventStream,
+    PollStarted,
+    QueueSink,
+    TextSink,
+    TokenRefreshed,
+    TransientErrorEncountered,
+    WaitEvent,
+    combine_sinks,
+)
+from aqt_connector.exceptions import RequestError
+from tests.commit.domain.stdout_spy import StdoutSpy
+
+
+def test_text_sink_only_writes_transient_errors() -> None:
+    """It should write transient errors in the text format of the waits, ignoring other events."""
+    job_id = uuid4()
+    stdout = StdoutSpy()
+    sink = TextSink(stdout)
+
+    sink(PollStarted(job_id, 1))
+    sink(TransientErrorEncountered(job_id, RequestError("timed out")))
+
+    assert stdout.getvalue() == "Transient (RequestError) error encountered while fetching job state: timed out.\n"
+
+
+def test_text_sink_can_name_the_job() -> None:
+    """It should name the job in the output if asked to."""
+    job_id = uuid4()
+    stdout = StdoutSpy()
+
+    TextSink(stdout, include_job_id=True)(TransientErrorEncountered(job_id, RequestError("timed out")))
+
+    assert stdout.getvalue() == (
+        f"Transient (RequestError) error encountered while fetching state of job {job_id}: timed out.\n"
+    )
+
+
+def test_text_sinks_writing_to_the_same_stream_are_equal() -> None:
+    """It should consider text sinks equal if they write the same way to the same stream."""
+    stdout = StdoutSpy()
+
+    assert TextSink(stdout) == TextSink(stdout)
+    assert len({TextSink(stdout), TextSink(stdout)}) == 1
+    assert TextSink(stdout) != TextSink(StdoutSpy())
+    assert TextSink(stdout) != TextSink(stdout, include_job_id=True)
+
+
+def test_queue_sink_puts_events_on_its_queue() -> None:
+    """It should put the events it receives on its queue."""
+    sink = QueueSink()
+    event = TokenRefreshed(uuid4())
+
+    sink(event)
+
+    assert sink.queue.get_nowait() == event
+
+
+def test_async_event_stream_receives_events_from_other_threads() -> None:
+    """It should let async code iterate over events sent from other threads, until it is closed."""
+    job_id = uuid4()
+
+    async def main() -> list[WaitEvent]:
+        stream = AsyncEventStream()
+
+        def send() -> None:
+            for attempt in range(1, 4):
+                stream(PollStarted(job_id, attempt))
+            stream.close()
+
+        threading.Thread(target=send).start()
+        return [event async for event in stream]
+
+    assert asyncio.run(main()) == [PollStarted(job_id, attempt) for attempt in range(1, 4)]
+
+
+def test_combine_sinks_sends_every_event_to_every_sink() -> None:
+    """It should combine the given sinks, ignoring missing ones."""
+    first: list[WaitEvent] = []
+    second: list[WaitEvent] = []
+    event = TokenRefreshed(uuid4())
+
+    combined = combine_sinks(first.append, None, second.append)
+    assert combined is not None
+    combined(event)
+
+    assert first == second == [event]
+    assert combine_sinks(None, None) is None
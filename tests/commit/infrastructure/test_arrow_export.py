@@ -0,0 +1,104 @@
+from datetime import datetime, timezone
+from pathlib import Path
+from uuid import uuid4
+
+import numpy as np
+import pyarrow.parquet as pq  # type: ignore[import-untyped]
+import pytest
+
+from aqt_connector._domain.wait_events import JobFinished
+from aqt_connector._infrastructure.arrow_export import (
+    ParquetResultWriter,
+    result_record_batch,
+    result_record_batches,
+)
+from aqt_connector.models.arnica.jobs import BasicJobMetadata, JobStatus, StatusChange
+from aqt_connector.models.arnica.response_bodies.jobs import RRCancelled, RRError, RRFinished, RROngoing
+
+
+def test_it_exports_a_row_per_circuit_of_finished_jobs() -> None:
+    """It should export the metadata of a finished job with each of its circuits, encoding shots as outcomes."""
+    metadata = BasicJobMetadata(job_id=uuid4(), label="sweep", resource_id="resource", workspace_id="workspace")
+    queued_at = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    state = RRFinished(
+        result={0: [[1, 0], [1, 1]], 1: [[0, 0, 1]]},
+        timing_data=[StatusChange(new_status=JobStatus.QUEUED, timestamp=queued_at)],
+    )
+
+    rows = result_record_batch([(metadata, state)]).to_pylist()
+
+    assert [row["circuit"] for row in rows] == [0, 1]
+    assert rows[0]["outcomes"] == [1, 3]
+    assert rows[1]["outcomes"] == [4]
+    assert (rows[1]["shot_count"], rows[1]["qubit_count"]) == (1, 3)
+    assert rows[0]["job_id"] == str(metadata.job_id)
+    assert (rows[0]["label"], rows[0]["resource_id"], rows[0]["workspace_id"]) == ("sweep", "resource", "workspace")
+    assert rows[0]["status"] == "finished"
+    assert rows[0]["timing_data"] == [{"new_status": "queued", "timestamp": queued_at}]
+
+
+def test_it_exports_a_single_row_for_other_states() -> None:
+    """It should export the state of a job without results, leaving the unknown metadata and the circuit empty."""
+    ongoing, failed, cancelled = uuid4(), uuid4(), uuid4()
+
+    rows = result_record_batch(
+        [(ongoing, RROngoing(finished_count=3)), (failed, RRError(message="boom")), (cancelled, RRCancelled())]
+    ).to_pylist()
+
+    assert [(row["job_id"], row["status"]) for row in rows] == [
+        (str(ongoing), "ongoing"),
+        (str(failed), "error"),
+        (str(cancelled), "cancelled"),
+    ]
+    assert rows[0]["finished_count"] == 3
+    assert rows[1]["message"] == "boom"
+    assert all(row["resource_id"] is None and row["circuit"] is None for row in rows)
+    assert all(row["outcomes"] is None for row in rows)
+
+
+def test_it_exports_packed_shots() -> None:
+    """It should pack the shots of each circuit to one bit per qubit, the first qubit being the least significant."""
+    shots = [[1, 0, 0, 0, 0, 0, 0, 0, 1], [0, 1, 1, 0, 0, 0, 0, 0, 0]]
+
+    (row,) = result_record_batch([(uuid4(), RRFinished(result={0: shots}))], shot_encoding="packed").to_pylist()
+
+    assert row["packed"] == bytes([0b1, 0b1, 0b110, 0b0])
+    unpacked = np.unpackbits(
+        np.frombuffer(row["packed"], dtype=np.uint8).reshape(row["shot_count"], -1),
+        axis=1,
+        count=row["qubit_count"],
+        bitorder="little",
+    )
+    np.testing.assert_array_equal(unpacked, shots)
+
+
+def test_it_rejects_outcomes_of_too_many_qubits() -> None:
+    """It should only encode the shots of up to 64 qubits as integers."""
+    with pytest.raises(ValueError):
+        result_record_batch([(uuid4(), RRFinished(result={0: [[0] * 65]}))])
+
+
+def test_it_streams_record_batches() -> None:
+    """It should convert the jobs in batches as they come."""
+    results = ((uuid4(), RRFinished(result={0: [[1]]})) for _ in range(5))
+
+    batches = list(result_record_batches(results, jobs_per_batch=2))
+
+    assert [batch.num_rows for batch in batches] == [2, 2, 1]
+
+
+def test_it_writes_a_parquet_file_one_row_group_per_batch(tmp_path: Path) -> None:
+    """It should write the jobs to a Parquet file in row groups, including those given as wait events."""
+    path = tmp_path / "results.parquet"
+    job_ids = [uuid4() for _ in range(3)]
+
+    with ParquetResultWriter(path, jobs_per_row_group=2) as writer:
+        writer.write_all([(job_ids[0], RRFinished(result={0: [[0, 1]], 1: [[1, 1]]})), (job_ids[1], RRCancelled())])
+        writer(JobFinished(job_id=job_ids[2], state=RRFinished(result={0: [[1, 0]]}), attempts=1))
+
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == 2
+    assert writer.jobs_written == 3
+    table = parquet.read()
+    assert table.column("job_id").to_pylist() == [str(job_ids[0]), str(job_ids[0]), str(job_ids[1]), str(job_ids[2])]
+    assert table.column("outcomes").to_pylist() == [[2], [3], None, [1]]
@@ -0,0 +1,107 @@
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from uuid import uuid4
+
+from aqt_connector._infrastructure.job_journal import JobJournal
+from aqt_connector.models.arnica.jobs import JobStatus
+from aqt_connector.models.arnica.response_bodies.jobs import RRCancelled, RRFinished, RROngoing, RRQueued
+
+
+def test_it_creates_the_database_in_the_app_dir(tmp_path: Path) -> None:
+    """It should create the database file, including missing parent directories."""
+    path = tmp_path / "app" / "journal.sqlite3"
+
+    JobJournal(path).close()
+
+    assert path.is_file()
+
+
+def test_it_tracks_job_metadata(tmp_path: Path) -> None:
+    """It should record the details of a tracked job, keeping known details when tracked again."""
+    journal = JobJournal(tmp_path / "journal.sqlite3")
+    job_id = uuid4()
+
+    journal.track(job_id, label="sweep", workspace_id="ws", resource_id="sim")
+    journal.track(job_id, label="renamed")
+
+    entry = journal.get(job_id)
+    assert entry is not None
+    assert (entry.label, entry.workspace_id, entry.resource_id) == ("renamed", "ws", "sim")
+    assert entry.status is None
+    assert not entry.is_finished()
+
+
+def test_it_returns_none_for_unknown_jobs(tmp_path: Path) -> None:
+    """It should return None when looking up a job it doesn't know."""
+    journal = JobJournal(tmp_path / "journal.sqlite3")
+
+    assert journal.get(uuid4()) is None
+
+
+def test_it_records_statuses_without_results(tmp_path: Path) -> None:
+    """It should record the status of the last known state of a job, but not its results."""
+    path = tmp_path / "journal.sqlite3"
+    journal = JobJournal(path)
+    job_id = uuid4()
+
+    journal.record_state(job_id, RROngoing(finished_count=1))
+    ongoing = journal.get(job_id)
+    journal.record_state(job_id, RRFinished(result={0: [[0, 1], [1, 0]] * 1000}))
+    finished = journal.get(job_id)
+    journal.close()
+
+    assert ongoing is not None and ongoing.status == JobStatus.ONGOING
+    assert finished is not None and finished.is_finished()
+    with closing(sqlite3.connect(path)) as connection:
+        columns = {row[1] for row in connection.execute("PRAGMA table_info(jobs)")}
+        assert "state" not in columns
+        assert all(len(str(value)) < 100 for row in connection.execute("SELECT * FROM jobs") for value in row)
+
+
+def test_it_lists_entries_by_status_and_label(tmp_path: Path) -> None:
+    """It should filter the listed entries by last known status and by label."""
+    journal = JobJournal(tmp_path / "journal.sqlite3")
+    queued, ongoing, cancelled = uuid4(), uuid4(), uuid4()
+    journal.track(queued, label="a")
+    journal.track(ongoing, label="b")
+    journal.track(cancelled, label="a")
+    journal.record_state(queued, RRQueued())
+    journal.record_state(ongoing, RROngoing(finished_count=0))
+    journal.record_state(cancelled, RRCancelled())
+
+    assert [entry.job_id for entry in journal.entries(status=JobStatus.QUEUED)] == [queued]
+    assert {entry.job_id for entry in journal.entries(label="a")} == {queued, cancelled}
+    assert journal.entries(status=[JobStatus.ONGOING, JobStatus.CANCELLED], label="a")[0].job_id == cancelled
+    assert len(journal.entries()) == 3
+
+
+def test_it_lists_unfinished_jobs(tmp_path: Path) -> None:
+    """It should list the jobs not known to be finished, including those never fetched."""
+    journal = JobJournal(tmp_path / "journal.sqlite3")
+    never_fetched, ongoing, finished = uuid4(), uuid4(), uuid4()
+    journal.track(never_fetched, label="x")
+    journal.record_state(ongoing, RROngoing(finished_count=0))
+    journal.record_state(finished, RRFinished(result={}))
+
+    assert {entry.job_id for entry in journal.unfinished()} == {never_fetched, ongoing}
+    assert [entry.job_id for entry in journal.unfinished(label="x")] == [never_fetched]
+
+
+def test_it_persists_across_instances(tmp_path: Path) -> None:
+    """It should keep the recorded jobs when reopened, e.g. after a restart."""
+    path = tmp_path / "journal.sqlite3"
+    job_id = uuid4()
+    journal = JobJournal(path)
+    journal.track(job_id, label="survivor")
+    journal.record_state(job_id, RRFinished(result={0: [[1]]}))
+    journal.record_result_location(job_id, "/results/survivor.json")
+    journal.close()
+
+    reopened = JobJournal(path)
+
+    entry = reopened.get(job_id)
+    assert entry is not None
+    assert entry.label == "survivor"
+    assert entry.result_location == "/results/survivor.json"
+    assert entry.is_finished()
@@ -0,0 +1,103 @@
+import os
+from pathlib import Path
+from uuid import uuid4
+
+import numpy as np
+
+from aqt_connector._infrastructure.result_cache import ResultCache
+from aqt_connector.models.arnica.response_bodies.jobs import RRCancelled, RRError, RRFinished
+
+
+def test_it_returns_cached_states_from_memory(tmp_path: Path) -> None:
+    """It should return the very state it was given while it is in memory."""
+    cache = ResultCache(tmp_path)
+    job_id = uuid4()
+    state = RRFinished(result={0: [[0, 1]]})
+
+    cache.put(job_id, state)
+
+    assert cache.get(job_id) is state
+    assert cache.get(uuid4()) is None
+
+
+def test_it_persists_compressed_states_across_instances(tmp_path: Path) -> None:
+    """It should find the states cached by another instance on disk, e.g. before a restart."""
+    finished, failed = uuid4(), uuid4()
+    ResultCache(tmp_path).put(finished, RRFinished(result={0: [[1, 1]] * 100}))
+    ResultCache(tmp_path).put(failed, RRError(message="boom"))
+
+    reopened = ResultCache(tmp_path)
+
+    assert reopened.get(finished) == RRFinished(result={0: [[1, 1]] * 100})
+    assert reopened.get(failed) == RRError(message="boom")
+    assert (tmp_path / f"{finished}.json.gz").stat().st_size < len(
+        RRFinished(result={0: [[1, 1]] * 100}).model_dump_json()
+    )
+
+
+def test_it_evicts_the_least_recently_used_states_from_memory(tmp_path: Path) -> None:
+    """It should keep the memory tier within its budget, evicting the least recently used states first."""
+    size = len(RRCancelled().model_dump_json())
+    cache = ResultCache(tmp_path, memory_bytes=2 * size, disk_bytes=0)
+    first, second, third = uuid4(), uuid4(), uuid4()
+    cache.put(first, RRCancelled())
+    cache.put(second, RRCancelled())
+    cache.get(first)
+
+    cache.put(third, RRCancelled())
+
+    assert cache.get(first) is not None
+    assert cache.get(second) is None
+    assert cache.get(third) is not None
+
+
+def test_it_evicts_the_least_recently_used_files_from_disk(tmp_path: Path) -> None:
+    """It should keep the disk tier within its budget, evicting the least recently used files first."""
+    old, recent = uuid4(), uuid4()
+    cache = ResultCache(tmp_path, memory_bytes=0)
+    cache.put(old, RRFinished(result={0: [[0]]}))
+    os.utime(tmp_path / f"{old}.json.gz", (0, 0))
+    file_size = (tmp_path / f"{old}.json.gz").stat().st_size
+    cache.disk_bytes = file_size + file_size // 2
+
+    cache.put(recent, RRFinished(result={0: [[1]]}))
+
+    assert cache.get(old) is None
+    assert cache.get(recent) == RRFinished(result={0: [[1]]})
+
+
+def test_it_drops_corrupted_files(tmp_path: Path) -> None:
+    """It should treat a corrupted file as a miss and remove it."""
+    job_id = uuid4()
+    (tmp_path / f"{job_id}.json.gz").write_bytes(b"not gzip")
+
+    assert ResultCache(tmp_path).get(job_id) is None
+    assert not (tmp_path / f"{job_id}.json.gz").exists()
+
+
+def test_it_discards_states_from_both_tiers(tmp_path: Path) -> None:
+    """It should forget a discarded state, in memory and on disk."""
+    cache = ResultCache(tmp_path)
+    job_id = uuid4()
+    cache.put(job_id, RRCancelled())
+
+    cache.discard(job_id)
+
+    assert cache.get(job_id) is None
+    assert ResultCache(tmp_path).get(job_id) is None
+
+
+def test_it_caches_lazy_states_without_decoding_them(tmp_path: Path) -> None:
+    """It should write the raw result of a lazy state, or the arrays of a streamed one, without decoding them."""
+    fetched, streamed = RRFinished(result={}), RRFinished(result={})
+    fetched.attach_raw_result(b'{"0": [[0, 1], [1, 1]]}', lazy=True)
+    streamed.attach_result_arrays({0: np.array([[0, 1], [1, 1]], dtype=np.uint8)})
+    fetched_id, streamed_id = uuid4(), uuid4()
+
+    ResultCache(tmp_path).put(fetched_id, fetched)
+    ResultCache(tmp_path).put(streamed_id, streamed)
+
+    assert fetched.is_lazy() and streamed.is_lazy()
+    reopened = ResultCache(tmp_path)
+    assert reopened.get(fetched_id) == RRFinished(result={0: [[0, 1], [1, 1]]})
+    assert reopened.get(streamed_id) == RRFinished(result={0: [[0, 1], [1, 1]]})
@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+from aqt_connector._infrastructure.result_payload import ResultStartScanner, find_result_span
+
+
+def test_it_finds_the_result_of_a_finished_job() -> None:
+    """It should find the result object of the response, skipping keys and values of the same name elsewhere."""
+    body = (
+        b'{"job": {"label": "\\"result\\":", "result": {"0": [[1]]}}, '
+        b'"response": {"status": "finished", "timing_data": [{"result": "x"}], "result": {"0": [[0, 1]], "1": []}}}'
+    )
+
+    span = find_result_span(body)
+
+    assert span is not None
+    assert json.loads(body[span[0] : span[1]]) == {"0": [[0, 1]], "1": []}
+
+
+def test_it_finds_no_result_for_unfinished_jobs() -> None:
+    """It should return None when the response has no result."""
+    assert find_result_span(b'{"job": {"result": {}}, "response": {"status": "queued"}}') is None
+    assert find_result_span(b'{"response": {"status": "finished", "result": null}}') is None
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"job": {"label": "\\"a{b\\": ["}, "response": {"status": "finished", "result" :  {"0": [[1]]}}}',
+        b'{"response": {"status": "finished", "result": null}}',
+    ],
+)
+def test_it_scans_a_body_received_in_parts_like_a_whole_one(body: bytes) -> None:
+    """It should find the same result start however the body is split, including within strings and whitespace."""
+    expected = find_result_span(body)
+
+    for split in range(1, len(body)):
+        scanner = ResultStartScanner()
+        first = scanner.scan(body[:split])
+        start = first if first is not None else scanner.scan(body)
+        assert start == (expected[0] if expected else None)
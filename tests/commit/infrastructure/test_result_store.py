@@ -0,0 +1,95 @@
+import pickle
+from pathlib import Path
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from aqt_connector._domain.wait_events import JobFinished
+from aqt_connector._infrastructure.result_store import ResultStore
+from aqt_connector.models.arnica.response_bodies.jobs import RRCancelled, RRFinished
+
+
+def test_it_reads_back_the_stored_shots_as_memory_mapped_arrays(tmp_path: Path) -> None:
+    """It should return the shots of each stored circuit as read-only views of the data file, across instances."""
+    job_id = uuid4()
+    ResultStore(tmp_path).append(job_id, RRFinished(result={0: [[0, 1], [1, 1]], 1: [[1, 0, 1]], 2: []}))
+
+    store = ResultStore(tmp_path)
+
+    assert store.job_ids() == [job_id]
+    assert store.circuits(job_id) == [0, 1, 2]
+    arrays = store.result_arrays(job_id)
+    np.testing.assert_array_equal(arrays[0], [[0, 1], [1, 1]])
+    np.testing.assert_array_equal(arrays[1], [[1, 0, 1]])
+    assert arrays[2].shape == (0, 0)
+    assert isinstance(arrays[0], np.memmap)
+    assert not arrays[0].flags.writeable
+
+
+def test_it_only_stores_each_job_once(tmp_path: Path) -> None:
+    """It should ignore the results of a job that is already stored, as they never change."""
+    store = ResultStore(tmp_path)
+    job_id = uuid4()
+
+    assert store.append(job_id, RRFinished(result={0: [[1]]})) is True
+    assert store.append(job_id, RRFinished(result={0: [[0]]})) is False
+
+    assert len(store) == 1
+    np.testing.assert_array_equal(store.result_array(job_id, 0), [[1]])
+
+
+def test_readers_see_jobs_appended_by_a_writer(tmp_path: Path) -> None:
+    """It should find the jobs appended by another instance since it was last read, e.g. in another process."""
+    writer, reader = ResultStore(tmp_path), ResultStore(tmp_path)
+    first, second = uuid4(), uuid4()
+    writer.append(first, RRFinished(result={0: [[1, 1]]}))
+    assert reader.job_ids() == [first]
+    reader.result_array(first, 0)
+
+    writer.append(second, RRFinished(result={0: [[0, 1]] * 1000}))
+
+    assert list(reader) == [first, second]
+    assert second in reader
+    np.testing.assert_array_equal(reader.result_array(second, 0), [[0, 1]] * 1000)
+
+
+def test_it_ignores_an_interrupted_write(tmp_path: Path) -> None:
+    """It should ignore an incomplete index record, and overwrite it with the next one."""
+    store = ResultStore(tmp_path)
+    first, second = uuid4(), uuid4()
+    store.append(first, RRFinished(result={0: [[1]]}))
+    with open(tmp_path / "index.bin", "ab") as index:
+        index.write(b"\x01" * 10)
+
+    assert ResultStore(tmp_path).job_ids() == [first]
+    ResultStore(tmp_path).append(second, RRFinished(result={0: [[0]]}))
+    assert ResultStore(tmp_path).job_ids() == [first, second]
+
+
+def test_it_rejects_arrays_that_are_not_shots(tmp_path: Path) -> None:
+    """It should only store two-dimensional arrays of shots."""
+    with pytest.raises(ValueError):
+        ResultStore(tmp_path).append_arrays(uuid4(), {0: np.zeros(3, dtype=np.uint8)})
+
+
+def test_it_stores_the_jobs_that_finish_during_a_wait(tmp_path: Path) -> None:
+    """It should store the results of the jobs that finished successfully when used as an event sink."""
+    store = ResultStore(tmp_path)
+    finished, cancelled = uuid4(), uuid4()
+
+    store(JobFinished(job_id=finished, state=RRFinished(result={0: [[1]]}), attempts=1))
+    store(JobFinished(job_id=cancelled, state=RRCancelled(), attempts=1))
+
+    assert store.job_ids() == [finished]
+
+
+def test_it_pickles_as_its_directory(tmp_path: Path) -> None:
+    """It should be usable in the workers of a process pool."""
+    store = ResultStore(tmp_path)
+    job_id = uuid4()
+    store.append(job_id, RRFinished(result={0: [[1, 0]]}))
+
+    copy = pickle.loads(pickle.dumps(store))
+
+    np.testing.assert_array_equal(copy.result_array(job_id, 0), [[1, 0]])
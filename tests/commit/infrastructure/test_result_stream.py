@@ -0,0 +1,67 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from aqt_connector._infrastructure.result_stream import NpyDirectorySink, ResultStreamParser
+
+BODY = (
+    b'{"job": {"job_id": "00000000-0000-0000-0000-000000000001", "label": "result: {"}, '
+    b'"response": {"status": "finished", "result": {"0": [[0, 1], [1, 1]],\n "1": [], "2": [[1, 0]]}, '
+    b'"timing_data": null}}'
+)
+
+
+def parse(body: bytes, chunk_size: int, parser: ResultStreamParser | None = None) -> tuple[ResultStreamParser, bytes]:
+    parser = parser or ResultStreamParser()
+    for start in range(0, len(body), chunk_size):
+        parser.feed(body[start : start + chunk_size])
+    return parser, parser.close()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 16, len(BODY)])
+def test_it_decodes_each_circuit_whatever_the_chunks(chunk_size: int) -> None:
+    """It should decode the shots of each circuit and keep the rest of the body, however it is split."""
+    parser, rest = parse(BODY, chunk_size)
+
+    assert {circuit: shots.tolist() for circuit, shots in parser.arrays.items()} == {
+        0: [[0, 1], [1, 1]],
+        1: [],
+        2: [[1, 0]],
+    }
+    assert json.loads(rest)["response"] == {"status": "finished", "result": {}, "timing_data": None}
+    assert json.loads(rest)["job"]["label"] == "result: {"
+
+
+def test_it_keeps_bodies_without_result() -> None:
+    """It should return the whole body of a job that has not finished."""
+    body = b'{"job": {}, "response": {"status": "ongoing", "finished_count": 1}}'
+
+    parser, rest = parse(body, 7)
+
+    assert rest == body
+    assert parser.arrays == {}
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"response": {"status": "finished", "result": {"0": [[0, 1]]',
+        b'{"response": {"status": "finished", "result": {"0": [[0, 2]]}}}',
+        b'{"response": {"status": "finished", "result": {"zero": [[0, 1]]}}}',
+    ],
+)
+def test_it_rejects_incomplete_or_invalid_results(body: bytes) -> None:
+    """It should raise a ValueError for results that are incomplete or not made of arrays of bits."""
+    with pytest.raises(ValueError):
+        parse(body, 8)
+
+
+def test_it_writes_circuits_to_a_directory_sink(tmp_path: Path) -> None:
+    """It should hand each circuit to the sink, keeping the arrays it returns."""
+    parser, _ = parse(BODY, 16, ResultStreamParser(NpyDirectorySink(tmp_path / "shots")))
+
+    assert isinstance(parser.arrays[0], np.memmap)
+    assert np.load(tmp_path / "shots" / "2.npy").tolist() == [[1, 0]]
+    assert parser.arrays[0].tolist() == [[0, 1], [1, 1]]
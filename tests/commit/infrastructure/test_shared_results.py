@@ -0,0 +1,122 @@
+import multiprocessing
+import os
+import pickle
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from types import SimpleNamespace
+
+import pytest
+
+from aqt_connector._infrastructure import shared_results as shared_results_module
+from aqt_connector._infrastructure.shared_results import SharedResult, SharedResults
+from aqt_connector.models.arnica.response_bodies import result_analysis
+from aqt_connector.models.arnica.response_bodies.jobs import RRFinished
+
+
+def count_outcomes(shared: SharedResult) -> dict[int, dict[int, int]]:
+    """Counts the outcomes of shared results, in a worker process."""
+    with shared.attach() as state:
+        return result_analysis.job_counts(state)
+
+
+def test_it_views_the_shared_results_without_copying_them() -> None:
+    """It should attach to the shared results as read-only views of the shared memory."""
+    state = RRFinished(result={0: [[1, 0], [1, 1]], 3: [[0, 1, 1]], 1: []})
+
+    with SharedResults() as shared_results:
+        shared = shared_results.share(state)
+        with shared.attach() as attached:
+            assert attached == state
+            assert attached.circuits() == [0, 3, 1]
+            assert not attached.result_array(0).flags.writeable
+            assert not attached.result_array(0).flags.owndata
+        assert attached.circuits() == []
+
+    assert len(pickle.dumps(shared)) < 200
+
+
+@pytest.mark.parametrize(
+    "start_method",
+    [pytest.param("fork", marks=pytest.mark.skipif(not hasattr(os, "fork"), reason="fork is not available")), "spawn"],
+)
+def test_it_hands_results_off_to_a_process_pool(start_method: str) -> None:
+    """It should let the workers of a process pool analyse the shared results."""
+    states = [RRFinished(result={0: [[job % 2, 1]] * 10}) for job in range(4)]
+
+    with (
+        SharedResults() as shared_results,
+        ProcessPoolExecutor(2, mp_context=multiprocessing.get_context(start_method)) as pool,
+    ):
+        counts = list(pool.map(count_outcomes, [shared_results.share(state) for state in states]))
+
+    assert counts == [result_analysis.job_counts(state) for state in states]
+
+
+def test_it_keeps_the_shared_memory_when_an_unrelated_process_detaches() -> None:
+    """It should keep the shared results when a process not started by the owner attaches to them and exits."""
+    state = RRFinished(result={0: [[1, 0], [1, 1]]})
+    attach = (
+        "import pickle, sys\n"
+        "from aqt_connector._infrastructure.shared_results import SharedResult\n"
+        "with pickle.loads(sys.stdin.buffer.read()).attach() as state:\n"
+        "    assert state.result == {0: [[1, 0], [1, 1]]}\n"
+    )
+
+    with SharedResults() as shared_results:
+        shared = shared_results.share(state)
+        completed = subprocess.run(
+            [sys.executable, "-c", attach], input=pickle.dumps(shared), capture_output=True, check=False
+        )
+
+        assert completed.returncode == 0, completed.stderr.decode()
+        assert b"leaked shared_memory" not in completed.stderr
+        with shared.attach() as attached:
+            assert attached == state
+
+
+def test_it_leaves_the_resource_tracker_alone_where_shared_memory_is_not_tracked(monkeypatch) -> None:
+    """It should not use the resource tracker, which can't be started on Windows, where shared memory isn't tracked."""
+
+    def start_tracker(*args: object) -> None:
+        raise ModuleNotFoundError("No module named '_posixsubprocess'")
+
+    monkeypatch.setattr(shared_results_module, "_TRACKED", False)
+    # Only replaced for the imports of the shared results, shared memory keeps the resource tracker it imported
+    monkeypatch.setattr(
+        multiprocessing, "resource_tracker", SimpleNamespace(register=start_tracker, unregister=start_tracker)
+    )
+    state = RRFinished(result={0: [[1, 0]]})
+
+    with SharedResults() as shared_results:
+        shared = shared_results.share(state)
+        with shared.attach() as attached:
+            assert attached == state
+        shared_results.release(shared)
+
+
+def test_it_removes_the_shared_memory_when_released_or_closed() -> None:
+    """It should remove the shared memory of results once released, or once the owner is closed."""
+    shared_results = SharedResults()
+    released = shared_results.share(RRFinished(result={0: [[1]]}))
+    kept = shared_results.share(RRFinished(result={0: [[0]]}))
+
+    shared_results.release(released)
+    assert len(shared_results) == 1
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(released.name)
+
+    shared_results.close()
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(kept.name)
+    with pytest.raises(RuntimeError):
+        shared_results.share(RRFinished(result={0: [[0]]}))
+
+
+def test_it_removes_the_shared_memory_once_garbage_collected() -> None:
+    """It should remove the shared memory of results when the owner is no longer referenced."""
+    shared = SharedResults().share(RRFinished(result={0: [[1]]}))
+
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(shared.name)
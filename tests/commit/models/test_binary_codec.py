@@ -0,0 +1,97 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from aqt_connector.models.arnica.jobs import BasicJobMetadata, JobStatus, StatusChange
+from aqt_connector.models.arnica.response_bodies.jobs import (
+    JobState,
+    ResultResponse,
+    RRCancelled,
+    RRError,
+    RRFinished,
+    RROngoing,
+    RRQueued,
+)
+from aqt_connector.models.binary_codec import decode, encode
+from aqt_connector.models.circuits import QuantumCircuit
+
+TIMING_DATA = [StatusChange(new_status=JobStatus.QUEUED, timestamp=datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc))]
+
+
+@pytest.mark.parametrize(
+    "state",
+    [
+        RRQueued(timing_data=TIMING_DATA),
+        RROngoing(finished_count=2),
+        RRFinished(result={0: [[1, 0], [1, 1]], 1: [[1] * 9, [0] * 9], 2: []}, timing_data=TIMING_DATA),
+        RRError(message="boom"),
+        RRCancelled(),
+    ],
+)
+def test_it_round_trips_job_states(state: JobState) -> None:
+    """It should decode every job state to an equal state, of the same type."""
+    decoded: JobState = decode(encode(state), JobState)  # type: ignore[arg-type]
+
+    assert type(decoded) is type(state)
+    assert decoded == state
+
+
+def test_it_round_trips_result_responses_with_their_shots_as_arrays() -> None:
+    """It should decode the shots of a finished job to arrays, converting them to lists only when accessed."""
+    metadata = BasicJobMetadata(job_id=uuid4(), label="label", resource_id="resource", workspace_id="workspace")
+    response = ResultResponse(job=metadata, response=RRFinished(result={3: [[0, 1, 1]], 0: [[1]]}))
+
+    decoded = decode(encode(response), ResultResponse)
+
+    assert isinstance(decoded.response, RRFinished)
+    assert decoded.response.is_lazy()
+    assert decoded.response.circuits() == [3, 0]
+    np.testing.assert_array_equal(decoded.response.result_array(3), [[0, 1, 1]])
+    assert decoded == response
+
+
+def test_it_round_trips_circuits() -> None:
+    """It should decode a circuit to an equal circuit."""
+    circuit = QuantumCircuit.model_validate(
+        {
+            "repetitions": 10,
+            "number_of_qubits": 2,
+            "quantum_circuit": [
+                {"operation": "RZ", "qubit": 0, "phi": 0.5},
+                {"operation": "R", "qubit": 1, "phi": 0.25, "theta": 0.5},
+                {"operation": "RXX", "qubits": [0, 1], "theta": 0.25},
+                {"operation": "MEASURE"},
+            ],
+        }
+    )
+
+    assert decode(encode(circuit), QuantumCircuit) == circuit
+
+
+def test_it_encodes_lazy_results_without_decoding_them() -> None:
+    """It should encode the shots of a lazy result from its raw JSON, without converting them to lists."""
+    state = RRFinished(result={})
+    state.attach_raw_result(b'{"0": [[1, 0], [0, 1]]}', lazy=True)
+
+    decoded = decode(encode(state), RRFinished)
+
+    assert state.is_lazy()
+    assert decoded.result == {0: [[1, 0], [0, 1]]}
+
+
+def test_it_is_smaller_than_json_for_results() -> None:
+    """It should bit-pack the shots."""
+    state = RRFinished(result={0: [[1, 0, 1, 1] * 4] * 100})
+
+    assert len(encode(state)) * 10 < len(state.model_dump_json())
+
+
+def test_it_validates_decoded_models() -> None:
+    """It should reject data that is not an encoded model of the given type."""
+    with pytest.raises(ValueError):
+        decode(b"\xc1", RRCancelled)
+    with pytest.raises(ValidationError):
+        decode(encode(RRCancelled()), RRError)
@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from aqt_connector.models.circuit_builder import CircuitBuilder
+from aqt_connector.models.circuits import Circuit, QuantumCircuit
+from aqt_connector.models.operations import GateR, GateRXX, GateRZ, Measure, OperationModel
+
+
+def test_it_writes_the_json_of_the_equivalent_model() -> None:
+    builder = CircuitBuilder().r(0, phi=0.5, theta=1.0).rz(2, phi=-3.7).rxx(1, 0, theta=0.25).rz(1, phi=1e-7)
+    model = QuantumCircuit(
+        repetitions=100,
+        number_of_qubits=3,
+        quantum_circuit=Circuit(
+            root=[
+                OperationModel(root=GateR(qubit=0, phi=0.5, theta=1.0)),
+                OperationModel(root=GateRZ(qubit=2, phi=-3.7)),
+                OperationModel(root=GateRXX(qubits=[1, 0], theta=0.25)),
+                OperationModel(root=GateRZ(qubit=1, phi=1e-7)),
+                OperationModel(root=Measure()),
+            ]
+        ),
+    )
+
+    assert json.loads(builder.to_json(100)) == json.loads(model.model_dump_json())
+    assert builder.to_model(100) == model
+
+
+def test_it_measures_an_empty_circuit_on_a_single_qubit() -> None:
+    assert json.loads(CircuitBuilder().to_json(5)) == {
+        "repetitions": 5,
+        "quantum_circuit": [{"operation": "MEASURE"}],
+        "number_of_qubits": 1,
+    }
+
+
+@pytest.mark.parametrize(
+    "builder",
+    [
+        CircuitBuilder().rz(0, phi=float("inf")),
+        CircuitBuilder().rz(0, phi=float("nan")),
+        CircuitBuilder().r(0, phi=2.5, theta=0.5),
+        CircuitBuilder().r(0, phi=0.5, theta=-0.1),
+        CircuitBuilder().rxx(0, 1, theta=0.75),
+        CircuitBuilder().rxx(1, 1, theta=0.25),
+        CircuitBuilder().rz(-1, phi=0.5),
+    ],
+)
+def test_it_rejects_gates_outside_the_limits_of_the_models(builder: CircuitBuilder) -> None:
+    with pytest.raises(ValueError, match="Gate 1 is invalid"):
+        CircuitBuilder().rz(0, phi=0.5).extend(builder).to_json(1)
+
+
+@pytest.mark.parametrize(
+    ("repetitions", "number_of_qubits", "message"),
+    [
+        (0, None, "repetitions must be between"),
+        (1, 32, "number_of_qubits must be between"),
+        (1, 2, "outside of given quantum register of size 2"),
+    ],
+)
+def test_it_rejects_invalid_repetitions_and_registers(
+    repetitions: int, number_of_qubits: int | None, message: str
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        CircuitBuilder().rz(2, phi=0.5).to_json(repetitions, number_of_qubits)
+
+
+def test_it_rejects_too_many_gates() -> None:
+    builder = CircuitBuilder()
+    for _ in range(2000):
+        builder.rz(0, phi=0.5)
+
+    with pytest.raises(ValueError, match="at most 1999 gates"):
+        builder.to_json(1)
+
+
+def test_copies_are_built_independently() -> None:
+    preparation = CircuitBuilder().r(0, phi=0.5, theta=0.5)
+    first = preparation.copy().rz(0, phi=0.1)
+    second = preparation.copy().rxx(0, 1, theta=0.5)
+
+    assert (len(preparation), len(first), len(second)) == (1, 2, 2)
+    assert second.to_model(1).quantum_circuit.number_of_qubits == 2
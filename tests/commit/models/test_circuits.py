@@ -0,0 +1,75 @@
+import pytest
+from pydantic import ValidationError
+
+from aqt_connector.models.circuits import Circuit, QuantumCircuit
+from aqt_connector.models.operations import GateR, GateRXX, GateRZ, Measure, Operation, OperationModel
+
+MEASURE = {"operation": "MEASURE"}
+
+
+@pytest.mark.parametrize(
+    ("operations", "expected"),
+    [
+        ([MEASURE], 0),
+        ([{"operation": "RZ", "qubit": 4, "phi": 0.5}, MEASURE], 5),
+        (
+            [
+                {"operation": "RXX", "qubits": [6, 1], "theta": 0.25},
+                {"operation": "R", "qubit": 2, "phi": 0, "theta": 1},
+                MEASURE,
+            ],
+            7,
+        ),
+    ],
+)
+def test_it_counts_the_qubits_up_to_the_highest_addressed(operations: list[dict], expected: int) -> None:
+    assert Circuit.model_validate(operations).number_of_qubits == expected
+
+
+@pytest.mark.parametrize(
+    "operations",
+    [
+        [{"operation": "RZ", "qubit": 0, "phi": 0.5}],
+        [MEASURE, {"operation": "RZ", "qubit": 0, "phi": 0.5}, MEASURE],
+        [MEASURE, MEASURE],
+    ],
+)
+def test_it_rejects_circuits_not_measuring_exactly_once_at_the_end(operations: list[dict]) -> None:
+    with pytest.raises(ValidationError, match="Need exactly one `MEASURE` operation"):
+        Circuit.model_validate(operations)
+
+
+def test_it_counts_the_qubits_again_when_the_operations_change() -> None:
+    circuit = Circuit(root=[OperationModel(root=GateRZ(qubit=0, phi=0.5)), OperationModel(root=Measure())])
+    assert circuit.number_of_qubits == 1
+
+    circuit.root[0] = OperationModel(root=GateR(qubit=25, phi=0.5, theta=0.5))
+    assert circuit.number_of_qubits == 26
+
+    circuit.root.insert(0, OperationModel(root=GateRXX(qubits=[30, 0], theta=0.5)))
+    assert circuit.number_of_qubits == 31
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [GateRZ(qubit=0, phi=0.5), GateR(qubit=0, phi=0.5, theta=0.5), GateRXX(qubits=[0, 1], theta=0.5), Measure()],
+)
+def test_operations_always_serialise_their_tag(operation: Operation) -> None:
+    assert "operation" in operation.model_dump(exclude_unset=True)
+    assert "operation" in operation.model_dump(exclude_defaults=True)
+    assert "operation" in OperationModel(root=operation).model_dump(exclude_unset=True)
+
+
+def test_operations_are_tagged_with_their_type() -> None:
+    assert GateRZ.model_validate({"qubit": 0, "phi": 0.5, "operation": "R"}).operation == "RZ"
+
+
+def test_it_rejects_quantum_circuits_addressing_qubits_outside_the_register() -> None:
+    with pytest.raises(ValidationError, match="outside of given quantum register of size 2"):
+        QuantumCircuit.model_validate(
+            {
+                "repetitions": 1,
+                "number_of_qubits": 2,
+                "quantum_circuit": [{"operation": "RZ", "qubit": 2, "phi": 0}, MEASURE],
+            }
+        )
@@ -0,0 +1,96 @@
+import pickle
+from collections.abc import Callable
+
+import pytest
+
+from aqt_connector.exceptions import UnknownServerError
+from aqt_connector.models.arnica.response_bodies.jobs import RRFinished
+
+RAW_RESULT = b'{"0": [[0, 1], [1, 1]], "1": [[1, 0]], "2": []}'
+RESULT = {0: [[0, 1], [1, 1]], 1: [[1, 0]], 2: []}
+
+
+def lazy_state(raw_result: bytes = RAW_RESULT) -> RRFinished:
+    state = RRFinished(result={})
+    state.attach_raw_result(raw_result, lazy=True)
+    return state
+
+
+def test_it_lists_circuits_without_decoding_them() -> None:
+    """It should list the circuits and report its status while no shots are decoded."""
+    state = lazy_state()
+
+    assert state.circuits() == [0, 1, 2]
+    assert state.is_finished()
+    assert state.is_lazy()
+
+
+def test_it_decodes_single_circuits_on_access() -> None:
+    """It should decode only the accessed circuit, caching it."""
+    state = lazy_state()
+
+    shots = state.circuit_result(1)
+
+    assert shots == [[1, 0]]
+    assert state.circuit_result(1) is shots
+    assert state.is_lazy()
+    with pytest.raises(KeyError):
+        state.circuit_result(3)
+
+
+def test_it_decodes_all_circuits_when_the_result_is_accessed() -> None:
+    """It should decode the whole result on access of `result`, keeping the circuits decoded so far."""
+    state = lazy_state()
+    first = state.circuit_result(0)
+
+    assert state.result == RESULT
+    assert state.result[0] is first
+    assert not state.is_lazy()
+
+
+def test_it_decodes_arrays_without_decoding_the_lists() -> None:
+    """It should decode the arrays of a circuit straight from the raw result."""
+    state = lazy_state()
+
+    assert state.result_array(0).tolist() == RESULT[0]
+    assert state.result_arrays()[2].shape == (0, 0)
+    assert state.is_lazy()
+
+
+def test_it_validates_shots_on_access() -> None:
+    """It should raise an UnknownServerError when invalid shots are accessed, but not before."""
+    state = lazy_state(b'{"0": [[0, 1]], "1": [[2]]}')
+
+    assert state.circuit_result(0) == [[0, 1]]
+    with pytest.raises(UnknownServerError, match="circuit 1"):
+        state.circuit_result(1)
+    with pytest.raises(UnknownServerError):
+        _ = state.result
+
+
+def test_it_serialises_compares_and_pickles_like_an_eager_state() -> None:
+    """It should behave like a state built from the decoded result."""
+    eager = RRFinished(result=RESULT)
+
+    assert lazy_state().model_dump() == eager.model_dump()
+    assert lazy_state().model_dump_json() == eager.model_dump_json()
+    assert lazy_state() == eager
+    assert pickle.loads(pickle.dumps(lazy_state())) == eager
+
+
+def test_it_decodes_lazy_results_without_circuits() -> None:
+    """It should list no circuits and decode an empty result when the result object is empty."""
+    state = lazy_state(b"{}")
+
+    assert state.circuits() == []
+    assert state.result_arrays() == {}
+    assert state.result == {}
+
+
+@pytest.mark.parametrize("access", [RRFinished.circuits, RRFinished.result_arrays, lambda state: state.result])
+def test_it_raises_for_malformed_lazy_results(access: Callable[[RRFinished], object]) -> None:
+    """It should raise an UnknownServerError, as for invalid shots, when the circuits can't be found."""
+    state = lazy_state(b'{"0": [[0, 1]] "1": [[1, 0]]}')
+
+    with pytest.raises(UnknownServerError, match="invalid result"):
+        access(state)
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from aqt_connector.models.arnica.response_bodies.jobs import RRFinished
+from aqt_connector.models.arnica.response_bodies.result_analysis import (
+    counts,
+    counts_parity_expectation,
+    job_counts,
+    job_marginal_counts,
+    job_parity_expectations,
+    marginal_counts,
+    outcomes,
+    parity_expectation,
+    z_expectations,
+)
+
+SHOTS = np.array([[1, 0, 1], [1, 0, 1], [0, 1, 1], [0, 0, 0]], dtype=np.uint8)
+
+
+def test_it_encodes_outcomes_with_the_first_qubit_as_least_significant_bit() -> None:
+    """It should encode each shot as an integer."""
+    assert outcomes(SHOTS).tolist() == [5, 5, 6, 0]
+
+
+def test_it_rejects_outcomes_too_large_for_integers() -> None:
+    """It should raise a ValueError for shots of more than 64 qubits."""
+    with pytest.raises(ValueError):
+        outcomes(np.zeros((1, 65), dtype=np.uint8))
+
+
+def test_it_counts_outcomes() -> None:
+    """It should count the shots of each outcome, only listing the outcomes that occurred."""
+    assert counts(SHOTS) == {0: 1, 5: 2, 6: 1}
+    assert counts(np.zeros((0, 0), dtype=np.uint8)) == {}
+
+
+def test_it_counts_marginal_outcomes() -> None:
+    """It should count the outcomes of the given qubits, in the given order."""
+    assert marginal_counts(SHOTS, [2, 0]) == {0: 1, 1: 1, 3: 2}
+
+
+def test_it_computes_parity_expectations() -> None:
+    """It should compute the expectation values of Z and ZZ operators."""
+    assert parity_expectation(SHOTS, [0]) == 0.0
+    assert parity_expectation(SHOTS, [2]) == -0.5
+    assert parity_expectation(SHOTS, [0, 2]) == 0.5
+    assert parity_expectation(SHOTS, []) == 1.0
+    assert z_expectations(SHOTS).tolist() == [0.0, 0.5, -0.5]
+
+
+@pytest.mark.parametrize(("qubits", "cancelled"), [([0, 0], []), ([0, 2, 0], [2]), ([2, 0, 2, 2], [0, 2])])
+def test_repeated_qubits_cancel_out_in_parity_expectations(qubits: list[int], cancelled: list[int]) -> None:
+    """It should treat a qubit given twice as the identity, from the shots and from their counts alike."""
+    expected = parity_expectation(SHOTS, cancelled)
+
+    assert parity_expectation(SHOTS, qubits) == expected
+    assert counts_parity_expectation(counts(SHOTS), qubits) == expected
+
+
+def test_it_rejects_expectations_without_shots() -> None:
+    """It should raise a ValueError for circuits without shots."""
+    with pytest.raises(ValueError):
+        parity_expectation(np.zeros((0, 0), dtype=np.uint8), [0])
+    with pytest.raises(ValueError):
+        counts_parity_expectation({}, [0])
+
+
+def test_it_analyses_every_circuit_of_a_job() -> None:
+    """It should analyse each circuit of a finished job."""
+    state = RRFinished(result={0: SHOTS.tolist(), 1: [[1, 1, 0]]})
+
+    assert job_counts(state) == {0: {0: 1, 5: 2, 6: 1}, 1: {3: 1}}
+    assert job_marginal_counts(state, [1]) == {0: {0: 3, 1: 1}, 1: {1: 1}}
+    assert job_parity_expectations(state, [0, 1]) == {0: -0.5, 1: 1.0}
@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+from aqt_connector.models.arnica.response_bodies.jobs import RRFinished
+from aqt_connector.models.arnica.response_bodies.shot_arrays import (
+    decode_shot_arrays,
+    encode_shot_arrays,
+    find_circuit_spans,
+    pack_shots,
+)
+
+
+def test_it_decodes_shot_arrays_from_the_raw_result() -> None:
+    """It should decode each circuit's shots to an array of shape (shots, qubits), whatever the whitespace."""
+    arrays = decode_shot_arrays(b'{"0": [[0, 1, 1], [1, 0, 0]],\n "3":[[1,1,1]]}')
+
+    assert list(arrays) == [0, 3]
+    assert arrays[0].dtype == np.uint8
+    assert arrays[0].tolist() == [[0, 1, 1], [1, 0, 0]]
+    assert arrays[3].tolist() == [[1, 1, 1]]
+
+
+def test_it_decodes_circuits_without_shots_or_qubits() -> None:
+    """It should decode an empty array of shots, and shots that measured no qubits."""
+    arrays = decode_shot_arrays(b'{"0":[],"1":[[],[]]}')
+
+    assert arrays[0].shape == (0, 0)
+    assert arrays[1].shape == (2, 0)
+
+
+@pytest.mark.parametrize(
+    "raw_result",
+    [
+        b'{"0":[[0,2]]}',
+        b'{"0":[[0,10]]}',
+        b'{"0":[[0,"1"]]}',
+        b'{"0":[[0,1],[1]]}',
+        b'{"0":[0,1]}',
+    ],
+)
+def test_it_rejects_anything_but_rectangular_arrays_of_bits(raw_result: bytes) -> None:
+    """It should raise a ValueError for invalid bits and for shots of different lengths."""
+    with pytest.raises(ValueError):
+        decode_shot_arrays(raw_result)
+
+
+@pytest.mark.parametrize("raw_result", [b"{}", b" { }\n"])
+def test_it_decodes_results_without_circuits(raw_result: bytes) -> None:
+    """It should decode a result object without any circuit."""
+    assert decode_shot_arrays(raw_result) == {}
+
+
+@pytest.mark.parametrize(
+    "raw_result",
+    [
+        b"",
+        b"[]",
+        b'{"0":[[0,1]]',
+        b'{"0":[[0,1]] "1":[[1,1]]}',
+        b'{"a":1,"0":[[0,1]]}',
+        b'{"0":[[0,1]],"1":[[1,1]],}',
+        b'{"0":[[0,1]]}[]',
+    ],
+)
+def test_it_rejects_malformed_result_objects(raw_result: bytes) -> None:
+    """It should raise a ValueError for anything but an object mapping circuit indices to arrays."""
+    with pytest.raises(ValueError):
+        find_circuit_spans(raw_result)
+
+
+def test_it_encodes_shot_arrays_as_a_result_object() -> None:
+    """It should encode arrays of shots, including empty ones, to the JSON they are decoded from."""
+    raw_result = b'{"0":[[0,1,1],[1,0,0]],"2":[],"3":[[],[]]}'
+
+    assert encode_shot_arrays(decode_shot_arrays(raw_result)) == raw_result
+    assert encode_shot_arrays({}) == b"{}"
+
+
+def test_it_packs_shots_least_significant_bit_first() -> None:
+    """It should pack the shots to one bit per qubit, starting from the least significant bit of the first byte."""
+    shots = np.array([[1, 0, 0, 0, 0, 0, 0, 0, 1], [0, 1, 1, 0, 0, 0, 0, 0, 0]], dtype=np.uint8)
+
+    assert pack_shots(shots).tolist() == [[1, 1], [6, 0]]
+
+
+def test_finished_state_falls_back_to_its_result_lists() -> None:
+    """It should convert the result of a state that wasn't fetched from the Arnica API."""
+    state = RRFinished(result={0: [[0, 1], [1, 1]], 1: []})
+
+    arrays = state.result_arrays()
+
+    assert arrays[0].tolist() == [[0, 1], [1, 1]]
+    assert arrays[1].shape == (0, 0)
+    assert state.result_arrays()[0] is arrays[0]
+    assert state.result_arrays(packed=True)[0].tolist() == [[2], [3]]
+
+
+def test_finished_state_decodes_its_raw_result() -> None:
+    """It should decode the arrays from the raw result when there is one, and still compare by its result."""
+    state = RRFinished(result={0: [[0, 1]]})
+    state._raw_result = b'{"0":[[0,1]]}'
+
+    assert state.result_arrays()[0].tolist() == [[0, 1]]
+    assert state == RRFinished(result={0: [[0, 1]]})
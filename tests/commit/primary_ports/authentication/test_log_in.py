@@ -31,7 +31,7 @@ class AuthenticatedAuthService(AuthService):
     def save_access_token(self, access_token: str) -> None:
         self.stored_access_token = access_token
 
-    def get_or_refresh_access_token(self, store: bool) -> str | None:
+    def get_or_refresh_access_token(self, store: bool, rejected: str | None = None) -> str | None:
         return self.stored_access_token
 
 
@@ -39,7 +39,7 @@ class UnauthenticatedAuthService(AuthService):
     def __init__(self) -> None:
         self.stored_access_token: str | None = None
 
-    def get_or_refresh_access_token(self, store: bool) -> str | None:
+    def get_or_refresh_access_token(self, store: bool, rejected: str | None = None) -> str | None:
         return self.stored_access_token
 
     def save_access_token(self, access_token: str) -> None:
@@ -65,7 +65,7 @@ def test_it_stores_refreshed_access_token_if_configured(store_access_token: bool
         def __init__(self):
             self.stored = False
 
-        def get_or_refresh_access_token(self, store: bool) -> str | None:
+        def get_or_refresh_access_token(self, store: bool, rejected: str | None = None) -> str | None:
             self.stored = store
             return "newaccesstoken"
 
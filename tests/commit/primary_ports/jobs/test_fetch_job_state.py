@@ -18,7 +18,7 @@ class AuthServiceSpy(AuthService):
         self.was_token_stored = False
         self.fetched_token = "thisisthetoken"
 
-    def get_or_refresh_access_token(self, store: bool) -> str | None:
+    def get_or_refresh_access_token(self, store: bool, rejected: str | None = None) -> str | None:
         self.was_token_fetched = True
         self.was_token_stored = store
         return self.fetched_token
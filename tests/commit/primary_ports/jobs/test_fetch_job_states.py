@@ -0,0 +1,88 @@
+from collections.abc import Iterable
+from uuid import UUID, uuid4
+
+import pytest
+
+from aqt_connector import ArnicaApp, ArnicaConfig, fetch_job_states
+from aqt_connector._domain.auth_service import AuthService
+from aqt_connector._domain.job_service import JobService
+from aqt_connector.exceptions import NotAuthenticatedError
+from aqt_connector.models.arnica.response_bodies.jobs import JobState, RRQueued
+
+
+class AuthServiceSpy(AuthService):
+    """A spy for the AuthService to track method calls and parameters."""
+
+    def __init__(self) -> None:
+        self.token_fetch_count = 0
+        self.fetched_token: str | None = "thisisthetoken"
+
+    def get_or_refresh_access_token(self, store: bool, rejected: str | None = None) -> str | None:
+        self.token_fetch_count += 1
+        return self.fetched_token
+
+
+class JobServiceSpy(JobService):
+    """A spy for the JobService to track method calls and parameters."""
+
+    def __init__(self) -> None:
+        self.given_token: str | None = None
+        self.requested_job_ids: list[UUID] = []
+        self.given_max_concurrency: int | None = None
+
+    def fetch_job_states(
+        self, token: str, job_ids: Iterable[UUID], *, max_concurrency: int = 8
+    ) -> dict[UUID, JobState | Exception]:
+        self.given_token = token
+        self.requested_job_ids = list(job_ids)
+        self.given_max_concurrency = max_concurrency
+        return {job_id: RRQueued() for job_id in self.requested_job_ids}
+
+
+def test_it_resolves_the_token_once() -> None:
+    """It should get or refresh the access token only once for all jobs."""
+    app = ArnicaApp(ArnicaConfig())
+    app.auth_service = AuthServiceSpy()
+    app.job_service = JobServiceSpy()
+
+    fetch_job_states(app, [uuid4() for _ in range(10)])
+
+    assert app.auth_service.token_fetch_count == 1
+    assert app.job_service.given_token == app.auth_service.fetched_token
+
+
+def test_it_uses_provided_api_token() -> None:
+    """It should use a provided API token instead of fetching one."""
+    app = ArnicaApp(ArnicaConfig())
+    app.auth_service = AuthServiceSpy()
+    app.job_service = JobServiceSpy()
+
+    fetch_job_states(app, [uuid4()], api_token="provided_api_token")
+
+    assert app.job_service.given_token == "provided_api_token"
+    assert app.auth_service.token_fetch_count == 0
+
+
+def test_it_raises_if_not_authenticated() -> None:
+    """It should raise NotAuthenticatedError if no access token is available."""
+    app = ArnicaApp(ArnicaConfig())
+    app.auth_service = AuthServiceSpy()
+    app.auth_service.fetched_token = None
+    app.job_service = JobServiceSpy()
+
+    with pytest.raises(NotAuthenticatedError, match="User not authenticated. Please log in."):
+        fetch_job_states(app, [uuid4()])
+
+
+def test_it_returns_states_from_job_service() -> None:
+    """It should pass the job IDs and concurrency bound on and return the resulting mapping."""
+    app = ArnicaApp(ArnicaConfig())
+    app.auth_service = AuthServiceSpy()
+    app.job_service = JobServiceSpy()
+    job_ids = [uuid4() for _ in range(3)]
+
+    states = fetch_job_states(app, job_ids, max_concurrency=2)
+
+    assert app.job_service.requested_job_ids == job_ids
+    assert app.job_service.given_max_concurrency == 2
+    assert states == {job_id: RRQueued() for job_id in job_ids}
@@ -0,0 +1,44 @@
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from aqt_connector import ArnicaApp, ArnicaConfig, journal_entries, track_job, unfinished_jobs
+from aqt_connector.models.arnica.jobs import JobStatus
+from aqt_connector.models.arnica.response_bodies.jobs import RRFinished, RRQueued
+
+
+def journalled_app(tmp_path: Path) -> ArnicaApp:
+    config = ArnicaConfig(tmp_path)
+    config.journal = True
+    return ArnicaApp(config)
+
+
+def test_it_answers_what_is_still_running_offline(tmp_path: Path) -> None:
+    """It should list the tracked jobs that aren't known to be finished."""
+    with journalled_app(tmp_path) as app:
+        assert app.job_journal is not None
+        queued, finished = uuid4(), uuid4()
+        track_job(app, queued, label="run", workspace_id="ws", resource_id="sim")
+        track_job(app, finished, label="run")
+        app.job_journal.record_state(queued, RRQueued())
+        app.job_journal.record_state(finished, RRFinished(result={}))
+
+        assert [entry.job_id for entry in unfinished_jobs(app, label="run")] == [queued]
+        assert [entry.job_id for entry in journal_entries(app, status=JobStatus.FINISHED)] == [finished]
+
+
+def test_the_journal_survives_the_app(tmp_path: Path) -> None:
+    """It should find jobs tracked by a previous instance of the app."""
+    job_id = uuid4()
+    with journalled_app(tmp_path) as app:
+        track_job(app, job_id, label="before-restart")
+
+    with journalled_app(tmp_path) as app:
+        assert [entry.label for entry in unfinished_jobs(app)] == ["before-restart"]
+
+
+def test_it_raises_when_the_journal_is_disabled(tmp_path: Path) -> None:
+    """It should raise a RuntimeError when the journal is not enabled."""
+    with ArnicaApp(ArnicaConfig(tmp_path)) as app, pytest.raises(RuntimeError, match="not enabled"):
+        unfinished_jobs(app)
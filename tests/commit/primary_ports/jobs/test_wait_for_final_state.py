@@ -1,15 +1,19 @@
 import sys
+import threading
 import time
 from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
 from typing import TextIO, cast
 from uuid import UUID, uuid4
 
 import pytest
 
-from aqt_connector import ArnicaApp, ArnicaConfig
+from aqt_connector import AdaptivePolling, ArnicaApp, ArnicaConfig
 from aqt_connector._application.jobs import wait_for_final_state
 from aqt_connector._domain.auth_service import AuthService
 from aqt_connector._domain.job_service import JobService
+from aqt_connector._domain.polling import PollingStrategy
+from aqt_connector._domain.wait_events import EventSink
 from aqt_connector.exceptions import InvalidJobIDError, JobNotFoundError, NotAuthenticatedError, UnknownServerError
 from aqt_connector.models.arnica.response_bodies.jobs import (
     FinalJobState,
@@ -30,7 +34,7 @@ class AuthServiceSpy(AuthService):
         self.was_token_stored = False
         self.fetched_token = "thisisthetoken"
 
-    def get_or_refresh_access_token(self, store: bool) -> str | None:
+    def get_or_refresh_access_token(self, store: bool, rejected: str | None = None) -> str | None:
         self.token_fetch_count += 1
         self.was_token_stored = store
         return self.fetched_token
@@ -45,6 +49,11 @@ class JobServiceSpy(JobService):
         self.given_query_interval_seconds: float | None = None
         self.given_max_attempts: int | None = None
         self.given_out: TextIO | None = None
+        self.given_polling: PollingStrategy | None = None
+        self.given_deadline: float | None = None
+        self.given_cancel: threading.Event | None = None
+        self.given_number_of_circuits: int | None = None
+        self.given_refresh_token: Callable[[str], str | None] | None = None
         self.returned_state = RRQueued()
 
     def wait_for_result(
@@ -52,17 +61,30 @@ class JobServiceSpy(JobService):
         token: str,
         job_id: UUID,
         *,
+        refresh_token: Callable[[str], str | None] | None = None,
         query_interval_seconds: float = 1.0,
         wait: Callable[[float], None] = time.sleep,
         max_attempts: int = 600,
-        out: TextIO = sys.stdout,
+        clock: Callable[[], float] = time.monotonic,
+        deadline: float | None = None,
+        cancel: threading.Event | None = None,
+        out: TextIO | None = sys.stdout,
         report_state: Callable[[NonFinalJobState], None] | None = None,
+        polling: PollingStrategy | None = None,
+        priority: float = 1.0,
+        events: EventSink | None = None,
+        number_of_circuits: int | None = None,
     ) -> FinalJobState:
         self.given_token = token
+        self.given_refresh_token = refresh_token
         self.requested_job_id = job_id
         self.given_query_interval_seconds = query_interval_seconds
         self.given_max_attempts = max_attempts
         self.given_out = out
+        self.given_polling = polling
+        self.given_deadline = deadline
+        self.given_cancel = cancel
+        self.given_number_of_circuits = number_of_circuits
         return cast(FinalJobState, self.returned_state)
 
 
@@ -133,141 +155,121 @@ def test_passes_query_interval_max_attempts_and_out_to_job_service() -> None:
     assert app.job_service.given_out is stdout
 
 
-def test_it_returns_job_state_from_job_service() -> None:
-    """It should return the job state fetched from the job service."""
+def test_it_passes_polling_strategy_to_job_service() -> None:
+    """It should pass the polling strategy and the number of circuits on to the job service."""
     app = ArnicaApp(ArnicaConfig())
     app.auth_service = AuthServiceSpy()
     app.job_service = JobServiceSpy()
+    polling = AdaptivePolling()
 
-    job_state = wait_for_final_state(app, uuid4())
+    wait_for_final_state(app, uuid4(), polling=polling, number_of_circuits=7)
 
-    assert job_state is app.job_service.returned_state
+    assert app.job_service.given_polling is polling
+    assert app.job_service.given_number_of_circuits == 7
 
 
-def test_it_retries_after_not_authenticated_once_by_refreshing_token_and_succeeds() -> None:
-    """It should retry once after NotAuthenticatedError by refreshing the token and succeeding."""
+def test_it_passes_no_deadline_by_default() -> None:
+    """It should wait without a deadline if neither a timeout nor a deadline is given."""
+    app = ArnicaApp(ArnicaConfig())
+    app.auth_service = AuthServiceSpy()
+    app.job_service = JobServiceSpy()
 
-    class AuthServiceDouble(AuthServiceSpy):
-        def get_or_refresh_access_token(self, store: bool) -> str | None:
-            self.token_fetch_count += 1
-            return f"thisistoken{self.token_fetch_count}"
+    wait_for_final_state(app, uuid4())
 
-    class JobServiceDouble(JobService):
-        def __init__(self) -> None:
-            self.call_count = 0
-            self.return_value = RRCancelled()
+    assert app.job_service.given_deadline is None
 
-        def wait_for_result(
-            self,
-            token: str,
-            job_id: UUID,
-            *,
-            query_interval_seconds: float = 1.0,
-            wait: Callable[[float], None] = time.sleep,
-            max_attempts: int = 600,
-            out: TextIO = sys.stdout,
-            report_state: Callable[[NonFinalJobState], None] | None = None,
-        ) -> FinalJobState:
-            if self.call_count == 0:
-                self.call_count = 1
-                raise NotAuthenticatedError
-            return self.return_value
 
+def test_it_converts_timeout_to_monotonic_deadline() -> None:
+    """It should pass the timeout on to the job service as a deadline on the monotonic clock."""
     app = ArnicaApp(ArnicaConfig())
-    app.auth_service = AuthServiceDouble()
-    app.job_service = JobServiceDouble()
+    app.auth_service = AuthServiceSpy()
+    app.job_service = JobServiceSpy()
 
-    final_state = wait_for_final_state(app, uuid4())
+    before = time.monotonic()
+    wait_for_final_state(app, uuid4(), timeout=30.0)
+    after = time.monotonic()
 
-    assert final_state is app.job_service.return_value
-    assert app.auth_service.token_fetch_count == 2  # initial + 1 retry
+    assert app.job_service.given_deadline is not None
+    assert before + 30.0 <= app.job_service.given_deadline <= after + 30.0
 
 
-def test_it_propagates_not_authenticated_error_when_refresh_returns_none() -> None:
-    """It should propagate NotAuthenticatedError if token refresh returns None."""
+@pytest.mark.parametrize("tzinfo", [timezone.utc, None])
+def test_it_converts_wall_clock_deadline_to_monotonic_deadline(tzinfo: timezone | None) -> None:
+    """It should pass a wall-clock deadline on to the job service as a deadline on the monotonic clock."""
+    app = ArnicaApp(ArnicaConfig())
+    app.auth_service = AuthServiceSpy()
+    app.job_service = JobServiceSpy()
 
-    class AuthServiceDouble(AuthServiceSpy):
-        def get_or_refresh_access_token(self, store: bool) -> str | None:
-            if self.token_fetch_count == 0:
-                self.token_fetch_count = 1
-                return self.fetched_token
-            return None  # simulate failure to refresh token
+    deadline = datetime.now(tzinfo) + timedelta(minutes=5)
+    wait_for_final_state(app, uuid4(), deadline=deadline)
+
+    assert app.job_service.given_deadline == pytest.approx(time.monotonic() + 300.0, abs=1.0)
 
-    class JobServiceDouble(JobServiceSpy):
-        def wait_for_result(
-            self,
-            token: str,
-            job_id: UUID,
-            *,
-            query_interval_seconds: float = 1.0,
-            wait: Callable[[float], None] = time.sleep,
-            max_attempts: int = 600,
-            out: TextIO = sys.stdout,
-            report_state: Callable[[NonFinalJobState], None] | None = None,
-        ) -> FinalJobState:
-            raise NotAuthenticatedError
 
+def test_it_uses_the_earlier_of_timeout_and_deadline() -> None:
+    """It should stop waiting at whichever of the timeout and the deadline comes first."""
     app = ArnicaApp(ArnicaConfig())
-    app.auth_service = AuthServiceDouble()
-    app.job_service = JobServiceDouble()
+    app.auth_service = AuthServiceSpy()
+    app.job_service = JobServiceSpy()
 
-    with pytest.raises(NotAuthenticatedError):
-        wait_for_final_state(app, uuid4())
+    wait_for_final_state(app, uuid4(), timeout=10.0, deadline=datetime.now(timezone.utc) + timedelta(hours=1))
 
+    assert app.job_service.given_deadline == pytest.approx(time.monotonic() + 10.0, abs=1.0)
 
-def test_it_propagates_not_authenticated_error_when_refresh_returns_same_token() -> None:
-    """It should propagate NotAuthenticatedError if token refresh returns the same token."""
 
-    class AuthServiceDouble(AuthServiceSpy):
-        def get_or_refresh_access_token(self, store: bool) -> str | None:
-            return self.fetched_token
+def test_it_passes_cancel_event_to_job_service() -> None:
+    """It should pass the cancellation event on to the job service."""
+    app = ArnicaApp(ArnicaConfig())
+    app.auth_service = AuthServiceSpy()
+    app.job_service = JobServiceSpy()
+    cancel = threading.Event()
 
-    class JobServiceDouble(JobServiceSpy):
-        def wait_for_result(
-            self,
-            token: str,
-            job_id: UUID,
-            *,
-            query_interval_seconds: float = 1.0,
-            wait: Callable[[float], None] = time.sleep,
-            max_attempts: int = 600,
-            out: TextIO = sys.stdout,
-            report_state: Callable[[NonFinalJobState], None] | None = None,
-        ) -> FinalJobState:
-            raise NotAuthenticatedError
+    wait_for_final_state(app, uuid4(), cancel=cancel)
 
+    assert app.job_service.given_cancel is cancel
+
+
+def test_it_returns_job_state_from_job_service() -> None:
+    """It should return the job state fetched from the job service."""
     app = ArnicaApp(ArnicaConfig())
-    app.auth_service = AuthServiceDouble()
-    app.job_service = JobServiceDouble()
+    app.auth_service = AuthServiceSpy()
+    app.job_service = JobServiceSpy()
 
-    with pytest.raises(NotAuthenticatedError):
-        wait_for_final_state(app, uuid4())
+    job_state = wait_for_final_state(app, uuid4())
 
+    assert job_state is app.job_service.returned_state
 
-def test_it_does_not_attempt_refresh_when_static_api_token_and_not_authenticated_error_occurs() -> None:
-    """It should not attempt to refresh the token when a user-managed API token is provided."""
 
-    class JobServiceDouble(JobServiceSpy):
-        def wait_for_result(
-            self,
-            token: str,
-            job_id: UUID,
-            *,
-            query_interval_seconds: float = 1.0,
-            wait: Callable[[float], None] = time.sleep,
-            max_attempts: int = 600,
-            out: TextIO = sys.stdout,
-            report_state: Callable[[NonFinalJobState], None] | None = None,
-        ) -> FinalJobState:
-            raise NotAuthenticatedError
+def test_it_lets_the_job_service_refresh_rejected_tokens() -> None:
+    """It should let the job service refresh a rejected token, so that the wait carries on where it was."""
+
+    class AuthServiceDouble(AuthServiceSpy):
+        def get_or_refresh_access_token(self, store: bool, rejected: str | None = None) -> str | None:
+            self.token_fetch_count += 1
+            self.given_rejected = rejected
+            return f"thisistoken{self.token_fetch_count}"
 
+    app = ArnicaApp(ArnicaConfig())
+    app.auth_service = AuthServiceDouble()
+    app.job_service = JobServiceSpy()
+
+    wait_for_final_state(app, uuid4())
+
+    refresh_token = app.job_service.given_refresh_token
+    assert refresh_token is not None
+    assert refresh_token("thisistoken1") == "thisistoken2"
+    assert app.auth_service.given_rejected == "thisistoken1"
+
+
+def test_it_does_not_refresh_a_static_api_token() -> None:
+    """It should not let the job service refresh a user-managed API token."""
     app = ArnicaApp(ArnicaConfig())
     app.auth_service = AuthServiceSpy()
-    app.job_service = JobServiceDouble()
+    app.job_service = JobServiceSpy()
 
-    with pytest.raises(NotAuthenticatedError):
-        wait_for_final_state(app, uuid4(), api_token="provided_token")
+    wait_for_final_state(app, uuid4(), api_token="provided_token")
 
+    assert app.job_service.given_refresh_token is None
     assert app.auth_service.token_fetch_count == 0
 
 
@@ -290,11 +292,19 @@ def test_it_propagates_other_exceptions_from_job_service(exception_type: type[Ex
             token: str,
             job_id: UUID,
             *,
+            refresh_token: Callable[[str], str | None] | None = None,
             query_interval_seconds: float = 1.0,
             wait: Callable[[float], None] = time.sleep,
             max_attempts: int = 600,
-            out: TextIO = sys.stdout,
+            clock: Callable[[], float] = time.monotonic,
+            deadline: float | None = None,
+            cancel: threading.Event | None = None,
+            out: TextIO | None = sys.stdout,
             report_state: Callable[[NonFinalJobState], None] | None = None,
+            polling: PollingStrategy | None = None,
+            priority: float = 1.0,
+            events: EventSink | None = None,
+            number_of_circuits: int | None = None,
         ) -> FinalJobState:
             raise exception_type()
 
@@ -306,44 +316,6 @@ def test_it_propagates_other_exceptions_from_job_service(exception_type: type[Ex
         wait_for_final_state(app, uuid4())
 
 
-def test_it_handles_multiple_sequential_token_expiries_and_retries_until_success() -> None:
-    """It should handle multiple sequential NotAuthenticatedError exceptions by refreshing the token until success."""
-
-    class AuthServiceDouble(AuthServiceSpy):
-        def get_or_refresh_access_token(self, store: bool) -> str | None:
-            self.token_fetch_count += 1
-            return f"thisistoken{self.token_fetch_count}"
-
-    class JobServiceDouble(JobService):
-        def __init__(self) -> None:
-            self.call_count = 0
-
-        def wait_for_result(
-            self,
-            token: str,
-            job_id: UUID,
-            *,
-            query_interval_seconds: float = 1.0,
-            wait: Callable[[float], None] = time.sleep,
-            max_attempts: int = 600,
-            out: TextIO = sys.stdout,
-            report_state: Callable[[NonFinalJobState], None] | None = None,
-        ) -> FinalJobState:
-            if self.call_count < 2:
-                self.call_count += 1
-                raise NotAuthenticatedError
-            return RRCancelled()
-
-    app = ArnicaApp(ArnicaConfig())
-    app.auth_service = AuthServiceDouble()
-    app.job_service = JobServiceDouble()
-
-    final_state = wait_for_final_state(app, uuid4())
-
-    assert final_state == RRCancelled()
-    assert app.auth_service.token_fetch_count == 3  # initial + 2 retries
-
-
 @pytest.mark.parametrize("api_token", ["I am a token", None])
 def test_it_passes_report_state_callable_to_job_service(api_token: str | None) -> None:
     """It should pass the report_state callable to the job service."""
@@ -356,11 +328,19 @@ def test_it_passes_report_state_callable_to_job_service(api_token: str | None) -
             token: str,
             job_id: UUID,
             *,
+            refresh_token: Callable[[str], str | None] | None = None,
             query_interval_seconds: float = 1.0,
             wait: Callable[[float], None] = time.sleep,
             max_attempts: int = 600,
-            out: TextIO = sys.stdout,
+            clock: Callable[[], float] = time.monotonic,
+            deadline: float | None = None,
+            cancel: threading.Event | None = None,
+            out: TextIO | None = sys.stdout,
             report_state: Callable[[NonFinalJobState], None] | None = None,
+            polling: PollingStrategy | None = None,
+            priority: float = 1.0,
+            events: EventSink | None = None,
+            number_of_circuits: int | None = None,
         ) -> FinalJobState:
             self.passed_callable = report_state
             if report_state:
@@ -0,0 +1,147 @@
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from typing import TextIO
+from uuid import UUID, uuid4
+
+import pytest
+
+from aqt_connector import ArnicaApp, ArnicaConfig, gather_final_states, wait_for_final_states
+from aqt_connector._domain.auth_service import AuthService
+from aqt_connector._domain.job_service import JobService
+from aqt_connector._domain.polling import PollingStrategy
+from aqt_connector._domain.wait_events import EventSink
+from aqt_connector.exceptions import NotAuthenticatedError
+from aqt_connector.models.arnica.response_bodies.jobs import FinalJobState, NonFinalJobState, RRCancelled
+
+
+class AuthServiceSpy(AuthService):
+    """A spy for the AuthService that hands out a new token on every call."""
+
+    def __init__(self) -> None:
+        self.token_fetch_count = 0
+
+    def get_or_refresh_access_token(self, store: bool, rejected: str | None = None) -> str | None:
+        self.token_fetch_count += 1
+        return f"thisistoken{self.token_fetch_count}"
+
+
+class JobServiceSpy(JobService):
+    """A spy for the JobService that finishes every job."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, list[UUID]]] = []
+        self.given_refresh_token: Callable[[str], str | None] | None = None
+        self.given_max_concurrency: int | None = None
+        self.given_deadlines: list[float | None] = []
+        self.given_cancel: threading.Event | None = None
+
+    def wait_for_results(
+        self,
+        token: str,
+        job_ids: Iterable[UUID],
+        *,
+        refresh_token: Callable[[str], str | None] | None = None,
+        query_interval_seconds: float = 1.0,
+        wait: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+        max_attempts: int = 600,
+        deadline: float | None = None,
+        cancel: threading.Event | None = None,
+        max_concurrency: int = 8,
+        out: TextIO | None = sys.stdout,
+        report_state: Callable[[UUID, NonFinalJobState], None] | None = None,
+        polling: PollingStrategy | None = None,
+        priority: float = 1.0,
+        events: EventSink | None = None,
+        number_of_circuits: Mapping[UUID, int] | None = None,
+    ) -> Iterator[tuple[UUID, FinalJobState]]:
+        job_ids = list(job_ids)
+        self.calls.append((token, job_ids))
+        self.given_refresh_token = refresh_token
+        self.given_max_concurrency = max_concurrency
+        self.given_deadlines.append(deadline)
+        self.given_cancel = cancel
+        for job_id in job_ids:
+            yield job_id, RRCancelled()
+
+
+def test_it_yields_final_state_of_every_job() -> None:
+    """It should yield the final state of every given job."""
+    app = ArnicaApp(ArnicaConfig())
+    app.auth_service = AuthServiceSpy()
+    app.job_service = JobServiceSpy()
+    job_ids = [uuid4() for _ in range(3)]
+
+    completed = list(wait_for_final_states(app, job_ids, max_concurrency=2))
+
+    assert completed == [(job_id, RRCancelled()) for job_id in job_ids]
+    assert app.job_service.given_max_concurrency == 2
+
+
+def test_it_raises_eagerly_if_not_authenticated() -> None:
+    """It should raise NotAuthenticatedError before iteration if no access token is available."""
+
+    class UnauthenticatedAuthService(AuthServiceSpy):
+        def get_or_refresh_access_token(self, store: bool, rejected: str | None = None) -> str | None:
+            return None
+
+    app = ArnicaApp(ArnicaConfig())
+    app.auth_service = UnauthenticatedAuthService()
+    app.job_service = JobServiceSpy()
+
+    with pytest.raises(NotAuthenticatedError, match="User not authenticated. Please log in."):
+        wait_for_final_states(app, [uuid4()])
+
+
+def test_it_lets_the_job_service_refresh_rejected_tokens() -> None:
+    """It should wait once, letting the job service refresh a rejected token so that the wait carries on."""
+    app = ArnicaApp(ArnicaConfig())
+    app.auth_service = AuthServiceSpy()
+    app.job_service = JobServiceSpy()
+    job_ids = [uuid4() for _ in range(3)]
+
+    list(wait_for_final_states(app, job_ids))
+
+    assert app.job_service.calls == [("thisistoken1", job_ids)]
+    refresh_token = app.job_service.given_refresh_token
+    assert refresh_token is not None
+    assert refresh_token("thisistoken1") == "thisistoken2"
+
+
+def test_it_does_not_refresh_a_static_api_token() -> None:
+    """It should not let the job service refresh a user-managed API token."""
+    app = ArnicaApp(ArnicaConfig())
+    app.auth_service = AuthServiceSpy()
+    app.job_service = JobServiceSpy()
+
+    list(wait_for_final_states(app, [uuid4()], api_token="provided_token"))
+
+    assert app.job_service.given_refresh_token is None
+    assert app.auth_service.token_fetch_count == 0
+
+
+def test_it_passes_the_deadline_and_cancel_event_on() -> None:
+    """It should pass the deadline and the cancellation event on to the job service."""
+    app = ArnicaApp(ArnicaConfig())
+    app.auth_service = AuthServiceSpy()
+    app.job_service = JobServiceSpy()
+    cancel = threading.Event()
+
+    list(wait_for_final_states(app, [uuid4() for _ in range(3)], timeout=60.0, cancel=cancel))
+
+    assert app.job_service.given_deadlines == [pytest.approx(time.monotonic() + 60.0, abs=1.0)]
+    assert app.job_service.given_cancel is cancel
+
+
+def test_gather_returns_mapping_of_final_states() -> None:
+    """It should gather the final states of all jobs into a mapping."""
+    app = ArnicaApp(ArnicaConfig())
+    app.auth_service = AuthServiceSpy()
+    app.job_service = JobServiceSpy()
+    job_ids = [uuid4() for _ in range(3)]
+
+    final_states = gather_final_states(app, job_ids)
+
+    assert final_states == {job_id: RRCancelled() for job_id in job_ids}
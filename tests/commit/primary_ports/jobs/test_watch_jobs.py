@@ -0,0 +1,132 @@
+import sys
+from collections.abc import Callable
+from typing import TextIO
+from uuid import UUID, uuid4
+
+import pytest
+
+from aqt_connector import AdaptivePolling, ArnicaApp, ArnicaConfig, JobHandle, watch_job, watch_jobs
+from aqt_connector._domain.auth_service import AuthService
+from aqt_connector._domain.job_watcher import JobWatcher
+from aqt_connector._domain.polling import PollingStrategy
+from aqt_connector._domain.wait_events import EventSink
+from aqt_connector.exceptions import NotAuthenticatedError
+
+
+class AuthServiceSpy(AuthService):
+    """A spy for the AuthService that hands out a new token on every call."""
+
+    def __init__(self) -> None:
+        self.token_fetch_count = 0
+        self.available = True
+
+    def get_or_refresh_access_token(self, store: bool, rejected: str | None = None) -> str | None:
+        if not self.available:
+            return None
+        self.token_fetch_count += 1
+        return f"thisistoken{self.token_fetch_count}"
+
+
+class JobWatcherSpy(JobWatcher):
+    """A spy for the JobWatcher recording the watches."""
+
+    def __init__(self) -> None:
+        self.watches: list[tuple[str, UUID, Callable[[str], str | None] | None, PollingStrategy | None, float]] = []
+        self.numbers_of_circuits: list[int | None] = []
+
+    def watch(
+        self,
+        token: str,
+        job_id: UUID,
+        *,
+        refresh_token: Callable[[str], str | None] | None = None,
+        polling: PollingStrategy | None = None,
+        priority: float = 1.0,
+        out: TextIO | None = sys.stdout,
+        events: EventSink | None = None,
+        number_of_circuits: int | None = None,
+    ) -> JobHandle:
+        self.watches.append((token, job_id, refresh_token, polling, priority))
+        self.numbers_of_circuits.append(number_of_circuits)
+        return JobHandle(job_id)
+
+    def close(self) -> None: ...
+
+
+def test_it_watches_every_job_with_a_single_token() -> None:
+    """It should resolve the token once and return a handle per job, in order."""
+    app = ArnicaApp(ArnicaConfig())
+    app.auth_service = AuthServiceSpy()
+    app.job_watcher = JobWatcherSpy()
+    job_ids = [uuid4() for _ in range(3)]
+
+    handles = watch_jobs(app, job_ids, priority=2.0)
+
+    assert [handle.job_id for handle in handles] == job_ids
+    assert app.auth_service.token_fetch_count == 1
+    assert [(token, job_id, priority) for token, job_id, _, _, priority in app.job_watcher.watches] == [
+        ("thisistoken1", job_id, 2.0) for job_id in job_ids
+    ]
+
+
+def test_it_lets_the_watcher_refresh_the_token() -> None:
+    """It should let the watcher refresh a rejected token through the auth service."""
+    app = ArnicaApp(ArnicaConfig())
+    app.auth_service = AuthServiceSpy()
+    app.job_watcher = JobWatcherSpy()
+
+    watch_job(app, uuid4())
+    refresh_token = app.job_watcher.watches[0][2]
+
+    assert refresh_token is not None
+    assert refresh_token("thisistoken1") == "thisistoken2"
+
+
+def test_it_does_not_refresh_a_static_api_token() -> None:
+    """It should use a provided API token without fetching or refreshing one."""
+    app = ArnicaApp(ArnicaConfig())
+    app.auth_service = AuthServiceSpy()
+    app.job_watcher = JobWatcherSpy()
+
+    watch_job(app, uuid4(), api_token="provided_api_token")
+
+    token, _, refresh_token, _, _ = app.job_watcher.watches[0]
+    assert token == "provided_api_token"
+    assert refresh_token is None
+    assert app.auth_service.token_fetch_count == 0
+
+
+def test_it_passes_polling_strategy_to_the_watcher() -> None:
+    """It should pass the polling strategy on to the watcher."""
+    app = ArnicaApp(ArnicaConfig())
+    app.auth_service = AuthServiceSpy()
+    app.job_watcher = JobWatcherSpy()
+    polling = AdaptivePolling()
+
+    watch_job(app, uuid4(), polling=polling)
+
+    assert app.job_watcher.watches[0][3] is polling
+
+
+def test_it_passes_the_number_of_circuits_of_each_job_to_the_watcher() -> None:
+    """It should pass the number of circuits of each job on to the watcher, where known."""
+    app = ArnicaApp(ArnicaConfig())
+    app.auth_service = AuthServiceSpy()
+    app.job_watcher = JobWatcherSpy()
+    known, unknown = uuid4(), uuid4()
+
+    watch_jobs(app, [known, unknown], number_of_circuits={known: 3})
+    watch_job(app, unknown, number_of_circuits=5)
+
+    assert app.job_watcher.numbers_of_circuits == [3, None, 5]
+
+
+def test_it_raises_if_no_token_available() -> None:
+    """It should raise NotAuthenticatedError if no access token is available."""
+    app = ArnicaApp(ArnicaConfig())
+    app.auth_service = AuthServiceSpy()
+    app.auth_service.available = False
+    app.job_watcher = JobWatcherSpy()
+
+    with pytest.raises(NotAuthenticatedError, match="User not authenticated. Please log in."):
+        watch_job(app, uuid4())
@@ -0,0 +1,113 @@
+import os
+import pickle
+from uuid import uuid4
+
+import pytest
+
+from aqt_connector import ArnicaApp, ArnicaConfig
+from aqt_connector._data_types import OfflineAccessTokens
+
+
+@pytest.mark.parametrize("budget", [None, 0.0])
+def test_it_polls_without_a_budget_when_disabled(tmp_path, budget: float | None) -> None:
+    """Waits should not be paced by a global budget when there is none."""
+    config = ArnicaConfig(tmp_path)
+    config.max_polls_per_second = budget
+
+    with ArnicaApp(config) as app:
+        assert app.poll_scheduler is None
+        assert app.job_service.scheduler is None
+        assert app.job_watcher.scheduler is None
+
+
+def test_it_shares_the_polling_budget_between_services(tmp_path) -> None:
+    config = ArnicaConfig(tmp_path)
+    config.max_polls_per_second = 5.0
+
+    with ArnicaApp(config) as app:
+        assert app.poll_scheduler is not None
+        assert app.poll_scheduler.max_requests_per_second == 5.0
+        assert app.job_service.scheduler is app.job_watcher.scheduler is app.poll_scheduler
+
+
+def journalling_config(tmp_path) -> ArnicaConfig:
+    config = ArnicaConfig(tmp_path)
+    config.journal = True
+    return config
+
+
+def test_it_opens_the_journal_on_first_use(tmp_path) -> None:
+    """Creating an app should not open the job journal."""
+    with ArnicaApp(journalling_config(tmp_path)) as app:
+        assert not (tmp_path / "journal.sqlite3").exists()
+
+        assert app.job_journal is app.job_service.journal is app.job_watcher.journal
+        assert (tmp_path / "journal.sqlite3").is_file()
+
+
+def test_it_only_resets_clients_and_locks_after_a_fork(tmp_path) -> None:
+    """After a fork, the app should drop the inherited clients and services without closing them, keeping the token
+    session, and build new ones on first use."""
+    app = ArnicaApp(journalling_config(tmp_path))
+    app.auth_service.session_tokens = OfflineAccessTokens("access", "refresh")
+    auth_service = app.auth_service
+    job_service = app.job_service
+    journal = app.job_journal
+    assert journal is not None
+    client = app._arnica_adapter._http_client
+
+    app._after_fork()
+
+    assert app.__dict__.keys().isdisjoint({"job_service", "job_watcher", "job_journal", "poll_scheduler"})
+    assert app._arnica_adapter._client is None
+    assert not client.is_closed
+    assert journal._connection.execute("SELECT COUNT(*) FROM jobs").fetchone() == (0,)
+    assert app.auth_service is auth_service
+    assert app.auth_service.session_tokens == ("access", "refresh")
+    assert app.job_service is not job_service
+    assert app.job_journal is not journal
+    assert app.job_service.journal is app.job_journal
+    app.close()
+    journal.close()
+    client.close()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork is not available")
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_it_can_be_used_in_a_forked_process(tmp_path) -> None:
+    """A forked process should get its own journal and clients, leaving those of the parent usable."""
+    with ArnicaApp(journalling_config(tmp_path)) as app:
+        job_id = uuid4()
+        assert app.job_journal is not None
+        app.job_journal.track(job_id, label="parent")
+        parent_journal = app.job_journal
+
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                journal = app.job_journal
+                if journal is not None and journal is not parent_journal and journal.get(job_id) is not None:
+                    journal.track(uuid4(), label="child")
+                    exit_code = 0
+            finally:
+                os._exit(exit_code)
+        _, status = os.waitpid(pid, 0)
+
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert app.job_journal is parent_journal
+        assert [entry.label for entry in parent_journal.entries(label="child")] == ["child"]
+
+
+def test_it_pickles_without_building_services(tmp_path) -> None:
+    """An app should pickle as its configuration and token session, and be restored without opening the journal."""
+    with ArnicaApp(journalling_config(tmp_path)) as app:
+        app.auth_service.session_tokens = OfflineAccessTokens("access", "refresh")
+        assert app.job_journal is not None
+
+        restored = pickle.loads(pickle.dumps(app))
+
+    assert restored.config._app_dir == tmp_path
+    assert restored.auth_service.session_tokens == ("access", "refresh")
+    assert "job_journal" not in restored.__dict__
+    restored.close()
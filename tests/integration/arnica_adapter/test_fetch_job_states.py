@@ -0,0 +1,81 @@
+import contextlib
+import threading
+from uuid import UUID, uuid4
+
+import httpx
+import pytest
+
+from aqt_connector._infrastructure.arnica_adapter import ArnicaAdapter
+from aqt_connector.exceptions import JobNotFoundError, WaitCancelledError
+from aqt_connector.models.arnica.jobs import BasicJobMetadata
+from aqt_connector.models.arnica.response_bodies.jobs import ResultResponse, RRQueued
+
+
+@pytest.mark.simulated
+def test_it_fetches_all_jobs_with_bounded_concurrency() -> None:
+    """It should request every job with the given token, never exceeding the concurrency bound."""
+    job_ids = [uuid4() for _ in range(40)]
+    missing_job_id = job_ids[7]
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+    barrier = threading.Barrier(4, timeout=1)
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        with contextlib.suppress(threading.BrokenBarrierError):
+            barrier.wait()
+        with lock:
+            in_flight -= 1
+
+        assert request.headers["Authorization"] == "Bearer some-token"
+        job_id = UUID(request.url.path.rsplit("/", 1)[-1])
+        if job_id == missing_job_id:
+            return httpx.Response(status_code=404)
+        metadata = BasicJobMetadata(job_id=job_id, resource_id="resource", workspace_id="workspace")
+        return httpx.Response(200, content=ResultResponse(job=metadata, response=RRQueued()).model_dump_json())
+
+    arnica_adapter = ArnicaAdapter(base_url="https://arnica.example")
+    arnica_adapter._http_client = httpx.Client(transport=httpx.MockTransport(respond))
+
+    states = arnica_adapter.fetch_job_states("some-token", job_ids, max_concurrency=4)
+
+    assert list(states) == job_ids
+    assert isinstance(states[missing_job_id], JobNotFoundError)
+    assert all(state == RRQueued() for job_id, state in states.items() if job_id != missing_job_id)
+    assert max_in_flight == 4
+
+
+@pytest.mark.simulated
+def test_it_paces_every_request() -> None:
+    """It should call the pace before each request, and return what it raises without sending the request."""
+    job_ids = [uuid4() for _ in range(6)]
+    requested: list[UUID] = []
+    paced = 0
+    lock = threading.Lock()
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        job_id = UUID(request.url.path.rsplit("/", 1)[-1])
+        with lock:
+            requested.append(job_id)
+        metadata = BasicJobMetadata(job_id=job_id, resource_id="resource", workspace_id="workspace")
+        return httpx.Response(200, content=ResultResponse(job=metadata, response=RRQueued()).model_dump_json())
+
+    def pace() -> None:
+        nonlocal paced
+        with lock:
+            paced += 1
+            if paced > 4:
+                raise WaitCancelledError
+
+    arnica_adapter = ArnicaAdapter(base_url="https://arnica.example")
+    arnica_adapter._http_client = httpx.Client(transport=httpx.MockTransport(respond))
+
+    states = arnica_adapter.fetch_job_states("some-token", job_ids, max_concurrency=3, pace=pace)
+
+    assert paced == 6
+    assert len(requested) == 4
+    assert sum(isinstance(state, WaitCancelledError) for state in states.values()) == 2
@@ -1,5 +1,7 @@
 import os
 
+import pytest
+
 from aqt_connector._sdk_config import ArnicaConfig
 
 
@@ -40,3 +42,81 @@ def test_env_config_overwrites_file_config(tmp_path, monkeypatch) -> None:
     config = ArnicaConfig(tmp_path)
 
     assert config.client_id == expected_value
+
+
+def test_it_loads_the_polling_budget(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("AQT_MAX_POLLS_PER_SECOND", "2.5")
+
+    config = ArnicaConfig(tmp_path)
+
+    assert config.max_polls_per_second == 2.5
+
+
+def test_it_disables_the_polling_budget_when_zero(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("AQT_MAX_POLLS_PER_SECOND", "0")
+
+    config = ArnicaConfig(tmp_path)
+
+    assert config.max_polls_per_second is None
+
+
+@pytest.mark.parametrize(("value", "expected"), [("true", True), ("1", True), ("false", False), ("0", False)])
+def test_it_loads_the_journal_flag_from_env_variables(monkeypatch, tmp_path, value: str, expected: bool) -> None:
+    monkeypatch.setenv("AQT_JOURNAL", value)
+
+    config = ArnicaConfig(tmp_path)
+
+    assert config.journal is expected
+
+
+def test_it_loads_the_journal_flag_from_the_config_file(tmp_path) -> None:
+    p = tmp_path / "config"
+    p.write_text("default.journal = true")
+
+    config = ArnicaConfig(tmp_path)
+
+    assert config.journal is True
+
+
+def test_it_loads_the_lazy_results_flag(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("AQT_LAZY_RESULTS", "true")
+
+    config = ArnicaConfig(tmp_path)
+
+    assert config.lazy_results is True
+
+
+@pytest.mark.parametrize(("value", "expected"), [("1", True), ("0", False)])
+def test_it_loads_flags_given_as_integers_in_the_config_file(tmp_path, value: str, expected: bool) -> None:
+    p = tmp_path / "config"
+    p.write_text(f"default.lazy_results = {value}")
+
+    config = ArnicaConfig(tmp_path)
+
+    assert config.lazy_results is expected
+
+
+def test_it_rejects_flags_that_are_not_booleans(tmp_path) -> None:
+    p = tmp_path / "config"
+    p.write_text("default.lazy_results = [1]")
+
+    with pytest.raises(ValueError, match="lazy_results option must be a boolean"):
+        ArnicaConfig(tmp_path)
+
+
+@pytest.mark.parametrize("value", ["ture", "maybe"])
+def test_it_rejects_flags_with_unknown_spellings(monkeypatch, tmp_path, value: str) -> None:
+    monkeypatch.setenv("AQT_JOURNAL", value)
+
+    with pytest.raises(ValueError, match="journal option must be a boolean"):
+        ArnicaConfig(tmp_path)
+
+
+def test_it_loads_the_result_cache_options(tmp_path) -> None:
+    p = tmp_path / "config"
+    p.write_text("default.result_cache = true\ndefault.result_cache_memory_mb = 8\ndefault.result_cache_disk_mb = 0.5")
+
+    config = ArnicaConfig(tmp_path)
+
+    assert config.result_cache is True
+    assert (config.result_cache_memory_mb, config.result_cache_disk_mb) == (8.0, 0.5)
@@ -1,3 +1,4 @@
+import threading
 from pathlib import Path
 
 from aqt_connector._infrastructure.token_repository import TokenRepository
@@ -89,3 +90,24 @@ def test_it_returns_none_if_the_refresh_token_doesnt_exist(tmp_path: Path) -> No
     token = token_repo.load_refresh_token()
 
     assert token is None
+
+
+def test_concurrent_readers_never_see_partial_tokens(tmp_path: Path) -> None:
+    """It should replace stored tokens atomically, so readers get either the old or the new token."""
+    tokens = [f"token-{i}-" + "x" * 4096 for i in range(50)]
+    token_repo = TokenRepository(tmp_path)
+    token_repo.save_access_token(tokens[0])
+    read: list[str | None] = []
+
+    def write_all() -> None:
+        for token in tokens:
+            token_repo.save_access_token(token)
+
+    writer = threading.Thread(target=write_all)
+    writer.start()
+    while writer.is_alive():
+        read.append(token_repo.load_access_token())
+    writer.join()
+
+    assert set(read) <= set(tokens)
+    assert list(tmp_path.iterdir()) == [tmp_path / "access_token"]